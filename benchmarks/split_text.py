@@ -0,0 +1,76 @@
+"""\
+Compare basic and fast text splitting using a sentencepiece tokenizer to count sizes.
+
+Run from the repository root: `python benchmarks/split_text.py`
+"""
+
+from asyncio import run
+from time import perf_counter
+from typing import Literal
+
+from draive import ctx, split_text
+from draive.mistral import MistralChatConfig, mistral_tokenize_text
+
+
+def measure(
+    text: str,
+    *,
+    part_size: int,
+    part_overlap_size: int | None,
+    mode: Literal["basic", "fast"],
+) -> tuple[float, int, list[str]]:
+    counted: int = 0
+
+    def count_size(text: str) -> int:
+        nonlocal counted
+        counted += 1
+        return len(mistral_tokenize_text(text))
+
+    start: float = perf_counter()
+    parts: list[str] = split_text(
+        text=text,
+        part_size=part_size,
+        count_size=count_size,
+        separators=[". ", " "],  # sentences give many parts for each chunk
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+    )
+    return (perf_counter() - start, counted, parts)
+
+
+def report(
+    label: str,
+    time: float,
+    counted: int,
+) -> None:
+    print(f"  {label:<6} {time * 1000:>10.1f} ms {counted:>8} counts")
+
+
+async def main() -> None:
+    with open("tests/data/sample_text.txt") as file:
+        text: str = file.read() * 10
+
+    async with ctx.new("benchmark", state=[MistralChatConfig()]):
+        for part_size, part_overlap_size in [(128, None), (512, None), (512, 64), (2048, 256)]:
+            print(f"part_size={part_size}, part_overlap_size={part_overlap_size}")
+            basic_time, basic_counted, basic_parts = measure(
+                text,
+                part_size=part_size,
+                part_overlap_size=part_overlap_size,
+                mode="basic",
+            )
+            fast_time, fast_counted, fast_parts = measure(
+                text,
+                part_size=part_size,
+                part_overlap_size=part_overlap_size,
+                mode="fast",
+            )
+            report("basic", basic_time, basic_counted)
+            report("fast", fast_time, fast_counted)
+            print(
+                f"  speedup {basic_time / fast_time:.1f}x, same parts: {basic_parts == fast_parts}"
+            )
+
+
+if __name__ == "__main__":
+    run(main())
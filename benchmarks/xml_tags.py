@@ -0,0 +1,199 @@
+"""\
+Compare the character based xml_tags scanner with the current implementation \
+on a long completion containing many tags.
+
+Run from the repository root: `python benchmarks/xml_tags.py`
+"""
+
+from collections.abc import Callable, Generator
+from time import perf_counter
+
+from draive import MultimodalContent, xml_tagged, xml_tags
+from draive.types import Multimodal, MultimodalContentElement, TextContent
+
+
+# previous implementation of xml_tags, kept as a reference
+def legacy_xml_tags(  # noqa: C901, PLR0912, PLR0915
+    tag: str,
+    /,
+    source: Multimodal,
+) -> Generator[MultimodalContent, None]:
+    content_parts: tuple[MultimodalContentElement, ...]
+    match source:
+        case str() as string:
+            content_parts = (TextContent(text=string),)
+
+        case MultimodalContent() as multimodal:
+            content_parts = multimodal.parts
+
+        case TextContent() as text:
+            content_parts = (text,)
+
+        case _:
+            return  # can't process other types
+
+    opening_tag_prefix: str = f"<{tag} "
+    opening_tag: str = f"<{tag}>"
+    closing_tag: str = f"</{tag}>"
+
+    def check_opening(
+        accumulator: str,
+        /,
+    ) -> bool:
+        return accumulator == opening_tag or (
+            accumulator.endswith(">") and accumulator.startswith(opening_tag_prefix)
+        )
+
+    accumulator: str = ""
+    content_accumulator: str = ""
+    content_accumulator_meta: dict[str, str | float | int | bool | None] | None = None
+    content: list[MultimodalContentElement] = []
+    in_tag: bool = False
+    in_content: bool = False
+    for part in content_parts:
+        match part:
+            case TextContent() as text:
+                # preserve parts as in input
+                if in_content and content_accumulator:
+                    content.append(
+                        TextContent(
+                            text=content_accumulator,
+                            meta=content_accumulator_meta,
+                        )
+                    )
+                    content_accumulator = ""
+
+                content_accumulator_meta = text.meta  # use current part meta
+
+                for char in text.text:
+                    if in_tag:
+                        if char == ">":
+                            accumulator += char
+                            if in_content and accumulator == closing_tag:
+                                in_content = False
+                                if content_accumulator:
+                                    yield MultimodalContent.of(
+                                        *content,
+                                        TextContent(
+                                            text=content_accumulator,
+                                            meta=content_accumulator_meta,
+                                        ),
+                                    )
+
+                                else:
+                                    yield MultimodalContent.of(*content)
+
+                                content = []  # clear to be ready for next tag
+                                content_accumulator = ""
+
+                            elif check_opening(accumulator):
+                                in_content = True
+                                content = []  # clear current content in case of nested tags
+                                content_accumulator = ""
+
+                            elif in_content:
+                                content_accumulator += accumulator
+
+                            in_tag = False
+                            accumulator = ""
+
+                        elif char == "<":
+                            if in_content:
+                                content_accumulator += accumulator
+
+                            accumulator = char
+
+                        else:
+                            accumulator += char
+
+                    elif char == "<":
+                        in_tag = True
+                        accumulator = char
+
+                    elif in_content:
+                        content_accumulator += char
+
+                    # else skip character
+
+            case other:
+                if in_content:
+                    if accumulator:
+                        content_accumulator += accumulator
+
+                    if content_accumulator:
+                        content.append(
+                            TextContent(
+                                text=content_accumulator,
+                                meta=content_accumulator_meta,
+                            )
+                        )
+                        content_accumulator = ""
+
+                    content.append(other)
+
+                if in_tag:
+                    in_tag = False
+                    accumulator = ""
+
+
+def measure(
+    label: str,
+    extract: Callable[[], list[MultimodalContent]],
+    *,
+    repeats: int = 10,
+) -> tuple[float, list[MultimodalContent]]:
+    result: list[MultimodalContent] = extract()
+    start: float = perf_counter()
+    for _ in range(repeats):
+        extract()
+
+    time: float = (perf_counter() - start) / repeats
+    print(f"  {label:<28} {time * 1000:>10.2f} ms")
+    return (time, result)
+
+
+def main() -> None:
+    with open("tests/data/sample_text.txt") as file:
+        paragraphs: list[str] = file.read().split("\n\n")
+
+    # about 30k tokens report with many tags and some angle brackets in text
+    completion: MultimodalContent = MultimodalContent.of(
+        *(
+            f"<section id={idx}><title>Part {idx}</title>"
+            f"<summary>{paragraph}</summary> a < b > c <note>{paragraph[:80]}</note></section>\n"
+            for idx, paragraph in enumerate(paragraphs * 60)
+        )
+    )
+    tags: tuple[str, ...] = ("title", "summary", "note")
+
+    print("single tag")
+    legacy_time, legacy_result = measure(
+        "legacy",
+        lambda: list(legacy_xml_tags("summary", source=completion)),
+    )
+    current_time, current_result = measure(
+        "current",
+        lambda: list(xml_tags("summary", source=completion)),
+    )
+    print(
+        f"  speedup {legacy_time / current_time:.1f}x,"
+        f" same result: {legacy_result == current_result}"
+    )
+
+    print("multiple tags")
+    legacy_time, legacy_result = measure(
+        "legacy, call for each tag",
+        lambda: [content for tag in tags for content in legacy_xml_tags(tag, source=completion)],
+    )
+    current_time, current_result = measure(
+        "current, single pass",
+        lambda: [content for _, content in xml_tagged(tags, source=completion)],
+    )
+    print(
+        f"  speedup {legacy_time / current_time:.1f}x,"
+        f" same contents: {sorted(map(str, legacy_result)) == sorted(map(str, current_result))}"
+    )
+
+
+if __name__ == "__main__":
+    main()
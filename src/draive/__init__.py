@@ -43,6 +43,7 @@ from draive.embedding import (
 from draive.generation import (
     ImageGeneration,
     ImageGenerator,
+    JSONRepairTrace,
     ModelGeneration,
     ModelGenerator,
     ModelGeneratorDecoder,
@@ -51,9 +52,20 @@ from draive.generation import (
     generate_image,
     generate_model,
     generate_text,
+    repairing_json_decoder,
 )
 from draive.helpers import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    CircuitBreakerPermit,
+    CircuitBreakerStatus,
     ConstantMemory,
+    EndpointBalancer,
+    EndpointStatus,
+    EndpointUsage,
+    RetryBackoff,
+    RetryBudget,
+    RetryTrace,
     VolatileAccumulativeMemory,
     VolatileMemory,
     VolatileVectorIndex,
@@ -70,12 +82,17 @@ from draive.instructions import (
 )
 from draive.lmm import (
     LMM,
+    LMMHedgingTrace,
+    LMMScheduler,
+    LMMScheduling,
+    LMMSchedulingClass,
     Tool,
     ToolAvailabilityCheck,
     Toolbox,
     ToolContext,
     ToolException,
     ToolStatus,
+    hedged_lmm_invocation,
     lmm_invocation,
     tool,
 )
@@ -111,13 +128,24 @@ from draive.scope import (
     ScopeDependency,
     ScopeState,
     ctx,
+    dispose_shared_dependencies,
 )
 from draive.similarity import (
     mmr_vector_similarity_search,
     vector_similarity_score,
     vector_similarity_search,
 )
-from draive.splitters import split_text
+from draive.splitters import (
+    TextSpan,
+    semantic_split_text,
+    split_text,
+    split_text_async_stream,
+    split_text_spans,
+    split_text_stream,
+    split_texts,
+    split_texts_as_completed,
+    text_splitting_executor,
+)
 from draive.steps import (
     Step,
     Steps,
@@ -125,15 +153,27 @@ from draive.steps import (
     lmm_steps_completion,
     steps_completion,
 )
-from draive.tokenization import TextTokenizer, Tokenization, count_text_tokens, tokenize_text
+from draive.tokenization import (
+    TextBatchTokenizer,
+    TextBatchTokensCounter,
+    TextTokenizer,
+    TextTokensCounter,
+    Tokenization,
+    count_text_tokens,
+    count_texts_tokens,
+    tokenize_text,
+    tokenize_texts,
+)
 from draive.types import (
     JSON,
     AudioBase64Content,
     AudioContent,
+    AudioDataContent,
     AudioURLContent,
     BasicMemory,
     ImageBase64Content,
     ImageContent,
+    ImageDataContent,
     ImageURLContent,
     LMMCompletion,
     LMMCompletionChunk,
@@ -154,10 +194,16 @@ from draive.types import (
     TextContent,
     VideoBase64Content,
     VideoContent,
+    VideoDataContent,
     VideoURLContent,
+    XMLStreamChunk,
     frozenlist,
     xml_tag,
+    xml_tag_stream,
+    xml_tagged,
+    xml_tagged_stream,
     xml_tags,
+    xml_tags_stream,
 )
 from draive.utils import (
     MISSING,
@@ -177,7 +223,9 @@ from draive.utils import (
     is_missing,
     load_env,
     markdown_block,
+    markdown_block_stream,
     markdown_blocks,
+    markdown_blocks_stream,
     noop,
     not_missing,
     setup_logging,
@@ -208,12 +256,17 @@ __all__ = [
     "AsyncStream",
     "AudioBase64Content",
     "AudioContent",
+    "AudioDataContent",
     "AudioURLContent",
     "auto_retry",
     "BasicMemory",
     "BasicValue",
     "cache",
     "choice_completion",
+    "CircuitBreaker",
+    "CircuitBreakerOpen",
+    "CircuitBreakerPermit",
+    "CircuitBreakerStatus",
     "Choice",
     "ChoiceCompletion",
     "ChoiceOption",
@@ -226,13 +279,18 @@ __all__ = [
     "ConversationMessageChunk",
     "ConversationResponseStream",
     "count_text_tokens",
+    "count_texts_tokens",
     "ctx",
     "DataModel",
+    "dispose_shared_dependencies",
     "embed_image",
     "embed_images",
     "embed_text",
     "embed_texts",
     "Embedded",
+    "EndpointBalancer",
+    "EndpointStatus",
+    "EndpointUsage",
     "Field",
     "freeze",
     "frozenlist",
@@ -243,9 +301,11 @@ __all__ = [
     "getenv_float",
     "getenv_int",
     "getenv_str",
+    "hedged_lmm_invocation",
     "GuardrailsException",
     "ImageBase64Content",
     "ImageContent",
+    "ImageDataContent",
     "ImageEmbedding",
     "ImageGeneration",
     "ImageGenerator",
@@ -258,6 +318,7 @@ __all__ = [
     "InstructionsRepository",
     "is_missing",
     "JSON",
+    "JSONRepairTrace",
     "lmm_choice_completion",
     "lmm_conversation_completion",
     "lmm_invocation",
@@ -266,14 +327,20 @@ __all__ = [
     "LMMCompletion",
     "LMMCompletionChunk",
     "LMMContextElement",
+    "LMMHedgingTrace",
     "LMMInput",
     "LMMOutputStream",
     "LMMOutputStreamChunk",
+    "LMMScheduler",
+    "LMMScheduling",
+    "LMMSchedulingClass",
     "LMMToolRequest",
     "LMMToolResponse",
     "load_env",
     "markdown_block",
+    "markdown_block_stream",
     "markdown_blocks",
+    "markdown_blocks_stream",
     "Memory",
     "Metric",
     "metrics_log_reporter",
@@ -303,27 +370,43 @@ __all__ = [
     "ParameterValidator",
     "ParameterVerifier",
     "RateLimitError",
+    "repairing_json_decoder",
+    "RetryBackoff",
+    "RetryBudget",
+    "RetryTrace",
     "ScopeDependencies",
     "ScopeDependency",
     "ScopeState",
     "SelectionException",
+    "semantic_split_text",
     "setup_logging",
     "split_sequence",
     "split_text",
+    "split_text_async_stream",
+    "split_text_spans",
+    "split_text_stream",
+    "split_texts",
+    "split_texts_as_completed",
     "State",
     "Stateless",
     "Step",
     "steps_completion",
     "Steps",
     "StepsCompletion",
+    "TextBatchTokenizer",
+    "TextBatchTokensCounter",
     "TextContent",
     "TextEmbedding",
     "TextGeneration",
     "TextGenerator",
+    "TextSpan",
+    "text_splitting_executor",
     "TextTokenizer",
+    "TextTokensCounter",
     "throttle",
     "Tokenization",
     "tokenize_text",
+    "tokenize_texts",
     "TokenUsage",
     "tool",
     "Tool",
@@ -339,6 +422,7 @@ __all__ = [
     "vector_similarity_search",
     "VideoBase64Content",
     "VideoContent",
+    "VideoDataContent",
     "VideoURLContent",
     "VolatileAccumulativeMemory",
     "VolatileMemory",
@@ -346,5 +430,10 @@ __all__ = [
     "with_timeout",
     "workflow",
     "xml_tag",
+    "xml_tag_stream",
+    "xml_tagged",
+    "xml_tagged_stream",
     "xml_tags",
+    "xml_tags_stream",
+    "XMLStreamChunk",
 ]
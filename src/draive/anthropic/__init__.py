@@ -2,11 +2,12 @@ from draive.anthropic.client import AnthropicClient
 from draive.anthropic.config import AnthropicConfig
 from draive.anthropic.errors import AnthropicException
 from draive.anthropic.lmm import anthropic_lmm_invocation
-from draive.anthropic.tokenization import anthropic_tokenize_text
+from draive.anthropic.tokenization import anthropic_tokenize_text, anthropic_tokenize_texts
 
 __all__ = [
     "anthropic_lmm_invocation",
     "anthropic_tokenize_text",
+    "anthropic_tokenize_texts",
     "AnthropicClient",
     "AnthropicConfig",
     "AnthropicException",
@@ -23,14 +23,21 @@ class AnthropicClient(ScopeDependency):
     def prepare(cls) -> Self:
         return cls(
             api_key=getenv_str("ANTHROPIC_API_KEY"),
+            base_url=getenv_str("ANTHROPIC_BASE_URL"),
         )
 
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse the client and its connections between scopes
+
     def __init__(
         self,
         api_key: str | None,
+        base_url: str | None = None,
     ) -> None:
         self._client: AsyncAnthropic = AsyncAnthropic(
             api_key=api_key,
+            base_url=base_url,
             max_retries=0,  # disable library retries
         )
 
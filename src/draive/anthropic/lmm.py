@@ -1,15 +1,25 @@
+import json
 from collections.abc import AsyncGenerator, Sequence
 from typing import Any, Literal, cast, overload
 
+from anthropic import AsyncStream
 from anthropic.types import (
     ImageBlockParam,
+    InputJsonDelta,
     Message,
     MessageParam,
+    RawContentBlockDeltaEvent,
+    RawContentBlockStartEvent,
+    RawMessageDeltaEvent,
+    RawMessageStartEvent,
+    RawMessageStreamEvent,
     TextBlock,
     TextBlockParam,
+    TextDelta,
     ToolParam,
     ToolUseBlock,
 )
+from anthropic.types.message_create_params import ToolChoiceToolChoiceTool
 
 from draive.anthropic.client import AnthropicClient
 from draive.anthropic.config import AnthropicConfig
@@ -21,8 +31,10 @@ from draive.parameters import DataModel
 from draive.scope import ctx
 from draive.types import (
     AudioBase64Content,
+    AudioDataContent,
     AudioURLContent,
     ImageBase64Content,
+    ImageDataContent,
     ImageURLContent,
     LMMCompletion,
     LMMCompletionChunk,
@@ -38,8 +50,10 @@ from draive.types import (
     MultimodalContentElement,
     TextContent,
     VideoBase64Content,
+    VideoDataContent,
     VideoURLContent,
 )
+from draive.utils import identity_cache
 
 __all__ = [
     "anthropic_lmm_invocation",
@@ -114,9 +128,7 @@ async def anthropic_lmm_invocation(  # noqa: PLR0913
         config: AnthropicConfig = ctx.state(AnthropicConfig).updated(**extra)
         ctx.record(config)
 
-        messages: list[MessageParam] = [
-            _convert_context_element(element=element) for element in context
-        ]
+        messages: list[MessageParam] = [_convert_context_element(element) for element in context]
 
         if stream:
             return ctx.stream(
@@ -155,7 +167,7 @@ def _convert_content_element(
             # TODO: we could download the media to have data instead
             raise ValueError("Unsupported message content", element)
 
-        case ImageBase64Content() as image:
+        case ImageBase64Content() | ImageDataContent() as image:
             return {
                 "type": "image",
                 "source": {
@@ -168,13 +180,13 @@ def _convert_content_element(
         case AudioURLContent():
             raise ValueError("Unsupported message content", element)
 
-        case AudioBase64Content():
+        case AudioBase64Content() | AudioDataContent():
             raise ValueError("Unsupported message content", element)
 
         case VideoURLContent():
             raise ValueError("Unsupported message content", element)
 
-        case VideoBase64Content():
+        case VideoBase64Content() | VideoDataContent():
             raise ValueError("Unsupported message content", element)
 
         case DataModel() as data:
@@ -184,8 +196,11 @@ def _convert_content_element(
             }
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
+    /,
 ) -> MessageParam:
     match element:
         case LMMInput() as input:
@@ -402,7 +417,7 @@ async def _completion(  # noqa: PLR0913, PLR0912, C901
             raise AnthropicException(f"Unexpected finish reason: {other}")
 
 
-async def _completion_stream(  # noqa: PLR0913
+async def _completion_stream(  # noqa: PLR0913, PLR0912, PLR0915, C901
     *,
     client: AnthropicClient,
     config: AnthropicConfig,
@@ -411,19 +426,145 @@ async def _completion_stream(  # noqa: PLR0913
     tools: Sequence[ToolSpecification] | None,
     tool_selection: LMMToolSelection,
 ) -> AsyncGenerator[LMMOutputStreamChunk, None]:
-    ctx.log_debug("Anthropic streaming api is not supported yet, using regular response...")
-    output: LMMOutput = await _completion(
-        client=client,
+    tool_choice: ToolChoiceToolChoiceTool | Literal["auto", "any", "none"]
+    match tool_selection:
+        case "auto":
+            tool_choice = "auto"
+
+        case "none":
+            tool_choice = "none"
+
+        case "required":
+            tool_choice = "any"
+
+        case tool:
+            tool_choice = {
+                "type": "tool",
+                "name": tool["function"]["name"],
+            }
+
+    completion_stream: AsyncStream[RawMessageStreamEvent] = await client.completion(
         config=config,
         instruction=instruction,
         messages=messages,
-        tools=tools,
-        tool_selection=tool_selection,
+        tools=[
+            ToolParam(
+                name=tool["function"]["name"],
+                description=tool["function"]["description"],
+                input_schema=cast(
+                    dict[str, Any],
+                    tool["function"]["parameters"],
+                ),
+            )
+            for tool in tools or []
+        ],
+        tool_choice=tool_choice,
+        stream=True,
     )
 
-    match output:
-        case LMMCompletion() as completion:
-            yield LMMCompletionChunk.of(completion.content)
+    accumulated_completion: str = ""
+    # emit prefill first to produce the same content as the regular response
+    match messages[-1]:
+        case {"role": "assistant", "content": str() as content_text}:
+            accumulated_completion = content_text
+
+        case {"role": "assistant", "content": content_parts}:
+            accumulated_completion = "".join(  # currently supporting only text prefills
+                part.text for part in content_parts if isinstance(part, TextBlock)
+            )
+
+        case _:
+            pass
+
+    if accumulated_completion:
+        yield LMMCompletionChunk.of(accumulated_completion)
+
+    # tool calls come in parts, arguments are streamed as partial json
+    requested_tool_calls: dict[int, tuple[ToolUseBlock, list[str]]] = {}
+    stop_reason: str | None = None
+    input_tokens: int = 0
+    output_tokens: int = 0
+    try:
+        async for event in completion_stream:
+            match event:
+                case RawMessageStartEvent() as start:
+                    input_tokens = start.message.usage.input_tokens or 0
+                    output_tokens = start.message.usage.output_tokens or 0
+
+                case RawContentBlockStartEvent(content_block=TextBlock() as text):
+                    if text.text:
+                        accumulated_completion += text.text
+                        yield LMMCompletionChunk.of(text.text)
+
+                case RawContentBlockStartEvent(content_block=ToolUseBlock() as call, index=index):
+                    requested_tool_calls[index] = (call, [])
+
+                case RawContentBlockDeltaEvent(delta=TextDelta() as delta):
+                    if not delta.text:
+                        continue  # skip empty parts
+
+                    accumulated_completion += delta.text
+                    yield LMMCompletionChunk.of(delta.text)
+
+                case RawContentBlockDeltaEvent(delta=InputJsonDelta() as delta, index=index):
+                    if call_parts := requested_tool_calls.get(index):
+                        call_parts[1].append(delta.partial_json)
+
+                    else:
+                        ctx.log_warning("Unexpected Anthropic tool use delta: %s", event)
+
+                case RawMessageDeltaEvent() as message_delta:
+                    stop_reason = message_delta.delta.stop_reason
+                    # output tokens are cumulative
+                    output_tokens = message_delta.usage.output_tokens
+
+                case _:
+                    pass  # blocks and message stop do not carry any data
+
+    finally:
+        await completion_stream.close()
+
+    ctx.record(
+        TokenUsage.for_model(
+            config.model,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+        ),
+    )
+
+    tool_calls: list[LMMToolRequest] = [
+        LMMToolRequest(
+            identifier=call.id,
+            tool=call.name,
+            # parameterless tools stream empty partial json
+            arguments=json.loads(raw)
+            if (raw := "".join(arguments))
+            else cast(dict[str, Any], call.input),
+        )
+        for call, arguments in (
+            requested_tool_calls[index] for index in sorted(requested_tool_calls.keys())
+        )
+    ]
+
+    match stop_reason:
+        case "tool_use":
+            if tool_calls and tools:
+                ctx.record(ResultTrace.of(tool_calls))
+                yield LMMToolRequests(requests=tool_calls)
+
+            else:
+                raise AnthropicException("Invalid Anthropic completion stream")
+
+        case "end_turn" | "stop_sequence":
+            if tool_calls and tools:
+                ctx.record(ResultTrace.of(tool_calls))
+                yield LMMToolRequests(requests=tool_calls)
+
+            else:
+                ctx.record(ResultTrace.of(accumulated_completion))
+
+        case None:
+            raise AnthropicException("Incomplete Anthropic completion stream")
 
         case other:
-            yield other
+            raise AnthropicException(f"Unexpected finish reason: {other}")
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from anthropic import Anthropic
@@ -7,6 +8,7 @@ from draive.utils import cache
 
 __all__ = [
     "anthropic_tokenize_text",
+    "anthropic_tokenize_texts",
 ]
 
 
@@ -17,6 +19,16 @@ def anthropic_tokenize_text(
     return _tokenizer().encode(text).ids  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
 
 
+def anthropic_tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    return [
+        encoding.ids  # pyright: ignore[reportUnknownMemberType]
+        for encoding in _tokenizer().encode_batch(list(texts))  # pyright: ignore[reportUnknownMemberType, reportUnknownVariableType]
+    ]
+
+
 @cache(limit=1)
 def _tokenizer() -> Tokenizer:
     return Anthropic().get_tokenizer()
@@ -6,6 +6,7 @@ from draive.generation import generate_text
 from draive.similarity.score import vector_similarity_score
 from draive.types import (
     ImageBase64Content,
+    ImageDataContent,
     Multimodal,
     MultimodalTemplate,
     xml_tag,
@@ -109,15 +110,18 @@ async def text_vector_similarity_evaluator(
 
 @evaluator(name="image_vector_similarity")
 async def image_vector_similarity_evaluator(
-    evaluated: ImageBase64Content | bytes,
+    evaluated: ImageBase64Content | ImageDataContent | bytes,
     /,
-    reference: ImageBase64Content | bytes,
+    reference: ImageBase64Content | ImageDataContent | bytes,
 ) -> float:
     evaluated_data: bytes
     match evaluated:
         case ImageBase64Content() as base64_data:
             evaluated_data = b64decode(base64_data.image_base64)
 
+        case ImageDataContent() as image_data:
+            evaluated_data = image_data.image_data
+
         case raw_data:
             evaluated_data = raw_data
 
@@ -126,6 +130,9 @@ async def image_vector_similarity_evaluator(
         case ImageBase64Content() as base64_data:
             reference_data = b64decode(base64_data.image_base64)
 
+        case ImageDataContent() as image_data:
+            reference_data = image_data.image_data
+
         case raw_data:
             reference_data = raw_data
 
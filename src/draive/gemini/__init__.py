@@ -1,16 +1,18 @@
 from draive.gemini.client import GeminiClient
-from draive.gemini.config import GeminiConfig, GeminiEmbeddingConfig
+from draive.gemini.config import GeminiConfig, GeminiEmbeddingConfig, GeminiEndpoint
 from draive.gemini.embedding import gemini_embed_text
 from draive.gemini.errors import GeminiException
 from draive.gemini.lmm import gemini_lmm_invocation
-from draive.gemini.tokenization import gemini_tokenize_text
+from draive.gemini.tokenization import gemini_tokenize_text, gemini_tokenize_texts
 
 __all__ = [
     "gemini_embed_text",
     "gemini_lmm_invocation",
     "gemini_tokenize_text",
+    "gemini_tokenize_texts",
     "GeminiClient",
     "GeminiConfig",
     "GeminiEmbeddingConfig",
+    "GeminiEndpoint",
     "GeminiException",
 ]
@@ -1,22 +1,26 @@
 import json
 from asyncio import gather
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import AsyncExitStack
 from http import HTTPStatus
 from itertools import chain
 from typing import Any, Literal, Self, final, overload
 
-from httpx import AsyncClient, Response
+from httpx import AsyncBaseTransport, AsyncClient, Response
 
-from draive.gemini.config import GeminiConfig, GeminiEmbeddingConfig
+from draive.gemini.config import GeminiConfig, GeminiEmbeddingConfig, GeminiEndpoint
 from draive.gemini.errors import GeminiException
 from draive.gemini.models import (
     GeminiFunctionsTool,
     GeminiGenerationResult,
+    GeminiGenerationStreamResult,
     GeminiRequestMessage,
 )
+from draive.helpers.balancer import EndpointBalancer, EndpointStatus
+from draive.http import shared_http_transport
 from draive.parameters import DataModel
 from draive.scope import ScopeDependency
-from draive.utils import getenv_str, not_missing
+from draive.utils import getenv_str, not_missing, sse_events
 
 __all__ = [
     "GeminiClient",
@@ -33,20 +37,79 @@ class GeminiClient(ScopeDependency):
             timeout=90,
         )
 
-    def __init__(
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse the client and its connections between scopes
+
+    def __init__(  # noqa: PLR0913
         self,
-        endpoint: str,
-        api_key: str | None,
+        endpoint: str | None = None,
+        api_key: str | None = None,
         timeout: float | None = None,
+        *,
+        endpoints: Sequence[GeminiEndpoint] | None = None,
+        balancing: Literal["least_outstanding", "remaining_quota"] = "least_outstanding",
+        transport: AsyncBaseTransport | None = None,
     ) -> None:
-        self._client: AsyncClient = AsyncClient(
-            base_url=endpoint,
-            params={
-                "key": api_key,
-            },
-            timeout=timeout,
+        # balance between multiple endpoints if provided
+        if endpoints:
+            assert not (  # nosec: B101
+                endpoint or api_key
+            ), "Can't use both endpoints and a single endpoint configuration"
+
+        else:
+            assert endpoint, "Missing Gemini endpoint"  # nosec: B101
+            endpoints = [GeminiEndpoint(endpoint=endpoint, api_key=api_key)]
+
+        self._balancer: EndpointBalancer[AsyncClient] = EndpointBalancer(
+            [
+                (
+                    element.name or f"gemini_{index}",
+                    AsyncClient(
+                        base_url=element.endpoint,
+                        params={
+                            "key": element.api_key,
+                        },
+                        timeout=timeout,
+                        # reuse process wide connection pool by default
+                        transport=transport or shared_http_transport(),
+                    ),
+                )
+                for index, element in enumerate(endpoints)
+            ],
+            strategy=balancing,
         )
 
+    @property
+    def endpoints_status(self) -> list[EndpointStatus]:
+        return self._balancer.status
+
+    @overload
+    async def generate(
+        self,
+        *,
+        config: GeminiConfig,
+        instruction: str,
+        messages: list[GeminiRequestMessage],
+        tools: list[GeminiFunctionsTool] | None = None,
+        tool_calling_mode: Literal["AUTO", "ANY", "NONE"] = "AUTO",
+        response_schema: dict[str, Any] | None = None,
+        stream: Literal[True],
+    ) -> AsyncIterator[GeminiGenerationStreamResult]: ...
+
+    @overload
+    async def generate(
+        self,
+        *,
+        config: GeminiConfig,
+        instruction: str,
+        messages: list[GeminiRequestMessage],
+        tools: list[GeminiFunctionsTool] | None = None,
+        tool_calling_mode: Literal["AUTO", "ANY", "NONE"] = "AUTO",
+        response_schema: dict[str, Any] | None = None,
+        stream: Literal[False] = False,
+    ) -> GeminiGenerationResult: ...
+
     async def generate(  # noqa: PLR0913
         self,
         *,
@@ -57,57 +120,62 @@ class GeminiClient(ScopeDependency):
         tool_calling_mode: Literal["AUTO", "ANY", "NONE"] = "AUTO",
         response_schema: dict[str, Any] | None = None,
         stream: bool = False,
-    ) -> GeminiGenerationResult:
+    ) -> AsyncIterator[GeminiGenerationStreamResult] | GeminiGenerationResult:
+        request: dict[str, Any] = {
+            "generationConfig": {
+                "responseMimeType": config.response_format
+                if not_missing(config.response_format)
+                else "text/plain",
+                "temperature": config.temperature,
+                "topP": config.top_p if not_missing(config.top_p) else None,
+                "topK": config.top_k if not_missing(config.top_k) else None,
+                "maxOutputTokens": config.max_tokens,
+                "responseSchema": response_schema if response_schema else None,
+                "candidateCount": 1,
+                "stopSequences": config.stop_sequences
+                if not_missing(config.stop_sequences)
+                else None,
+            },
+            "systemInstruction": {
+                "parts": ({"text": instruction},),
+            },
+            "contents": messages,
+            "tools": tools or [],
+            "toolConfig": {
+                "functionCallingConfig": {
+                    "mode": tool_calling_mode if tools else "NONE",
+                },
+            },
+            "safetySettings": [  # google moderation is terrible, disabling it all
+                {
+                    "category": "HARM_CATEGORY_HATE_SPEECH",
+                    "threshold": "BLOCK_NONE",
+                },
+                {
+                    "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
+                    "threshold": "BLOCK_NONE",
+                },
+                {
+                    "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
+                    "threshold": "BLOCK_NONE",
+                },
+                {
+                    "category": "HARM_CATEGORY_HARASSMENT",
+                    "threshold": "BLOCK_NONE",
+                },
+            ],
+        }
+
         if stream:
-            raise NotImplementedError("Gemini streaming is not supported yet")
+            return self._generate_content_stream(
+                model=config.model,
+                request=request,
+            )
 
         else:
             return await self._generate_content(
                 model=config.model,
-                request={
-                    "generationConfig": {
-                        "responseMimeType": config.response_format
-                        if not_missing(config.response_format)
-                        else "text/plain",
-                        "temperature": config.temperature,
-                        "topP": config.top_p if not_missing(config.top_p) else None,
-                        "topK": config.top_k if not_missing(config.top_k) else None,
-                        "maxOutputTokens": config.max_tokens,
-                        "responseSchema": response_schema if response_schema else None,
-                        "candidateCount": 1,
-                        "stopSequences": config.stop_sequences
-                        if not_missing(config.stop_sequences)
-                        else None,
-                    },
-                    "systemInstruction": {
-                        "parts": ({"text": instruction},),
-                    },
-                    "contents": messages,
-                    "tools": tools or [],
-                    "toolConfig": {
-                        "functionCallingConfig": {
-                            "mode": tool_calling_mode if tools else "NONE",
-                        },
-                    },
-                    "safetySettings": [  # google moderation is terrible, disabling it all
-                        {
-                            "category": "HARM_CATEGORY_HATE_SPEECH",
-                            "threshold": "BLOCK_NONE",
-                        },
-                        {
-                            "category": "HARM_CATEGORY_SEXUALLY_EXPLICIT",
-                            "threshold": "BLOCK_NONE",
-                        },
-                        {
-                            "category": "HARM_CATEGORY_DANGEROUS_CONTENT",
-                            "threshold": "BLOCK_NONE",
-                        },
-                        {
-                            "category": "HARM_CATEGORY_HARASSMENT",
-                            "threshold": "BLOCK_NONE",
-                        },
-                    ],
-                },
+                request=request,
             )
 
     async def _generate_content(
@@ -122,6 +190,55 @@ class GeminiClient(ScopeDependency):
             body=request,
         )
 
+    async def _generate_content_stream(
+        self,
+        model: str,
+        request: dict[str, Any],
+    ) -> AsyncGenerator[GeminiGenerationStreamResult, None]:
+        with self._balancer.lease() as lease:
+            async with AsyncExitStack() as stack:
+                response: Response
+                try:
+                    response = await stack.enter_async_context(
+                        lease.endpoint.stream(
+                            method="POST",
+                            url=f"v1beta/models/{model}:streamGenerateContent",
+                            # use server sent events instead of a streamed json array
+                            params={"alt": "sse"},
+                            headers={
+                                "Accept": "text/event-stream",
+                                "Content-Type": "application/json",
+                            },
+                            content=json.dumps(request),
+                        )
+                    )
+
+                except Exception as exc:
+                    lease.eject()
+                    raise GeminiException("Network request failed") from exc
+
+                status: HTTPStatus = HTTPStatus(value=response.status_code)
+                if status.is_success:
+                    lease.update_quota(response.headers.get("x-ratelimit-remaining-requests"))
+
+                elif status.is_client_error:
+                    if status == HTTPStatus.TOO_MANY_REQUESTS:
+                        lease.eject(_retry_after(response))
+
+                    error_body: bytes = await response.aread()
+                    raise GeminiException(
+                        "Gemini request error: %s, %s",
+                        status,
+                        error_body.decode("utf-8"),
+                    )
+
+                else:
+                    lease.eject()
+                    raise GeminiException("Network request failed: %s", response)
+
+                async for event in sse_events(response.aiter_bytes()):
+                    yield _decode_stream_chunk(event)
+
     async def embedding(
         self,
         config: GeminiEmbeddingConfig,
@@ -175,7 +292,7 @@ class GeminiClient(ScopeDependency):
         return result
 
     async def dispose(self) -> None:
-        await self._client.aclose()
+        await gather(*[client.aclose() for client in self._balancer.endpoints])
 
     @overload
     async def _request[Requested: DataModel](
@@ -203,7 +320,7 @@ class GeminiClient(ScopeDependency):
         timeout: float | None = None,
     ) -> Requested: ...
 
-    async def _request[Requested: DataModel](  # noqa: PLR0913, PLR0912
+    async def _request[Requested: DataModel](  # noqa: C901, PLR0913, PLR0912
         self,
         model: type[Requested] | None,
         method: str,
@@ -237,40 +354,69 @@ class GeminiClient(ScopeDependency):
         if body_content:
             request_headers["Content-Type"] = "application/json"
 
-        response: Response
-        try:
-            response = await self._client.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                params=query,
-                content=body_content,
-                follow_redirects=follow_redirects or False,
-                timeout=timeout,
-            )
+        with self._balancer.lease() as lease:
+            response: Response
+            try:
+                response = await lease.endpoint.request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    params=query,
+                    content=body_content,
+                    follow_redirects=follow_redirects or False,
+                    timeout=timeout,
+                )
+
+            except Exception as exc:
+                lease.eject()
+                raise GeminiException("Network request failed") from exc
+
+            status: HTTPStatus = HTTPStatus(value=response.status_code)
+            if status.is_success:
+                lease.update_quota(response.headers.get("x-ratelimit-remaining-requests"))
+                try:
+                    if model := model:
+                        return model.from_json(await response.aread())
+
+                    else:
+                        return json.loads(await response.aread())
+
+                except Exception as exc:
+                    raise GeminiException("Failed to decode Gemini response", response) from exc
+
+            elif status.is_client_error:
+                if status == HTTPStatus.TOO_MANY_REQUESTS:
+                    lease.eject(_retry_after(response))
+
+                error_body: bytes = await response.aread()
+                raise GeminiException(
+                    "Gemini request error: %s, %s",
+                    status,
+                    error_body.decode("utf-8"),
+                )
 
-        except Exception as exc:
-            raise GeminiException("Network request failed") from exc
+            else:
+                lease.eject()
+                raise GeminiException("Network request failed: %s", response)
 
-        status: HTTPStatus = HTTPStatus(value=response.status_code)
-        if status.is_success:
-            try:
-                if model := model:
-                    return model.from_json(await response.aread())
 
-                else:
-                    return json.loads(await response.aread())
+def _decode_stream_chunk(
+    data: bytes,
+    /,
+) -> GeminiGenerationStreamResult:
+    try:
+        return GeminiGenerationStreamResult.from_json(data)
 
-            except Exception as exc:
-                raise GeminiException("Failed to decode Gemini response", response) from exc
-
-        elif status.is_client_error:
-            error_body: bytes = await response.aread()
-            raise GeminiException(
-                "Gemini request error: %s, %s",
-                status,
-                error_body.decode("utf-8"),
-            )
+    except Exception as exc:
+        raise GeminiException("Failed to decode Gemini stream chunk", data) from exc
 
-        else:
-            raise GeminiException("Network request failed: %s", response)
+
+def _retry_after(
+    response: Response,
+    /,
+) -> float | None:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+
+    except ValueError:
+        return None
@@ -6,6 +6,7 @@ from draive.utils import MISSING, Missing
 __all__ = [
     "GeminiConfig",
     "GeminiEmbeddingConfig",
+    "GeminiEndpoint",
 ]
 
 
@@ -23,3 +24,9 @@ class GeminiConfig(DataModel):
 class GeminiEmbeddingConfig(DataModel):
     model: str = "embedding-gecko-001"
     batch_size: int = 128
+
+
+class GeminiEndpoint(DataModel):
+    name: str | None = None
+    endpoint: str
+    api_key: str | None = None
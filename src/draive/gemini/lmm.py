@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from copy import copy
 from typing import Any, Literal, cast, overload
 from uuid import uuid4
@@ -14,10 +14,13 @@ from draive.gemini.models import (
     GeminiFunctionsTool,
     GeminiFunctionToolSpecification,
     GeminiGenerationResult,
+    GeminiGenerationStreamResult,
     GeminiMessage,
     GeminiMessageContent,
     GeminiRequestMessage,
+    GeminiStreamChoice,
     GeminiTextMessageContent,
+    GeminiUsage,
 )
 from draive.instructions import Instruction
 from draive.lmm import LMMToolSelection, ToolSpecification
@@ -26,8 +29,10 @@ from draive.parameters import DataModel
 from draive.scope import ctx
 from draive.types import (
     AudioBase64Content,
+    AudioDataContent,
     AudioURLContent,
     ImageBase64Content,
+    ImageDataContent,
     ImageURLContent,
     LMMCompletion,
     LMMCompletionChunk,
@@ -43,8 +48,10 @@ from draive.types import (
     MultimodalContentElement,
     TextContent,
     VideoBase64Content,
+    VideoDataContent,
     VideoURLContent,
 )
+from draive.utils import identity_cache
 
 __all__ = [
     "gemini_lmm_invocation",
@@ -135,7 +142,7 @@ async def gemini_lmm_invocation(  # noqa: PLR0913
                     config = config.updated(response_format="application/json")
 
         messages: list[GeminiRequestMessage] = [
-            _convert_context_element(element=element) for element in context
+            _convert_context_element(element) for element in context
         ]
 
         if stream:
@@ -176,7 +183,7 @@ def _convert_content_element(  # noqa: PLR0911
                 }
             }
 
-        case ImageBase64Content() as image:
+        case ImageBase64Content() | ImageDataContent() as image:
             return {
                 "inlineData": {
                     "mimeType": image.mime_type or "image",
@@ -192,7 +199,7 @@ def _convert_content_element(  # noqa: PLR0911
                 }
             }
 
-        case AudioBase64Content() as audio:
+        case AudioBase64Content() | AudioDataContent() as audio:
             return {
                 "inlineData": {
                     "mimeType": audio.mime_type or "audio",
@@ -208,7 +215,7 @@ def _convert_content_element(  # noqa: PLR0911
                 }
             }
 
-        case VideoBase64Content() as video:
+        case VideoBase64Content() | VideoDataContent() as video:
             return {
                 "inlineData": {
                     "mimeType": video.mime_type or "video",
@@ -220,8 +227,11 @@ def _convert_content_element(  # noqa: PLR0911
             return {"text": data.as_json()}
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
+    /,
 ) -> GeminiRequestMessage:
     match element:
         case LMMInput() as input:
@@ -346,19 +356,9 @@ async def _generate(  # noqa: PLR0913, C901, PLR0912, PLR0915
     tool_selection: LMMToolSelection,
 ) -> LMMOutput:
     result: GeminiGenerationResult
-    converted_tools: Sequence[GeminiFunctionToolSpecification] = []
-    for tool in tools or []:
-        tool_function: GeminiFunctionToolSpecification = cast(
-            # those models are the same, can safely cast
-            GeminiFunctionToolSpecification,
-            tool["function"],
-        )
-        # AIStudio api requires to delete properties if those are empty...
-        if "parameters" in tool_function and not tool_function["parameters"]["properties"]:
-            tool_function = copy(tool_function)
-            del tool_function["parameters"]
-
-        converted_tools.append(tool_function)
+    converted_tools: list[GeminiFunctionToolSpecification] = [
+        _convert_tool(tool) for tool in tools or []
+    ]
 
     prefill: str = ""
     match messages[-1]:
@@ -408,21 +408,11 @@ async def _generate(  # noqa: PLR0913, C901, PLR0912, PLR0915
 
         case tool:
             assert tool in (tools or []), "Can't suggest a tool without using it"  # nosec: B101
-            tool_function: GeminiFunctionToolSpecification = cast(
-                # those models are the same, can safely cast
-                GeminiFunctionToolSpecification,
-                tool["function"],
-            )
-            # AIStudio api requires to delete properties if those are empty...
-            if "parameters" in tool_function and not tool_function["parameters"]["properties"]:
-                tool_function = copy(tool_function)
-                del tool_function["parameters"]
-
             result = await client.generate(
                 config=config,
                 instruction=instruction,
                 messages=messages,
-                tools=[GeminiFunctionsTool(functionDeclarations=[tool_function])],
+                tools=[GeminiFunctionsTool(functionDeclarations=[_convert_tool(tool)])],
                 tool_calling_mode="ANY",
             )
 
@@ -514,7 +504,7 @@ async def _generate(  # noqa: PLR0913, C901, PLR0912, PLR0915
         raise GeminiException("Invalid Gemini completion", result)
 
 
-async def _generation_stream(  # noqa: PLR0913
+async def _generation_stream(  # noqa: PLR0913, C901, PLR0912, PLR0915
     *,
     client: GeminiClient,
     config: GeminiConfig,
@@ -523,19 +513,156 @@ async def _generation_stream(  # noqa: PLR0913
     tools: Sequence[ToolSpecification] | None,
     tool_selection: LMMToolSelection,
 ) -> AsyncGenerator[LMMOutputStreamChunk, None]:
-    ctx.log_debug("Gemini streaming api is not supported yet, using regular response...")
-    output: LMMOutput = await _generate(
-        client=client,
+    converted_tools: list[GeminiFunctionsTool]
+    tool_calling_mode: Literal["AUTO", "ANY", "NONE"]
+    match tool_selection:
+        case "auto":
+            converted_tools = [
+                GeminiFunctionsTool(
+                    functionDeclarations=[_convert_tool(tool) for tool in tools or []],
+                )
+            ]
+            tool_calling_mode = "AUTO"
+
+        case "none":
+            converted_tools = []
+            tool_calling_mode = "NONE"
+
+        case "required":
+            converted_tools = [
+                GeminiFunctionsTool(
+                    functionDeclarations=[_convert_tool(tool) for tool in tools or []],
+                )
+            ]
+            tool_calling_mode = "ANY"
+
+        case tool:
+            assert tool in (tools or []), "Can't suggest a tool without using it"  # nosec: B101
+            converted_tools = [GeminiFunctionsTool(functionDeclarations=[_convert_tool(tool)])]
+            tool_calling_mode = "ANY"
+
+    prefill: str = ""
+    match messages[-1]:
+        case {"role": "model", "parts": content_parts}:
+            if config.response_format == "application/json":
+                del messages[-1]  # for json mode ignore prefill
+
+            else:
+                for part in content_parts:
+                    match part:  # currently supporting only text prefills
+                        case {"text": str() as text}:
+                            prefill += text
+
+                        case _:
+                            continue
+
+        case _:
+            pass
+
+    result_stream: AsyncIterator[GeminiGenerationStreamResult] = await client.generate(
         config=config,
         instruction=instruction,
         messages=messages,
-        tools=tools,
-        tool_selection=tool_selection,
+        tools=converted_tools,
+        tool_calling_mode=tool_calling_mode,
+        stream=True,
     )
 
-    match output:
-        case LMMCompletion() as completion:
-            yield LMMCompletionChunk.of(completion.content)
+    if prefill:  # emit prefill first to produce the same content as the regular response
+        yield LMMCompletionChunk.of(prefill)
 
-        case other:
-            yield other
+    accumulated_completion: str = prefill
+    tool_calls: list[GeminiFunctionCallMessageContent] = []
+    finish_reason: str | None = None
+    usage: GeminiUsage | None = None
+    async for chunk in result_stream:
+        if chunk.usage:  # usage is cumulative, use the latest one
+            usage = chunk.usage
+
+        if not chunk.choices:
+            continue  # usage only chunk
+
+        # we are always requesting single result - no need to take care of indices
+        choice: GeminiStreamChoice = chunk.choices[0]
+        for part in choice.content.content if choice.content else []:
+            match part:
+                case GeminiTextMessageContent() as text:
+                    if not text.text:
+                        continue  # skip empty parts
+
+                    accumulated_completion += text.text
+                    yield LMMCompletionChunk.of(text.text)
+
+                case GeminiFunctionCallMessageContent() as call:
+                    # function calls are not split between chunks
+                    tool_calls.append(call)
+
+                case GeminiDataReferenceMessageContent() | GeminiDataMessageContent() as data:
+                    yield LMMCompletionChunk.of(_convert_content_part(data))
+
+                case other:
+                    raise GeminiException("Invalid Gemini completion part", other)
+
+        if choice.finish_reason:
+            finish_reason = choice.finish_reason
+
+    if usage:
+        ctx.record(
+            TokenUsage.for_model(
+                config.model,
+                input_tokens=usage.prompt_tokens,
+                output_tokens=usage.generated_tokens,
+            ),
+        )
+
+    match finish_reason:
+        case "STOP":
+            pass
+
+        case "MAX_TOKENS":
+            raise GeminiException("Gemini response finish caused by token limit")
+
+        case "SAFETY":
+            raise GeminiException("Gemini response finish caused by safety reason")
+
+        case "RECITATION":
+            raise GeminiException("Gemini response finish caused by recitation reason")
+
+        case "OTHER":
+            raise GeminiException("Gemini response finish caused by unknown reason")
+
+        case _:
+            raise GeminiException("Incomplete Gemini completion stream")
+
+    if tool_calls and tools:
+        ctx.record(ResultTrace.of(tool_calls))
+        yield LMMToolRequests(
+            requests=[
+                LMMToolRequest(
+                    identifier=uuid4().hex,
+                    tool=call.function_call.name,
+                    arguments=call.function_call.arguments,
+                )
+                for call in tool_calls
+            ]
+        )
+
+    else:
+        ctx.record(ResultTrace.of(accumulated_completion))
+
+
+def _convert_tool(
+    tool: ToolSpecification,
+    /,
+) -> GeminiFunctionToolSpecification:
+    tool_function: GeminiFunctionToolSpecification = cast(
+        # those models are the same, can safely cast
+        GeminiFunctionToolSpecification,
+        tool["function"],
+    )
+    # AIStudio api requires to delete properties if those are empty...
+    if "parameters" in tool_function and not tool_function["parameters"]["properties"]:
+        tool_function = copy(tool_function)
+        del tool_function["parameters"]
+
+    return tool_function
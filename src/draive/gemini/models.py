@@ -4,6 +4,7 @@ from draive.parameters import DataModel, Field
 
 __all__ = [
     "GeminiGenerationResult",
+    "GeminiGenerationStreamResult",
     "GeminiMessage",
     "GeminiTextMessageContent",
     "GeminiFunctionCallMessageContent",
@@ -113,3 +114,25 @@ class GeminiChoice(DataModel):
 class GeminiGenerationResult(DataModel):
     choices: list[GeminiChoice] = Field(aliased="candidates")
     usage: GeminiUsage = Field(aliased="usageMetadata")
+
+
+class GeminiStreamChoice(DataModel):
+    content: GeminiMessage | None = None
+    finish_reason: (
+        Literal[
+            "STOP",
+            "MAX_TOKENS",
+            "SAFETY",
+            "RECITATION",
+            "OTHER",
+        ]
+        | None
+    ) = Field(aliased="finishReason", default=None)
+
+
+class GeminiGenerationStreamResult(DataModel):
+    choices: list[GeminiStreamChoice] = Field(
+        aliased="candidates",
+        default_factory=list[GeminiStreamChoice],
+    )
+    usage: GeminiUsage | None = Field(aliased="usageMetadata", default=None)
@@ -1,13 +1,15 @@
+from collections.abc import Sequence
 from pathlib import Path
 from typing import Any
 
 from draive.gemini.config import GeminiConfig
 from draive.scope import ctx
-from draive.sentencepiece import sentencepiece_tokenize_text
+from draive.sentencepiece import sentencepiece_tokenize_text, sentencepiece_tokenize_texts
 from draive.utils import cache
 
 __all__ = [
     "gemini_tokenize_text",
+    "gemini_tokenize_texts",
 ]
 
 
@@ -22,6 +24,17 @@ def gemini_tokenize_text(
     )
 
 
+def gemini_tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    return sentencepiece_tokenize_texts(
+        texts=texts,
+        model_path=_model_path(ctx.state(GeminiConfig).model),
+        **extra,
+    )
+
+
 @cache(limit=2)
 def _model_path(model_name: str) -> str:
     model_file: str = _mapping.get(model_name, "gemini_tokenizer.model")
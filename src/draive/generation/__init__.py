@@ -1,9 +1,11 @@
 from draive.generation.image import ImageGeneration, ImageGenerator, generate_image
 from draive.generation.model import (
+    JSONRepairTrace,
     ModelGeneration,
     ModelGenerator,
     ModelGeneratorDecoder,
     generate_model,
+    repairing_json_decoder,
 )
 from draive.generation.text import TextGeneration, TextGenerator, generate_text
 
@@ -13,9 +15,11 @@ __all__ = [
     "generate_text",
     "ImageGeneration",
     "ImageGenerator",
+    "JSONRepairTrace",
     "ModelGeneration",
     "ModelGenerator",
     "ModelGeneratorDecoder",
+    "repairing_json_decoder",
     "TextGeneration",
     "TextGenerator",
 ]
@@ -1,10 +1,13 @@
 from draive.generation.model.call import generate_model
 from draive.generation.model.generator import ModelGenerator, ModelGeneratorDecoder
+from draive.generation.model.repair import JSONRepairTrace, repairing_json_decoder
 from draive.generation.model.state import ModelGeneration
 
 __all__ = [
     "generate_model",
+    "JSONRepairTrace",
     "ModelGeneration",
     "ModelGenerator",
     "ModelGeneratorDecoder",
+    "repairing_json_decoder",
 ]
@@ -1,5 +1,5 @@
-from collections.abc import Iterable, Sequence
-from typing import Any, Literal
+from collections.abc import AsyncIterable, Iterable, Sequence
+from typing import Any, Literal, overload
 
 from draive.generation.model.generator import ModelGeneratorDecoder
 from draive.generation.model.state import ModelGeneration
@@ -14,6 +14,57 @@ __all__ = [
 ]
 
 
+@overload
+async def generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: Literal[False] = False,
+    **extra: Any,
+) -> Generated: ...
+
+
+@overload
+async def generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: Literal[True],
+    **extra: Any,
+) -> AsyncIterable[Generated | dict[str, Any]]: ...
+
+
+@overload
+async def generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: bool,
+    **extra: Any,
+) -> AsyncIterable[Generated | dict[str, Any]] | Generated: ...
+
+
 async def generate_model[Generated: DataModel](  # noqa: PLR0913
     generated: type[Generated],
     /,
@@ -25,15 +76,38 @@ async def generate_model[Generated: DataModel](  # noqa: PLR0913
     examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
     | None = None,
     decoder: ModelGeneratorDecoder | None = None,
+    stream: bool = False,
     **extra: Any,
-) -> Generated:
-    return await ctx.state(ModelGeneration).generate(
-        generated,
-        instruction=instruction,
-        input=input,
-        schema_injection=schema_injection,
-        tools=tools,
-        examples=examples,
-        decoder=decoder,
-        **extra,
-    )
+) -> AsyncIterable[Generated | dict[str, Any]] | Generated:
+    """\
+    Generate an instance of the model using ModelGeneration from the current scope.
+
+    When streaming, partial objects are yielded as dicts while the JSON \
+    is generated and the validated model is yielded as the last element.
+    """
+
+    if stream:
+        return await ctx.state(ModelGeneration).generate(
+            generated,
+            instruction=instruction,
+            input=input,
+            schema_injection=schema_injection,
+            tools=tools,
+            examples=examples,
+            decoder=decoder,
+            stream=True,
+            **extra,
+        )
+
+    else:
+        # generators which do not support streaming do not have to accept it
+        return await ctx.state(ModelGeneration).generate(  # pyright: ignore[reportUnknownVariableType]
+            generated,
+            instruction=instruction,
+            input=input,
+            schema_injection=schema_injection,
+            tools=tools,
+            examples=examples,
+            decoder=decoder,
+            **extra,
+        )
@@ -1,5 +1,5 @@
-from collections.abc import Iterable, Sequence
-from typing import Any, Literal, Protocol, runtime_checkable
+from collections.abc import AsyncIterable, Iterable, Sequence
+from typing import Any, Literal, Protocol, overload, runtime_checkable
 
 from draive.instructions import Instruction
 from draive.lmm import AnyTool, Toolbox
@@ -22,6 +22,57 @@ class ModelGeneratorDecoder(Protocol):
 
 @runtime_checkable
 class ModelGenerator(Protocol):
+    @overload
+    async def __call__[Generated: DataModel](
+        self,
+        generated: type[Generated],
+        /,
+        *,
+        instruction: Instruction | str,
+        input: MultimodalContent | MultimodalContentConvertible,
+        schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+        tools: Toolbox | Sequence[AnyTool] | None = None,
+        examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+        | None = None,
+        decoder: ModelGeneratorDecoder | None = None,
+        stream: Literal[False] = False,
+        **extra: Any,
+    ) -> Generated: ...
+
+    @overload
+    async def __call__[Generated: DataModel](
+        self,
+        generated: type[Generated],
+        /,
+        *,
+        instruction: Instruction | str,
+        input: MultimodalContent | MultimodalContentConvertible,
+        schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+        tools: Toolbox | Sequence[AnyTool] | None = None,
+        examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+        | None = None,
+        decoder: ModelGeneratorDecoder | None = None,
+        stream: Literal[True],
+        **extra: Any,
+    ) -> AsyncIterable[Generated | dict[str, Any]]: ...
+
+    @overload
+    async def __call__[Generated: DataModel](
+        self,
+        generated: type[Generated],
+        /,
+        *,
+        instruction: Instruction | str,
+        input: MultimodalContent | MultimodalContentConvertible,
+        schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+        tools: Toolbox | Sequence[AnyTool] | None = None,
+        examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+        | None = None,
+        decoder: ModelGeneratorDecoder | None = None,
+        stream: bool,
+        **extra: Any,
+    ) -> AsyncIterable[Generated | dict[str, Any]] | Generated: ...
+
     async def __call__[Generated: DataModel](  # noqa: PLR0913
         self,
         generated: type[Generated],
@@ -34,5 +85,6 @@ class ModelGenerator(Protocol):
         examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
         | None = None,
         decoder: ModelGeneratorDecoder | None = None,
+        stream: bool = False,
         **extra: Any,
-    ) -> Generated: ...
+    ) -> AsyncIterable[Generated | dict[str, Any]] | Generated: ...
@@ -1,13 +1,15 @@
-from collections.abc import Iterable, Sequence
-from typing import Any, Literal
+from collections.abc import AsyncGenerator, AsyncIterable, Iterable, Sequence
+from typing import Any, Literal, overload
 
 from draive.generation.model.generator import ModelGeneratorDecoder
+from draive.generation.model.partial import PartialJSONParser
 from draive.instructions import Instruction
 from draive.lmm import AnyTool, Toolbox, lmm_invocation
 from draive.parameters import DataModel
 from draive.scope import ctx
 from draive.types import (
     LMMCompletion,
+    LMMCompletionChunk,
     LMMContextElement,
     LMMInput,
     LMMToolRequests,
@@ -21,7 +23,58 @@ __all__: list[str] = [
 ]
 
 
-async def lmm_generate_model[Generated: DataModel](  # noqa: PLR0913, C901, PLR0912
+@overload
+async def lmm_generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: Literal[False] = False,
+    **extra: Any,
+) -> Generated: ...
+
+
+@overload
+async def lmm_generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: Literal[True],
+    **extra: Any,
+) -> AsyncIterable[Generated | dict[str, Any]]: ...
+
+
+@overload
+async def lmm_generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction | str,
+    input: MultimodalContent | MultimodalContentConvertible,
+    schema_injection: Literal["auto", "full", "simplified", "skip"] = "auto",
+    tools: Toolbox | Sequence[AnyTool] | None = None,
+    examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
+    | None = None,
+    decoder: ModelGeneratorDecoder | None = None,
+    stream: bool,
+    **extra: Any,
+) -> AsyncIterable[Generated | dict[str, Any]] | Generated: ...
+
+
+async def lmm_generate_model[Generated: DataModel](  # noqa: PLR0913, C901
     generated: type[Generated],
     /,
     *,
@@ -32,8 +85,9 @@ async def lmm_generate_model[Generated: DataModel](  # noqa: PLR0913, C901, PLR0
     examples: Iterable[tuple[MultimodalContent | MultimodalContentConvertible, Generated]]
     | None = None,
     decoder: ModelGeneratorDecoder | None = None,
+    stream: bool = False,
     **extra: Any,
-) -> Generated:
+) -> AsyncIterable[Generated | dict[str, Any]] | Generated:
     with ctx.nested("lmm_generate_model"):
         toolbox: Toolbox
         match tools:
@@ -92,24 +146,113 @@ async def lmm_generate_model[Generated: DataModel](  # noqa: PLR0913, C901, PLR0
             LMMCompletion.of("{"),  # prefill with json opening
         ]
 
-        recursion_level: int = 0
-        while recursion_level <= toolbox.recursion_limit:
-            match await lmm_invocation(
+        if stream:
+            return ctx.stream(
+                _lmm_generate_model_stream(
+                    generated,
+                    instruction=extended_instruction,
+                    context=context,
+                    toolbox=toolbox,
+                    decoder=decoder,
+                    **extra,
+                ),
+            )
+
+        else:
+            return await _lmm_generate_model(
+                generated,
                 instruction=extended_instruction,
                 context=context,
-                tools=toolbox.available_tools(),
-                tool_selection=toolbox.tool_selection(recursion_level=recursion_level),
-                output="json",
-                stream=False,
+                toolbox=toolbox,
+                decoder=decoder,
                 **extra,
-            ):
-                case LMMCompletion() as completion:
-                    ctx.log_debug("Received model generation result")
-                    if decoder := decoder:
-                        return generated.from_dict(decoder(completion.content))
+            )
 
-                    else:
-                        return generated.from_json(completion.content.as_string())
+
+async def _lmm_generate_model[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction,
+    context: list[LMMContextElement],
+    toolbox: Toolbox,
+    decoder: ModelGeneratorDecoder | None,
+    **extra: Any,
+) -> Generated:
+    recursion_level: int = 0
+    while recursion_level <= toolbox.recursion_limit:
+        match await lmm_invocation(
+            instruction=instruction,
+            context=context,
+            tools=toolbox.available_tools(),
+            tool_selection=toolbox.tool_selection(recursion_level=recursion_level),
+            output="json",
+            stream=False,
+            **extra,
+        ):
+            case LMMCompletion() as completion:
+                ctx.log_debug("Received model generation result")
+                if decoder := decoder:
+                    return generated.from_dict(decoder(completion.content))
+
+                else:
+                    return generated.from_json(completion.content.as_string())
+
+            case LMMToolRequests() as tool_requests:
+                ctx.log_debug("Received model generation tool calls")
+                context.append(tool_requests)
+                responses: list[LMMToolResponse] = await toolbox.respond(tool_requests)
+
+                if direct_responses := [response for response in responses if response.direct]:
+                    return _direct_result(
+                        generated,
+                        direct_responses,
+                        decoder=decoder,
+                    )
+
+                else:
+                    context.extend(responses)
+
+        recursion_level += 1  # continue with next recursion level
+
+    raise RuntimeError("LMM exceeded limit of recursive calls")
+
+
+async def _lmm_generate_model_stream[Generated: DataModel](
+    generated: type[Generated],
+    /,
+    *,
+    instruction: Instruction,
+    context: list[LMMContextElement],
+    toolbox: Toolbox,
+    decoder: ModelGeneratorDecoder | None,
+    **extra: Any,
+) -> AsyncGenerator[Generated | dict[str, Any], None]:
+    recursion_level: int = 0
+    while recursion_level <= toolbox.recursion_limit:
+        parser: PartialJSONParser = PartialJSONParser()
+        content: MultimodalContent = MultimodalContent.of()  # empty
+        require_callback: bool = False
+        async for part in await lmm_invocation(
+            instruction=instruction,
+            context=context,
+            tools=toolbox.available_tools(),
+            tool_selection=toolbox.tool_selection(recursion_level=recursion_level),
+            output="json",
+            stream=True,
+            **extra,
+        ):
+            match part:
+                case LMMCompletionChunk() as chunk:
+                    ctx.log_debug("Received model generation result chunk")
+                    content = content.extending(
+                        chunk.content,
+                        merge_text=True,
+                    )
+                    if partial := parser.feed(chunk.content.as_string()):
+                        yield partial
+
+                    # keep parsing chunks
 
                 case LMMToolRequests() as tool_requests:
                     ctx.log_debug("Received model generation tool calls")
@@ -117,32 +260,58 @@ async def lmm_generate_model[Generated: DataModel](  # noqa: PLR0913, C901, PLR0
                     responses: list[LMMToolResponse] = await toolbox.respond(tool_requests)
 
                     if direct_responses := [response for response in responses if response.direct]:
-                        for response in direct_responses:
-                            if isinstance(response, generated):
-                                # return first response matching requested model
-                                return response
+                        yield _direct_result(
+                            generated,
+                            direct_responses,
+                            decoder=decoder,
+                        )
+                        return
 
-                            else:
-                                continue
+                    else:
+                        context.extend(responses)
+                        require_callback = True  # request lmm again with tool results
 
-                        direct_responses_content: MultimodalContent = MultimodalContent.of(
-                            *[response.content for response in direct_responses]
-                        )
+        if not require_callback:
+            # validate the final result using the whole content
+            if decoder := decoder:
+                yield generated.from_dict(decoder(content))
 
-                        # TODO: check if this join makes any sense,
-                        # perhaps we could merge json objects instead?
-                        if decoder := decoder:
-                            return generated.from_dict(decoder(direct_responses_content))
+            else:
+                yield generated.from_json(content.as_string())
 
-                        else:
-                            return generated.from_json(direct_responses_content.as_string())
+            return
 
-                    else:
-                        context.extend(responses)
+        recursion_level += 1  # continue with next recursion level
+
+    raise RuntimeError("LMM exceeded limit of recursive calls")
+
+
+def _direct_result[Generated: DataModel](
+    generated: type[Generated],
+    responses: list[LMMToolResponse],
+    /,
+    *,
+    decoder: ModelGeneratorDecoder | None,
+) -> Generated:
+    for response in responses:
+        if isinstance(response, generated):
+            # return first response matching requested model
+            return response
+
+        else:
+            continue
+
+    responses_content: MultimodalContent = MultimodalContent.of(
+        *[response.content for response in responses]
+    )
 
-            recursion_level += 1  # continue with next recursion level
+    # TODO: check if this join makes any sense,
+    # perhaps we could merge json objects instead?
+    if decoder := decoder:
+        return generated.from_dict(decoder(responses_content))
 
-        raise RuntimeError("LMM exceeded limit of recursive calls")
+    else:
+        return generated.from_json(responses_content.as_string())
 
 
 DEFAULT_INSTRUCTION_EXTENSION: str = """\
@@ -0,0 +1,293 @@
+import json
+import re
+from re import Match, Pattern
+from typing import Any, Final, final
+
+__all__ = [
+    "PartialJSONParser",
+]
+
+# characters changing the structure outside of strings
+_STRUCTURE: Pattern[str] = re.compile(r'["{}\[\],]')
+# characters ending or escaping within strings
+_STRING: Pattern[str] = re.compile(r'["\\]')
+# elements of open containers which can be copied for partial results per received character
+_COPY_RATIO: Final[int] = 4
+
+
+@final
+class _Frame:
+    __slots__ = (
+        "completed",
+        "container",
+        "key",
+        "start",
+        "visible",
+    )
+
+    def __init__(
+        self,
+        container: dict[str, Any] | list[Any],
+        /,
+        *,
+        key: str | None,
+        start: int,
+    ) -> None:
+        self.container: dict[str, Any] | list[Any] = container
+        # key of the container within the parent object, None within arrays
+        self.key: str | None = key
+        # start of the current member text
+        self.start: int = start
+        # current member was already included, i.e. nested container
+        self.completed: bool = False
+        # container is included in partial results after its first member or when closed
+        self.visible: bool = False
+
+
+@final
+class PartialJSONParser:
+    """\
+    Incremental parser of a JSON object received in chunks. \
+    Only structural characters are inspected when chunks arrive, each member of \
+    arrays and objects up to the depth limit is decoded once when completed. \
+    Incomplete strings, numbers and keys are not included in partial results. \
+    Partial results of large containers are throttled to keep the cost linear.
+    """
+
+    def __init__(
+        self,
+        *,
+        depth: int = 2,
+    ) -> None:
+        assert depth > 0  # nosec: B101
+        self._depth: int = depth
+        # text which was not consumed yet, starting with the current member
+        self._text: str = ""
+        self._position: int = 0
+        self._started: bool = False
+        self._in_string: bool = False
+        # closing characters of currently open arrays and objects
+        self._closing: list[str] = []
+        # currently open arrays and objects up to the depth limit
+        self._frames: list[_Frame] = []
+        self._root: dict[str, Any] = {}
+        self._changed: bool = False
+        self._failed: bool = False
+        # received characters since the last partial result
+        self._received: int = 0
+        # elements copied for the last partial result
+        self._copied: int = 0
+
+    def feed(
+        self,
+        chunk: str,
+        /,
+    ) -> dict[str, Any] | None:
+        """\
+        Consume next chunk of the text.
+
+        Returns
+        -------
+        dict[str, Any] | None
+            partial object if any value was completed within the chunk, None otherwise
+        """
+
+        if self._failed:
+            return None  # skip partial results after invalid member
+
+        self._text += chunk
+        self._received += len(chunk)
+        try:
+            self._scan()
+
+        except ValueError:
+            self._failed = True
+            return None
+
+        if not self._changed:
+            return None  # nothing new was completed
+
+        if self._frames and self._received * _COPY_RATIO < self._copied:
+            return None  # wait for more text before copying large containers again
+
+        self._changed = False
+        self._received = 0
+        return self._snapshot()
+
+    def _snapshot(self) -> dict[str, Any]:
+        # completed members are not changed anymore, copy only open containers
+        snapshot: dict[str, Any] = dict(self._root)
+        self._copied = len(snapshot)
+        parent: dict[str, Any] | list[Any] = snapshot
+        for frame in self._frames[1:]:
+            nested: dict[str, Any] | list[Any] = (
+                dict(frame.container)
+                if isinstance(frame.container, dict)
+                else list(frame.container)
+            )
+            self._copied += len(nested)
+            if isinstance(parent, dict):
+                assert frame.key is not None  # nosec: B101
+                parent[frame.key] = nested
+
+            else:
+                parent[-1] = nested
+
+            parent = nested
+
+        return snapshot
+
+    def _show(self) -> None:
+        self._changed = True
+        for frame in reversed(self._frames):
+            if frame.visible:
+                break  # outer containers are already visible
+
+            frame.visible = True
+
+    def _complete(
+        self,
+        frame: _Frame,
+        member: str,
+        /,
+    ) -> None:
+        if frame.completed or not member.strip():
+            return  # already included or nothing to include i.e. empty container
+
+        if isinstance(frame.container, dict):
+            frame.container.update(json.loads(f"{{{member}}}"))
+
+        else:
+            frame.container.append(json.loads(member))
+
+        frame.completed = True
+        self._show()
+
+    def _open(
+        self,
+        container: dict[str, Any] | list[Any],
+        /,
+        *,
+        start: int,
+        end: int,
+    ) -> None:
+        parent: _Frame = self._frames[-1]
+        key: str | None = None
+        if isinstance(parent.container, dict):
+            # decode the key using the member text preceding the container
+            member: dict[str, Any] = json.loads(f"{{{self._text[parent.start : start]}null}}")
+            key = next(iter(member))
+            parent.container[key] = container
+
+        else:
+            parent.container.append(container)
+
+        parent.completed = True
+        self._frames.append(
+            _Frame(
+                container,
+                key=key,
+                start=end,
+            )
+        )
+
+    def _scan(self) -> None:  # noqa: C901, PLR0912, PLR0915
+        text: str = self._text
+        position: int = self._position
+        if not self._started:
+            # skip everything until the object opening, i.e. markdown code fences
+            start: int = text.find("{", position)
+            if start < 0:
+                self._text = ""
+                self._position = 0
+                return
+
+            self._started = True
+            self._closing.append("}")
+            self._frames.append(
+                _Frame(
+                    self._root,
+                    key=None,
+                    start=start + 1,
+                )
+            )
+            position = start + 1
+
+        depth: int = self._depth
+        closing: list[str] = self._closing
+        frames: list[_Frame] = self._frames
+        in_string: bool = self._in_string
+        while closing:
+            if in_string:
+                string_match: Match[str] | None = _STRING.search(text, position)
+                if string_match is None:
+                    position = len(text)
+                    break
+
+                if string_match.group() == "\\":
+                    if string_match.end() >= len(text):
+                        # escaped character is in the next chunk, scan the escape again
+                        position = string_match.start()
+                        break
+
+                    position = string_match.end() + 1
+                    continue
+
+                in_string = False
+                position = string_match.end()
+                continue
+
+            structure_match: Match[str] | None = _STRUCTURE.search(text, position)
+            if structure_match is None:
+                position = len(text)
+                break
+
+            position = structure_match.end()
+            match structure_match.group():
+                case '"':
+                    in_string = True
+
+                case "{":
+                    closing.append("}")
+                    if len(closing) <= depth:
+                        self._open({}, start=position - 1, end=position)
+
+                case "[":
+                    closing.append("]")
+                    if len(closing) <= depth:
+                        self._open([], start=position - 1, end=position)
+
+                case "}" | "]":
+                    closing.pop()
+                    if len(closing) < depth:
+                        # container with its own frame was completed
+                        frame: _Frame = frames[-1]
+                        self._complete(frame, text[frame.start : position - 1])
+                        if not frame.visible:
+                            self._show()  # include empty container
+
+                        frames.pop()
+
+                    elif len(closing) == depth:
+                        # container nested deeper than the limit was completed
+                        self._complete(frames[-1], text[frames[-1].start : position])
+
+                case _:  # ","
+                    if len(closing) <= depth:
+                        # preceding value was completed
+                        frame = frames[-1]
+                        self._complete(frame, text[frame.start : position - 1])
+                        frame.start = position
+                        frame.completed = False
+
+        # drop consumed text, keeping only the current member if it was not included yet
+        consumed: int = position
+        if frames and not frames[-1].completed:
+            consumed = frames[-1].start
+
+        for frame in frames:
+            frame.start -= consumed
+
+        self._text = text[consumed:]
+        self._position = position - consumed
+        self._in_string = in_string
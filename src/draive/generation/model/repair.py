@@ -0,0 +1,292 @@
+import json
+import re
+from re import Pattern
+from typing import Any, Final, Self, final
+
+from draive.parameters import DataModel
+from draive.scope import ctx
+from draive.types import MultimodalContent
+
+__all__ = [
+    "JSONRepairTrace",
+    "repairing_json_decoder",
+]
+
+
+class JSONRepairTrace(DataModel):
+    repairs: int = 0
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            repairs=self.repairs + other.repairs,
+        )
+
+
+def repairing_json_decoder(
+    generated: MultimodalContent,
+) -> dict[str, Any]:
+    """\
+    Decode JSON object from the generated content, repairing common defects locally \
+    instead of generating it again. Fixes trailing commas, missing opening or closing \
+    braces, unquoted keys, missing commas or colons and output truncated within \
+    arrays or objects, dropping keys and values cut off at the end of the text. \
+    Text around the object, i.e. code fences, is skipped. \
+    Applied repairs are recorded within metrics using JSONRepairTrace.
+    Can be used as the decoder of generate_model.
+
+    Parameters
+    ----------
+    generated: MultimodalContent
+        content generated by the model
+
+    Returns
+    -------
+    dict[str, Any]
+        decoded object
+
+    Raises
+    ------
+    ValueError
+        when the content can't be decoded even after repairing it
+    """
+
+    text: str = generated.as_string()
+    decoded: Any
+    try:
+        decoded = json.loads(text)
+
+    except ValueError as exc:
+        try:
+            decoded = json.loads(
+                _repaired(text),
+                strict=False,  # allow control characters within strings
+            )
+
+        except ValueError:
+            raise ValueError(f"Failed to repair generated json:\n{text}") from exc
+
+        ctx.log_warning("Repaired malformed generated json")
+        ctx.record(JSONRepairTrace(repairs=1))
+
+    if isinstance(decoded, dict):
+        return decoded  # pyright: ignore[reportUnknownVariableType]
+
+    else:
+        raise ValueError(f"Generated json is not an object:\n{text}")
+
+
+# object without its opening brace, i.e. when the "{" prefill was not included
+_MISSING_OPENING: Pattern[str] = re.compile(r'\s*"[^"\n]*"\s*:')
+_TOKEN: Pattern[str] = re.compile(
+    # string, unterminated only at the end of the text, possibly within an escape sequence
+    r'(?P<string>"(?:[^"\\]|\\.)*(?:(?P<closed>")|\\?\Z))'
+    r"|(?P<structure>[{}\[\],:])"
+    r"|(?P<number>-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?)"
+    r"|(?P<word>[A-Za-z_$][\w$]*)"
+    r"|(?P<other>\S)",
+    re.DOTALL,
+)
+_LITERALS: Final[dict[str, str]] = {
+    "true": "true",
+    "false": "false",
+    "null": "null",
+    "True": "true",
+    "False": "false",
+    "None": "null",
+}
+
+_KEY: Final[int] = 0
+_COLON: Final[int] = 1
+_VALUE: Final[int] = 2
+_COMMA: Final[int] = 3
+
+
+@final
+class _Container:
+    __slots__ = (
+        "closing",
+        "expecting",
+        "opening",
+        "safe",
+    )
+
+    def __init__(
+        self,
+        closing: str,
+        /,
+        *,
+        opening: int,
+    ) -> None:
+        self.closing: str = closing
+        self.expecting: int = _KEY if closing == "}" else _VALUE
+        # end of the output right after the opening bracket
+        self.opening: int = opening
+        # end of the output right after the last complete member
+        self.safe: int = opening
+
+    def cut(
+        self,
+        output: list[str],
+        /,
+    ) -> None:
+        # drop the incomplete member or the trailing comma
+        del output[self.safe :]
+        if self.safe != self.opening:
+            self.expecting = _COMMA
+
+        elif self.closing == "}":
+            self.expecting = _KEY
+
+        else:
+            self.expecting = _VALUE
+
+
+def _close(
+    stack: list[_Container],
+    output: list[str],
+    /,
+) -> None:
+    container: _Container = stack.pop()
+    if container.expecting != _COMMA:
+        container.cut(output)
+
+    output.append(container.closing)
+    if stack:
+        _completed(stack[-1], output)
+
+
+def _completed(
+    container: _Container,
+    output: list[str],
+    /,
+) -> None:
+    container.expecting = _COMMA
+    container.safe = len(output)
+
+
+def _repaired(  # noqa: C901, PLR0912, PLR0915
+    text: str,
+    /,
+) -> str:
+    output: list[str] = []
+    stack: list[_Container] = []
+    start: int
+    if _MISSING_OPENING.match(text):
+        output.append("{")
+        stack.append(_Container("}", opening=1))
+        start = 0
+
+    else:
+        start = text.find("{")
+        if start < 0:
+            raise ValueError("Missing json object")
+
+    end: int = len(text)
+    for token_match in _TOKEN.finditer(text, start):
+        token: str = token_match.group()
+        if not stack:
+            if output:
+                break  # skip everything after the object
+
+            # the first token is always the object opening
+            output.append(token)
+            stack.append(_Container("}", opening=1))
+            continue
+
+        container: _Container = stack[-1]
+        char: str = token[0]
+        match char:
+            case "}" | "]":
+                if char != container.closing:
+                    if not any(element.closing == char for element in stack):
+                        continue  # skip unexpected closing
+
+                    # close nested containers which were left open
+                    while stack[-1].closing != char:
+                        _close(stack, output)
+
+                _close(stack, output)
+
+            case ",":
+                if container.expecting in (_COLON, _VALUE):
+                    container.cut(output)  # drop member without a value
+
+                if container.expecting == _COMMA:
+                    output.append(",")
+                    container.expecting = _KEY if container.closing == "}" else _VALUE
+
+                # else skip repeated comma
+
+            case ":":
+                if container.expecting == _COLON:
+                    output.append(":")
+                    container.expecting = _VALUE
+
+                # else skip unexpected colon
+
+            case _:
+                value: str
+                match token_match.lastgroup:
+                    case "string":
+                        if token_match.group("closed"):
+                            value = token
+
+                        else:
+                            continue  # skip truncated key or value
+
+                    case "structure":  # "{" or "["
+                        value = token
+
+                    case "number":
+                        if token_match.end() == end:
+                            continue  # skip number which might be truncated
+
+                        value = token
+
+                    case "word":
+                        if literal := _LITERALS.get(token):
+                            value = literal
+
+                        elif token_match.end() == end and container.expecting != _KEY:
+                            continue  # skip truncated literal
+
+                        else:
+                            value = json.dumps(token)
+
+                    case _:
+                        continue  # skip unexpected characters
+
+                if container.expecting == _COMMA:
+                    # add missing comma
+                    output.append(",")
+                    container.expecting = _KEY if container.closing == "}" else _VALUE
+
+                if container.expecting == _KEY:
+                    if value[0] != '"':
+                        continue  # only strings and words can be keys
+
+                    output.append(value)
+                    container.expecting = _COLON
+                    continue
+
+                if container.expecting == _COLON:
+                    output.append(":")  # add missing colon
+
+                output.append(value)
+                if char == "{":
+                    stack.append(_Container("}", opening=len(output)))
+
+                elif char == "[":
+                    stack.append(_Container("]", opening=len(output)))
+
+                else:
+                    _completed(container, output)
+
+    # close containers left open by the truncated output
+    while stack:
+        _close(stack, output)
+
+    return "".join(output)
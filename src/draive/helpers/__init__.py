@@ -1,4 +1,17 @@
-from draive.helpers.retry import auto_retry
+from draive.helpers.balancer import (
+    EndpointBalancer,
+    EndpointLease,
+    EndpointStatus,
+    EndpointUsage,
+    EndpointUsageStatistics,
+)
+from draive.helpers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    CircuitBreakerPermit,
+    CircuitBreakerStatus,
+)
+from draive.helpers.retry import RetryBackoff, RetryBudget, RetryTrace, auto_retry
 from draive.helpers.trace import traced
 from draive.helpers.volatile_index import VolatileVectorIndex
 from draive.helpers.volatile_memory import (
@@ -9,7 +22,19 @@ from draive.helpers.volatile_memory import (
 
 __all__ = [
     "auto_retry",
+    "CircuitBreaker",
+    "CircuitBreakerOpen",
+    "CircuitBreakerPermit",
+    "CircuitBreakerStatus",
     "ConstantMemory",
+    "EndpointBalancer",
+    "EndpointLease",
+    "EndpointStatus",
+    "EndpointUsage",
+    "EndpointUsageStatistics",
+    "RetryBackoff",
+    "RetryBudget",
+    "RetryTrace",
     "traced",
     "VolatileAccumulativeMemory",
     "VolatileMemory",
@@ -0,0 +1,276 @@
+from collections.abc import Iterable, Mapping, Sequence
+from time import monotonic
+from types import TracebackType
+from typing import Literal, Self, final
+
+from draive.parameters import DataModel
+from draive.scope import ctx
+
+__all__ = [
+    "EndpointBalancer",
+    "EndpointLease",
+    "EndpointStatus",
+    "EndpointUsage",
+    "EndpointUsageStatistics",
+]
+
+
+class EndpointUsageStatistics(DataModel):
+    requests: int = 0
+    failures: int = 0
+    latency: float = 0
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            requests=self.requests + other.requests,
+            failures=self.failures + other.failures,
+            latency=self.latency + other.latency,
+        )
+
+
+class EndpointUsage(DataModel):
+    usage: dict[str, EndpointUsageStatistics]
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        usage: dict[str, EndpointUsageStatistics] = dict(self.usage)
+        for key, value in other.usage.items():
+            if current := usage.get(key):
+                usage[key] = current + value
+
+            else:
+                usage[key] = value
+
+        return self.__class__(usage=usage)
+
+
+class EndpointStatus(DataModel):
+    name: str
+    outstanding: int
+    requests: int
+    failures: int
+    latency: float
+    utilization: float
+    remaining_quota: float | None
+    ejected: bool
+
+
+_LATENCY_SMOOTHING: float = 0.2
+
+
+class _Endpoint[Endpoint]:
+    def __init__(
+        self,
+        name: str,
+        endpoint: Endpoint,
+    ) -> None:
+        self.name: str = name
+        self.endpoint: Endpoint = endpoint
+        self.outstanding: int = 0
+        self.requests: int = 0
+        self.failures: int = 0
+        self.latency: float = 0
+        self.busy_time: float = 0
+        self.remaining_quota: float | None = None
+        self.ejected_until: float = 0
+
+
+@final
+class EndpointLease[Endpoint]:
+    def __init__(
+        self,
+        endpoint: _Endpoint[Endpoint],
+        /,
+        ejection: float,
+    ) -> None:
+        self._endpoint: _Endpoint[Endpoint] = endpoint
+        self._ejection: float = ejection
+        self._start: float = 0
+
+    @property
+    def name(self) -> str:
+        return self._endpoint.name
+
+    @property
+    def endpoint(self) -> Endpoint:
+        return self._endpoint.endpoint
+
+    def eject(
+        self,
+        duration: float | None = None,
+    ) -> None:
+        """
+        Exclude endpoint from balancing for a given time, i.e. after 429 or 5xx responses.
+        """
+        self._endpoint.ejected_until = monotonic() + (duration or self._ejection)
+
+    def update_quota(
+        self,
+        remaining: str | float | None,
+    ) -> None:
+        """
+        Update remaining quota of the endpoint, i.e. using rate limit response headers.
+        """
+        if remaining is None:
+            return
+
+        try:
+            self._endpoint.remaining_quota = float(remaining)
+
+        except ValueError:
+            pass  # ignore invalid values
+
+    def __enter__(self) -> Self:
+        self._start = monotonic()
+        self._endpoint.outstanding += 1
+        self._endpoint.requests += 1
+        return self
+
+    def __exit__(
+        self,
+        exc_type: type[BaseException] | None,
+        exc_val: BaseException | None,
+        exc_tb: TracebackType | None,
+    ) -> None:
+        latency: float = monotonic() - self._start
+        endpoint: _Endpoint[Endpoint] = self._endpoint
+        endpoint.outstanding -= 1
+        endpoint.busy_time += latency
+        failed: bool = exc_val is not None
+        if failed:
+            endpoint.failures += 1
+
+        elif endpoint.latency:
+            endpoint.latency += _LATENCY_SMOOTHING * (latency - endpoint.latency)
+
+        else:
+            endpoint.latency = latency
+
+        ctx.record(
+            EndpointUsage(
+                usage={
+                    endpoint.name: EndpointUsageStatistics(
+                        requests=1,
+                        failures=1 if failed else 0,
+                        latency=latency,
+                    ),
+                },
+            )
+        )
+
+
+@final
+class EndpointBalancer[Endpoint]:
+    """\
+    Balancer distributing calls between multiple endpoints of the same service, \
+    i.e. multiple api keys or deployments. Each call is routed to the endpoint with \
+    the least outstanding requests or the highest remaining quota. Endpoints which were \
+    ejected (i.e. after 429 or 5xx responses) are skipped until the ejection time passes. \
+    This object is not thread safe.
+
+    Parameters
+    ----------
+    endpoints: Mapping[str, Endpoint] | Sequence[tuple[str, Endpoint]]
+        named endpoints to balance, names have to be unique
+    strategy: Literal["least_outstanding", "remaining_quota"]
+        endpoint selection strategy, default is "least_outstanding"
+    ejection: float
+        default ejection time in seconds, default is 10 seconds
+    """
+
+    def __init__(
+        self,
+        endpoints: Mapping[str, Endpoint] | Sequence[tuple[str, Endpoint]],
+        /,
+        *,
+        strategy: Literal["least_outstanding", "remaining_quota"] = "least_outstanding",
+        ejection: float = 10,
+    ) -> None:
+        named_endpoints: Iterable[tuple[str, Endpoint]]
+        if isinstance(endpoints, Sequence):
+            named_endpoints = endpoints
+
+        else:
+            named_endpoints = endpoints.items()
+
+        self._endpoints: list[_Endpoint[Endpoint]] = [
+            _Endpoint(name, endpoint) for name, endpoint in named_endpoints
+        ]
+        assert self._endpoints, "At least one endpoint is required"  # nosec: B101
+        names: set[str] = {endpoint.name for endpoint in self._endpoints}
+        if len(names) != len(self._endpoints):
+            raise ValueError("Endpoint names have to be unique")
+
+        self._strategy: Literal["least_outstanding", "remaining_quota"] = strategy
+        self._ejection: float = ejection
+        self._rotation: int = 0
+        self._start: float = monotonic()
+
+    @property
+    def endpoints(self) -> Sequence[Endpoint]:
+        return [endpoint.endpoint for endpoint in self._endpoints]
+
+    @property
+    def status(self) -> list[EndpointStatus]:
+        time_now: float = monotonic()
+        lifetime: float = max(time_now - self._start, 1e-9)
+        return [
+            EndpointStatus(
+                name=endpoint.name,
+                outstanding=endpoint.outstanding,
+                requests=endpoint.requests,
+                failures=endpoint.failures,
+                latency=endpoint.latency,
+                utilization=endpoint.busy_time / lifetime,
+                remaining_quota=endpoint.remaining_quota,
+                ejected=endpoint.ejected_until > time_now,
+            )
+            for endpoint in self._endpoints
+        ]
+
+    def lease(self) -> EndpointLease[Endpoint]:
+        """
+        Select endpoint for the next call. Returned lease should be used as a context manager \
+        wrapping the call to track its outcome.
+        """
+        return EndpointLease(
+            self._select(),
+            ejection=self._ejection,
+        )
+
+    def _select(self) -> _Endpoint[Endpoint]:
+        if len(self._endpoints) == 1:
+            return self._endpoints[0]
+
+        time_now: float = monotonic()
+        # rotate the starting point to spread calls evenly between equal endpoints
+        self._rotation = (self._rotation + 1) % len(self._endpoints)
+        candidates: list[_Endpoint[Endpoint]] = [
+            endpoint
+            for endpoint in self._endpoints[self._rotation :] + self._endpoints[: self._rotation]
+            if endpoint.ejected_until <= time_now
+        ]
+
+        if not candidates:  # use the endpoint which will recover first when all are ejected
+            return min(self._endpoints, key=lambda endpoint: endpoint.ejected_until)
+
+        match self._strategy:
+            case "least_outstanding":
+                return min(candidates, key=lambda endpoint: endpoint.outstanding)
+
+            case "remaining_quota":
+                # endpoints with unknown quota are preferred to discover it
+                return max(
+                    candidates,
+                    key=lambda endpoint: (
+                        float("inf")
+                        if endpoint.remaining_quota is None
+                        else endpoint.remaining_quota - endpoint.outstanding,
+                        -endpoint.outstanding,
+                    ),
+                )
@@ -0,0 +1,216 @@
+from collections import deque
+from time import monotonic
+from typing import Literal, Self, final
+
+from draive.parameters import DataModel
+
+__all__ = [
+    "CircuitBreaker",
+    "CircuitBreakerOpen",
+    "CircuitBreakerPermit",
+    "CircuitBreakerStatus",
+]
+
+CircuitBreakerState = Literal["closed", "open", "half_open"]
+
+
+class CircuitBreakerOpen(Exception):
+    def __init__(
+        self,
+        *args: object,
+        breaker: str,
+        retry_after: float,
+    ) -> None:
+        super().__init__(*args)
+        self.breaker: str = breaker
+        self.retry_after: float = retry_after
+
+
+@final
+class CircuitBreakerPermit:
+    """\
+    Permission for a single call acquired from the CircuitBreaker. \
+    Outcome of the call has to be reported back using the same permit, \
+    only the probe permit can release the probe or resolve the half open state.
+    """
+
+    __slots__ = ("probe",)
+
+    def __init__(
+        self,
+        *,
+        probe: bool,
+    ) -> None:
+        self.probe: bool = probe
+
+
+# permit shared by all calls allowed by the closed circuit
+_REGULAR_PERMIT: CircuitBreakerPermit = CircuitBreakerPermit(probe=False)
+
+
+class CircuitBreakerStatus(DataModel):
+    states: dict[str, CircuitBreakerState]
+    rejections: int = 0
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            states={**self.states, **other.states},
+            rejections=self.rejections + other.rejections,
+        )
+
+
+@final
+class CircuitBreaker:
+    """\
+    Circuit breaker tracking failure rate of calls within a sliding time window. \
+    When the failure rate exceeds the threshold, the circuit opens and calls fail fast \
+    with CircuitBreakerOpen until the cooldown passes. After the cooldown a single probe \
+    call is allowed (half open state) which either closes the circuit or opens it again. \
+    Single instance can be shared between multiple functions to make a process wide breaker. \
+    This object is not thread safe.
+
+    Parameters
+    ----------
+    name: str
+        name of the breaker used in metrics and errors
+    failure_rate: float
+        ratio of failed calls within the window which opens the circuit, default is 0.5
+    minimum_calls: int
+        minimal number of calls within the window required to open the circuit, default is 10
+    window: float
+        time window in seconds used to compute the failure rate, default is 30 seconds
+    cooldown: float
+        time in seconds for which the circuit stays open, default is 15 seconds
+    """
+
+    def __init__(
+        self,
+        name: str,
+        /,
+        *,
+        failure_rate: float = 0.5,
+        minimum_calls: int = 10,
+        window: float = 30,
+        cooldown: float = 15,
+    ) -> None:
+        assert 0 < failure_rate <= 1, "Failure rate has to be within (0, 1] range"  # nosec: B101
+        assert minimum_calls > 0, "Minimum calls has to be greater than zero"  # nosec: B101
+        self.name: str = name
+        self._failure_rate: float = failure_rate
+        self._minimum_calls: int = minimum_calls
+        self._window: float = window
+        self._cooldown: float = cooldown
+        self._outcomes: deque[tuple[float, bool]] = deque()
+        self._failures: int = 0
+        self._opened_at: float | None = None
+        # permit of the call probing the half open circuit
+        self._probe: CircuitBreakerPermit | None = None
+
+    @property
+    def state(self) -> CircuitBreakerState:
+        if self._opened_at is None:
+            return "closed"
+
+        elif self._probe is not None or self._opened_at + self._cooldown <= monotonic():
+            return "half_open"
+
+        else:
+            return "open"
+
+    @property
+    def status(self) -> CircuitBreakerStatus:
+        return CircuitBreakerStatus(states={self.name: self.state})
+
+    def acquire(self) -> CircuitBreakerPermit:
+        """\
+        Check if a call is allowed, raises CircuitBreakerOpen otherwise.
+
+        Returns
+        -------
+        CircuitBreakerPermit
+            permit of the call used to report its outcome
+        """
+
+        if self._opened_at is None:
+            return _REGULAR_PERMIT  # closed - allow all calls
+
+        time_now: float = monotonic()
+        reopen_time: float = self._opened_at + self._cooldown
+        if self._probe is not None or reopen_time > time_now:
+            raise CircuitBreakerOpen(
+                f"Circuit breaker {self.name} is open",
+                breaker=self.name,
+                retry_after=max(reopen_time - time_now, 0),
+            )
+
+        # half open - allow a single probe call
+        self._probe = CircuitBreakerPermit(probe=True)
+        return self._probe
+
+    def release(
+        self,
+        permit: CircuitBreakerPermit,
+        /,
+    ) -> None:
+        """\
+        Give back the acquired call without recording its outcome.
+        """
+
+        if permit is self._probe:
+            self._probe = None
+
+    def record_success(
+        self,
+        permit: CircuitBreakerPermit,
+        /,
+    ) -> None:
+        if self._opened_at is not None:
+            if permit is not self._probe:
+                return  # ignore late results of calls started before opening
+
+            # probe succeeded - close the circuit
+            self._opened_at = None
+            self._probe = None
+            self._outcomes.clear()
+            self._failures = 0
+
+        else:
+            self._record(failed=False)
+
+    def record_failure(
+        self,
+        permit: CircuitBreakerPermit,
+        /,
+    ) -> None:
+        if self._opened_at is not None:
+            if permit is not self._probe:
+                return  # ignore late results of calls started before opening
+
+            # probe failed - open the circuit again
+            self._opened_at = monotonic()
+            self._probe = None
+
+        else:
+            self._record(failed=True)
+
+    def _record(
+        self,
+        *,
+        failed: bool,
+    ) -> None:
+        time_now: float = monotonic()
+        while self._outcomes and self._outcomes[0][0] + self._window <= time_now:
+            _, outdated_failed = self._outcomes.popleft()
+            if outdated_failed:
+                self._failures -= 1
+
+        self._outcomes.append((time_now, failed))
+        if failed:
+            self._failures += 1
+
+        calls: int = len(self._outcomes)
+        if calls >= self._minimum_calls and self._failures / calls >= self._failure_rate:
+            self._opened_at = time_now
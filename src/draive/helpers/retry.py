@@ -1,16 +1,140 @@
 from asyncio import CancelledError, iscoroutinefunction, sleep
+from collections import deque
 from collections.abc import Callable, Coroutine
-from typing import cast, overload
-
+from random import uniform
+from time import monotonic
+from typing import Self, cast, final, overload
+
+from draive.helpers.circuit_breaker import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    CircuitBreakerPermit,
+    CircuitBreakerStatus,
+)
+from draive.parameters import DataModel
 from draive.scope import ctx
 from draive.types import RateLimitError
 from draive.utils import mimic_function
 
 __all__ = [
     "auto_retry",
+    "RetryBackoff",
+    "RetryBudget",
+    "RetryTrace",
 ]
 
 
+class RetryTrace(DataModel):
+    retries: int = 0
+    exhausted: int = 0
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            retries=self.retries + other.retries,
+            exhausted=self.exhausted + other.exhausted,
+        )
+
+
+@final
+class RetryBackoff:
+    """\
+    Exponential retry backoff with optional decorrelated jitter. \
+    Jitter spreads retries of concurrent calls in time to avoid retrying in lock-step.
+
+    Parameters
+    ----------
+    base: float
+        initial delay in seconds, default is 0.1 second
+    cap: float
+        maximal delay in seconds, default is 10 seconds
+    jitter: bool
+        use decorrelated jitter instead of plain exponential delays, default is True
+    """
+
+    def __init__(
+        self,
+        *,
+        base: float = 0.1,
+        cap: float = 10,
+        jitter: bool = True,
+    ) -> None:
+        assert base > 0, "Base delay has to be greater than zero"  # nosec: B101
+        assert cap >= base, "Delay cap can't be lower than base delay"  # nosec: B101
+        self._base: float = base
+        self._cap: float = cap
+        self._jitter: bool = jitter
+
+    def next_delay(
+        self,
+        attempt: int,
+        /,
+        previous: float | None,
+    ) -> float:
+        if self._jitter:
+            return min(
+                self._cap,
+                uniform(self._base, max(self._base, (previous or self._base) * 3)),  # nosec: B311
+            )
+
+        else:
+            return min(self._cap, self._base * 2 ** (attempt - 1))
+
+
+@final
+class RetryBudget:
+    """\
+    Retry budget limiting number of retries to a ratio of all calls within a sliding window. \
+    Single instance can be shared between multiple functions to make a process wide budget. \
+    This object is not thread safe.
+
+    Parameters
+    ----------
+    ratio: float
+        maximal ratio of retries to calls within the window, default is 0.1 (10%)
+    minimum: int
+        number of retries always allowed within the window regardless of the ratio, \
+        default is 10
+    window: float
+        time window in seconds used to count calls and retries, default is 10 seconds
+    """
+
+    def __init__(
+        self,
+        *,
+        ratio: float = 0.1,
+        minimum: int = 10,
+        window: float = 10,
+    ) -> None:
+        assert ratio >= 0, "Ratio can't be negative"  # nosec: B101
+        assert window > 0, "Window has to be greater than zero"  # nosec: B101
+        self._ratio: float = ratio
+        self._minimum: int = minimum
+        self._window: float = window
+        self._calls: deque[float] = deque()
+        self._retries: deque[float] = deque()
+
+    def record_call(self) -> None:
+        self._calls.append(monotonic())
+
+    def acquire(self) -> bool:
+        """
+        Consume a single retry if the budget allows it.
+        """
+        time_now: float = monotonic()
+        for entries in (self._calls, self._retries):
+            while entries and entries[0] + self._window <= time_now:
+                entries.popleft()
+
+        if len(self._retries) >= max(self._minimum, self._ratio * len(self._calls)):
+            return False
+
+        self._retries.append(time_now)
+        return True
+
+
 @overload
 def auto_retry[**Args, Result](
     function: Callable[Args, Result],
@@ -38,8 +162,10 @@ def auto_retry[**Args, Result](
 def auto_retry[**Args, Result](
     *,
     limit: int = 1,
-    delay: Callable[[int], float] | float | None = None,
+    delay: Callable[[int], float] | RetryBackoff | float | None = None,
     catching: set[type[Exception]] | tuple[type[Exception], ...] | type[Exception] = Exception,
+    budget: RetryBudget | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> Callable[[Callable[Args, Result]], Callable[Args, Result]]:
     """\
     Function wrapper retrying the wrapped function again on fail. \
@@ -51,14 +177,20 @@ def auto_retry[**Args, Result](
     ----------
     limit: int
         limit of retries, default is 1
-    delay: Callable[[], float] | float | None
-        retry delay time in seconds, either concrete value or a function producing it, \
-        default is None (no delay)
+    delay: Callable[[int], float] | RetryBackoff | float | None
+        retry delay time in seconds, either concrete value, a function producing it \
+        or exponential backoff, default is None (no delay)
     catching: set[type[Exception]] | type[Exception] | None
         Exception types that are triggering auto retry. Retry will trigger only when \
         exceptions of matching types (including subclasses) will occur. CancelledError \
         will be always propagated even if specified explicitly.
         Default is Exception - all subclasses of Exception will be handled.
+    budget: RetryBudget | None
+        retry budget limiting retries in relation to all calls, share a single instance \
+        to limit retries process wide, default is None (no budget)
+    breaker: CircuitBreaker | None
+        circuit breaker failing fast when error rate spikes, share a single instance \
+        to break the circuit process wide, default is None (no breaker)
 
     Returns
     -------
@@ -67,12 +199,14 @@ def auto_retry[**Args, Result](
     """
 
 
-def auto_retry[**Args, Result](
+def auto_retry[**Args, Result](  # noqa: PLR0913
     function: Callable[Args, Result] | None = None,
     *,
     limit: int = 1,
-    delay: Callable[[int], float] | float | None = None,
+    delay: Callable[[int], float] | RetryBackoff | float | None = None,
     catching: set[type[Exception]] | tuple[type[Exception], ...] | type[Exception] = Exception,
+    budget: RetryBudget | None = None,
+    breaker: CircuitBreaker | None = None,
 ) -> Callable[[Callable[Args, Result]], Callable[Args, Result]] | Callable[Args, Result]:
     """\
     Function wrapper retrying the wrapped function again on fail. \
@@ -86,14 +220,20 @@ def auto_retry[**Args, Result](
         function to wrap in auto retry, either sync or async.
     limit: int
         limit of retries, default is 1
-    delay: Callable[[], float] | float | None
-        retry delay time in seconds, either concrete value or a function producing it, \
-        default is None (no delay)
+    delay: Callable[[int], float] | RetryBackoff | float | None
+        retry delay time in seconds, either concrete value, a function producing it \
+        or exponential backoff, default is None (no delay)
     catching: set[type[Exception]] | type[Exception] | None
         Exception types that are triggering auto retry. Retry will trigger only when \
         exceptions of matching types (including subclasses) will occur. CancelledError \
         will be always propagated even if specified explicitly.
         Default is Exception - all subclasses of Exception will be handled.
+    budget: RetryBudget | None
+        retry budget limiting retries in relation to all calls, share a single instance \
+        to limit retries process wide, default is None (no budget)
+    breaker: CircuitBreaker | None
+        circuit breaker failing fast when error rate spikes, share a single instance \
+        to break the circuit process wide, default is None (no breaker)
 
     Returns
     -------
@@ -114,6 +254,8 @@ def auto_retry[**Args, Result](
                     limit=limit,
                     delay=delay,
                     catching=catching if isinstance(catching, set | tuple) else {catching},
+                    budget=budget,
+                    breaker=breaker,
                 ),
             )
         else:
@@ -122,6 +264,8 @@ def auto_retry[**Args, Result](
                 limit=limit,
                 delay=delay,
                 catching=catching if isinstance(catching, set | tuple) else {catching},
+                budget=budget,
+                breaker=breaker,
             )
 
     if function := function:
@@ -130,12 +274,14 @@ def auto_retry[**Args, Result](
         return _wrap
 
 
-def _wrap_sync[**Args, Result](
+def _wrap_sync[**Args, Result](  # noqa: PLR0913
     function: Callable[Args, Result],
     *,
     limit: int,
-    delay: Callable[[int], float] | float | None,
+    delay: Callable[[int], float] | RetryBackoff | float | None,
     catching: set[type[Exception]] | tuple[type[Exception], ...],
+    budget: RetryBudget | None,
+    breaker: CircuitBreaker | None,
 ) -> Callable[Args, Result]:
     assert limit > 0, "Limit has to be greater than zero"  # nosec: B101
     assert delay is None, "Delay is not supported in sync wrapper"  # nosec: B101
@@ -146,14 +292,29 @@ def _wrap_sync[**Args, Result](
         **kwargs: Args.kwargs,
     ) -> Result:
         attempt: int = 0
+        if budget is not None:
+            budget.record_call()
+
         while True:
+            permit: CircuitBreakerPermit | None = _acquire_breaker(breaker)
             try:
-                return function(*args, **kwargs)
+                result: Result = function(*args, **kwargs)
+
             except CancelledError as exc:
+                _release_breaker(breaker, permit)
+
                 raise exc
 
             except Exception as exc:
-                if attempt < limit and any(isinstance(exc, exception) for exception in catching):
+                if _should_retry(
+                    exc,
+                    attempt=attempt,
+                    limit=limit,
+                    catching=catching,
+                    budget=budget,
+                    breaker=breaker,
+                    permit=permit,
+                ):
                     attempt += 1
                     ctx.log_error(
                         "Attempting to retry %s which failed due to an error: %s",
@@ -164,32 +325,54 @@ def _wrap_sync[**Args, Result](
                 else:
                     raise exc
 
+            else:
+                _record_success(breaker, permit)
+                return result
+
     return wrapped
 
 
-def _wrap_async[**Args, Result](
+def _wrap_async[**Args, Result](  # noqa: C901, PLR0913
     function: Callable[Args, Coroutine[None, None, Result]],
     *,
     limit: int,
-    delay: Callable[[int], float] | float | None,
+    delay: Callable[[int], float] | RetryBackoff | float | None,
     catching: set[type[Exception]] | tuple[type[Exception], ...],
+    budget: RetryBudget | None,
+    breaker: CircuitBreaker | None,
 ) -> Callable[Args, Coroutine[None, None, Result]]:
     assert limit > 0, "Limit has to be greater than zero"  # nosec: B101
 
     @mimic_function(function)
-    async def wrapped(
+    async def wrapped(  # noqa: C901, PLR0912
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
         attempt: int = 0
+        previous_delay: float | None = None
+        if budget is not None:
+            budget.record_call()
+
         while True:
+            permit: CircuitBreakerPermit | None = _acquire_breaker(breaker)
             try:
-                return await function(*args, **kwargs)
+                result: Result = await function(*args, **kwargs)
+
             except CancelledError as exc:
+                _release_breaker(breaker, permit)
+
                 raise exc
 
             except RateLimitError as exc:
-                if attempt < limit and any(isinstance(exc, exception) for exception in catching):
+                if _should_retry(
+                    exc,
+                    attempt=attempt,
+                    limit=limit,
+                    catching=catching,
+                    budget=budget,
+                    breaker=breaker,
+                    permit=permit,
+                ):
                     attempt += 1
                     ctx.log_warning(
                         "Attempting to retry %s after %.2fs which failed due to rate limit",
@@ -202,7 +385,15 @@ def _wrap_async[**Args, Result](
                     raise exc
 
             except Exception as exc:
-                if attempt < limit and any(isinstance(exc, exception) for exception in catching):
+                if _should_retry(
+                    exc,
+                    attempt=attempt,
+                    limit=limit,
+                    catching=catching,
+                    budget=budget,
+                    breaker=breaker,
+                    permit=permit,
+                ):
                     attempt += 1
                     ctx.log_error(
                         "Attempting to retry %s which failed due to an error",
@@ -214,13 +405,100 @@ def _wrap_async[**Args, Result](
                         case None:
                             continue
 
-                        case float(strict):
+                        case int() | float() as strict:
                             await sleep(delay=strict)
 
-                        case make_delay:  # type: Callable[[], float]
-                            await sleep(delay=make_delay(attempt))  # pyright: ignore[reportCallIssue, reportUnknownArgumentType]
+                        case RetryBackoff() as backoff:
+                            previous_delay = backoff.next_delay(
+                                attempt,
+                                previous=previous_delay,
+                            )
+                            await sleep(delay=previous_delay)
+
+                        case make_delay:
+                            await sleep(delay=make_delay(attempt))
 
                 else:
                     raise exc
 
+            else:
+                _record_success(breaker, permit)
+                return result
+
     return wrapped
+
+
+def _acquire_breaker(
+    breaker: CircuitBreaker | None,
+    /,
+) -> CircuitBreakerPermit | None:
+    if breaker is None:
+        return None
+
+    try:
+        return breaker.acquire()
+
+    except CircuitBreakerOpen as exc:
+        ctx.record(
+            CircuitBreakerStatus(
+                states={breaker.name: breaker.state},
+                rejections=1,
+            )
+        )
+        raise exc
+
+
+def _release_breaker(
+    breaker: CircuitBreaker | None,
+    permit: CircuitBreakerPermit | None,
+    /,
+) -> None:
+    if breaker is None or permit is None:
+        return
+
+    breaker.release(permit)
+
+
+def _record_success(
+    breaker: CircuitBreaker | None,
+    permit: CircuitBreakerPermit | None,
+    /,
+) -> None:
+    if breaker is None or permit is None:
+        return
+
+    breaker.record_success(permit)
+    ctx.record(breaker.status)
+
+
+def _should_retry(  # noqa: PLR0913
+    exception: Exception,
+    /,
+    *,
+    attempt: int,
+    limit: int,
+    catching: set[type[Exception]] | tuple[type[Exception], ...],
+    budget: RetryBudget | None,
+    breaker: CircuitBreaker | None,
+    permit: CircuitBreakerPermit | None,
+) -> bool:
+    if not any(isinstance(exception, exception_type) for exception_type in catching):
+        _release_breaker(breaker, permit)  # not a tracked failure
+        return False
+
+    if breaker is not None and permit is not None:
+        breaker.record_failure(permit)
+        ctx.record(breaker.status)
+        if breaker.state != "closed":
+            return False  # fail fast when circuit was opened
+
+    if attempt >= limit:
+        return False
+
+    if budget is not None and not budget.acquire():
+        ctx.record(RetryTrace(exhausted=1))
+        ctx.log_warning("Retry budget exhausted, skipping retry")
+        return False
+
+    ctx.record(RetryTrace(retries=1))
+    return True
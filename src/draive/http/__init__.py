@@ -0,0 +1,6 @@
+from draive.http.transport import close_shared_http_transports, shared_http_transport
+
+__all__ = [
+    "close_shared_http_transports",
+    "shared_http_transport",
+]
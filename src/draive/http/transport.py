@@ -0,0 +1,404 @@
+from asyncio import AbstractEventLoop, get_running_loop
+from collections.abc import AsyncIterable, AsyncIterator, Generator, Iterable
+from contextlib import contextmanager
+from importlib.util import find_spec
+from ipaddress import ip_address
+from socket import SOCK_STREAM
+from time import monotonic
+from typing import Protocol, cast, final, runtime_checkable
+from urllib.request import getproxies
+from weakref import WeakKeyDictionary
+
+import httpcore
+import httpx
+from httpx import (
+    URL,
+    AsyncBaseTransport,
+    AsyncByteStream,
+    AsyncHTTPTransport,
+    Limits,
+    Request,
+    Response,
+    create_ssl_context,
+)
+
+__all__ = [
+    "close_shared_http_transports",
+    "shared_http_transport",
+]
+
+
+def shared_http_transport(
+    *,
+    max_connections: int = 100,
+    max_keepalive_connections: int = 20,
+    keepalive_expiry: float = 60,
+    http2: bool | None = None,
+    dns_cache_ttl: float = 300,
+) -> AsyncBaseTransport:
+    """\
+    Get the process wide transport for httpx clients with a given configuration. \
+    Connections are pooled independently of scopes and clients using the same \
+    configuration, so that connection setup and TLS handshakes are paid only once. \
+    Connection pools are bound to the event loop, each running loop gets its own pool. \
+    Closing a client using shared transport does not close it, \
+    use close_shared_http_transports to release all connections. \
+    Proxies configured by environment variables (HTTP_PROXY, HTTPS_PROXY, ALL_PROXY \
+    and NO_PROXY) are used the same way as httpx clients use them.
+
+    Parameters
+    ----------
+    max_connections: int
+        limit of concurrently opened connections, default is 100
+    max_keepalive_connections: int
+        limit of idle connections kept for reuse, default is 20
+    keepalive_expiry: float
+        time in seconds after which idle connections are closed, default is 60
+    http2: bool | None
+        use HTTP/2 multiplexing when supported by the server, \
+        default is to use it when the optional h2 package is installed
+    dns_cache_ttl: float
+        time in seconds for which resolved host addresses are reused, \
+        default is 300, 0 disables caching
+
+    Returns
+    -------
+    AsyncBaseTransport
+        shared transport which can be used by any number of httpx clients
+    """
+
+    # environment is checked each time to reflect proxy changes
+    proxies: dict[str, str] = getproxies()
+    key: _TransportKey = (
+        max_connections,
+        max_keepalive_connections,
+        keepalive_expiry,
+        _HTTP2_AVAILABLE if http2 is None else http2,
+        dns_cache_ttl,
+        tuple(sorted(proxies.items())),
+    )
+    if transport := _SHARED_TRANSPORTS.get(key):
+        return transport
+
+    transport = _SharedTransport(
+        limits=Limits(
+            max_connections=max_connections,
+            max_keepalive_connections=max_keepalive_connections,
+            keepalive_expiry=keepalive_expiry,
+        ),
+        http2=key[3],
+        dns_cache_ttl=dns_cache_ttl,
+        proxies=proxies,
+    )
+    _SHARED_TRANSPORTS[key] = transport
+    return transport
+
+
+async def close_shared_http_transports() -> None:
+    """
+    Close connections of all shared transports opened within the current event loop.
+    """
+    for transport in _SHARED_TRANSPORTS.values():
+        await transport.close_pool()
+
+
+_HTTP2_AVAILABLE: bool = find_spec("h2") is not None
+
+
+@final
+class _SharedTransport(AsyncBaseTransport):
+    def __init__(
+        self,
+        *,
+        limits: Limits,
+        http2: bool,
+        dns_cache_ttl: float,
+        proxies: dict[str, str],
+    ) -> None:
+        self._limits: Limits = limits
+        self._http2: bool = http2
+        self._dns_cache_ttl: float = dns_cache_ttl
+        self._proxies: dict[str, str] = proxies
+        # hosts excluded from proxying, "*" excludes all
+        self._no_proxy: tuple[str, ...] = tuple(
+            host.strip().lstrip(".").lower()
+            for host in proxies.get("no", "").split(",")
+            if host.strip()
+        )
+        # pools of each event loop, keyed by the proxy url, None for direct connections
+        self._pools: WeakKeyDictionary[
+            AbstractEventLoop,
+            dict[str | None, AsyncBaseTransport],
+        ] = WeakKeyDictionary()
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        loop: AbstractEventLoop = get_running_loop()
+        pools: dict[str | None, AsyncBaseTransport]
+        if (current_pools := self._pools.get(loop)) is not None:
+            pools = current_pools
+
+        else:
+            pools = {}
+            self._pools[loop] = pools
+
+        proxy: str | None = self._proxy(request.url)
+        pool: AsyncBaseTransport
+        if current := pools.get(proxy):
+            pool = current
+
+        elif proxy is None:
+            pool = _PooledTransport(
+                limits=self._limits,
+                http2=self._http2,
+                dns_cache_ttl=self._dns_cache_ttl,
+            )
+            pools[proxy] = pool
+
+        else:
+            # proxy is a single host, use the regular transport which supports all proxy types
+            pool = AsyncHTTPTransport(
+                http2=self._http2,
+                limits=self._limits,
+                proxy=proxy if "://" in proxy else f"http://{proxy}",
+            )
+            pools[proxy] = pool
+
+        return await pool.handle_async_request(request)
+
+    def _proxy(
+        self,
+        url: URL,
+        /,
+    ) -> str | None:
+        if not self._proxies:
+            return None
+
+        host: str = url.host.lower()
+        for excluded in self._no_proxy:
+            if excluded in ("*", host) or host.endswith(f".{excluded}"):
+                return None  # excluded by NO_PROXY
+
+        return self._proxies.get(url.scheme) or self._proxies.get("all")
+
+    async def close_pool(self) -> None:
+        if pools := self._pools.pop(get_running_loop(), None):
+            for pool in pools.values():
+                await pool.aclose()
+
+    async def aclose(self) -> None:
+        pass  # shared transport is not closed by clients
+
+
+@final
+class _PooledTransport(AsyncBaseTransport):
+    def __init__(
+        self,
+        *,
+        limits: Limits,
+        http2: bool,
+        dns_cache_ttl: float,
+    ) -> None:
+        self._pool: httpcore.AsyncConnectionPool = httpcore.AsyncConnectionPool(
+            ssl_context=create_ssl_context(http2=http2),
+            max_connections=limits.max_connections,
+            max_keepalive_connections=limits.max_keepalive_connections,
+            keepalive_expiry=limits.keepalive_expiry,
+            http1=True,
+            http2=http2,
+            network_backend=_CachingResolverBackend(ttl=dns_cache_ttl)
+            if dns_cache_ttl > 0
+            else None,
+        )
+
+    async def handle_async_request(
+        self,
+        request: Request,
+    ) -> Response:
+        assert isinstance(request.stream, AsyncByteStream)  # nosec: B101
+        with _mapped_exceptions():
+            response: httpcore.Response = await self._pool.handle_async_request(
+                httpcore.Request(
+                    method=request.method,
+                    url=httpcore.URL(
+                        scheme=request.url.raw_scheme,
+                        host=request.url.raw_host,
+                        port=request.url.port,
+                        target=request.url.raw_path,
+                    ),
+                    headers=request.headers.raw,
+                    content=request.stream,
+                    extensions=request.extensions,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+                )
+            )
+
+        assert isinstance(response.stream, AsyncIterable)  # nosec: B101
+        return Response(
+            status_code=response.status,
+            headers=response.headers,
+            stream=_ResponseStream(response.stream),
+            extensions=response.extensions,  # pyright: ignore[reportUnknownMemberType, reportUnknownArgumentType]
+        )
+
+    async def aclose(self) -> None:
+        await self._pool.aclose()
+
+
+@final
+class _ResponseStream(AsyncByteStream):
+    def __init__(
+        self,
+        stream: AsyncIterable[bytes],
+        /,
+    ) -> None:
+        self._stream: AsyncIterable[bytes] = stream
+
+    async def __aiter__(self) -> AsyncIterator[bytes]:
+        with _mapped_exceptions():
+            async for part in self._stream:
+                yield part
+
+    async def aclose(self) -> None:
+        if isinstance(self._stream, _AsyncClosable):
+            await self._stream.aclose()
+
+
+@runtime_checkable
+class _AsyncClosable(Protocol):
+    async def aclose(self) -> None: ...
+
+
+# httpcore errors translated to httpx errors, more specific errors go first
+_EXCEPTIONS: tuple[tuple[type[Exception], type[httpx.TransportError]], ...] = (
+    (httpcore.ConnectTimeout, httpx.ConnectTimeout),
+    (httpcore.ReadTimeout, httpx.ReadTimeout),
+    (httpcore.WriteTimeout, httpx.WriteTimeout),
+    (httpcore.PoolTimeout, httpx.PoolTimeout),
+    (httpcore.TimeoutException, httpx.TimeoutException),
+    (httpcore.ConnectError, httpx.ConnectError),
+    (httpcore.ReadError, httpx.ReadError),
+    (httpcore.WriteError, httpx.WriteError),
+    (httpcore.NetworkError, httpx.NetworkError),
+    (httpcore.ProxyError, httpx.ProxyError),
+    (httpcore.UnsupportedProtocol, httpx.UnsupportedProtocol),
+    (httpcore.LocalProtocolError, httpx.LocalProtocolError),
+    (httpcore.RemoteProtocolError, httpx.RemoteProtocolError),
+    (httpcore.ProtocolError, httpx.ProtocolError),
+)
+
+
+@contextmanager
+def _mapped_exceptions() -> Generator[None, None]:
+    try:
+        yield
+
+    except Exception as exc:
+        for source, target in _EXCEPTIONS:
+            if isinstance(exc, source):
+                raise target(str(exc)) from exc
+
+        raise exc
+
+
+@final
+class _CachingResolverBackend(httpcore.AsyncNetworkBackend):
+    def __init__(
+        self,
+        *,
+        ttl: float,
+    ) -> None:
+        self._backend: httpcore.AsyncNetworkBackend = cast(
+            # AnyIOBackend is conditionally defined, it is available with httpx
+            httpcore.AsyncNetworkBackend,
+            httpcore.AnyIOBackend(),
+        )
+        self._ttl: float = ttl
+        self._addresses: dict[tuple[str, int], tuple[float, list[str]]] = {}
+
+    async def _resolve(
+        self,
+        host: str,
+        port: int,
+    ) -> list[str]:
+        try:
+            ip_address(host)
+            return [host]  # no need to resolve ip addresses
+
+        except ValueError:
+            pass  # resolve host names
+
+        if (cached := self._addresses.get((host, port))) and cached[0] > monotonic():
+            return cached[1]
+
+        addresses: list[str] = []
+        for *_, address in await get_running_loop().getaddrinfo(
+            host,
+            port,
+            type=SOCK_STREAM,
+        ):
+            if address[0] not in addresses:
+                addresses.append(str(address[0]))
+
+        self._addresses[(host, port)] = (monotonic() + self._ttl, addresses)
+        return addresses
+
+    async def connect_tcp(
+        self,
+        host: str,
+        port: int,
+        timeout: float | None = None,
+        local_address: str | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        # TLS uses the requested host name, only the tcp connection uses resolved address
+        addresses: list[str] = await self._resolve(host, port)
+        for index, address in enumerate(addresses):
+            try:
+                return await self._backend.connect_tcp(
+                    address,
+                    port,
+                    timeout=timeout,
+                    local_address=local_address,
+                    socket_options=socket_options,
+                )
+
+            except (httpcore.ConnectError, httpcore.ConnectTimeout) as exc:
+                if index < len(addresses) - 1:
+                    continue  # try next address
+
+                # resolve again next time, addresses might have changed
+                self._addresses.pop((host, port), None)
+                raise exc
+
+        # fallback to regular resolution if nothing was resolved
+        return await self._backend.connect_tcp(
+            host,
+            port,
+            timeout=timeout,
+            local_address=local_address,
+            socket_options=socket_options,
+        )
+
+    async def connect_unix_socket(
+        self,
+        path: str,
+        timeout: float | None = None,
+        socket_options: Iterable[httpcore.SOCKET_OPTION] | None = None,
+    ) -> httpcore.AsyncNetworkStream:
+        return await self._backend.connect_unix_socket(
+            path,
+            timeout=timeout,
+            socket_options=socket_options,
+        )
+
+    async def sleep(
+        self,
+        seconds: float,
+    ) -> None:
+        await self._backend.sleep(seconds)
+
+
+_TransportKey = tuple[int, int, float, bool, float, tuple[tuple[str, str], ...]]
+_SHARED_TRANSPORTS: dict[_TransportKey, _SharedTransport] = {}
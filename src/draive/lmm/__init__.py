@@ -1,5 +1,7 @@
 from draive.lmm.call import lmm_invocation
+from draive.lmm.hedging import LMMHedgingTrace, hedged_lmm_invocation
 from draive.lmm.invocation import LMMInvocation, LMMToolSelection
+from draive.lmm.scheduling import LMMScheduler, LMMScheduling, LMMSchedulingClass
 from draive.lmm.state import LMM
 from draive.lmm.tools import (
     AnyTool,
@@ -15,9 +17,14 @@ from draive.lmm.tools import (
 
 __all__ = [
     "AnyTool",
+    "hedged_lmm_invocation",
     "lmm_invocation",
     "LMM",
+    "LMMHedgingTrace",
     "LMMInvocation",
+    "LMMScheduler",
+    "LMMScheduling",
+    "LMMSchedulingClass",
     "LMMToolSelection",
     "tool",
     "Tool",
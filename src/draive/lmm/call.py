@@ -1,12 +1,13 @@
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, Callable, Sequence
 from typing import Any, Literal, overload
 
 from draive.instructions import Instruction
-from draive.lmm.invocation import LMMOutputStream, LMMToolSelection
+from draive.lmm.invocation import LMMInvocation, LMMOutputStream, LMMToolSelection
+from draive.lmm.scheduling import LMMScheduler, LMMScheduling
 from draive.lmm.state import LMM
 from draive.lmm.tools import ToolSpecification
 from draive.scope import ctx
-from draive.types import LMMContextElement, LMMOutput
+from draive.types import LMMContextElement, LMMOutput, LMMOutputStreamChunk
 
 __all__ = [
     "lmm_invocation",
@@ -62,12 +63,59 @@ async def lmm_invocation(  # noqa: PLR0913
     stream: bool = False,
     **extra: Any,
 ) -> LMMOutputStream | LMMOutput:
-    return await ctx.state(LMM).invocation(
-        instruction=instruction,
-        context=context,
-        tool_selection=tool_selection,
-        tools=tools,
-        output=output,
-        stream=stream,
-        **extra,
-    )
+    invocation: LMMInvocation = ctx.state(LMM).invocation
+    scheduling: LMMScheduling = ctx.state(LMMScheduling)
+    scheduler: LMMScheduler | None = scheduling.scheduler
+    if scheduler is None:
+        return await invocation(
+            instruction=instruction,
+            context=context,
+            tool_selection=tool_selection,
+            tools=tools,
+            output=output,
+            stream=stream,
+            **extra,
+        )
+
+    priority: str | None = scheduling.priority
+    await scheduler.acquire(priority)
+    try:
+        result: LMMOutputStream | LMMOutput = await invocation(
+            instruction=instruction,
+            context=context,
+            tool_selection=tool_selection,
+            tools=tools,
+            output=output,
+            stream=stream,
+            **extra,
+        )
+
+    except BaseException as exc:
+        scheduler.release(priority)
+        raise exc
+
+    if stream:
+        # keep the slot until the stream finishes
+        return ctx.stream(
+            _scheduled_stream(
+                result,  # pyright: ignore[reportArgumentType]
+                release=lambda: scheduler.release(priority),
+            )
+        )
+
+    else:
+        scheduler.release(priority)
+        return result
+
+
+async def _scheduled_stream(
+    stream: LMMOutputStream,
+    /,
+    release: Callable[[], None],
+) -> AsyncGenerator[LMMOutputStreamChunk, None]:
+    try:
+        async for chunk in stream:
+            yield chunk
+
+    finally:
+        release()
@@ -0,0 +1,319 @@
+from asyncio import (
+    FIRST_COMPLETED,
+    AbstractEventLoop,
+    CancelledError,
+    Task,
+    gather,
+    get_running_loop,
+    wait,
+)
+from collections import deque
+from collections.abc import Sequence
+from time import monotonic
+from typing import Any, Literal, Self, final, overload
+
+from draive.instructions import Instruction
+from draive.lmm.invocation import LMMInvocation, LMMToolSelection
+from draive.lmm.tools import ToolSpecification
+from draive.parameters import DataModel
+from draive.scope import ctx
+from draive.types import LMMContextElement, LMMOutput, LMMOutputStream
+
+__all__ = [
+    "hedged_lmm_invocation",
+    "LMMHedgingTrace",
+]
+
+
+class LMMHedgingTrace(DataModel):
+    requests: int = 0
+    hedged: int = 0
+    fallbacks: int = 0
+
+    def __add__(
+        self,
+        other: Self,
+    ) -> Self:
+        return self.__class__(
+            requests=self.requests + other.requests,
+            hedged=self.hedged + other.hedged,
+            fallbacks=self.fallbacks + other.fallbacks,
+        )
+
+
+def hedged_lmm_invocation(
+    invocation: LMMInvocation,
+    /,
+    *invocations: LMMInvocation,
+    percentile: float = 0.95,
+    initial_delay: float = 2.0,
+    samples: int = 128,
+) -> LMMInvocation:
+    """\
+    Combine multiple LMM invocations into a single one which uses them in order. \
+    When an invocation does not answer within its latency percentile the next one \
+    is requested concurrently (hedged request) and the first result is used while \
+    the remaining requests are cancelled. Cancelled requests which were already \
+    slower than their hedging delay are recorded with the time they were running, \
+    so that latency of slow invocations is not underestimated when hedged requests win. \
+    When an invocation fails the next one is used immediately (fallback). \
+    Streaming requests use only fallback, \
+    the first invocation which successfully starts a stream is used.
+
+    Parameters
+    ----------
+    invocation: LMMInvocation
+        primary LMM invocation
+    *invocations: LMMInvocation
+        LMM invocations used in order for hedged and fallback requests
+    percentile: float
+        latency percentile of an invocation after which the next one is requested, \
+        default is 0.95
+    initial_delay: float
+        hedging delay in seconds used until enough latency samples were collected, \
+        default is 2 seconds
+    samples: int
+        number of recent latency samples used for each invocation, default is 128
+
+    Returns
+    -------
+    LMMInvocation
+        combined LMM invocation
+    """
+
+    return _HedgedLMMInvocation(
+        invocation,
+        *invocations,
+        percentile=percentile,
+        initial_delay=initial_delay,
+        samples=samples,
+    )
+
+
+_MINIMAL_SAMPLES: int = 8
+
+
+@final
+class _HedgedLMMInvocation:
+    def __init__(
+        self,
+        *invocations: LMMInvocation,
+        percentile: float,
+        initial_delay: float,
+        samples: int,
+    ) -> None:
+        assert 0 < percentile <= 1, "Percentile has to be within (0, 1] range"  # nosec: B101
+        self._invocations: tuple[LMMInvocation, ...] = invocations
+        self._percentile: float = percentile
+        self._initial_delay: float = initial_delay
+        self._latencies: tuple[deque[float], ...] = tuple(
+            deque(maxlen=samples) for _ in invocations
+        )
+
+    def _hedging_delay(
+        self,
+        index: int,
+        /,
+    ) -> float:
+        latencies: deque[float] = self._latencies[index]
+        if len(latencies) < _MINIMAL_SAMPLES:
+            return self._initial_delay
+
+        ordered: list[float] = sorted(latencies)
+        return ordered[min(int(self._percentile * len(ordered)), len(ordered) - 1)]
+
+    def _record_cancelled(
+        self,
+        requests: list[tuple[int, float]],
+        /,
+    ) -> None:
+        cancel_time: float = monotonic()
+        for index, start in requests:
+            # latency of cancelled request is at least the time it was running,
+            # record only slow requests which would be missing from the samples otherwise
+            if cancel_time - start >= self._hedging_delay(index):
+                self._latencies[index].append(cancel_time - start)
+
+    @overload
+    async def __call__(
+        self,
+        *,
+        instruction: Instruction | str,
+        context: Sequence[LMMContextElement],
+        tools: Sequence[ToolSpecification] | None = None,
+        tool_selection: LMMToolSelection = "auto",
+        output: Literal["text", "json"] = "text",
+        stream: Literal[True],
+        **extra: Any,
+    ) -> LMMOutputStream: ...
+
+    @overload
+    async def __call__(
+        self,
+        *,
+        instruction: Instruction | str,
+        context: Sequence[LMMContextElement],
+        tools: Sequence[ToolSpecification] | None = None,
+        tool_selection: LMMToolSelection = "auto",
+        output: Literal["text", "json"] = "text",
+        stream: Literal[False] = False,
+        **extra: Any,
+    ) -> LMMOutput: ...
+
+    @overload
+    async def __call__(
+        self,
+        *,
+        instruction: Instruction | str,
+        context: Sequence[LMMContextElement],
+        tools: Sequence[ToolSpecification] | None = None,
+        tool_selection: LMMToolSelection = "auto",
+        output: Literal["text", "json"] = "text",
+        stream: bool,
+        **extra: Any,
+    ) -> LMMOutputStream | LMMOutput: ...
+
+    async def __call__(  # noqa: PLR0913
+        self,
+        *,
+        instruction: Instruction | str,
+        context: Sequence[LMMContextElement],
+        tools: Sequence[ToolSpecification] | None = None,
+        tool_selection: LMMToolSelection = "auto",
+        output: Literal["text", "json"] = "text",
+        stream: bool = False,
+        **extra: Any,
+    ) -> LMMOutputStream | LMMOutput:
+        if stream:
+            return await self._stream(
+                instruction=instruction,
+                context=context,
+                tools=tools,
+                tool_selection=tool_selection,
+                output=output,
+                **extra,
+            )
+
+        else:
+            return await self._hedged(
+                instruction=instruction,
+                context=context,
+                tools=tools,
+                tool_selection=tool_selection,
+                output=output,
+                **extra,
+            )
+
+    async def _stream(
+        self,
+        **arguments: Any,
+    ) -> LMMOutputStream:
+        last_exception: Exception | None = None
+        for index, invocation in enumerate(self._invocations):
+            if index > 0:
+                ctx.log_warning("Falling back to the next LMM invocation")
+                ctx.record(LMMHedgingTrace(fallbacks=1))
+
+            try:
+                return await invocation(
+                    **arguments,
+                    stream=True,
+                )
+
+            except CancelledError as exc:
+                raise exc
+
+            except Exception as exc:
+                last_exception = exc
+
+        assert last_exception is not None  # nosec: B101
+        raise last_exception
+
+    async def _hedged(  # noqa: C901, PLR0912
+        self,
+        **arguments: Any,
+    ) -> LMMOutput:
+        loop: AbstractEventLoop = get_running_loop()
+        started: dict[Task[LMMOutput], tuple[int, float]] = {}
+        next_index: int = 0
+        latest_start: float = monotonic()
+        last_exception: BaseException | None = None
+
+        def request_next() -> None:
+            nonlocal next_index, latest_start
+            latest_start = monotonic()
+            started[
+                loop.create_task(
+                    self._invocations[next_index](
+                        **arguments,
+                        stream=False,
+                    )
+                )
+            ] = (next_index, latest_start)
+            next_index += 1
+
+        ctx.record(LMMHedgingTrace(requests=1))
+        request_next()
+        pending: set[Task[LMMOutput]] = set(started.keys())
+        try:
+            while pending:
+                timeout: float | None
+                if next_index < len(self._invocations):
+                    # hedge after the latency percentile of the latest request
+                    timeout = max(
+                        0,
+                        latest_start + self._hedging_delay(next_index - 1) - monotonic(),
+                    )
+
+                else:
+                    timeout = None
+
+                done: set[Task[LMMOutput]]
+                done, pending = await wait(
+                    pending,
+                    timeout=timeout,
+                    return_when=FIRST_COMPLETED,
+                )
+
+                if not done:
+                    ctx.log_info("Requesting hedged LMM invocation")
+                    ctx.record(LMMHedgingTrace(hedged=1))
+                    request_next()
+                    pending = {task for task in started if not task.done()}
+                    continue
+
+                for task in done:
+                    if task.cancelled():
+                        continue
+
+                    elif exception := task.exception():
+                        last_exception = exception
+
+                    else:
+                        index, start = started[task]
+                        self._latencies[index].append(monotonic() - start)
+                        return task.result()
+
+                if not pending and next_index < len(self._invocations):
+                    ctx.log_warning(
+                        "Falling back to the next LMM invocation",
+                        exception=last_exception if isinstance(last_exception, Exception) else None,
+                    )
+                    ctx.record(LMMHedgingTrace(fallbacks=1))
+                    request_next()
+                    pending = {task for task in started if not task.done()}
+
+            if last_exception is not None:
+                raise last_exception
+
+            else:
+                raise CancelledError()
+
+        finally:
+            losers: list[Task[LMMOutput]] = [task for task in started if not task.done()]
+            self._record_cancelled([started[task] for task in losers])
+            for task in losers:
+                task.cancel()
+
+            # wait for the cancelled requests to finish their cleanup
+            await gather(*losers, return_exceptions=True)
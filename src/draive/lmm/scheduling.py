@@ -0,0 +1,155 @@
+from asyncio import AbstractEventLoop, CancelledError, Future, get_running_loop
+from collections import deque
+from collections.abc import Mapping
+from typing import final
+
+from draive.parameters import DataModel, State
+
+__all__ = [
+    "LMMScheduler",
+    "LMMScheduling",
+    "LMMSchedulingClass",
+]
+
+
+class LMMSchedulingClass(DataModel):
+    weight: float = 1
+    concurrency: int | None = None
+
+
+@final
+class LMMScheduler:
+    """\
+    Priority aware scheduler of LMM invocations. \
+    Waiting invocations are started using weighted fair queuing between priority classes, \
+    each class gets a share of the capacity proportional to its weight while unused \
+    capacity is available to any other class. Both total and per class concurrency \
+    can be limited. Single instance should be shared between scopes using the same \
+    provider quota. This object is not thread safe.
+
+    Parameters
+    ----------
+    concurrency: int
+        limit of concurrently running invocations
+    classes: Mapping[str, LMMSchedulingClass] | None
+        priority classes configuration, default is "interactive" class with weight 8 \
+        and "batch" class with weight 1
+    default: str
+        priority class used when not specified, default is "interactive"
+    """
+
+    def __init__(
+        self,
+        *,
+        concurrency: int,
+        classes: Mapping[str, LMMSchedulingClass] | None = None,
+        default: str = "interactive",
+    ) -> None:
+        assert concurrency > 0, "Concurrency has to be greater than zero"  # nosec: B101
+        self._concurrency: int = concurrency
+        self._classes: Mapping[str, LMMSchedulingClass] = classes or {
+            "interactive": LMMSchedulingClass(weight=8),
+            "batch": LMMSchedulingClass(weight=1),
+        }
+        assert default in self._classes, "Default priority class has to be defined"  # nosec: B101
+        assert all(  # nosec: B101
+            scheduling_class.weight > 0 for scheduling_class in self._classes.values()
+        ), "Priority class weight has to be greater than zero"
+        self._default: str = default
+        self._running: dict[str, int] = {name: 0 for name in self._classes}
+        self._running_total: int = 0
+        self._waiting: dict[str, deque[tuple[float, Future[None]]]] = {
+            name: deque() for name in self._classes
+        }
+        self._finish_tags: dict[str, float] = {name: 0 for name in self._classes}
+        self._virtual_time: float = 0
+
+    def _priority(
+        self,
+        priority: str | None,
+        /,
+    ) -> str:
+        if priority is None:
+            return self._default
+
+        elif priority in self._classes:
+            return priority
+
+        else:
+            raise ValueError(f"Unknown LMM priority class: {priority}")
+
+    async def acquire(
+        self,
+        priority: str | None = None,
+        /,
+    ) -> None:
+        """
+        Wait for the invocation slot of a given priority class.
+        """
+        priority = self._priority(priority)
+        loop: AbstractEventLoop = get_running_loop()
+        # virtual finish time of the request - lower weight advances it faster
+        finish_tag: float = max(self._finish_tags[priority], self._virtual_time) + (
+            1 / self._classes[priority].weight
+        )
+        self._finish_tags[priority] = finish_tag
+        waiting: Future[None] = loop.create_future()
+        self._waiting[priority].append((finish_tag, waiting))
+        self._dispatch()
+
+        try:
+            await waiting
+
+        except CancelledError as exc:
+            if not waiting.cancelled():
+                # slot was already granted - give it back
+                self.release(priority)
+
+            raise exc
+
+    def release(
+        self,
+        priority: str | None = None,
+        /,
+    ) -> None:
+        """
+        Release previously acquired invocation slot of a given priority class.
+        """
+        priority = self._priority(priority)
+        assert self._running[priority] > 0, "Unbalanced scheduler release"  # nosec: B101
+        self._running[priority] -= 1
+        self._running_total -= 1
+        self._dispatch()
+
+    def _dispatch(self) -> None:
+        while self._running_total < self._concurrency:
+            selected: str | None = None
+            selected_tag: float = 0
+            for name, waiting in self._waiting.items():
+                while waiting and waiting[0][1].done():
+                    waiting.popleft()  # drop cancelled requests
+
+                if not waiting:
+                    continue
+
+                limit: int | None = self._classes[name].concurrency
+                if limit is not None and self._running[name] >= limit:
+                    continue
+
+                if selected is None or waiting[0][0] < selected_tag:
+                    selected = name
+                    selected_tag = waiting[0][0]
+
+            if selected is None:
+                return  # nothing can be started
+
+            _, future = self._waiting[selected].popleft()
+            self._virtual_time = max(self._virtual_time, selected_tag)
+            self._running[selected] += 1
+            self._running_total += 1
+            future.set_result(None)
+
+
+class LMMScheduling(State):
+    scheduler: LMMScheduler | None = None
+    priority: str | None = None
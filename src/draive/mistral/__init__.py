@@ -1,16 +1,18 @@
 from draive.mistral.client import MistralClient
-from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig
+from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig, MistralEndpoint
 from draive.mistral.embedding import mistral_embed_text
 from draive.mistral.errors import MistralException
 from draive.mistral.lmm import mistral_lmm_invocation
-from draive.mistral.tokenization import mistral_tokenize_text
+from draive.mistral.tokenization import mistral_tokenize_text, mistral_tokenize_texts
 
 __all__ = [
     "mistral_embed_text",
     "mistral_lmm_invocation",
     "mistral_tokenize_text",
+    "mistral_tokenize_texts",
     "MistralChatConfig",
     "MistralClient",
     "MistralEmbeddingConfig",
+    "MistralEndpoint",
     "MistralException",
 ]
@@ -1,13 +1,16 @@
 import json
 from asyncio import gather
-from collections.abc import AsyncIterable, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
+from contextlib import AsyncExitStack
 from http import HTTPStatus
 from itertools import chain
-from typing import Any, Literal, Self, cast, final, overload
+from typing import Any, Literal, Self, final, overload
 
-from httpx import AsyncClient, Response
+from httpx import AsyncBaseTransport, AsyncClient, Response
 
-from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig
+from draive.helpers.balancer import EndpointBalancer, EndpointStatus
+from draive.http import shared_http_transport
+from draive.mistral.config import MistralChatConfig, MistralEmbeddingConfig, MistralEndpoint
 from draive.mistral.errors import MistralException
 from draive.mistral.models import (
     ChatCompletionResponse,
@@ -17,7 +20,7 @@ from draive.mistral.models import (
 )
 from draive.parameters import DataModel
 from draive.scope import ScopeDependency
-from draive.utils import getenv_str, not_missing
+from draive.utils import getenv_str, not_missing, sse_events
 
 __all__ = [
     "MistralClient",
@@ -34,20 +37,53 @@ class MistralClient(ScopeDependency):
             timeout=90,
         )
 
-    def __init__(
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse the client and its connections between scopes
+
+    def __init__(  # noqa: PLR0913
         self,
-        endpoint: str,
-        api_key: str | None,
+        endpoint: str | None = None,
+        api_key: str | None = None,
         timeout: float | None = None,
+        *,
+        endpoints: Sequence[MistralEndpoint] | None = None,
+        balancing: Literal["least_outstanding", "remaining_quota"] = "least_outstanding",
+        transport: AsyncBaseTransport | None = None,
     ) -> None:
-        self._client: AsyncClient = AsyncClient(
-            base_url=endpoint,
-            headers={
-                "Authorization": f"Bearer {api_key}",
-            },
-            timeout=timeout,
+        # balance between multiple endpoints if provided
+        if endpoints:
+            assert not (  # nosec: B101
+                endpoint or api_key
+            ), "Can't use both endpoints and a single endpoint configuration"
+
+        else:
+            assert endpoint, "Missing Mistral endpoint"  # nosec: B101
+            endpoints = [MistralEndpoint(endpoint=endpoint, api_key=api_key)]
+
+        self._balancer: EndpointBalancer[AsyncClient] = EndpointBalancer(
+            [
+                (
+                    element.name or f"mistral_{index}",
+                    AsyncClient(
+                        base_url=element.endpoint,
+                        headers={
+                            "Authorization": f"Bearer {element.api_key}",
+                        },
+                        timeout=timeout,
+                        # reuse process wide connection pool by default
+                        transport=transport or shared_http_transport(),
+                    ),
+                )
+                for index, element in enumerate(endpoints)
+            ],
+            strategy=balancing,
         )
 
+    @property
+    def endpoints_status(self) -> list[EndpointStatus]:
+        return self._balancer.status
+
     @overload
     async def chat_completion(
         self,
@@ -57,7 +93,7 @@ class MistralClient(ScopeDependency):
         tools: list[dict[str, object]] | None = None,
         tool_choice: Literal["auto", "any", "none"] = "auto",
         stream: Literal[True],
-    ) -> AsyncIterable[ChatCompletionStreamResponse]: ...
+    ) -> AsyncIterator[ChatCompletionStreamResponse]: ...
 
     @overload
     async def chat_completion(
@@ -77,30 +113,42 @@ class MistralClient(ScopeDependency):
         tools: list[dict[str, object]] | None = None,
         tool_choice: Literal["auto", "any", "none"] = "auto",
         stream: bool = False,
-    ) -> AsyncIterable[ChatCompletionStreamResponse] | ChatCompletionResponse:
+    ) -> AsyncIterator[ChatCompletionStreamResponse] | ChatCompletionResponse:
+        # messages may be cached or owned by the caller, prepare a copy instead of editing them
+        if messages[-1]["role"] == "assistant":
+            if config.response_format == {"type": "json_object"}:
+                messages = messages[:-1]  # for json mode ignore prefill
+
+            else:
+                # add prefill parameter indicator
+                messages = [*messages[:-1], {**messages[-1], "prefix": True}]
+
+        request_body: dict[str, Any] = {
+            "model": config.model,
+            "temperature": config.temperature,
+            "messages": messages,
+        }
+
+        if tools:
+            request_body["tools"] = tools
+            request_body["tool_choice"] = tool_choice
+        if config.max_tokens:
+            request_body["max_tokens"] = config.max_tokens
+        if not_missing(config.top_p):
+            request_body["top_p"] = config.top_p
+        if not_missing(config.seed) and config.seed is not None:
+            request_body["random_seed"] = config.seed
+        if not_missing(config.stop_sequences) and config.stop_sequences:
+            request_body["stop"] = config.stop_sequences
+        if not_missing(config.response_format):
+            request_body["response_format"] = config.response_format
+
         if stream:
-            raise NotImplementedError("Mistral streaming is not supported yet")
+            request_body["stream"] = True
+            return self._create_chat_completion_stream(request_body)
 
         else:
-            if messages[-1]["role"] == "assistant":
-                if config.response_format == {"type": "json_object"}:
-                    del messages[-1]  # for json mode ignore prefill
-
-                else:
-                    messages[-1]["prefix"] = True  # add prefill parameter indicator
-
-            return await self._create_chat_completion(
-                messages=messages,
-                model=config.model,
-                temperature=config.temperature,
-                top_p=config.top_p if not_missing(config.top_p) else None,
-                max_tokens=config.max_tokens if not_missing(config.max_tokens) else None,
-                response_format=cast(dict[str, str], config.response_format),
-                seed=config.seed if not_missing(config.seed) else None,
-                tools=tools,
-                tool_choice=tool_choice if tools else None,
-                stop=config.stop_sequences if not_missing(config.stop_sequences) else None,
-            )
+            return await self._create_chat_completion(request_body)
 
     async def embedding(
         self,
@@ -121,42 +169,11 @@ class MistralClient(ScopeDependency):
             )
         )
 
-    async def _create_chat_completion(  # noqa: PLR0913
+    async def _create_chat_completion(
         self,
-        model: str,
-        temperature: float,
-        top_p: float | None,
-        seed: int | None,
-        max_tokens: int | None,
-        response_format: dict[str, str] | None,
-        messages: list[ChatMessage],
-        tools: list[dict[str, object]] | None,
-        tool_choice: str | None,
-        stop: list[str] | None,
+        request_body: dict[str, Any],
+        /,
     ) -> ChatCompletionResponse:
-        request_body: dict[str, Any] = {
-            "model": model,
-            "temperature": temperature,
-            "messages": messages,
-        }
-
-        if tools:
-            request_body["tools"] = tools
-        if tool_choice is not None:
-            request_body["tool_choice"] = tool_choice
-        elif tools:
-            request_body["tool_choice"] = "auto"
-        if max_tokens:
-            request_body["max_tokens"] = max_tokens
-        if top_p is not None:
-            request_body["top_p"] = top_p
-        if seed is not None:
-            request_body["random_seed"] = seed
-        if stop:
-            request_body["stop"] = stop
-        if response_format is not None:
-            request_body["response_format"] = response_format
-
         return await self._request(
             model=ChatCompletionResponse,
             method="POST",
@@ -164,6 +181,62 @@ class MistralClient(ScopeDependency):
             body=request_body,
         )
 
+    async def _create_chat_completion_stream(
+        self,
+        request_body: dict[str, Any],
+        /,
+    ) -> AsyncGenerator[ChatCompletionStreamResponse, None]:
+        with self._balancer.lease() as lease:
+            async with AsyncExitStack() as stack:
+                response: Response
+                try:
+                    response = await stack.enter_async_context(
+                        lease.endpoint.stream(
+                            method="POST",
+                            url="v1/chat/completions",
+                            headers={
+                                "Accept": "text/event-stream",
+                                "Content-Type": "application/json",
+                            },
+                            content=json.dumps(request_body),
+                        )
+                    )
+
+                except Exception as exc:
+                    lease.eject()
+                    raise MistralException("Network request failed") from exc
+
+                status: HTTPStatus = HTTPStatus(value=response.status_code)
+                if status.is_success:
+                    lease.update_quota(response.headers.get("x-ratelimit-remaining-requests"))
+
+                elif status.is_client_error:
+                    if status == HTTPStatus.TOO_MANY_REQUESTS:
+                        lease.eject(_retry_after(response))
+
+                    error_body: bytes = await response.aread()
+                    raise MistralException(
+                        "Mistral request error: %s %s",
+                        status,
+                        error_body.decode("utf-8"),
+                    )
+
+                else:
+                    lease.eject()
+                    raise MistralException("Network request failed %s", response)
+
+                async for event in sse_events(response.aiter_bytes()):
+                    if event == b"[DONE]":
+                        break  # end of the stream
+
+                    try:
+                        yield ChatCompletionStreamResponse.from_json(event)
+
+                    except Exception as exc:
+                        raise MistralException(
+                            "Failed to decode Mistral stream chunk", event
+                        ) from exc
+
     async def _create_text_embedding(
         self,
         model: str,
@@ -181,7 +254,7 @@ class MistralClient(ScopeDependency):
         return [element.embedding for element in response.data]
 
     async def dispose(self) -> None:
-        await self._client.aclose()
+        await gather(*[client.aclose() for client in self._balancer.endpoints])
 
     async def _request[Requested: DataModel](  # noqa: PLR0913
         self,
@@ -217,36 +290,56 @@ class MistralClient(ScopeDependency):
         if body_content:
             request_headers["Content-Type"] = "application/json"
 
-        response: Response
-        try:
-            response = await self._client.request(
-                method=method,
-                url=url,
-                headers=request_headers,
-                params=query,
-                content=body_content,
-                follow_redirects=follow_redirects or False,
-                timeout=timeout,
-            )
-
-        except Exception as exc:
-            raise MistralException("Network request failed") from exc
-
-        status: HTTPStatus = HTTPStatus(value=response.status_code)
-        if status.is_success:
+        with self._balancer.lease() as lease:
+            response: Response
             try:
-                return model.from_json(await response.aread())
+                response = await lease.endpoint.request(
+                    method=method,
+                    url=url,
+                    headers=request_headers,
+                    params=query,
+                    content=body_content,
+                    follow_redirects=follow_redirects or False,
+                    timeout=timeout,
+                )
 
             except Exception as exc:
-                raise MistralException("Failed to decode Mistral response %s", response) from exc
-
-        elif status.is_client_error:
-            error_body: bytes = await response.aread()
-            raise MistralException(
-                "Mistral request error: %s %s",
-                status,
-                error_body.decode("utf-8"),
-            )
+                lease.eject()
+                raise MistralException("Network request failed") from exc
 
-        else:
-            raise MistralException("Network request failed %s", response)
+            status: HTTPStatus = HTTPStatus(value=response.status_code)
+            if status.is_success:
+                lease.update_quota(response.headers.get("x-ratelimit-remaining-requests"))
+                try:
+                    return model.from_json(await response.aread())
+
+                except Exception as exc:
+                    raise MistralException(
+                        "Failed to decode Mistral response %s", response
+                    ) from exc
+
+            elif status.is_client_error:
+                if status == HTTPStatus.TOO_MANY_REQUESTS:
+                    lease.eject(_retry_after(response))
+
+                error_body: bytes = await response.aread()
+                raise MistralException(
+                    "Mistral request error: %s %s",
+                    status,
+                    error_body.decode("utf-8"),
+                )
+
+            else:
+                lease.eject()
+                raise MistralException("Network request failed %s", response)
+
+
+def _retry_after(
+    response: Response,
+    /,
+) -> float | None:
+    try:
+        return float(response.headers.get("Retry-After", ""))
+
+    except ValueError:
+        return None
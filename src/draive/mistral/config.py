@@ -6,6 +6,7 @@ from draive.utils import MISSING, Missing
 __all__ = [
     "MistralChatConfig",
     "MistralEmbeddingConfig",
+    "MistralEndpoint",
 ]
 
 
@@ -27,3 +28,9 @@ class MistralChatConfig(DataModel):
 class MistralEmbeddingConfig(DataModel):
     model: str = "mistral-embed"
     batch_size: int = 128
+
+
+class MistralEndpoint(DataModel):
+    name: str | None = None
+    endpoint: str
+    api_key: str | None = None
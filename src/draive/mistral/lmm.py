@@ -1,5 +1,5 @@
 import json
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from typing import Any, Literal, cast, overload
 
 from draive.instructions import Instruction
@@ -8,7 +8,14 @@ from draive.metrics import ArgumentsTrace, ResultTrace, TokenUsage
 from draive.mistral.client import MistralClient
 from draive.mistral.config import MistralChatConfig
 from draive.mistral.errors import MistralException
-from draive.mistral.models import ChatCompletionResponse, ChatMessage, ChatMessageResponse
+from draive.mistral.models import (
+    ChatCompletionResponse,
+    ChatCompletionStreamResponse,
+    ChatDeltaMessageResponse,
+    ChatMessage,
+    ChatMessageResponse,
+    ChatToolCallResponse,
+)
 from draive.scope import ctx
 from draive.types import (
     LMMCompletion,
@@ -22,6 +29,7 @@ from draive.types import (
     LMMToolRequests,
     LMMToolResponse,
 )
+from draive.utils import identity_cache
 
 __all__ = [
     "mistral_lmm_invocation",
@@ -116,7 +124,7 @@ async def mistral_lmm_invocation(  # noqa: PLR0913
                 role="system",
                 content=Instruction.of(instruction).format(),
             ),
-            *[_convert_context_element(element=element) for element in context],
+            *[_convert_context_element(element) for element in context],
         ]
 
         if stream:
@@ -140,8 +148,11 @@ async def mistral_lmm_invocation(  # noqa: PLR0913
             )
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
+    /,
 ) -> ChatMessage:
     match element:
         case LMMInput() as input:
@@ -285,18 +296,93 @@ async def _chat_completion_stream(
     tools: Sequence[ToolSpecification] | None,
     tool_selection: LMMToolSelection,
 ) -> AsyncGenerator[LMMOutputStreamChunk, None]:
-    ctx.log_debug("Mistral streaming api is not supported yet, using regular response...")
-    output: LMMOutput = await _chat_completion(
-        client=client,
-        config=config,
-        messages=messages,
-        tools=tools,
-        tool_selection=tool_selection,
-    )
-
-    match output:
-        case LMMCompletion() as completion:
-            yield LMMCompletionChunk.of(completion.content)
+    completion_stream: AsyncIterator[ChatCompletionStreamResponse]
+    match tool_selection:
+        case "auto":
+            completion_stream = await client.chat_completion(
+                config=config,
+                messages=messages,
+                tools=cast(
+                    list[dict[str, object]],
+                    tools,
+                ),
+                tool_choice="auto",
+                stream=True,
+            )
+
+        case "none":
+            completion_stream = await client.chat_completion(
+                config=config,
+                messages=messages,
+                tools=[],
+                tool_choice="none",
+                stream=True,
+            )
+
+        case "required":
+            completion_stream = await client.chat_completion(
+                config=config,
+                messages=messages,
+                tools=cast(
+                    list[dict[str, object]],
+                    tools,
+                ),
+                tool_choice="any",
+                stream=True,
+            )
+
+        case tool:
+            assert tool in (tools or []), "Can't suggest a tool without using it"  # nosec: B101
+            completion_stream = await client.chat_completion(
+                config=config,
+                messages=messages,
+                tools=cast(
+                    list[dict[str, object]],
+                    [tool],  # mistral can't be suggested with concrete tool
+                ),
+                tool_choice="any",
+                stream=True,
+            )
+
+    accumulated_completion: str = ""
+    tool_calls: list[ChatToolCallResponse] = []
+    async for part in completion_stream:
+        if usage := part.usage:  # record usage if able (expected in the last part)
+            ctx.record(
+                TokenUsage.for_model(
+                    config.model,
+                    input_tokens=usage.prompt_tokens,
+                    output_tokens=usage.completion_tokens,
+                ),
+            )
+
+        if not part.choices:
+            continue  # usage only part
+
+        # we are always requesting single result - no need to take care of indices
+        delta: ChatDeltaMessageResponse = part.choices[0].delta
+        if delta.content:
+            accumulated_completion += delta.content
+            yield LMMCompletionChunk.of(delta.content)
 
-        case other:
-            yield other
+        if delta.tool_calls:
+            # mistral sends complete tool calls, no need to merge parts
+            tool_calls.extend(delta.tool_calls)
+
+    if tool_calls and tools:
+        ctx.record(ResultTrace.of(tool_calls))
+        yield LMMToolRequests(
+            requests=[
+                LMMToolRequest(
+                    identifier=call.id,
+                    tool=call.function.name,
+                    arguments=json.loads(call.function.arguments)
+                    if isinstance(call.function.arguments, str)
+                    else call.function.arguments,
+                )
+                for call in tool_calls
+            ]
+        )
+
+    else:
+        ctx.record(ResultTrace.of(accumulated_completion))
@@ -1,7 +1,8 @@
-from asyncio import Lock
-from collections.abc import AsyncIterable, Generator, Iterator
-from concurrent.futures import Executor, ThreadPoolExecutor
-from typing import Any, Final, Literal, Self, cast, final, overload
+from asyncio import get_running_loop, shield, wrap_future
+from collections.abc import AsyncIterable, Generator, Iterable, Iterator, Mapping
+from concurrent.futures import Future, ThreadPoolExecutor
+from functools import partial
+from typing import Any, Literal, Self, cast, final, overload
 
 from mistralrs import (  # type: ignore
     Architecture,
@@ -15,17 +16,76 @@ from mistralrs import (  # type: ignore
 from draive.mrs.config import MRSChatConfig
 from draive.mrs.errors import MRSException
 from draive.scope import ScopeDependency, ctx
-from draive.utils import asynchronous, not_missing
+from draive.utils import getenv_bool, getenv_int, not_missing
 
 __all__ = [
     "MRSClient",
 ]
 
-MRS_EXECUTOR: Final[Executor | None] = ThreadPoolExecutor(max_workers=1)
+MRSModel = (
+    Which.Plain
+    | Which.Lora
+    | Which.XLora
+    | Which.GGUF
+    | Which.GGML
+    | Which.LoraGGML
+    | Which.LoraGGUF
+    | Which.XLoraGGML
+    | Which.XLoraGGUF
+    | Which.VisionPlain
+)
+
+
+@final
+class _MRSModelRunner:
+    def __init__(
+        self,
+        *,
+        name: str,
+        model: MRSModel,
+        workers: int,
+    ) -> None:
+        self.model: MRSModel = model
+        # each model uses own threads, runner is loaded within them as well
+        self.executor: ThreadPoolExecutor = ThreadPoolExecutor(
+            max_workers=max(1, workers),
+            thread_name_prefix=f"mrs-{name}",
+        )
+        self._runner: Future[Runner] | None = None
+
+    def runner(self) -> Future[Runner]:
+        # start loading in the background if not loaded yet
+        if self._runner is None:
+            self._runner = self.executor.submit(Runner, which=self.model)
+
+        return self._runner
+
+    async def loaded_runner(self) -> Runner:
+        loading: Future[Runner] = self.runner()
+        try:
+            # shield to avoid cancelling loading shared with other requests
+            return await shield(wrap_future(loading))
+
+        except Exception as exc:
+            if self._runner is loading:
+                self._runner = None  # allow loading again after failure
+
+            raise MRSException("Failed to load model runner") from exc
+
+    def dispose(self) -> None:
+        self._runner = None
+        self.executor.shutdown(
+            wait=False,
+            cancel_futures=True,
+        )
 
 
 @final
 class MRSClient(ScopeDependency):
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse loaded models between scopes
+
     @classmethod
     def prepare(cls) -> Self:
         return cls(
@@ -36,40 +96,56 @@ class MRSClient(ScopeDependency):
                     tokenizer_json=None,
                     repeat_last_n=64,
                 ),
-            }
+            },
+            workers=getenv_int("MRS_WORKERS", 1),
+            preload=getenv_bool("MRS_PRELOAD", False),
         )
 
     def __init__(
         self,
-        models: dict[
-            str,
-            Which.Plain
-            | Which.Lora
-            | Which.XLora
-            | Which.GGUF
-            | Which.GGML
-            | Which.LoraGGML
-            | Which.LoraGGUF
-            | Which.XLoraGGML
-            | Which.XLoraGGUF
-            | Which.VisionPlain,
-        ],
+        models: dict[str, MRSModel],
+        *,
+        workers: int | Mapping[str, int] = 1,
+        preload: bool | Iterable[str] = False,
     ) -> None:
-        self._models: dict[
-            str,
-            Which.Plain
-            | Which.Lora
-            | Which.XLora
-            | Which.GGUF
-            | Which.GGML
-            | Which.LoraGGML
-            | Which.LoraGGUF
-            | Which.XLoraGGML
-            | Which.XLoraGGUF
-            | Which.VisionPlain,
-        ] = models
-        self._runners: dict[str, Runner] = {}
-        self._cache_lock: Lock = Lock()
+        """\
+        Client running local models using mistral.rs.
+
+        Parameters
+        ----------
+        models: dict[str, MRSModel]
+            models available for the client by their names
+        workers: int | Mapping[str, int]
+            number of concurrent requests executed for each model, either the same \
+            for all models or per model name, models missing in the mapping use one. \
+            Each model uses own threads so requests to different models do not wait \
+            for each other, concurrent requests to the same model are batched by \
+            the mistral.rs scheduler when supported. Default is 1.
+        preload: bool | Iterable[str]
+            models to load right away in the background, either all when True \
+            or selected by names, other models are loaded on first use. \
+            Default is False.
+        """
+        self._models: dict[str, _MRSModelRunner] = {
+            name: _MRSModelRunner(
+                name=name,
+                model=model,
+                workers=(workers.get(name, 1) if isinstance(workers, Mapping) else workers),
+            )
+            for name, model in models.items()
+        }
+
+        match preload:
+            case True:
+                for model in self._models.values():
+                    model.runner()
+
+            case False:
+                pass
+
+            case names:
+                for name in names:
+                    self._model(name).runner()
 
     @overload
     async def chat_completion(
@@ -131,15 +207,21 @@ class MRSClient(ScopeDependency):
         messages: list[dict[str, object]],
         stop_sequences: list[str] | None,
     ) -> ChatCompletionResponse:
-        return await self._send_chat_completion_request(
-            runner=await self._get_runner(model),
-            model=model,
-            temperature=temperature,
-            top_p=top_p,
-            top_k=top_k,
-            max_tokens=max_tokens,
-            messages=messages,
-            stop_sequences=stop_sequences,
+        model_runner: _MRSModelRunner = self._model(model)
+        runner: Runner = await model_runner.loaded_runner()
+        return await get_running_loop().run_in_executor(
+            model_runner.executor,
+            partial(
+                self._send_chat_completion_request,
+                runner=runner,
+                model=model,
+                temperature=temperature,
+                top_p=top_p,
+                top_k=top_k,
+                max_tokens=max_tokens,
+                messages=messages,
+                stop_sequences=stop_sequences,
+            ),
         )
 
     async def _create_chat_stream(  # noqa: PLR0913
@@ -152,9 +234,10 @@ class MRSClient(ScopeDependency):
         messages: list[dict[str, object]],
         stop_sequences: list[str] | None,
     ) -> AsyncIterable[ChatCompletionChunkResponse]:
+        model_runner: _MRSModelRunner = self._model(model)
         return ctx.stream_sync(
             self._send_chat_completion_stream_request(
-                runner=await self._get_runner(model),
+                runner=await model_runner.loaded_runner(),
                 model=model,
                 temperature=temperature,
                 top_p=top_p,
@@ -163,49 +246,27 @@ class MRSClient(ScopeDependency):
                 messages=messages,
                 stop_sequences=stop_sequences,
             ),
-            executor=MRS_EXECUTOR,
+            executor=model_runner.executor,
         )
 
     async def dispose(self) -> None:
-        pass
+        for model in self._models.values():
+            model.dispose()
 
-    async def _get_runner(
+    def _model(
         self,
         model_name: str,
         /,
-    ) -> Runner:
-        async with self._cache_lock:
-            if current := self._runners.get(model_name):
-                return current
-
-            elif model := self._models.get(model_name):
-                runner: Runner = await self._load_runner(model=model)
-                self._runners[model_name] = runner
-                return runner
+    ) -> _MRSModelRunner:
+        if model := self._models.get(model_name):
+            return model
 
-            else:
-                raise MRSException(
-                    "Requested unsupported model - %s",
-                    model_name,
-                )
-
-    @asynchronous(executor=MRS_EXECUTOR)
-    def _load_runner(
-        self,
-        model: Which.Plain
-        | Which.Lora
-        | Which.XLora
-        | Which.GGUF
-        | Which.GGML
-        | Which.LoraGGML
-        | Which.LoraGGUF
-        | Which.XLoraGGML
-        | Which.XLoraGGUF
-        | Which.VisionPlain,
-    ) -> Runner:
-        return Runner(which=model)
+        else:
+            raise MRSException(
+                "Requested unsupported model - %s",
+                model_name,
+            )
 
-    @asynchronous(executor=MRS_EXECUTOR)
     def _send_chat_completion_request(  # noqa: PLR0913
         self,
         runner: Runner,
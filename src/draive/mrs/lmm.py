@@ -27,6 +27,7 @@ from draive.types import (
     LMMToolRequests,
     LMMToolResponse,
 )
+from draive.utils import identity_cache
 
 __all__ = [
     "mrs_lmm_invocation",
@@ -119,7 +120,7 @@ async def mrs_lmm_invocation(  # noqa: PLR0913
                 "role": "system",
                 "content": Instruction.of(instruction).format(),
             },
-            *[_convert_context_element(element=element) for element in context],
+            *[_convert_context_element(element) for element in context],
         ]
 
         if stream:
@@ -139,8 +140,11 @@ async def mrs_lmm_invocation(  # noqa: PLR0913
             )
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
+    /,
 ) -> dict[str, object]:
     match element:
         case LMMInput() as input:
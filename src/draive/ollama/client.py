@@ -1,15 +1,18 @@
 import json
+from collections.abc import AsyncGenerator, AsyncIterator
+from contextlib import AsyncExitStack
 from http import HTTPStatus
-from typing import Any, Literal, Self, cast, final
+from typing import Any, Literal, Self, final, overload
 
-from httpx import AsyncClient, Response
+from httpx import AsyncBaseTransport, AsyncClient, Response
 
+from draive.http import shared_http_transport
 from draive.ollama.config import OllamaChatConfig
 from draive.ollama.errors import OllamaException
 from draive.ollama.models import ChatCompletionResponse, ChatMessage
 from draive.parameters import DataModel
 from draive.scope import ScopeDependency
-from draive.utils import getenv_str, not_missing
+from draive.utils import getenv_str, ndjson_lines, not_missing
 
 __all__ = [
     "OllamaClient",
@@ -25,76 +28,123 @@ class OllamaClient(ScopeDependency):
             timeout=90,
         )
 
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse the client and its connections between scopes
+
     def __init__(
         self,
         endpoint: str,
         timeout: float | None = None,
+        *,
+        transport: AsyncBaseTransport | None = None,
     ) -> None:
         self._client: AsyncClient = AsyncClient(
             base_url=endpoint,
             timeout=timeout,
+            # reuse process wide connection pool by default
+            transport=transport or shared_http_transport(),
         )
 
+    @overload
     async def chat_completion(
         self,
         *,
         config: OllamaChatConfig,
         messages: list[ChatMessage],
-    ) -> ChatCompletionResponse:
-        return await self._create_chat_completion(
-            messages=messages,
-            model=config.model,
-            temperature=config.temperature,
-            top_k=config.top_k if not_missing(config.top_k) else None,
-            top_p=config.top_p if not_missing(config.top_p) else None,
-            max_tokens=config.max_tokens if not_missing(config.max_tokens) else None,
-            response_format=cast(Literal["text", "json"], config.response_format)
-            if not_missing(config.response_format)
-            else "text",
-            seed=config.seed if not_missing(config.seed) else None,
-            stop=config.stop_sequences if not_missing(config.stop_sequences) else None,
-        )
+        stream: Literal[True],
+    ) -> AsyncIterator[ChatCompletionResponse]: ...
 
-    async def _create_chat_completion(  # noqa: PLR0913
+    @overload
+    async def chat_completion(
+        self,
+        *,
+        config: OllamaChatConfig,
+        messages: list[ChatMessage],
+        stream: Literal[False] = False,
+    ) -> ChatCompletionResponse: ...
+
+    async def chat_completion(
         self,
-        model: str,
-        temperature: float,
-        top_k: float | None,
-        top_p: float | None,
-        seed: int | None,
-        max_tokens: int | None,
-        response_format: Literal["text", "json"],
+        *,
+        config: OllamaChatConfig,
         messages: list[ChatMessage],
-        stop: list[str] | None,
-    ) -> ChatCompletionResponse:
+        stream: bool = False,
+    ) -> AsyncIterator[ChatCompletionResponse] | ChatCompletionResponse:
         request_body: dict[str, Any] = {
-            "model": model,
+            "model": config.model,
             "messages": [message.as_dict() for message in messages],
             "options": {
-                "temperature": temperature,
+                "temperature": config.temperature,
             },
-            "stream": False,
+            "stream": stream,
         }
 
-        if max_tokens:
-            request_body["options"]["num_predict"] = max_tokens
-        if top_k is not None:
-            request_body["options"]["top_k"] = top_k
-        if top_p is not None:
-            request_body["options"]["top_p"] = top_p
-        if seed is not None:
-            request_body["options"]["seed"] = seed
-        if stop:
-            request_body["options"]["stop"] = stop
-        if response_format == "json":
+        if config.max_tokens:
+            request_body["options"]["num_predict"] = config.max_tokens
+        if not_missing(config.top_k):
+            request_body["options"]["top_k"] = config.top_k
+        if not_missing(config.top_p):
+            request_body["options"]["top_p"] = config.top_p
+        if not_missing(config.seed) and config.seed is not None:
+            request_body["options"]["seed"] = config.seed
+        if not_missing(config.stop_sequences) and config.stop_sequences:
+            request_body["options"]["stop"] = config.stop_sequences
+        if not_missing(config.response_format) and config.response_format == "json":
             request_body["format"] = "json"
 
-        return await self._request(
-            model=ChatCompletionResponse,
-            method="POST",
-            url="/api/chat",
-            body=request_body,
-        )
+        if stream:
+            return self._create_chat_completion_stream(request_body)
+
+        else:
+            return await self._request(
+                model=ChatCompletionResponse,
+                method="POST",
+                url="/api/chat",
+                body=request_body,
+            )
+
+    async def _create_chat_completion_stream(
+        self,
+        request_body: dict[str, Any],
+        /,
+    ) -> AsyncGenerator[ChatCompletionResponse, None]:
+        async with AsyncExitStack() as stack:
+            response: Response
+            try:
+                response = await stack.enter_async_context(
+                    self._client.stream(
+                        method="POST",
+                        url="/api/chat",
+                        headers={
+                            "Accept": "application/x-ndjson",
+                            "Content-Type": "application/json",
+                        },
+                        content=json.dumps(request_body),
+                    )
+                )
+
+            except Exception as exc:
+                raise OllamaException("Network request failed") from exc
+
+            status: HTTPStatus = HTTPStatus(value=response.status_code)
+            if status.is_client_error:
+                error_body: bytes = await response.aread()
+                raise OllamaException(
+                    "Ollama request error: %s %s",
+                    status,
+                    error_body.decode("utf-8"),
+                )
+
+            elif not status.is_success:
+                raise OllamaException("Network request failed", response)
+
+            async for line in ndjson_lines(response.aiter_bytes()):
+                try:
+                    yield ChatCompletionResponse.from_json(line)
+
+                except Exception as exc:
+                    raise OllamaException("Failed to decode Ollama stream chunk", line) from exc
 
     async def dispose(self) -> None:
         await self._client.aclose()
@@ -1,4 +1,4 @@
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from typing import Any, Literal, overload
 
 from draive.instructions import Instruction
@@ -20,6 +20,7 @@ from draive.types import (
     LMMToolRequests,
     LMMToolResponse,
 )
+from draive.utils import identity_cache
 
 __all__ = [
     "ollama_lmm_invocation",
@@ -112,7 +113,7 @@ async def ollama_lmm_invocation(  # noqa: PLR0913
                 role="system",
                 content=Instruction.of(instruction).format(),
             ),
-            *[_convert_context_element(element=element) for element in context],
+            *[_convert_context_element(element) for element in context],
         ]
 
         if stream:
@@ -132,8 +133,11 @@ async def ollama_lmm_invocation(  # noqa: PLR0913
             )
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
+    /,
 ) -> ChatMessage:
     match element:
         case LMMInput() as input:
@@ -193,16 +197,36 @@ async def _chat_completion_stream(
     config: OllamaChatConfig,
     messages: list[ChatMessage],
 ) -> AsyncGenerator[LMMOutputStreamChunk, None]:
-    ctx.log_debug("Ollama streaming api is not supported yet, using regular response...")
-    output: LMMOutput = await _chat_completion(
-        client=client,
+    prefill: str = ""
+    if messages[-1].role == "assistant":
+        if config.response_format == "json":
+            del messages[-1]  # for json mode ignore prefill
+
+        else:
+            prefill = messages[-1].content
+
+    completion_stream: AsyncIterator[ChatCompletionResponse] = await client.chat_completion(
         config=config,
         messages=messages,
+        stream=True,
     )
 
-    match output:
-        case LMMCompletion() as completion:
-            yield LMMCompletionChunk.of(completion.content)
+    if prefill:  # emit prefill first to produce the same content as the regular response
+        yield LMMCompletionChunk.of(prefill)
+
+    accumulated_completion: str = prefill
+    async for part in completion_stream:
+        if part.message.content:
+            accumulated_completion += part.message.content
+            yield LMMCompletionChunk.of(part.message.content)
+
+        if part.done:  # last part contains usage
+            ctx.record(
+                TokenUsage.for_model(
+                    config.model,
+                    input_tokens=part.prompt_eval_count,
+                    output_tokens=part.eval_count,
+                ),
+            )
 
-        case other:
-            yield other
+    ctx.record(ResultTrace.of(accumulated_completion))
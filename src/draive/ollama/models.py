@@ -17,3 +17,4 @@ class ChatCompletionResponse(DataModel):
     message: ChatMessage
     prompt_eval_count: int | None = None
     eval_count: int | None = None
+    done: bool = True
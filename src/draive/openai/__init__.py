@@ -2,6 +2,7 @@ from draive.openai.client import OpenAIClient
 from draive.openai.config import (
     OpenAIChatConfig,
     OpenAIEmbeddingConfig,
+    OpenAIEndpoint,
     OpenAIImageGenerationConfig,
     OpenAIModerationConfig,
 )
@@ -10,7 +11,7 @@ from draive.openai.errors import OpenAIException
 from draive.openai.guardrails import openai_content_guardrails
 from draive.openai.images import openai_generate_image
 from draive.openai.lmm import openai_lmm_invocation
-from draive.openai.tokenization import openai_tokenize_text
+from draive.openai.tokenization import openai_tokenize_text, openai_tokenize_texts
 
 __all__ = [
     "openai_content_guardrails",
@@ -18,9 +19,11 @@ __all__ = [
     "openai_generate_image",
     "openai_lmm_invocation",
     "openai_tokenize_text",
+    "openai_tokenize_texts",
     "OpenAIChatConfig",
     "OpenAIClient",
     "OpenAIEmbeddingConfig",
+    "OpenAIEndpoint",
     "OpenAIException",
     "OpenAIImageGenerationConfig",
     "OpenAIModerationConfig",
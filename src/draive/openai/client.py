@@ -1,10 +1,20 @@
 from asyncio import gather
-from collections.abc import Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Generator, Sequence
+from contextlib import contextmanager
 from itertools import chain
 from random import uniform
 from typing import Literal, Self, cast, final, overload
 
-from openai import AsyncAzureOpenAI, AsyncOpenAI, AsyncStream
+from httpx import AsyncBaseTransport, Response, TransportError
+from openai import (
+    APIConnectionError,
+    APIError,
+    AsyncAzureOpenAI,
+    AsyncOpenAI,
+    AsyncStream,
+    DefaultAsyncHttpxClient,
+    InternalServerError,
+)
 from openai import RateLimitError as OpenAIRateLimitError
 from openai._types import NOT_GIVEN, NotGiven
 from openai.types import Moderation, ModerationCreateResponse
@@ -20,9 +30,11 @@ from openai.types.create_embedding_response import CreateEmbeddingResponse
 from openai.types.image import Image
 from openai.types.images_response import ImagesResponse
 
+from draive.helpers.balancer import EndpointBalancer, EndpointLease, EndpointStatus
 from draive.openai.config import (
     OpenAIChatConfig,
     OpenAIEmbeddingConfig,
+    OpenAIEndpoint,
     OpenAIImageGenerationConfig,
 )
 from draive.scope import ScopeDependency
@@ -47,34 +59,67 @@ class OpenAIClient(ScopeDependency):
             azure_deployment=getenv_str("AZURE_OPENAI_DEPLOYMENT_NAME"),
         )
 
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"  # reuse the client and its connections between scopes
+
     def __init__(  # noqa: PLR0913
         self,
-        base_url: str | None,
-        api_key: str | None,
+        base_url: str | None = None,
+        api_key: str | None = None,
         organization: str | None = None,
         azure_api_endpoint: str | None = None,
         azure_api_version: str | None = None,
         azure_deployment: str | None = None,
+        *,
+        endpoints: Sequence[OpenAIEndpoint] | None = None,
+        balancing: Literal["least_outstanding", "remaining_quota"] = "least_outstanding",
+        transport: AsyncBaseTransport | None = None,
     ) -> None:
-        # if all AZURE settings were provided use it as provider
-        if azure_api_endpoint and azure_deployment and azure_api_version:
-            self._client: AsyncOpenAI = AsyncAzureOpenAI(
-                api_key=api_key,
-                azure_endpoint=azure_api_endpoint,
-                azure_deployment=azure_deployment,
-                api_version=azure_api_version,
-                organization=organization,
-            )
-        # otherwise try using OpenAI
+        # balance between multiple endpoints if provided
+        if endpoints:
+            assert not (  # nosec: B101
+                base_url or api_key or organization or azure_api_endpoint
+            ), "Can't use both endpoints and a single endpoint configuration"
+
         else:
-            self._client: AsyncOpenAI = AsyncOpenAI(
-                base_url=base_url,
-                api_key=api_key,
-                organization=organization,
-            )
+            endpoints = [
+                OpenAIEndpoint(
+                    base_url=base_url,
+                    api_key=api_key,
+                    organization=organization,
+                    azure_api_endpoint=azure_api_endpoint,
+                    azure_api_version=azure_api_version,
+                    azure_deployment=azure_deployment,
+                )
+            ]
+
+        names: list[str] = [
+            endpoint.name or f"openai_{index}" for index, endpoint in enumerate(endpoints)
+        ]
+        # remaining quota is read from response headers of each endpoint
+        self._quotas: dict[str, _RemainingQuota] = {name: _RemainingQuota() for name in names}
+        self._balancer: EndpointBalancer[AsyncOpenAI] = EndpointBalancer(
+            [
+                (
+                    name,
+                    _prepare_client(
+                        endpoint,
+                        quota=self._quotas[name],
+                        transport=transport,
+                    ),
+                )
+                for name, endpoint in zip(names, endpoints, strict=True)
+            ],
+            strategy=balancing,
+        )
 
         freeze(self)
 
+    @property
+    def endpoints_status(self) -> list[EndpointStatus]:
+        return self._balancer.status
+
     @overload
     async def chat_completion(
         self,
@@ -84,7 +129,7 @@ class OpenAIClient(ScopeDependency):
         tools: list[ChatCompletionToolParam] | None = None,
         tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven = NOT_GIVEN,
         stream: Literal[True],
-    ) -> AsyncStream[ChatCompletionChunk]: ...
+    ) -> AsyncIterator[ChatCompletionChunk]: ...
 
     @overload
     async def chat_completion(
@@ -104,9 +149,93 @@ class OpenAIClient(ScopeDependency):
         tools: list[ChatCompletionToolParam] | None = None,
         tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven = NOT_GIVEN,
         stream: bool = False,
+    ) -> AsyncIterator[ChatCompletionChunk] | ChatCompletion:
+        if stream:
+            return self._create_chat_completion_stream(
+                config=config,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+            )
+
+        else:
+            with self._balancer.lease() as lease:
+                return await self._create_chat_completion(
+                    lease,
+                    config=config,
+                    messages=messages,
+                    tools=tools,
+                    tool_choice=tool_choice,
+                    stream=False,
+                )
+
+    async def _create_chat_completion_stream(
+        self,
+        *,
+        config: OpenAIChatConfig,
+        messages: list[ChatCompletionMessageParam],
+        tools: list[ChatCompletionToolParam] | None,
+        tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven,
+    ) -> AsyncGenerator[ChatCompletionChunk, None]:
+        # keep the lease until the whole stream is received or closed
+        with self._balancer.lease() as lease:
+            response: AsyncStream[ChatCompletionChunk] = await self._create_chat_completion(
+                lease,
+                config=config,
+                messages=messages,
+                tools=tools,
+                tool_choice=tool_choice,
+                stream=True,
+            )
+            async with response:
+                with _handling_failures(lease, quota=self._quotas[lease.name]):
+                    try:
+                        async for chunk in response:
+                            yield chunk
+
+                    except APIError as exc:  # error events received within the stream
+                        lease.eject()
+                        raise exc
+
+    @overload
+    async def _create_chat_completion(
+        self,
+        lease: EndpointLease[AsyncOpenAI],
+        /,
+        *,
+        config: OpenAIChatConfig,
+        messages: list[ChatCompletionMessageParam],
+        tools: list[ChatCompletionToolParam] | None,
+        tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven,
+        stream: Literal[True],
+    ) -> AsyncStream[ChatCompletionChunk]: ...
+
+    @overload
+    async def _create_chat_completion(
+        self,
+        lease: EndpointLease[AsyncOpenAI],
+        /,
+        *,
+        config: OpenAIChatConfig,
+        messages: list[ChatCompletionMessageParam],
+        tools: list[ChatCompletionToolParam] | None,
+        tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven,
+        stream: Literal[False],
+    ) -> ChatCompletion: ...
+
+    async def _create_chat_completion(  # noqa: PLR0913
+        self,
+        lease: EndpointLease[AsyncOpenAI],
+        /,
+        *,
+        config: OpenAIChatConfig,
+        messages: list[ChatCompletionMessageParam],
+        tools: list[ChatCompletionToolParam] | None,
+        tool_choice: ChatCompletionToolChoiceOptionParam | NotGiven,
+        stream: bool,
     ) -> AsyncStream[ChatCompletionChunk] | ChatCompletion:
-        try:
-            return await self._client.chat.completions.create(
+        with _handling_failures(lease, quota=self._quotas[lease.name]):
+            return await lease.endpoint.chat.completions.create(
                 messages=messages,
                 model=config.model,
                 frequency_penalty=config.frequency_penalty
@@ -129,19 +258,6 @@ class OpenAIClient(ScopeDependency):
                 stop=config.stop_sequences if not_missing(config.stop_sequences) else NOT_GIVEN,
             )
 
-        except OpenAIRateLimitError as exc:  # retry on rate limit after delay
-            if delay := exc.response.headers.get("Retry-After"):
-                try:
-                    raise RateLimitError(
-                        retry_after=float(delay) + uniform(0.0, 0.3)  # nosec: B311 # add small random delay
-                    ) from exc
-
-                except ValueError:
-                    raise exc from None
-
-            else:
-                raise exc
-
     async def embedding(
         self,
         config: OpenAIEmbeddingConfig,
@@ -176,37 +292,31 @@ class OpenAIClient(ScopeDependency):
         encoding_format: Literal["float", "base64"] | NotGiven,
         timeout: float | NotGiven,
     ) -> list[list[float]]:
-        while True:
-            try:
-                response: CreateEmbeddingResponse = await self._client.embeddings.create(
-                    input=list(texts),
-                    model=model,
-                    dimensions=dimensions,
-                    encoding_format=encoding_format,
-                    timeout=timeout,
-                )
-                return [element.embedding for element in response.data]
-
-            except OpenAIRateLimitError as exc:  # always retry on rate limit after delay
-                if delay := exc.response.headers.get("Retry-After"):
-                    try:
-                        raise RateLimitError(
-                            retry_after=float(delay) + uniform(0.0, 0.3)  # nosec: B311 # add small random delay
-                        ) from exc
-
-                    except ValueError:
-                        raise exc from None
-
-                else:
-                    raise exc
+        with (
+            self._balancer.lease() as lease,
+            _handling_failures(lease, quota=self._quotas[lease.name]),
+        ):
+            response: CreateEmbeddingResponse = await lease.endpoint.embeddings.create(
+                input=list(texts),
+                model=model,
+                dimensions=dimensions,
+                encoding_format=encoding_format,
+                timeout=timeout,
+            )
+            return [element.embedding for element in response.data]
 
     async def moderation_check(
         self,
         text: str,
     ) -> Moderation:
-        response: ModerationCreateResponse = await self._client.moderations.create(
-            input=text,
-        )
+        with (
+            self._balancer.lease() as lease,
+            _handling_failures(lease, quota=self._quotas[lease.name]),
+        ):
+            response: ModerationCreateResponse = await lease.endpoint.moderations.create(
+                input=text,
+            )
+
         return response.results[0]  # TODO: check API about multiple results
 
     async def generate_image(
@@ -214,17 +324,102 @@ class OpenAIClient(ScopeDependency):
         config: OpenAIImageGenerationConfig,
         instruction: str,
     ) -> Image:
-        response: ImagesResponse = await self._client.images.generate(
-            model=config.model,
-            n=1,
-            prompt=instruction,
-            quality=config.quality,
-            size=config.size,
-            style=config.style,
-            timeout=config.timeout if not_missing(config.timeout) else NOT_GIVEN,
-            response_format=config.response_format,
-        )
+        with (
+            self._balancer.lease() as lease,
+            _handling_failures(lease, quota=self._quotas[lease.name]),
+        ):
+            response: ImagesResponse = await lease.endpoint.images.generate(
+                model=config.model,
+                n=1,
+                prompt=instruction,
+                quality=config.quality,
+                size=config.size,
+                style=config.style,
+                timeout=config.timeout if not_missing(config.timeout) else NOT_GIVEN,
+                response_format=config.response_format,
+            )
+
         return response.data[0]
 
     async def dispose(self) -> None:
-        await self._client.close()
+        await gather(*[client.close() for client in self._balancer.endpoints])
+
+
+@final
+class _RemainingQuota:
+    def __init__(self) -> None:
+        self.remaining: str | None = None
+
+    async def __call__(
+        self,
+        response: Response,
+    ) -> None:
+        if remaining := response.headers.get("x-ratelimit-remaining-requests"):
+            self.remaining = remaining
+
+
+@contextmanager
+def _handling_failures(
+    lease: EndpointLease[AsyncOpenAI],
+    /,
+    *,
+    quota: _RemainingQuota,
+) -> Generator[None, None, None]:
+    try:
+        yield
+
+    except OpenAIRateLimitError as exc:  # retry on rate limit after delay
+        if delay := exc.response.headers.get("Retry-After"):
+            try:
+                lease.eject(float(delay))
+                raise RateLimitError(
+                    retry_after=float(delay) + uniform(0.0, 0.3)  # nosec: B311 # add small random delay
+                ) from exc
+
+            except ValueError:
+                lease.eject()
+                raise exc from None
+
+        else:
+            lease.eject()
+            raise exc
+
+    except (APIConnectionError, InternalServerError, TransportError) as exc:
+        lease.eject()
+        raise exc
+
+    finally:
+        # rate limit headers are also available on failures
+        lease.update_quota(quota.remaining)
+
+
+def _prepare_client(
+    endpoint: OpenAIEndpoint,
+    /,
+    *,
+    quota: _RemainingQuota,
+    transport: AsyncBaseTransport | None,
+) -> AsyncOpenAI:
+    http_client = DefaultAsyncHttpxClient(
+        event_hooks={"response": [quota]},
+        transport=transport,
+    )
+    # if all AZURE settings were provided use it as provider
+    if endpoint.azure_api_endpoint and endpoint.azure_deployment and endpoint.azure_api_version:
+        return AsyncAzureOpenAI(
+            api_key=endpoint.api_key,
+            azure_endpoint=endpoint.azure_api_endpoint,
+            azure_deployment=endpoint.azure_deployment,
+            api_version=endpoint.azure_api_version,
+            organization=endpoint.organization,
+            http_client=http_client,
+        )
+
+    # otherwise try using OpenAI
+    else:
+        return AsyncOpenAI(
+            base_url=endpoint.base_url,
+            api_key=endpoint.api_key,
+            organization=endpoint.organization,
+            http_client=http_client,
+        )
@@ -6,6 +6,7 @@ from draive.utils import MISSING, Missing
 __all__ = [
     "OpenAIChatConfig",
     "OpenAIEmbeddingConfig",
+    "OpenAIEndpoint",
     "OpenAIImageGenerationConfig",
     "OpenAIModerationConfig",
     "OpenAISystemFingerprint",
@@ -16,6 +17,16 @@ class ResponseFormat(TypedDict):
     type: Literal["text", "json_object"]
 
 
+class OpenAIEndpoint(DataModel):
+    name: str | None = None
+    base_url: str | None = None
+    api_key: str | None = None
+    organization: str | None = None
+    azure_api_endpoint: str | None = None
+    azure_api_version: str | None = None
+    azure_deployment: str | None = None
+
+
 class OpenAIChatConfig(DataModel):
     model: str = "gpt-4o-mini"
     temperature: float = 0.75
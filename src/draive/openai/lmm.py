@@ -1,9 +1,8 @@
 import json
-from collections.abc import AsyncGenerator, Sequence
+from collections.abc import AsyncGenerator, AsyncIterator, Sequence
 from typing import Any, Literal, cast, overload
 from uuid import uuid4
 
-from openai import AsyncStream as OpenAIAsyncStream
 from openai.types.chat import (
     ChatCompletion,
     ChatCompletionChunk,
@@ -24,8 +23,10 @@ from draive.parameters import DataModel
 from draive.scope import ctx
 from draive.types import (
     AudioBase64Content,
+    AudioDataContent,
     AudioURLContent,
     ImageBase64Content,
+    ImageDataContent,
     ImageURLContent,
     LMMCompletion,
     LMMCompletionChunk,
@@ -40,9 +41,10 @@ from draive.types import (
     MultimodalContentElement,
     TextContent,
     VideoBase64Content,
+    VideoDataContent,
     VideoURLContent,
 )
-from draive.utils import not_missing
+from draive.utils import identity_cache, not_missing
 
 __all__ = [
     "openai_lmm_invocation",
@@ -124,12 +126,17 @@ async def openai_lmm_invocation(  # noqa: PLR0913
             case "json":
                 config = config.updated(response_format={"type": "json_object"})
 
+        vision_details: Literal["auto", "low", "high"] = (
+            cast(Literal["auto", "low", "high"], config.vision_details)
+            if not_missing(config.vision_details)
+            else "auto"
+        )
         messages: list[ChatCompletionMessageParam] = [
             {
                 "role": "system",
                 "content": Instruction.of(instruction).format(),
             },
-            *[_convert_context_element(config=config, element=element) for element in context],
+            *[_convert_context_element(element, vision_details) for element in context],
         ]
 
         if stream:
@@ -155,7 +162,7 @@ async def openai_lmm_invocation(  # noqa: PLR0913
 
 def _convert_content_element(
     element: MultimodalContentElement,
-    config: OpenAIChatConfig,
+    vision_details: Literal["auto", "low", "high"],
 ) -> ChatCompletionContentPartParam:
     match element:
         case TextContent() as text:
@@ -169,20 +176,16 @@ def _convert_content_element(
                 "type": "image_url",
                 "image_url": {
                     "url": image.image_url,
-                    "detail": cast(Literal["auto", "low", "high"], config.vision_details)
-                    if not_missing(config.vision_details)
-                    else "auto",
+                    "detail": vision_details,
                 },
             }
 
-        case ImageBase64Content() as image:
+        case ImageBase64Content() | ImageDataContent() as image:
             return {
                 "type": "image_url",
                 "image_url": {
                     "url": f"data:{image.mime_type or 'image/jpeg'};base64,{image.image_base64}",
-                    "detail": cast(Literal["auto", "low", "high"], config.vision_details)
-                    if not_missing(config.vision_details)
-                    else "auto",
+                    "detail": vision_details,
                 },
             }
 
@@ -190,7 +193,7 @@ def _convert_content_element(
             # TODO: OpenAI models with audio?
             raise ValueError("Unsupported message content", element)
 
-        case AudioBase64Content():
+        case AudioBase64Content() | AudioDataContent():
             # TODO: we could upload media using openAI endpoint to have url instead
             raise ValueError("Unsupported message content", element)
 
@@ -198,7 +201,7 @@ def _convert_content_element(
             # TODO: OpenAI models with video?
             raise ValueError("Unsupported message content", element)
 
-        case VideoBase64Content():
+        case VideoBase64Content() | VideoDataContent():
             # TODO: we could upload media using openAI endpoint to have url instead
             raise ValueError("Unsupported message content", element)
 
@@ -209,9 +212,12 @@ def _convert_content_element(
             }
 
 
+# context grows with each tool call, convert elements only once
+@identity_cache
 def _convert_context_element(
     element: LMMContextElement,
-    config: OpenAIChatConfig,
+    /,
+    vision_details: Literal["auto", "low", "high"],
 ) -> ChatCompletionMessageParam:
     match element:
         case LMMInput() as input:
@@ -220,7 +226,7 @@ def _convert_context_element(
                 "content": [
                     _convert_content_element(
                         element=element,
-                        config=config,
+                        vision_details=vision_details,
                     )
                     for element in input.content.parts
                 ],
@@ -412,7 +418,7 @@ async def _chat_completion_stream(  # noqa: C901, PLR0912, PLR0915
         case _:
             pass
 
-    completion_stream: OpenAIAsyncStream[ChatCompletionChunk]
+    completion_stream: AsyncIterator[ChatCompletionChunk]
     match tool_selection:
         case "auto":
             completion_stream = await client.chat_completion(
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any
 
 from tiktoken import Encoding, encoding_for_model
@@ -8,6 +9,7 @@ from draive.utils import cache
 
 __all__ = [
     "openai_tokenize_text",
+    "openai_tokenize_texts",
 ]
 
 
@@ -18,6 +20,16 @@ def openai_tokenize_text(
     return _encoding(model_name=ctx.state(OpenAIChatConfig).model).encode(text=text)
 
 
+def openai_tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    # tiktoken encodes batches using multiple threads
+    return _encoding(model_name=ctx.state(OpenAIChatConfig).model).encode_batch(
+        text=list(texts),
+    )
+
+
 @cache(limit=4)
 def _encoding(model_name: str) -> Encoding:
     return encoding_for_model(model_name=model_name)
@@ -1,9 +1,14 @@
 from draive.scope.access import ctx
-from draive.scope.dependencies import ScopeDependencies, ScopeDependency
+from draive.scope.dependencies import (
+    ScopeDependencies,
+    ScopeDependency,
+    dispose_shared_dependencies,
+)
 from draive.scope.state import ScopeState
 
 __all__ = [
     "ctx",
+    "dispose_shared_dependencies",
     "ScopeDependencies",
     "ScopeDependency",
     "ScopeState",
@@ -44,10 +44,11 @@ _DependenciesScope_Var = ContextVar[ScopeDependencies]("_DependenciesScope_Var")
 
 
 class _RootContext:
-    def __init__(
+    def __init__(  # noqa: PLR0913
         self,
         task_group: TaskGroup,
         dependencies: ScopeDependencies,
+        dispose_dependencies: bool,
         state: ScopeState,
         metrics: MetricsTrace,
         trace_reporting: MetricsTraceReporter | None,
@@ -55,6 +56,7 @@ class _RootContext:
         self._task_group: TaskGroup = task_group
         self._task_group_token: Token[TaskGroup] | None = None
         self._dependencies: ScopeDependencies = dependencies
+        self._dispose_dependencies: bool = dispose_dependencies
         self._dependencies_token: Token[ScopeDependencies] | None = None
         self._state: ScopeState = state
         self._state_token: Token[ScopeState] | None = None
@@ -133,6 +135,10 @@ class _RootContext:
             # cleanup dependencies next
             assert self._dependencies_token is not None, "Can't exit scope without entering"  # nosec: B101
             _DependenciesScope_Var.reset(self._dependencies_token)
+            if self._dispose_dependencies:
+                # dispose prepared dependencies and release shared ones
+                await shield(self._dependencies.dispose())
+
             # finally reset state
             assert self._state_token is not None, "Can't exit scope without entering"  # nosec: B101
             _StateScope_Var.reset(self._state_token)
@@ -263,6 +269,8 @@ class ctx:
         return _RootContext(
             task_group=TaskGroup(),
             dependencies=root_dependencies,
+            # dependencies provided as ScopeDependencies are managed by the caller
+            dispose_dependencies=not isinstance(dependencies, ScopeDependencies),
             state=root_state,
             metrics=MetricsTrace(
                 label=label,
@@ -549,6 +557,42 @@ class ctx:
     ) -> Dependency_T:
         return ctx._current_dependencies().dependency(dependency)
 
+    @staticmethod
+    def prepare_dependencies(
+        *dependencies: type[ScopeDependency],
+    ) -> Task[None]:
+        """\
+        Prepare dependencies of the current scope in the background, ahead of their \
+        first use. Await returned task to wait until the preparation completes. \
+        Dependencies are otherwise prepared lazily on first access, \
+        dependencies with asynchronous preparation have to be prepared this way. \
+        Preparation errors are logged, failed dependencies are prepared again when requested.
+
+        Parameters
+        ----------
+        *dependencies: type[ScopeDependency]
+            dependencies to prepare, default is all dependencies declared for the scope
+
+        Returns
+        -------
+        Task[None]
+            task preparing requested dependencies
+        """
+
+        scope_dependencies: ScopeDependencies = ctx._current_dependencies()
+
+        async def prepare_dependencies() -> None:
+            try:
+                await scope_dependencies.prepare(*dependencies)
+
+            except Exception as exc:
+                ctx.log_error(
+                    "Failed to prepare dependencies",
+                    exception=exc,
+                )
+
+        return ctx.spawn_task(prepare_dependencies)
+
     @staticmethod
     def read[Metric_T: Metric](
         metric: type[Metric_T],
@@ -1,12 +1,15 @@
 from abc import ABC, abstractmethod
-from asyncio import gather, shield
+from asyncio import AbstractEventLoop, Task, gather, get_running_loop, shield
+from collections.abc import Awaitable
+from inspect import isawaitable, iscoroutine
 from types import TracebackType
-from typing import Self, cast, final
+from typing import Any, Literal, Self, cast, final
+from weakref import WeakKeyDictionary
 
 from draive.scope.errors import MissingScopeDependency
-from draive.utils import freeze
 
 __all__ = [
+    "dispose_shared_dependencies",
     "ScopeDependencies",
     "ScopeDependency",
 ]
@@ -17,50 +20,85 @@ class ScopeDependency(ABC):
     def interface(cls) -> type:
         return cls
 
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        """\
+        Lifetime of the dependency prepared by the scope. "scope" dependencies are \
+        prepared for each scope and disposed with it. "shared" dependencies are \
+        prepared once per event loop and reused by all scopes until \
+        dispose_shared_dependencies is called.
+        """
+        return "scope"
+
     @classmethod
     @abstractmethod
-    def prepare(cls) -> Self: ...
+    def prepare(cls) -> Self | Awaitable[Self]:
+        """\
+        Prepare an instance of the dependency. It is called lazily on the first access \
+        within a scope or when preparing dependencies ahead of use. \
+        Dependencies returning an awaitable have to be prepared using \
+        ctx.prepare_dependencies before accessing them.
+        """
+        ...
 
     async def dispose(self) -> None:  # noqa: B027
         pass
 
 
+async def dispose_shared_dependencies() -> None:
+    """\
+    Dispose all shared dependencies prepared within the current event loop, \
+    i.e. on application shutdown. Dependencies which are still used by any scope \
+    are disposed when the last of those scopes is disposed. Shared dependencies \
+    requested after this call are prepared again.
+    """
+    await _SharedDependencies.current().dispose()
+
+
 @final
 class ScopeDependencies:
     def __init__(
         self,
         *dependencies: type[ScopeDependency] | object,
     ) -> None:
-        self._declared: tuple[type[ScopeDependency] | object, ...] = dependencies
-        self._prepared: dict[type[object], object] | None = None
-
-    @property
-    def _dependencies(self) -> dict[type[object], object]:
-        if self._prepared is None:
-            dependencies: dict[type[object], object] = {}
-            for dependency in self._declared:
-                if isinstance(dependency, ScopeDependency):
-                    dependencies[type(dependency).interface()] = dependency
+        # dependency types are prepared lazily on first access
+        self._declared: dict[type[object], type[ScopeDependency]] = {}
+        self._prepared: dict[type[object], object] = {}
+        self._preparing: dict[type[object], Task[object]] = {}
+        for dependency in dependencies:
+            if isinstance(dependency, ScopeDependency):
+                self._prepared[type(dependency).interface()] = dependency
 
-                elif isinstance(dependency, type) and issubclass(dependency, ScopeDependency):
-                    dependencies[dependency.interface()] = dependency.prepare()
+            elif isinstance(dependency, type) and issubclass(dependency, ScopeDependency):
+                self._declared[dependency.interface()] = dependency
 
-                else:
-                    dependencies[type(dependency)] = dependency
+            else:
+                self._prepared[type(dependency)] = dependency
 
-            self._prepared = dependencies
-            del self._declared
-            freeze(self)
-
-        return self._prepared
+        # dependencies prepared by this scope, provided instances are not owned
+        self._owned: list[ScopeDependency] = []
+        self._shared: _SharedDependencies | None = None
+        self._shared_references: list[type[ScopeDependency]] = []
+        self._disposed: bool = False
 
     def dependency[Dependency](
         self,
         dependency: type[Dependency],
         /,
     ) -> Dependency:
-        if dependency in self._dependencies:
-            return cast(Dependency, self._dependencies[dependency])
+        if dependency in self._prepared:
+            return cast(Dependency, self._prepared[dependency])
+
+        elif declared := self._declared.get(dependency):
+            if dependency in self._preparing:
+                raise MissingScopeDependency(
+                    f"{dependency.__qualname__} is still being prepared!"
+                    " Wait for ctx.prepare_dependencies to finish before using it."
+                )
+
+            prepared: ScopeDependency = self._prepare_sync(declared)
+            self._prepared[dependency] = prepared
+            return cast(Dependency, prepared)
 
         else:
             raise MissingScopeDependency(
@@ -68,27 +106,121 @@ class ScopeDependencies:
                 " You have to define it when creating a new context."
             )
 
+    async def prepare(
+        self,
+        *dependencies: type[ScopeDependency],
+    ) -> None:
+        """\
+        Prepare declared dependencies ahead of their first use, i.e. to warm up \
+        expensive clients or models. Dependencies are prepared concurrently, \
+        asynchronous preparation is awaited. All declared dependencies are prepared \
+        when none were specified. Dependencies which were not declared for the scope \
+        are ignored.
+
+        Parameters
+        ----------
+        *dependencies: type[ScopeDependency]
+            dependencies to prepare, default is all declared dependencies
+        """
+
+        requested: list[type[object]] = (
+            [dependency.interface() for dependency in dependencies]
+            if dependencies
+            else list(self._declared.keys())
+        )
+        await gather(
+            *[
+                self._prepare_async(interface)
+                for interface in requested
+                if interface in self._declared and interface not in self._prepared
+            ]
+        )
+
+    async def _prepare_async(
+        self,
+        interface: type[object],
+        /,
+    ) -> None:
+        if pending := self._preparing.get(interface):
+            await shield(pending)
+            return  # prepared concurrently
+
+        declared: type[ScopeDependency] = self._declared[interface]
+        pending = get_running_loop().create_task(self._prepare(declared))
+        self._preparing[interface] = pending
+        try:
+            self._prepared[interface] = await shield(pending)
+
+        finally:
+            del self._preparing[interface]
+
+    async def _prepare(
+        self,
+        dependency: type[ScopeDependency],
+        /,
+    ) -> ScopeDependency:
+        match dependency.lifetime():
+            case "scope":
+                prepared: ScopeDependency = await _prepared(dependency)
+                self._owned.append(prepared)
+                return prepared
+
+            case "shared":
+                if self._shared is None:
+                    self._shared = _SharedDependencies.current()
+
+                shared: ScopeDependency = await self._shared.acquire_async(dependency)
+                self._shared_references.append(dependency)
+                return shared
+
+    def _prepare_sync(
+        self,
+        dependency: type[ScopeDependency],
+        /,
+    ) -> ScopeDependency:
+        match dependency.lifetime():
+            case "scope":
+                prepared: ScopeDependency | Awaitable[ScopeDependency] = dependency.prepare()
+                if isawaitable(prepared):
+                    _discard(prepared)
+                    raise MissingScopeDependency(
+                        f"{dependency.__qualname__} requires asynchronous preparation!"
+                        " Use ctx.prepare_dependencies before using it."
+                    )
+
+                self._owned.append(prepared)
+                return prepared
+
+            case "shared":
+                if self._shared is None:
+                    self._shared = _SharedDependencies.current()
+
+                shared: ScopeDependency = self._shared.acquire(dependency)
+                self._shared_references.append(dependency)
+                return shared
+
     async def dispose(self) -> None:
-        if self._prepared is None:
-            # prevent preparing again
-            self._prepared = {}
-            del self._declared
-            freeze(self)
-
-        elif self._prepared:
-            # avoid preparing when disposing
-            await gather(
-                *[
-                    dependency.dispose()
-                    for dependency in self._prepared.values()
-                    if isinstance(dependency, ScopeDependency)
-                ]
-            )
+        if self._disposed:
+            return  # already disposed
+
+        self._disposed = True
+        # prevent preparing again
+        self._declared.clear()
+        # wait for pending preparation to dispose its results as well
+        await gather(*self._preparing.values(), return_exceptions=True)
+        await gather(
+            *[dependency.dispose() for dependency in self._owned],
+            *[
+                self._shared.release(dependency)
+                for dependency in self._shared_references
+                if self._shared is not None
+            ],
+        )
 
-            # cleanup memory and prevent preparing again
-            # can't simply replace with new instance due to freeze
-            for key in list(self._prepared.keys()):
-                del self._prepared[key]
+        # cleanup memory
+        self._prepared.clear()
+        self._owned.clear()
+        self._shared_references.clear()
 
     async def __aenter__(self) -> Self:
         return self
@@ -100,3 +232,145 @@ class ScopeDependencies:
         exc_tb: TracebackType | None,
     ) -> None:
         await shield(self.dispose())
+
+
+def _discard(
+    awaitable: Awaitable[Any],
+    /,
+) -> None:
+    # avoid warnings about never awaited coroutines
+    if iscoroutine(awaitable):
+        awaitable.close()
+
+
+@final
+class _SharedDependency:
+    def __init__(
+        self,
+        dependency: ScopeDependency,
+    ) -> None:
+        self.dependency: ScopeDependency = dependency
+        self.references: int = 0
+        self.disposing: bool = False
+
+
+@final
+class _SharedDependencies:
+    @classmethod
+    def current(cls) -> Self:
+        loop: AbstractEventLoop | None
+        try:
+            loop = get_running_loop()
+
+        except RuntimeError:
+            loop = None  # dependencies prepared outside of the event loop
+
+        if loop is None:
+            return cast(Self, _SHARED_DEPENDENCIES_WITHOUT_LOOP)
+
+        elif shared := _SHARED_DEPENDENCIES.get(loop):
+            return cast(Self, shared)
+
+        else:
+            shared = cls()
+            _SHARED_DEPENDENCIES[loop] = shared
+            return shared
+
+    def __init__(self) -> None:
+        self._dependencies: dict[type[ScopeDependency], _SharedDependency] = {}
+        self._preparing: dict[type[ScopeDependency], Task[ScopeDependency]] = {}
+
+    def acquire(
+        self,
+        dependency: type[ScopeDependency],
+        /,
+    ) -> ScopeDependency:
+        shared: _SharedDependency
+        if current := self._dependencies.get(dependency):
+            shared = current
+
+        elif dependency in self._preparing:
+            raise MissingScopeDependency(
+                f"{dependency.__qualname__} is still being prepared!"
+                " Wait for ctx.prepare_dependencies to finish before using it."
+            )
+
+        else:
+            prepared: ScopeDependency | Awaitable[ScopeDependency] = dependency.prepare()
+            if isawaitable(prepared):
+                _discard(prepared)
+                raise MissingScopeDependency(
+                    f"{dependency.__qualname__} requires asynchronous preparation!"
+                    " Use ctx.prepare_dependencies before using it."
+                )
+
+            shared = _SharedDependency(prepared)
+            self._dependencies[dependency] = shared
+
+        shared.references += 1
+        return shared.dependency
+
+    async def acquire_async(
+        self,
+        dependency: type[ScopeDependency],
+        /,
+    ) -> ScopeDependency:
+        if dependency not in self._dependencies:
+            pending: Task[ScopeDependency]
+            if current := self._preparing.get(dependency):
+                pending = current
+
+            else:
+                pending = get_running_loop().create_task(_prepared(dependency))
+                self._preparing[dependency] = pending
+                pending.add_done_callback(lambda _: self._preparing.pop(dependency, None))
+
+            prepared: ScopeDependency = await shield(pending)
+            if dependency not in self._dependencies:
+                self._dependencies[dependency] = _SharedDependency(prepared)
+
+        return self.acquire(dependency)
+
+    async def release(
+        self,
+        dependency: type[ScopeDependency],
+        /,
+    ) -> None:
+        shared: _SharedDependency | None = self._dependencies.get(dependency)
+        if shared is None:
+            return  # already disposed
+
+        shared.references -= 1
+        if shared.disposing and shared.references <= 0:
+            del self._dependencies[dependency]
+            await shared.dependency.dispose()
+
+    async def dispose(self) -> None:
+        disposed: list[ScopeDependency] = []
+        for dependency, shared in list(self._dependencies.items()):
+            if shared.references > 0:
+                shared.disposing = True  # dispose after the last scope releases it
+
+            else:
+                del self._dependencies[dependency]
+                disposed.append(shared.dependency)
+
+        await gather(*[dependency.dispose() for dependency in disposed])
+
+
+async def _prepared(
+    dependency: type[ScopeDependency],
+    /,
+) -> ScopeDependency:
+    prepared: ScopeDependency | Awaitable[ScopeDependency] = dependency.prepare()
+    if isawaitable(prepared):
+        return await prepared
+
+    else:
+        return prepared
+
+
+_SHARED_DEPENDENCIES: WeakKeyDictionary[AbstractEventLoop, _SharedDependencies] = (
+    WeakKeyDictionary()
+)
+_SHARED_DEPENDENCIES_WITHOUT_LOOP: _SharedDependencies = _SharedDependencies()
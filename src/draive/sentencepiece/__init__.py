@@ -1,7 +1,11 @@
 from draive.sentencepiece.config import SentencePieceConfig
-from draive.sentencepiece.tokenization import sentencepiece_tokenize_text
+from draive.sentencepiece.tokenization import (
+    sentencepiece_tokenize_text,
+    sentencepiece_tokenize_texts,
+)
 
 __all__ = [
     "sentencepiece_tokenize_text",
+    "sentencepiece_tokenize_texts",
     "SentencePieceConfig",
 ]
@@ -1,3 +1,4 @@
+from collections.abc import Sequence
 from typing import Any, cast
 
 from sentencepiece import SentencePieceProcessor  # pyright: ignore[reportMissingTypeStubs]
@@ -8,6 +9,7 @@ from draive.utils import cache, not_missing
 
 __all__ = [
     "sentencepiece_tokenize_text",
+    "sentencepiece_tokenize_texts",
 ]
 
 
@@ -25,6 +27,21 @@ def sentencepiece_tokenize_text(
         raise ValueError("Missing sentencepiece tokenizer model path")
 
 
+def sentencepiece_tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    config: SentencePieceConfig = ctx.state(SentencePieceConfig).updated(**extra)
+    if not_missing(config.model_path):
+        # sentencepiece encodes lists of texts within a single native call
+        return cast(
+            list[list[int]],
+            _encoding(model_path=config.model_path).encode(list(texts)),  # pyright: ignore[reportUnknownMemberType, reportAttributeAccessIssue]
+        )
+    else:
+        raise ValueError("Missing sentencepiece tokenizer model path")
+
+
 @cache(limit=4)
 def _encoding(model_path: str) -> SentencePieceProcessor:
     return SentencePieceProcessor(model_file=model_path)  # pyright: ignore[reportCallIssue]
@@ -1,5 +1,17 @@
+from draive.splitters.bulk import split_texts, split_texts_as_completed, text_splitting_executor
+from draive.splitters.semantic import semantic_split_text
+from draive.splitters.spans import TextSpan, split_text_spans
+from draive.splitters.stream import split_text_async_stream, split_text_stream
 from draive.splitters.text import split_text
 
 __all__ = [
+    "semantic_split_text",
     "split_text",
+    "split_text_async_stream",
+    "split_text_spans",
+    "split_text_stream",
+    "split_texts",
+    "split_texts_as_completed",
+    "text_splitting_executor",
+    "TextSpan",
 ]
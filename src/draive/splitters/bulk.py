@@ -0,0 +1,246 @@
+from asyncio import AbstractEventLoop, Future, as_completed, gather, get_running_loop
+from collections.abc import AsyncGenerator, Callable, Iterable, Sequence
+from concurrent.futures import Executor, ProcessPoolExecutor
+from functools import partial
+from itertools import batched
+from typing import Literal
+
+from draive.splitters.text import split_text
+
+__all__ = [
+    "split_texts",
+    "split_texts_as_completed",
+    "text_splitting_executor",
+]
+
+# size counter prepared within the worker process by text_splitting_executor
+_worker_count_size: Callable[[str], int] | None = None
+
+
+def text_splitting_executor(
+    count_size: Callable[[], Callable[[str], int]],
+    /,
+    *,
+    max_workers: int | None = None,
+) -> ProcessPoolExecutor:
+    """\
+    Prepare process pool for splitting texts with split_texts. \
+    Size counter, i.e. a tokenizer, is prepared once within each worker process.
+
+    Parameters
+    ----------
+    count_size: Callable[[], Callable[[str], int]]
+        picklable factory of the function measuring size of the text, \
+        called once by each worker process
+    max_workers: int | None
+        number of worker processes, default is the number of processors
+
+    Returns
+    -------
+    ProcessPoolExecutor
+        executor which can be used to split texts in parallel
+    """
+
+    return ProcessPoolExecutor(
+        max_workers=max_workers,
+        initializer=_initialize_worker,
+        initargs=(count_size,),
+    )
+
+
+async def split_texts(  # noqa: PLR0913
+    texts: Iterable[str],
+    /,
+    *,
+    executor: Executor,
+    part_size: int,
+    count_size: Callable[[str], int] | None = None,
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+    mode: Literal["basic", "fast", "exhaustive"] = "basic",
+    batch_size: int = 16,
+) -> list[list[str]]:
+    """\
+    Split multiple texts in parallel using the executor without blocking the event loop. \
+    Results are the same as produced by split_text for each text.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        texts to be split
+    executor: Executor
+        executor used for splitting, i.e. prepared with text_splitting_executor
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int] | None
+        picklable function measuring size of the text, \
+        default is the function prepared by text_splitting_executor
+    separators: Sequence[str] | str | None
+        separators used to split the text, default is paragraphs, lines and words
+    part_overlap_size: int | None
+        size of the overlap between consecutive parts, default is no overlap
+    mode: Literal["basic", "fast", "exhaustive"]
+        splitting mode, same as used for split_text, default is "basic"
+    batch_size: int
+        number of texts sent to the worker at once, default is 16
+
+    Returns
+    -------
+    list[list[str]]
+        parts of each text in the same order as provided texts
+    """
+
+    batches: list[list[list[str]]] = await gather(
+        *_submit(
+            texts,
+            executor=executor,
+            part_size=part_size,
+            count_size=count_size,
+            separators=separators,
+            part_overlap_size=part_overlap_size,
+            mode=mode,
+            batch_size=batch_size,
+        )
+    )
+
+    return [parts for batch in batches for parts in batch]
+
+
+async def split_texts_as_completed(  # noqa: PLR0913
+    texts: Iterable[str],
+    /,
+    *,
+    executor: Executor,
+    part_size: int,
+    count_size: Callable[[str], int] | None = None,
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+    mode: Literal["basic", "fast", "exhaustive"] = "basic",
+    batch_size: int = 16,
+) -> AsyncGenerator[tuple[int, list[str]], None]:
+    """\
+    Split multiple texts in parallel using the executor without blocking the event loop. \
+    Works the same as split_texts but yields results as soon as they are completed.
+
+    Parameters
+    ----------
+    texts: Iterable[str]
+        texts to be split
+    executor: Executor
+        executor used for splitting, i.e. prepared with text_splitting_executor
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int] | None
+        picklable function measuring size of the text, \
+        default is the function prepared by text_splitting_executor
+    separators: Sequence[str] | str | None
+        separators used to split the text, default is paragraphs, lines and words
+    part_overlap_size: int | None
+        size of the overlap between consecutive parts, default is no overlap
+    mode: Literal["basic", "fast", "exhaustive"]
+        splitting mode, same as used for split_text, default is "basic"
+    batch_size: int
+        number of texts sent to the worker at once, default is 16
+
+    Returns
+    -------
+    AsyncGenerator[tuple[int, list[str]], None]
+        generator of the index of a text within provided texts and its parts
+    """
+
+    futures: list[Future[list[list[str]]]] = _submit(
+        texts,
+        executor=executor,
+        part_size=part_size,
+        count_size=count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+        batch_size=batch_size,
+    )
+
+    try:
+        for completed in as_completed(
+            [_indexed(idx * batch_size, future) for idx, future in enumerate(futures)]
+        ):
+            offset, batch = await completed
+            for idx, parts in enumerate(batch, start=offset):
+                yield (idx, parts)
+
+    finally:
+        for future in futures:
+            future.cancel()
+
+
+async def _indexed[Result](
+    offset: int,
+    future: Future[Result],
+    /,
+) -> tuple[int, Result]:
+    return (offset, await future)
+
+
+def _submit(  # noqa: PLR0913
+    texts: Iterable[str],
+    /,
+    *,
+    executor: Executor,
+    part_size: int,
+    count_size: Callable[[str], int] | None,
+    separators: Sequence[str] | str | None,
+    part_overlap_size: int | None,
+    mode: Literal["basic", "fast", "exhaustive"],
+    batch_size: int,
+) -> list[Future[list[list[str]]]]:
+    assert batch_size > 0  # nosec: B101
+    loop: AbstractEventLoop = get_running_loop()
+    return [
+        loop.run_in_executor(
+            executor,
+            partial(
+                _split_batch,
+                batch,
+                part_size=part_size,
+                count_size=count_size,
+                separators=separators,
+                part_overlap_size=part_overlap_size,
+                mode=mode,
+            ),
+        )
+        for batch in batched(texts, batch_size)
+    ]
+
+
+def _initialize_worker(
+    count_size: Callable[[], Callable[[str], int]],
+    /,
+) -> None:
+    global _worker_count_size  # noqa: PLW0603 - worker process state
+    _worker_count_size = count_size()
+
+
+def _split_batch(  # noqa: PLR0913
+    texts: Sequence[str],
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int] | None,
+    separators: Sequence[str] | str | None,
+    part_overlap_size: int | None,
+    mode: Literal["basic", "fast", "exhaustive"],
+) -> list[list[str]]:
+    size: Callable[[str], int] | None = count_size or _worker_count_size
+    if size is None:
+        raise RuntimeError("Missing count_size, provide it directly or use text_splitting_executor")
+
+    return [
+        split_text(
+            text=text,
+            part_size=part_size,
+            count_size=size,
+            separators=separators,
+            part_overlap_size=part_overlap_size,
+            mode=mode,
+        )
+        for text in texts
+    ]
@@ -0,0 +1,179 @@
+from collections.abc import Callable, Iterator, Sequence
+
+__all__ = [
+    "fast_split_text",
+]
+
+
+def fast_split_text(
+    text: str,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+) -> list[str]:
+    """\
+    Split text the same way as basic_split_text but counting the size of each part \
+    only once. Sizes of merged parts are estimated as the sum of sizes of their parts \
+    and counted again only when the estimate exceeds the limit. \
+    Results are the same as basic_split_text for sizes which do not grow when texts \
+    are concatenated, which is the case for character counts and common tokenizers.
+    """
+
+    # if the text is already small enough just use it
+    if count_size(text) <= part_size:
+        return [text]
+
+    splitters: Sequence[str]
+
+    match separators:
+        case None:
+            splitters = ["\n\n", "\n", " "]
+
+        case str() as splitter:
+            splitters = [splitter, " "]
+
+        case [*separators]:
+            splitters = separators
+
+    # split using provided separators
+    used_splitter, fallback_splitters, parts = _split(
+        text=text,
+        splitters=splitters,
+    )
+    # then merge
+    return _merge(
+        parts=parts,
+        splitter=used_splitter,
+        fallback_splitters=fallback_splitters,
+        part_size=part_size,
+        count_size=count_size,
+        part_overlap_size=part_overlap_size,
+    )
+
+
+def _split(
+    text: str,
+    splitters: Sequence[str],
+) -> tuple[str, list[str], list[str]]:
+    iterator: Iterator[str] = iter(splitters)
+    while splitter := next(iterator, None):
+        # try splitting using provided splitters
+        parts: list[str] = text.split(splitter)
+        if len(parts) == 1:
+            continue
+
+        else:
+            # used_splitter, remaining_splitters, parts
+            return (splitter, list(iterator), parts)
+
+    # if splitting has still done nothing then fail
+    raise ValueError("Text splitting failed")
+
+
+def _merge(  # noqa: C901, PLR0912, PLR0913, PLR0915
+    parts: list[str],
+    part_size: int,
+    count_size: Callable[[str], int],
+    splitter: str,
+    fallback_splitters: list[str],
+    part_overlap_size: int | None,
+) -> list[str]:
+    result: list[str] = []
+    accumulator: str = ""
+    # upper bound of the accumulator size, exact after counting it again
+    accumulator_size: int = 0
+    overlap_accumulator: list[tuple[str, int]] = []
+    last_part_idx: int = len(parts) - 1
+    # iterate over splitted parts
+    for idx, part in enumerate(parts):
+        # Add the separator back if it is not the last part
+        current_part: str
+        if idx == last_part_idx:
+            current_part = part
+
+        else:
+            current_part = part + splitter
+
+        # each part is counted only once
+        current_part_size: int = count_size(current_part)
+        merged_part: str = accumulator + current_part
+        merged_part_size: int = accumulator_size + current_part_size
+        if merged_part_size > part_size and accumulator:
+            # estimate exceeds the limit, count again to make sure
+            merged_part_size = count_size(merged_part)
+
+        # check if can add to previous part
+        if merged_part_size <= part_size:
+            accumulator = merged_part
+            accumulator_size = merged_part_size
+            overlap_accumulator.append((current_part, current_part_size))
+
+        # check if current part is not too big on its own
+        elif current_part_size > part_size:
+            if chunk := accumulator.strip():
+                result.append(chunk)
+
+            # clean up accumulators - we have made nested splitting
+            accumulator = ""
+            accumulator_size = 0
+            overlap_accumulator = []
+
+            # do nested splitting if the part is too big
+            result.extend(
+                fast_split_text(
+                    text=current_part,
+                    part_size=part_size,
+                    separators=fallback_splitters,
+                    part_overlap_size=part_overlap_size,
+                    count_size=count_size,
+                ),
+            )
+
+        # if we have overlap defined do overlap between last part and current (not fitting)
+        elif part_overlap_size := part_overlap_size:
+            if chunk := accumulator.strip():
+                result.append(chunk)
+
+            # clear accumulator - we will fill it now
+            accumulator = ""
+            accumulator_size = 0
+            for element, element_size in reversed(overlap_accumulator):
+                merged_accumulator: str = element + accumulator
+                merged_accumulator_size: int = element_size + accumulator_size
+                if merged_accumulator_size >= part_overlap_size:
+                    merged_accumulator_size = count_size(merged_accumulator)
+
+                overlapping_part_size: int = accumulator_size + current_part_size
+                if overlapping_part_size > part_size:
+                    overlapping_part_size = count_size(accumulator + current_part)
+
+                if (
+                    merged_accumulator_size < part_overlap_size
+                    and overlapping_part_size <= part_size
+                ):
+                    overlap_accumulator = [(element, element_size), *overlap_accumulator]
+                    accumulator = merged_accumulator
+                    accumulator_size = merged_accumulator_size
+
+                else:
+                    break
+
+            overlap_accumulator.append((current_part, current_part_size))
+            accumulator = accumulator + current_part
+            accumulator_size = accumulator_size + current_part_size
+
+        # otherwise make start a new part out of current
+        else:
+            if chunk := accumulator.strip():
+                result.append(chunk)
+
+            accumulator = current_part
+            accumulator_size = current_part_size
+            overlap_accumulator = [(current_part, current_part_size)]
+
+    # add leftover if any
+    if chunk := accumulator.strip():
+        result.append(chunk)
+
+    return result
@@ -0,0 +1,262 @@
+from asyncio import Semaphore, gather
+from collections.abc import Callable, Sequence
+from itertools import batched, pairwise
+from typing import Any, Final
+
+import numpy as np
+from numpy.typing import NDArray
+
+from draive.embedding import Embedded, embed_texts
+from draive.splitters.basic import basic_split_text
+
+__all__ = [
+    "semantic_split_text",
+]
+
+
+async def semantic_split_text(  # noqa: PLR0913
+    text: str,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: Sequence[str] | None = None,
+    window_size: int = 3,
+    similarity_threshold: float | None = None,
+    batch_size: int = 64,
+    concurrent_batches: int = 4,
+    **extra: Any,
+) -> list[str]:
+    """\
+    Split text into parts following changes of its topic. Sentences are embedded \
+    in batches using TextEmbedding from the current scope, topic boundaries are placed \
+    at local minima of similarity between windows of sentences before and after, \
+    only where the similarity drops below the threshold. Adjacent topics are merged \
+    while they fit the required size, sentences of larger topics are merged into parts.
+
+    Parameters
+    ----------
+    text: str
+        text to be split
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int]
+        function measuring size of the text, i.e. counting its tokens
+    separators: Sequence[str] | None
+        separators used to split the text into sentences, \
+        default is sentence endings and new lines
+    window_size: int
+        number of sentences compared before and after each boundary, default is 3
+    similarity_threshold: float | None
+        cosine similarity of windows below which a topic boundary is placed, \
+        default is one standard deviation below the mean similarity within the text \
+        but at least 0.1 below the mean, so that texts without topic changes stay intact
+    batch_size: int
+        number of sentences embedded at once, default is 64
+    concurrent_batches: int
+        number of batches embedded concurrently, default is 4
+    **extra: Any
+        extra arguments passed to the embedding
+
+    Returns
+    -------
+    list[str]
+        parts of the text, stripped from leading and trailing whitespaces \
+        unless the whole text fits the part size
+    """
+
+    assert window_size > 0  # nosec: B101
+    assert batch_size > 0  # nosec: B101
+    assert concurrent_batches > 0  # nosec: B101
+    # if the text is already small enough just use it
+    if count_size(text) <= part_size:
+        return [text]
+
+    sentences: list[str] = _sentences(
+        text,
+        splitters=separators or [". ", "? ", "! ", "\n"],
+    )
+    if len(sentences) < 2:  # noqa: PLR2004
+        return _merge(
+            sentences,
+            part_size=part_size,
+            count_size=count_size,
+        )
+
+    # limit concurrent requests to avoid hitting rate limits with large texts
+    semaphore: Semaphore = Semaphore(concurrent_batches)
+
+    async def embed_batch(batch: Sequence[str]) -> list[Embedded[str]]:
+        async with semaphore:
+            return await embed_texts(batch, **extra)
+
+    embedded: list[list[Embedded[str]]] = await gather(
+        *[embed_batch(batch) for batch in batched(sentences, batch_size)]
+    )
+    similarities: NDArray[Any] = _windows_similarity(
+        np.array([element.vector for batch in embedded for element in batch]),
+        window_size=window_size,
+    )
+    threshold: float
+    if similarity_threshold is not None:
+        threshold = similarity_threshold
+
+    else:
+        mean: float = float(np.mean(similarities))
+        threshold = mean - max(float(np.std(similarities)), _MINIMAL_DROP)
+
+    # boundary at idx means the topic changes before the sentence at idx
+    boundaries: list[int] = [
+        0,
+        *(idx + 1 for idx in _local_minima(similarities) if similarities[idx] < threshold),
+        len(sentences),
+    ]
+
+    result: list[str] = []
+    # sentences of adjacent topics fitting the part size together
+    accumulator: list[str] = []
+    for start, end in pairwise(boundaries):
+        topic: list[str] = sentences[start:end]
+        if accumulator and count_size("".join(accumulator + topic)) <= part_size:
+            accumulator.extend(topic)
+
+        else:
+            result.extend(
+                _merge(
+                    accumulator,
+                    part_size=part_size,
+                    count_size=count_size,
+                )
+            )
+            accumulator = topic
+
+    result.extend(
+        _merge(
+            accumulator,
+            part_size=part_size,
+            count_size=count_size,
+        )
+    )
+
+    return result
+
+
+# minimal drop of similarity below its mean required for the default threshold
+_MINIMAL_DROP: Final[float] = 0.1
+
+
+def _local_minima(
+    values: NDArray[Any],
+    /,
+) -> list[int]:
+    # plateaus are reported once at their first element
+    return [
+        idx
+        for idx in range(len(values))
+        if (idx == 0 or values[idx] < values[idx - 1])
+        and (idx == len(values) - 1 or values[idx] <= values[idx + 1])
+    ]
+
+
+def _sentences(
+    text: str,
+    splitters: Sequence[str],
+) -> list[str]:
+    result: list[str] = [text]
+    for splitter in splitters:
+        parts: list[str] = []
+        for element in result:
+            splitted: list[str] = element.split(splitter)
+            for part in splitted[:-1]:
+                parts.append(part + splitter)
+            parts.append(splitted[-1])
+        result = parts
+
+    sentences: list[str] = []
+    for part in result:
+        # attach whitespaces to the preceding sentence, there is nothing to embed
+        if sentences and not part.strip():
+            sentences[-1] += part
+
+        else:
+            sentences.append(part)
+
+    return sentences
+
+
+def _windows_similarity(
+    vectors: NDArray[Any],
+    /,
+    *,
+    window_size: int,
+) -> NDArray[Any]:
+    # similarity between sentences windows before and after each sentence boundary
+    count: int = vectors.shape[0]
+    cumulative: NDArray[Any] = np.vstack(
+        [
+            np.zeros((1, vectors.shape[1])),
+            np.cumsum(vectors, axis=0),
+        ]
+    )
+    boundaries: NDArray[Any] = np.arange(1, count)
+    # windows sums are proportional to their means, which is enough for cosine similarity
+    before: NDArray[Any] = (
+        cumulative[boundaries] - cumulative[np.maximum(boundaries - window_size, 0)]
+    )
+    after: NDArray[Any] = (
+        cumulative[np.minimum(boundaries + window_size, count)] - cumulative[boundaries]
+    )
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        similarity: NDArray[Any] = np.sum(before * after, axis=1) / (
+            np.linalg.norm(before, axis=1) * np.linalg.norm(after, axis=1)
+        )
+
+    similarity[np.isnan(similarity) | np.isinf(similarity)] = 0.0
+
+    return similarity
+
+
+def _merge(
+    sentences: Sequence[str],
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int],
+) -> list[str]:
+    result: list[str] = []
+    accumulator: str = ""
+    for sentence in sentences:
+        merged_part: str = accumulator + sentence
+        # check if can add to previous part
+        if count_size(merged_part) <= part_size:
+            accumulator = merged_part
+
+        # check if current sentence is not too big on its own
+        elif count_size(sentence) > part_size:
+            if chunk := accumulator.strip():
+                result.append(chunk)
+
+            accumulator = ""
+            # split too big sentence using words
+            result.extend(
+                chunk
+                for part in basic_split_text(
+                    text=sentence,
+                    part_size=part_size,
+                    count_size=count_size,
+                    separators=[" "],
+                )
+                if (chunk := part.strip())
+            )
+
+        # otherwise make start a new part out of current
+        else:
+            if chunk := accumulator.strip():
+                result.append(chunk)
+
+            accumulator = sentence
+
+    # add leftover if any
+    if chunk := accumulator.strip():
+        result.append(chunk)
+
+    return result
@@ -0,0 +1,329 @@
+from collections.abc import Callable, Sequence
+from typing import Literal, final
+
+__all__ = [
+    "split_text_spans",
+    "TextSpan",
+]
+
+
+@final
+class TextSpan:
+    """\
+    Part of the text described by offsets within the source text. \
+    Text of the span is extracted on first access.
+    """
+
+    __slots__ = ("_source", "_text", "end", "start")
+
+    def __init__(
+        self,
+        source: str,
+        /,
+        *,
+        start: int,
+        end: int,
+    ) -> None:
+        self._source: str = source
+        self._text: str | None = None
+        self.start: int = start
+        self.end: int = end
+
+    @property
+    def text(self) -> str:
+        if self._text is None:
+            self._text = self._source[self.start : self.end]
+
+        return self._text
+
+    def __len__(self) -> int:
+        return self.end - self.start
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, TextSpan):
+            return False
+
+        return self.start == other.start and self.end == other.end and self.text == other.text
+
+    def __hash__(self) -> int:
+        return hash((self.start, self.end))
+
+    def __str__(self) -> str:
+        return self.text
+
+    def __repr__(self) -> str:
+        return f"TextSpan(start={self.start}, end={self.end})"
+
+
+def split_text_spans(  # noqa: PLR0913
+    text: str,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+    mode: Literal["basic", "exhaustive"] = "basic",
+) -> list[TextSpan]:
+    """\
+    Split text the same way as split_text but returning offsets of parts \
+    within the original text instead of copies of the parts. \
+    Parts are merged using offsets and only the parts which have to be measured \
+    are copied, text of the resulting spans is extracted when requested.
+
+    Parameters
+    ----------
+    text: str
+        text to be split
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int]
+        function measuring size of the text, i.e. counting its tokens
+    separators: Sequence[str] | str | None
+        separators used to split the text, default is paragraphs, lines and words
+    part_overlap_size: int | None
+        size of the overlap between consecutive parts, default is no overlap
+    mode: Literal["basic", "exhaustive"]
+        splitting mode, same as used for split_text, default is "basic"
+
+    Returns
+    -------
+    list[TextSpan]
+        spans of the text parts, stripped from leading and trailing whitespaces \
+        unless the whole text fits the part size
+    """
+
+    spans: list[tuple[int, int]]
+    match mode:
+        case "basic":
+            spans = _basic_split(
+                text,
+                start=0,
+                end=len(text),
+                part_size=part_size,
+                count_size=count_size,
+                splitters=_splitters(separators),
+                part_overlap_size=part_overlap_size,
+            )
+
+        case "exhaustive":
+            spans = _exhaustive_split(
+                text,
+                part_size=part_size,
+                count_size=count_size,
+                splitters=_splitters(separators),
+                part_overlap_size=part_overlap_size,
+            )
+
+    return [TextSpan(text, start=start, end=end) for start, end in spans]
+
+
+def _splitters(
+    separators: Sequence[str] | str | None,
+) -> Sequence[str]:
+    match separators:
+        case None:
+            return ["\n\n", "\n", " "]
+
+        case str() as splitter:
+            return [splitter, " "]
+
+        case [*separators]:
+            return separators
+
+
+def _basic_split(  # noqa: PLR0913
+    text: str,
+    /,
+    *,
+    start: int,
+    end: int,
+    part_size: int,
+    count_size: Callable[[str], int],
+    splitters: Sequence[str],
+    part_overlap_size: int | None,
+) -> list[tuple[int, int]]:
+    # if the text is already small enough just use it
+    if count_size(text[start:end]) <= part_size:
+        return [(start, end)]
+
+    for idx, splitter in enumerate(splitters):
+        # try splitting using provided splitters
+        if text.find(splitter, start, end) < 0:
+            continue
+
+        return _merge(
+            text,
+            parts=_splitted(
+                text,
+                start=start,
+                end=end,
+                splitter=splitter,
+            ),
+            part_size=part_size,
+            count_size=count_size,
+            part_overlap_size=part_overlap_size,
+            nested_splitters=splitters[idx + 1 :],
+        )
+
+    # if splitting has still done nothing then fail
+    raise ValueError("Text splitting failed")
+
+
+def _exhaustive_split(
+    text: str,
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int],
+    splitters: Sequence[str],
+    part_overlap_size: int | None,
+) -> list[tuple[int, int]]:
+    # if the text is already small enough just use it
+    if count_size(text) <= part_size:
+        return [(0, len(text))]
+
+    parts: list[tuple[int, int]] = [(0, len(text))]
+    for splitter in splitters:
+        parts = [
+            part
+            for start, end in parts
+            for part in _splitted(
+                text,
+                start=start,
+                end=end,
+                splitter=splitter,
+            )
+        ]
+
+    return _merge(
+        text,
+        parts=parts,
+        part_size=part_size,
+        count_size=count_size,
+        part_overlap_size=part_overlap_size,
+        nested_splitters=None,
+    )
+
+
+def _splitted(
+    text: str,
+    /,
+    *,
+    start: int,
+    end: int,
+    splitter: str,
+) -> list[tuple[int, int]]:
+    # parts include trailing splitter except the last one, same as split_text
+    parts: list[tuple[int, int]] = []
+    part_start: int = start
+    while (found := text.find(splitter, part_start, end)) >= 0:
+        part_end: int = found + len(splitter)
+        parts.append((part_start, part_end))
+        part_start = part_end
+
+    parts.append((part_start, end))
+    return parts
+
+
+def _stripped(
+    text: str,
+    /,
+    *,
+    start: int,
+    end: int,
+) -> tuple[int, int] | None:
+    while start < end and text[start].isspace():
+        start += 1
+
+    while end > start and text[end - 1].isspace():
+        end -= 1
+
+    if start < end:
+        return (start, end)
+
+    else:
+        return None
+
+
+def _merge(  # noqa: C901, PLR0912, PLR0913
+    text: str,
+    /,
+    *,
+    parts: list[tuple[int, int]],
+    part_size: int,
+    count_size: Callable[[str], int],
+    part_overlap_size: int | None,
+    nested_splitters: Sequence[str] | None,
+) -> list[tuple[int, int]]:
+    result: list[tuple[int, int]] = []
+    # parts are consecutive, accumulator is always a continuous span
+    accumulator: tuple[int, int] | None = None
+    # consecutive parts preceding the current part, available for the overlap
+    overlap_accumulator: list[tuple[int, int]] = []
+    for part_start, part_end in parts:
+        merged_start: int = part_start if accumulator is None else accumulator[0]
+        # check if can add to previous part
+        if count_size(text[merged_start:part_end]) <= part_size:
+            accumulator = (merged_start, part_end)
+            overlap_accumulator.append((part_start, part_end))
+
+        # check if current part is not too big on its own
+        elif count_size(text[part_start:part_end]) > part_size:
+            if nested_splitters is None:
+                raise ValueError("Failed to split text fitting required size.")
+
+            if accumulator and (chunk := _stripped(text, start=accumulator[0], end=accumulator[1])):
+                result.append(chunk)
+
+            # clean up accumulators - we have made nested splitting
+            accumulator = None
+            overlap_accumulator = []
+
+            # do nested splitting if the part is too big
+            result.extend(
+                _basic_split(
+                    text,
+                    start=part_start,
+                    end=part_end,
+                    part_size=part_size,
+                    count_size=count_size,
+                    splitters=nested_splitters,
+                    part_overlap_size=part_overlap_size,
+                )
+            )
+
+        # if we have overlap defined do overlap between last part and current (not fitting)
+        elif part_overlap_size := part_overlap_size:
+            if accumulator and (chunk := _stripped(text, start=accumulator[0], end=accumulator[1])):
+                result.append(chunk)
+
+            # fill the accumulator with preceding parts fitting the overlap
+            overlap_start: int = part_start
+            for element_start, element_end in reversed(overlap_accumulator):
+                if element_end != overlap_start:
+                    break  # overlap has to be continuous
+
+                if (
+                    count_size(text[element_start:part_start]) < part_overlap_size
+                    and count_size(text[overlap_start:part_end]) <= part_size
+                ):
+                    overlap_start = element_start
+
+                else:
+                    break
+
+            overlap_accumulator.append((part_start, part_end))
+            accumulator = (overlap_start, part_end)
+
+        # otherwise make start a new part out of current
+        else:
+            if accumulator and (chunk := _stripped(text, start=accumulator[0], end=accumulator[1])):
+                result.append(chunk)
+
+            accumulator = (part_start, part_end)
+            overlap_accumulator = [(part_start, part_end)]
+
+    # add leftover if any
+    if accumulator and (chunk := _stripped(text, start=accumulator[0], end=accumulator[1])):
+        result.append(chunk)
+
+    return result
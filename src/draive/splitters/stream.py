@@ -0,0 +1,246 @@
+from codecs import IncrementalDecoder, getincrementaldecoder
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable, Sequence
+from typing import Literal, final
+
+from draive.splitters.spans import TextSpan, split_text_spans
+
+__all__ = [
+    "split_text_async_stream",
+    "split_text_stream",
+]
+
+
+def split_text_stream(  # noqa: PLR0913
+    stream: Iterable[str] | Iterable[bytes],
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+    mode: Literal["basic", "exhaustive"] = "basic",
+    window_size: int = 65536,
+    encoding: str = "utf-8",
+) -> Generator[str, None]:
+    """\
+    Split text read from the stream, i.e. a file, into parts of the required size. \
+    Only a bounded window of the text is kept in memory and parts are yielded \
+    as soon as they are finalized. Parts are the same as produced by split_text \
+    except for the top level parts crossing the window boundaries.
+
+    Parameters
+    ----------
+    stream: Iterable[str] | Iterable[bytes]
+        consecutive chunks of the text, bytes are decoded using the encoding
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int]
+        function measuring size of the text, i.e. counting its tokens
+    separators: Sequence[str] | str | None
+        separators used to split the text, default is paragraphs, lines and words
+    part_overlap_size: int | None
+        size of the overlap between consecutive parts, default is no overlap
+    mode: Literal["basic", "exhaustive"]
+        splitting mode, same as used for split_text, default is "basic"
+    window_size: int
+        number of characters buffered before splitting, default is 65536
+    encoding: str
+        encoding of the bytes chunks, default is "utf-8"
+
+    Returns
+    -------
+    Generator[str, None]
+        generator of consecutive parts of the text
+    """
+
+    splitter = _StreamSplitter(
+        part_size=part_size,
+        count_size=count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+        window_size=window_size,
+        encoding=encoding,
+    )
+    for chunk in stream:
+        yield from splitter.feed(chunk)
+
+    yield from splitter.finish()
+
+
+async def split_text_async_stream(  # noqa: PLR0913
+    stream: AsyncIterable[str] | AsyncIterable[bytes],
+    /,
+    *,
+    part_size: int,
+    count_size: Callable[[str], int],
+    separators: Sequence[str] | str | None = None,
+    part_overlap_size: int | None = None,
+    mode: Literal["basic", "exhaustive"] = "basic",
+    window_size: int = 65536,
+    encoding: str = "utf-8",
+) -> AsyncGenerator[str, None]:
+    """\
+    Split text read from the async stream, i.e. http response bytes, \
+    into parts of the required size. Works the same as split_text_stream.
+
+    Parameters
+    ----------
+    stream: AsyncIterable[str] | AsyncIterable[bytes]
+        consecutive chunks of the text, bytes are decoded using the encoding
+    part_size: int
+        maximal size of each part
+    count_size: Callable[[str], int]
+        function measuring size of the text, i.e. counting its tokens
+    separators: Sequence[str] | str | None
+        separators used to split the text, default is paragraphs, lines and words
+    part_overlap_size: int | None
+        size of the overlap between consecutive parts, default is no overlap
+    mode: Literal["basic", "exhaustive"]
+        splitting mode, same as used for split_text, default is "basic"
+    window_size: int
+        number of characters buffered before splitting, default is 65536
+    encoding: str
+        encoding of the bytes chunks, default is "utf-8"
+
+    Returns
+    -------
+    AsyncGenerator[str, None]
+        generator of consecutive parts of the text
+    """
+
+    splitter = _StreamSplitter(
+        part_size=part_size,
+        count_size=count_size,
+        separators=separators,
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+        window_size=window_size,
+        encoding=encoding,
+    )
+    async for chunk in stream:
+        for part in splitter.feed(chunk):
+            yield part
+
+    for part in splitter.finish():
+        yield part
+
+
+@final
+class _StreamSplitter:
+    def __init__(  # noqa: PLR0913
+        self,
+        *,
+        part_size: int,
+        count_size: Callable[[str], int],
+        separators: Sequence[str] | str | None,
+        part_overlap_size: int | None,
+        mode: Literal["basic", "exhaustive"],
+        window_size: int,
+        encoding: str,
+    ) -> None:
+        assert window_size > 0  # nosec: B101
+        self._part_size: int = part_size
+        self._count_size: Callable[[str], int] = count_size
+        self._separators: Sequence[str] | str | None = separators
+        self._splitters: Sequence[str]
+        match separators:
+            case None:
+                self._splitters = ["\n\n", "\n", " "]
+
+            case str() as splitter:
+                self._splitters = [splitter, " "]
+
+            case [*separators]:
+                self._splitters = separators
+
+        self._part_overlap_size: int | None = part_overlap_size
+        self._mode: Literal["basic", "exhaustive"] = mode
+        self._window_size: int = window_size
+        self._encoding: str = encoding
+        self._decoder: IncrementalDecoder | None = None
+        self._chunks: list[str] = []
+        self._buffered: int = 0
+        # text carried over from the previous window, not finalized yet
+        self._pending: str = ""
+        self._split_threshold: int = window_size
+
+    def feed(
+        self,
+        chunk: str | bytes,
+        /,
+    ) -> list[str]:
+        text: str
+        if isinstance(chunk, str):
+            text = chunk
+
+        else:
+            if self._decoder is None:
+                self._decoder = getincrementaldecoder(self._encoding)()
+
+            text = self._decoder.decode(chunk)
+
+        if not text:
+            return []
+
+        self._chunks.append(text)
+        self._buffered += len(text)
+        if self._buffered < self._split_threshold:
+            return []
+
+        return self._split_window()
+
+    def finish(self) -> list[str]:
+        if self._decoder is not None:
+            self._chunks.append(self._decoder.decode(b"", final=True))
+
+        text: str = self._pending + "".join(self._chunks)
+        self._chunks = []
+        self._buffered = 0
+        self._pending = ""
+
+        return [
+            part
+            for span in self._split(text)
+            # text which fits the part size is not stripped by splitting
+            if (part := span.text.strip())
+        ]
+
+    def _split_window(self) -> list[str]:
+        text: str = self._pending + "".join(self._chunks)
+        self._pending = text
+        self._chunks = []
+
+        # split only complete top level parts, the tail might be not finished yet
+        window_end: int = -1
+        for splitter in self._splitters:
+            if (found := text.rfind(splitter)) >= 0:
+                window_end = found + len(splitter)
+                break
+
+        spans: list[TextSpan] = self._split(text[:window_end]) if window_end > 0 else []
+        if len(spans) < 2:  # noqa: PLR2004
+            # nothing can be finalized yet, wait for the next window
+            self._split_threshold = self._buffered + self._window_size
+            return []
+
+        # the last part might continue in the next window
+        self._pending = text[spans[-1].start :]
+        self._buffered = len(self._pending)
+        self._split_threshold = self._buffered + self._window_size
+
+        return [span.text for span in spans[:-1]]
+
+    def _split(
+        self,
+        text: str,
+        /,
+    ) -> list[TextSpan]:
+        return split_text_spans(
+            text=text,
+            part_size=self._part_size,
+            count_size=self._count_size,
+            separators=self._separators,
+            part_overlap_size=self._part_overlap_size,
+            mode=self._mode,
+        )
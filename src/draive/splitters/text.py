@@ -4,6 +4,7 @@ from typing import Literal, cast, overload
 
 from draive.splitters.basic import basic_split_text
 from draive.splitters.exhaustive import exhaustive_regex_split_text, exhaustive_split_text
+from draive.splitters.fast import fast_split_text
 
 
 @overload
@@ -26,7 +27,7 @@ def split_text(
     count_size: Callable[[str], int],
     separators: Sequence[str] | str | None = None,
     part_overlap_size: int | None = None,
-    mode: Literal["basic", "exhaustive"] = "basic",
+    mode: Literal["basic", "fast", "exhaustive"] = "basic",
 ) -> list[str]: ...
 
 
@@ -38,6 +39,7 @@ def split_text(  # noqa: PLR0913
     part_overlap_size: int | None = None,
     mode: Literal[
         "basic",
+        "fast",
         "exhaustive",
         "exhaustive_regex",
     ] = "basic",
@@ -54,6 +56,17 @@ def split_text(  # noqa: PLR0913
                 part_overlap_size=part_overlap_size,
             )
 
+        case "fast":
+            assert not isinstance(separators, Pattern)  # nosec: B101
+            assert not any(isinstance(separator, Pattern) for separator in separators or [])  # nosec: B101
+            return fast_split_text(
+                text=text,
+                part_size=part_size,
+                count_size=count_size,
+                separators=cast(Sequence[str] | str | None, separators),
+                part_overlap_size=part_overlap_size,
+            )
+
         case "exhaustive":
             assert not isinstance(separators, Pattern)  # nosec: B101
             assert not any(isinstance(separator, Pattern) for separator in separators or [])  # nosec: B101
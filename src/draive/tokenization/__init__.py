@@ -1,10 +1,25 @@
-from draive.tokenization.call import count_text_tokens, tokenize_text
+from draive.tokenization.call import (
+    count_text_tokens,
+    count_texts_tokens,
+    tokenize_text,
+    tokenize_texts,
+)
 from draive.tokenization.state import Tokenization
-from draive.tokenization.text import TextTokenizer
+from draive.tokenization.text import (
+    TextBatchTokenizer,
+    TextBatchTokensCounter,
+    TextTokenizer,
+    TextTokensCounter,
+)
 
 __all__ = [
     "count_text_tokens",
+    "count_texts_tokens",
+    "TextBatchTokenizer",
+    "TextBatchTokensCounter",
     "TextTokenizer",
+    "TextTokensCounter",
     "Tokenization",
     "tokenize_text",
+    "tokenize_texts",
 ]
@@ -1,11 +1,14 @@
+from collections.abc import Sequence
 from typing import Any
 
 from draive.scope import ctx
 from draive.tokenization.state import Tokenization
 
 __all__ = [
-    "tokenize_text",
     "count_text_tokens",
+    "count_texts_tokens",
+    "tokenize_text",
+    "tokenize_texts",
 ]
 
 
@@ -19,13 +22,83 @@ def tokenize_text(
     )
 
 
+def tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    tokenization: Tokenization = ctx.state(Tokenization)
+    if tokenize := tokenization.tokenize_texts:
+        return tokenize(
+            texts=texts,
+            **extra,
+        )
+
+    else:
+        return [
+            tokenization.tokenize_text(
+                text=text,
+                **extra,
+            )
+            for text in texts
+        ]
+
+
 def count_text_tokens(
     text: str,
     **extra: Any,
 ) -> int:
-    return len(
-        ctx.state(Tokenization).tokenize_text(
+    tokenization: Tokenization = ctx.state(Tokenization)
+    if count := tokenization.count_text_tokens:
+        return count(
             text=text,
             **extra,
         )
-    )
+
+    else:
+        return len(
+            tokenization.tokenize_text(
+                text=text,
+                **extra,
+            )
+        )
+
+
+def count_texts_tokens(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[int]:
+    tokenization: Tokenization = ctx.state(Tokenization)
+    if count := tokenization.count_texts_tokens:
+        return count(
+            texts=texts,
+            **extra,
+        )
+
+    elif tokenize := tokenization.tokenize_texts:
+        return [
+            len(tokens)
+            for tokens in tokenize(
+                texts=texts,
+                **extra,
+            )
+        ]
+
+    elif count_single := tokenization.count_text_tokens:
+        return [
+            count_single(
+                text=text,
+                **extra,
+            )
+            for text in texts
+        ]
+
+    else:
+        return [
+            len(
+                tokenization.tokenize_text(
+                    text=text,
+                    **extra,
+                )
+            )
+            for text in texts
+        ]
@@ -1,5 +1,10 @@
 from draive.parameters import State
-from draive.tokenization.text import TextTokenizer
+from draive.tokenization.text import (
+    TextBatchTokenizer,
+    TextBatchTokensCounter,
+    TextTokenizer,
+    TextTokensCounter,
+)
 
 __all__ = [
     "Tokenization",
@@ -8,3 +13,7 @@ __all__ = [
 
 class Tokenization(State):
     tokenize_text: TextTokenizer
+    # optional specializations, tokenize_text is used when not provided
+    tokenize_texts: TextBatchTokenizer | None = None
+    count_text_tokens: TextTokensCounter | None = None
+    count_texts_tokens: TextBatchTokensCounter | None = None
@@ -1,7 +1,11 @@
+from collections.abc import Sequence
 from typing import Any, Protocol, runtime_checkable
 
 __all__ = [
+    "TextBatchTokenizer",
+    "TextBatchTokensCounter",
     "TextTokenizer",
+    "TextTokensCounter",
 ]
 
 
@@ -12,3 +16,30 @@ class TextTokenizer(Protocol):
         text: str,
         **extra: Any,
     ) -> list[int]: ...
+
+
+@runtime_checkable
+class TextBatchTokenizer(Protocol):
+    def __call__(
+        self,
+        texts: Sequence[str],
+        **extra: Any,
+    ) -> list[list[int]]: ...
+
+
+@runtime_checkable
+class TextTokensCounter(Protocol):
+    def __call__(
+        self,
+        text: str,
+        **extra: Any,
+    ) -> int: ...
+
+
+@runtime_checkable
+class TextBatchTokensCounter(Protocol):
+    def __call__(
+        self,
+        texts: Sequence[str],
+        **extra: Any,
+    ) -> list[int]: ...
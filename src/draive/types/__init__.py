@@ -1,7 +1,17 @@
-from draive.types.audio import AudioBase64Content, AudioContent, AudioURLContent
+from draive.types.audio import (
+    AudioBase64Content,
+    AudioContent,
+    AudioDataContent,
+    AudioURLContent,
+)
 from draive.types.errors import RateLimitError
 from draive.types.frozenlist import frozenlist
-from draive.types.image import ImageBase64Content, ImageContent, ImageURLContent
+from draive.types.image import (
+    ImageBase64Content,
+    ImageContent,
+    ImageDataContent,
+    ImageURLContent,
+)
 from draive.types.json import JSON
 from draive.types.lmm import (
     LMMCompletion,
@@ -25,17 +35,32 @@ from draive.types.multimodal import (
     MultimodalTemplate,
 )
 from draive.types.text import TextContent
-from draive.types.video import VideoBase64Content, VideoContent, VideoURLContent
-from draive.types.xml import xml_tag, xml_tags
+from draive.types.video import (
+    VideoBase64Content,
+    VideoContent,
+    VideoDataContent,
+    VideoURLContent,
+)
+from draive.types.xml import (
+    XMLStreamChunk,
+    xml_tag,
+    xml_tag_stream,
+    xml_tagged,
+    xml_tagged_stream,
+    xml_tags,
+    xml_tags_stream,
+)
 
 __all__ = [
     "AudioBase64Content",
     "AudioContent",
+    "AudioDataContent",
     "AudioURLContent",
     "BasicMemory",
     "frozenlist",
     "ImageBase64Content",
     "ImageContent",
+    "ImageDataContent",
     "ImageURLContent",
     "JSON",
     "LMMCompletion",
@@ -59,7 +84,13 @@ __all__ = [
     "TextContent",
     "VideoBase64Content",
     "VideoContent",
+    "VideoDataContent",
     "VideoURLContent",
     "xml_tag",
+    "xml_tag_stream",
+    "xml_tagged",
+    "xml_tagged_stream",
     "xml_tags",
+    "xml_tags_stream",
+    "XMLStreamChunk",
 ]
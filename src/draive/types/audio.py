@@ -1,8 +1,13 @@
+from base64 import b64encode
+
 from draive.parameters import DataModel
+from draive.types.media import media_data_field
+from draive.utils import identity_cache
 
 __all__ = [
     "AudioBase64Content",
     "AudioContent",
+    "AudioDataContent",
     "AudioURLContent",
 ]
 
@@ -27,4 +32,29 @@ class AudioBase64Content(DataModel):
         return bool(self.audio_base64)
 
 
-AudioContent = AudioURLContent | AudioBase64Content
+class AudioDataContent(DataModel):
+    mime_type: str | None = None
+    audio_data: bytes = media_data_field(description="base64 encoded audio data")
+    audio_transcription: str | None = None
+    meta: dict[str, str | float | int | bool | None] | None = None
+
+    @property
+    def audio_base64(self) -> str:
+        """\
+        Base64 encoded audio data, encoded on first use and reused afterwards.
+        """
+        return _audio_base64(self)
+
+    def __bool__(self) -> bool:
+        return bool(self.audio_data)
+
+
+@identity_cache
+def _audio_base64(
+    content: AudioDataContent,
+    /,
+) -> str:
+    return b64encode(content.audio_data).decode()
+
+
+AudioContent = AudioURLContent | AudioBase64Content | AudioDataContent
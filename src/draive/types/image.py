@@ -1,10 +1,14 @@
+from base64 import b64encode
 from typing import Literal
 
 from draive.parameters import DataModel
+from draive.types.media import media_data_field
+from draive.utils import identity_cache
 
 __all__ = [
     "ImageBase64Content",
     "ImageContent",
+    "ImageDataContent",
     "ImageURLContent",
 ]
 
@@ -29,4 +33,29 @@ class ImageBase64Content(DataModel):
         return bool(self.image_base64)
 
 
-ImageContent = ImageURLContent | ImageBase64Content
+class ImageDataContent(DataModel):
+    mime_type: Literal["image/jpeg", "image/png", "image/gif"] | None = None
+    image_data: bytes = media_data_field(description="base64 encoded image data")
+    image_description: str | None = None
+    meta: dict[str, str | float | int | bool | None] | None = None
+
+    @property
+    def image_base64(self) -> str:
+        """\
+        Base64 encoded image data, encoded on first use and reused afterwards.
+        """
+        return _image_base64(self)
+
+    def __bool__(self) -> bool:
+        return bool(self.image_data)
+
+
+@identity_cache
+def _image_base64(
+    content: ImageDataContent,
+    /,
+) -> str:
+    return b64encode(content.image_data).decode()
+
+
+ImageContent = ImageURLContent | ImageBase64Content | ImageDataContent
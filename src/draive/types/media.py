@@ -0,0 +1,67 @@
+from base64 import b64decode, b64encode
+from typing import Any
+
+from draive.parameters import Field, ParameterValidationContext, ParameterValidationError
+
+__all__ = [
+    "media_data_field",
+]
+
+
+def media_data_field(
+    *,
+    description: str,
+) -> bytes:
+    """\
+    Field holding raw media bytes. Bytearray and memoryview values are copied \
+    into bytes, strings are decoded as base64 to allow reading serialized content. \
+    Serialized values are encoded as base64.
+    """
+
+    return Field(
+        validator=_media_data_validator,
+        converter=_media_data_converter,
+        specification={
+            "type": "string",
+            "description": description,
+        },
+    )
+
+
+def _media_data_validator(
+    value: Any,
+    context: ParameterValidationContext,
+) -> bytes:
+    match value:
+        case bytes() as data:
+            return data
+
+        case bytearray() as data:
+            return bytes(data)
+
+        case memoryview() as data:  # pyright: ignore[reportUnknownVariableType]
+            return data.tobytes()
+
+        case str() as encoded:
+            try:
+                return b64decode(encoded, validate=True)
+
+            except Exception as exc:
+                raise ParameterValidationError.invalid_value(
+                    expected=bytes,
+                    received=value,
+                    context=context,
+                ) from exc
+
+        case _:
+            raise ParameterValidationError.invalid_type(
+                expected=bytes,
+                received=value,
+                context=context,
+            )
+
+
+def _media_data_converter(
+    data: bytes,
+) -> str:
+    return b64encode(data).decode()
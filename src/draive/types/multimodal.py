@@ -3,11 +3,26 @@ from itertools import chain
 from typing import Self, final, overload
 
 from draive.parameters.model import DataModel
-from draive.types.audio import AudioBase64Content, AudioContent, AudioURLContent
+from draive.types.audio import (
+    AudioBase64Content,
+    AudioContent,
+    AudioDataContent,
+    AudioURLContent,
+)
 from draive.types.frozenlist import frozenlist
-from draive.types.image import ImageBase64Content, ImageContent, ImageURLContent
+from draive.types.image import (
+    ImageBase64Content,
+    ImageContent,
+    ImageDataContent,
+    ImageURLContent,
+)
 from draive.types.text import TextContent
-from draive.types.video import VideoBase64Content, VideoContent, VideoURLContent
+from draive.types.video import (
+    VideoBase64Content,
+    VideoContent,
+    VideoDataContent,
+    VideoURLContent,
+)
 
 __all__ = [
     "Multimodal",
@@ -316,19 +331,19 @@ def _is_artifact(  # noqa: PLR0911
         case ImageURLContent():
             return False
 
-        case ImageBase64Content():
+        case ImageBase64Content() | ImageDataContent():
             return False
 
         case AudioURLContent():
             return False
 
-        case AudioBase64Content():
+        case AudioBase64Content() | AudioDataContent():
             return False
 
         case VideoURLContent():
             return False
 
-        case VideoBase64Content():
+        case VideoBase64Content() | VideoDataContent():
             return False
 
         case _:
@@ -345,23 +360,23 @@ def _as_string(  # noqa: PLR0911
         case ImageURLContent() as image_url:
             return f"![{image_url.image_description or 'IMAGE'}]({image_url.image_url})"
 
-        case ImageBase64Content() as image_base64:
+        case ImageBase64Content() | ImageDataContent() as image_data:
             # we might want to use base64 content directly, but it would make a lot of tokens...
-            return f"![{image_base64.image_description or 'IMAGE'}]()"
+            return f"![{image_data.image_description or 'IMAGE'}]()"
 
         case AudioURLContent() as audio_url:
             return f"![{audio_url.audio_transcription or 'AUDIO'}]({audio_url.audio_url})"
 
-        case AudioBase64Content() as audio_base64:
+        case AudioBase64Content() | AudioDataContent() as audio_data:
             # we might want to use base64 content directly, but it would make a lot of tokens...
-            return f"![{audio_base64.audio_transcription or 'AUDIO'}]()"
+            return f"![{audio_data.audio_transcription or 'AUDIO'}]()"
 
         case VideoURLContent() as video_url:
             return f"![{video_url.video_transcription or 'VIDEO'}]({video_url.video_url})"
 
-        case VideoBase64Content() as video_base64:
+        case VideoBase64Content() | VideoDataContent() as video_data:
             # we might want to use base64 content directly, but it would make a lot of tokens...
-            return f"![{video_base64.video_transcription or 'VIDEO'}]()"
+            return f"![{video_data.video_transcription or 'VIDEO'}]()"
 
         case DataModel() as model:
             return str(model)
@@ -417,10 +432,13 @@ def _update_meta(
                 TextContent()
                 | ImageURLContent()
                 | ImageBase64Content()
+                | ImageDataContent()
                 | AudioURLContent()
                 | AudioBase64Content()
+                | AudioDataContent()
                 | VideoURLContent()
                 | VideoBase64Content()
+                | VideoDataContent()
             ) as content
         ):
             if current_meta := content.meta:
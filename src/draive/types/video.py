@@ -1,8 +1,13 @@
+from base64 import b64encode
+
 from draive.parameters import DataModel
+from draive.types.media import media_data_field
+from draive.utils import identity_cache
 
 __all__ = [
     "VideoBase64Content",
     "VideoContent",
+    "VideoDataContent",
     "VideoURLContent",
 ]
 
@@ -27,4 +32,29 @@ class VideoBase64Content(DataModel):
         return bool(self.video_base64)
 
 
-VideoContent = VideoURLContent | VideoBase64Content
+class VideoDataContent(DataModel):
+    mime_type: str | None = None
+    video_data: bytes = media_data_field(description="base64 encoded video data")
+    video_transcription: str | None = None
+    meta: dict[str, str | float | int | bool | None] | None = None
+
+    @property
+    def video_base64(self) -> str:
+        """\
+        Base64 encoded video data, encoded on first use and reused afterwards.
+        """
+        return _video_base64(self)
+
+    def __bool__(self) -> bool:
+        return bool(self.video_data)
+
+
+@identity_cache
+def _video_base64(
+    content: VideoDataContent,
+    /,
+) -> str:
+    return b64encode(content.video_data).decode()
+
+
+VideoContent = VideoURLContent | VideoBase64Content | VideoDataContent
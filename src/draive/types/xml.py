@@ -1,15 +1,33 @@
-from collections.abc import Callable, Generator
-from typing import cast, overload
+import re
+from collections.abc import AsyncGenerator, AsyncIterable, Callable, Generator, Iterable
+from re import Match, Pattern
+from typing import Protocol, cast, final, overload, runtime_checkable
 
+from draive.types.lmm import LMMCompletionChunk, LMMToolRequests
 from draive.types.multimodal import Multimodal, MultimodalContent, MultimodalContentElement
 from draive.types.text import TextContent
+from draive.utils import AsyncStream
 
 __all__ = [
     "xml_tag",
+    "xml_tag_stream",
+    "xml_tagged",
+    "xml_tagged_stream",
     "xml_tags",
+    "xml_tags_stream",
+    "XMLStreamChunk",
 ]
 
 
+@runtime_checkable
+class _ContentChunk(Protocol):  # i.e. ConversationMessageChunk
+    @property
+    def content(self) -> MultimodalContent: ...
+
+
+XMLStreamChunk = Multimodal | LMMCompletionChunk | LMMToolRequests | _ContentChunk
+
+
 @overload
 def xml_tags(
     tag: str,
@@ -27,143 +45,412 @@ def xml_tags[Result](
 ) -> Generator[Result, None]: ...
 
 
-def xml_tags[Result](  # noqa: C901, PLR0912, PLR0915
+def xml_tags[Result](
     tag: str,
     /,
     source: Multimodal,
     conversion: Callable[[MultimodalContent], Result] | None = None,
 ) -> Generator[MultimodalContent, None] | Generator[Result, None]:
-    content_parts: tuple[MultimodalContentElement, ...]
+    if conversion := conversion:
+        return (conversion(content) for _, content in _scan((tag,), source=source))
+
+    else:
+        return (content for _, content in _scan((tag,), source=source))
+
+
+def xml_tagged(
+    tags: Iterable[str],
+    /,
+    source: Multimodal,
+) -> Generator[tuple[str, MultimodalContent], None]:
+    """\
+    Extract contents of multiple tags in a single pass over the source. \
+    Contents are yielded in order of their closing tags together with the tag name. \
+    Nested tags are not supported, opening any of the tags discards the content \
+    of the tag opened before, same as for nested tags in xml_tags.
+
+    Parameters
+    ----------
+    tags: Iterable[str]
+        names of the tags to extract
+    source: Multimodal
+        content to be scanned
+
+    Returns
+    -------
+    Generator[tuple[str, MultimodalContent], None]
+        generator of the tag name and its content
+    """
+
+    return _scan(tuple(tags), source=source)
+
+
+@overload
+def xml_tags_stream(
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+) -> AsyncGenerator[MultimodalContent, None]: ...
+
+
+@overload
+def xml_tags_stream[Result](
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+    conversion: Callable[[MultimodalContent], Result],
+) -> AsyncGenerator[Result, None]: ...
+
+
+async def xml_tags_stream[Result](
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+    conversion: Callable[[MultimodalContent], Result] | None = None,
+) -> AsyncGenerator[MultimodalContent | Result, None]:
+    """\
+    Extract contents of the tag from the stream, i.e. LMM output stream. \
+    Contents are yielded as soon as the closing tag arrives, consecutive text \
+    chunks are merged. Tool requests are skipped.
+
+    Parameters
+    ----------
+    tag: str
+        name of the tag to extract
+    stream: AsyncIterable[XMLStreamChunk]
+        stream of content chunks, i.e. LMMOutputStream or conversation message chunks
+    conversion: Callable[[MultimodalContent], Result] | None
+        conversion of each extracted content
+
+    Returns
+    -------
+    AsyncGenerator[MultimodalContent | Result, None]
+        generator of extracted contents
+    """
+
+    async for _, content in xml_tagged_stream((tag,), stream=stream):
+        if conversion := conversion:
+            yield conversion(content)
+
+        else:
+            yield content
+
+
+async def xml_tagged_stream(
+    tags: Iterable[str],
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+) -> AsyncGenerator[tuple[str, MultimodalContent], None]:
+    """\
+    Extract contents of multiple tags from the stream, i.e. LMM output stream. \
+    Works the same as xml_tagged, yielding contents as soon as the closing tag arrives.
+
+    Parameters
+    ----------
+    tags: Iterable[str]
+        names of the tags to extract
+    stream: AsyncIterable[XMLStreamChunk]
+        stream of content chunks, i.e. LMMOutputStream or conversation message chunks
+
+    Returns
+    -------
+    AsyncGenerator[tuple[str, MultimodalContent], None]
+        generator of the tag name and its content
+    """
+
+    scanner = _XMLTagsScanner(tuple(tags), merge_text=True)
+    async for chunk in stream:
+        for element in scanner.scan(_chunk_parts(chunk)):
+            yield element
+
+
+@overload
+async def xml_tag_stream(
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+) -> MultimodalContent | None: ...
+
+
+@overload
+async def xml_tag_stream[Result](
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+    conversion: Callable[[MultimodalContent], Result],
+) -> Result | None: ...
+
+
+async def xml_tag_stream[Result](
+    tag: str,
+    /,
+    stream: AsyncIterable[XMLStreamChunk],
+    conversion: Callable[[MultimodalContent], Result] | None = None,
+) -> MultimodalContent | Result | None:
+    """\
+    Extract the first content of the tag from the stream, i.e. LMM output stream. \
+    The stream is closed as soon as the closing tag arrives, which cancels \
+    the remaining generation for streams of lmm_invocation.
+
+    Parameters
+    ----------
+    tag: str
+        name of the tag to extract
+    stream: AsyncIterable[XMLStreamChunk]
+        stream of content chunks, i.e. LMMOutputStream or conversation message chunks
+    conversion: Callable[[MultimodalContent], Result] | None
+        conversion of the extracted content
+
+    Returns
+    -------
+    MultimodalContent | Result | None
+        extracted content or None if the tag was not found
+    """
+
+    contents: AsyncGenerator[tuple[str, MultimodalContent], None] = xml_tagged_stream(
+        (tag,),
+        stream=stream,
+    )
+    try:
+        async for _, content in contents:
+            if conversion := conversion:
+                return conversion(content)
+
+            else:
+                return content
+
+        return None
+
+    finally:
+        await contents.aclose()
+        match stream:
+            case AsyncStream():
+                stream.cancel()  # pyright: ignore[reportUnknownMemberType]
+
+            case AsyncGenerator():
+                await stream.aclose()  # pyright: ignore[reportUnknownMemberType]
+
+            case _:
+                pass  # can't stop other streams
+
+
+def _chunk_parts(
+    chunk: XMLStreamChunk,
+    /,
+) -> tuple[MultimodalContentElement, ...]:
+    match chunk:
+        case MultimodalContent() as content:
+            return content.parts
+
+        case str() as string:
+            return (TextContent(text=string),)
+
+        case LMMCompletionChunk() as completion:
+            return completion.content.parts
+
+        case LMMToolRequests():
+            return ()
+
+        case _ContentChunk() as other:
+            return other.content.parts
+
+        case element:
+            return (element,)
+
+
+# tags are recognized between consecutive angle brackets
+_ANGLE_BRACKET: Pattern[str] = re.compile(r"[<>]")
+
+
+def _scan(
+    tags: tuple[str, ...],
+    /,
+    source: Multimodal,
+) -> Generator[tuple[str, MultimodalContent], None]:
     match source:
         case str() as string:
-            content_parts = (TextContent(text=string),)
+            return _XMLTagsScanner(tags).scan((TextContent(text=string),))
 
         case MultimodalContent() as multimodal:
-            content_parts = multimodal.parts
+            return _XMLTagsScanner(tags).scan(multimodal.parts)
 
         case TextContent() as text:
-            content_parts = (text,)
+            return _XMLTagsScanner(tags).scan((text,))
 
         case _:
-            return  # can't process other types
+            return _XMLTagsScanner(tags).scan(())  # can't process other types
 
-    opening_tag_prefix: str = f"<{tag} "
-    opening_tag: str = f"<{tag}>"
-    closing_tag: str = f"</{tag}>"
 
-    def check_opening(
+@final
+class _XMLTagsScanner:
+    def __init__(
+        self,
+        tags: tuple[str, ...],
+        /,
+        *,
+        merge_text: bool = False,
+    ) -> None:
+        self._tags: tuple[str, ...] = tags
+        # merge consecutive text parts with the same meta, i.e. stream chunks
+        self._merge_text: bool = merge_text
+        self._current_tag: str | None = None
+        self._closing_tag: str = ""
+        # text of the tag being scanned, from "<" until ">"
+        self._accumulator: str = ""
+        self._content_accumulator: list[str] = []
+        self._content_accumulator_meta: dict[str, str | float | int | bool | None] | None = None
+        self._content: list[MultimodalContentElement] = []
+        self._in_tag: bool = False
+
+    def _opened_tag(
+        self,
         accumulator: str,
         /,
-    ) -> bool:
-        return accumulator == opening_tag or (
-            accumulator.endswith(">") and accumulator.startswith(opening_tag_prefix)
+    ) -> str | None:
+        # opening tag is either exactly <tag> or <tag with extras>
+        name: str = accumulator[1:-1]
+        if (separator := name.find(" ")) >= 0:
+            name = name[:separator]
+
+        return name if name in self._tags else None
+
+    def scan(  # noqa: C901, PLR0912, PLR0915
+        self,
+        parts: Iterable[MultimodalContentElement],
+        /,
+    ) -> Generator[tuple[str, MultimodalContent], None]:
+        # use locals while scanning, state is stored back when finished
+        current_tag: str | None = self._current_tag
+        closing_tag: str = self._closing_tag
+        accumulator: str = self._accumulator
+        content_accumulator: list[str] = self._content_accumulator
+        content_accumulator_meta: dict[str, str | float | int | bool | None] | None = (
+            self._content_accumulator_meta
         )
+        content: list[MultimodalContentElement] = self._content
+        in_tag: bool = self._in_tag
+        try:
+            for part in parts:
+                match part:
+                    case TextContent() as text:
+                        # preserve parts as in input
+                        if (
+                            current_tag is not None
+                            and content_accumulator
+                            and not (self._merge_text and content_accumulator_meta == text.meta)
+                        ):
+                            content.append(
+                                TextContent(
+                                    text="".join(content_accumulator),
+                                    meta=content_accumulator_meta,
+                                )
+                            )
+                            content_accumulator = []
+
+                        content_accumulator_meta = text.meta  # use current part meta
+
+                        string: str = text.text
+                        position: int = 0
+                        while position < len(string):
+                            if not in_tag:
+                                # skip to the next tag
+                                tag_start: int = string.find("<", position)
+                                if tag_start < 0:
+                                    if current_tag is not None:
+                                        content_accumulator.append(string[position:])
+
+                                    break
+
+                                if current_tag is not None and tag_start > position:
+                                    content_accumulator.append(string[position:tag_start])
+
+                                in_tag = True
+                                accumulator = "<"
+                                position = tag_start + 1
+                                continue
+
+                            bracket: Match[str] | None = _ANGLE_BRACKET.search(string, position)
+                            if bracket is None:
+                                # tag continues in the next part
+                                accumulator += string[position:]
+                                break
+
+                            bracket_position: int = bracket.start()
+                            if bracket.group() == "<":
+                                # it was not a tag, start again from the current bracket
+                                if current_tag is not None:
+                                    content_accumulator.append(accumulator)
+                                    content_accumulator.append(string[position:bracket_position])
+
+                                accumulator = "<"
+                                position = bracket_position + 1
+                                continue
+
+                            accumulator += string[position : bracket_position + 1]
+                            position = bracket_position + 1
+                            in_tag = False
 
-    accumulator: str = ""
-    content_accumulator: str = ""
-    content_accumulator_meta: dict[str, str | float | int | bool | None] | None = None
-    content: list[MultimodalContentElement] = []
-    in_tag: bool = False
-    in_content: bool = False
-    for part in content_parts:
-        match part:
-            case TextContent() as text:
-                # preserve parts as in input
-                if in_content and content_accumulator:
-                    content.append(
-                        TextContent(
-                            text=content_accumulator,
-                            meta=content_accumulator_meta,
-                        )
-                    )
-                    content_accumulator = ""
-
-                content_accumulator_meta = text.meta  # use current part meta
-
-                for char in text.text:
-                    if in_tag:
-                        if char == ">":
-                            accumulator += char
-                            if in_content and accumulator == closing_tag:
-                                in_content = False
-                                if conversion := conversion:
-                                    if content_accumulator:
-                                        yield conversion(
-                                            MultimodalContent.of(
-                                                *content,
-                                                TextContent(
-                                                    text=content_accumulator,
-                                                    meta=content_accumulator_meta,
-                                                ),
-                                            )
-                                        )
-
-                                    else:
-                                        yield conversion(MultimodalContent.of(*content))
-
-                                elif content_accumulator:
-                                    yield MultimodalContent.of(
+                            if current_tag is not None and accumulator == closing_tag:
+                                tag: str = current_tag
+                                result: MultimodalContent
+                                if content_accumulator:
+                                    result = MultimodalContent.of(
                                         *content,
                                         TextContent(
-                                            text=content_accumulator,
+                                            text="".join(content_accumulator),
                                             meta=content_accumulator_meta,
                                         ),
                                     )
 
                                 else:
-                                    yield MultimodalContent.of(*content)
+                                    result = MultimodalContent.of(*content)
 
+                                current_tag = None
                                 content = []  # clear to be ready for next tag
-                                content_accumulator = ""
-
-                            elif check_opening(accumulator):
-                                in_content = True
+                                content_accumulator = []
+                                accumulator = ""
+                                yield (tag, result)
+                                continue
+
+                            elif (opened := self._opened_tag(accumulator)) is not None:
+                                current_tag = opened
+                                closing_tag = f"</{opened}>"
                                 content = []  # clear current content in case of nested tags
-                                content_accumulator = ""
+                                content_accumulator = []
 
-                            elif in_content:
-                                content_accumulator += accumulator
+                            elif current_tag is not None:
+                                content_accumulator.append(accumulator)
 
-                            in_tag = False
                             accumulator = ""
 
-                        elif char == "<":
-                            if in_content:
-                                content_accumulator += accumulator
-
-                            accumulator = char
-
-                        else:
-                            accumulator += char
-
-                    elif char == "<":
-                        in_tag = True
-                        accumulator = char
-
-                    elif in_content:
-                        content_accumulator += char
+                    case other:
+                        if current_tag is not None:
+                            if in_tag:
+                                content_accumulator.append(accumulator)
 
-                    # else skip character
-
-            case other:
-                if in_content:
-                    if accumulator:
-                        content_accumulator += accumulator
+                            if content_accumulator:
+                                content.append(
+                                    TextContent(
+                                        text="".join(content_accumulator),
+                                        meta=content_accumulator_meta,
+                                    )
+                                )
+                                content_accumulator = []
 
-                    if content_accumulator:
-                        content.append(
-                            TextContent(
-                                text=content_accumulator,
-                                meta=content_accumulator_meta,
-                            )
-                        )
-                        content_accumulator = ""
+                            content.append(other)
 
-                    content.append(other)
+                        if in_tag:
+                            in_tag = False
+                            accumulator = ""
 
-                if in_tag:
-                    in_tag = False
-                    accumulator = ""
+        finally:
+            self._current_tag = current_tag
+            self._closing_tag = closing_tag
+            self._accumulator = accumulator
+            self._content_accumulator = content_accumulator
+            self._content_accumulator_meta = content_accumulator_meta
+            self._content = content
+            self._in_tag = in_tag
 
 
 @overload
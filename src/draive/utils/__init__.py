@@ -1,10 +1,16 @@
 from draive.utils.always import always, async_always
 from draive.utils.asynchronous import asynchronous
-from draive.utils.cache import cache
+from draive.utils.byte_stream import ndjson_lines, sse_events
+from draive.utils.cache import cache, identity_cache
 from draive.utils.env import getenv_bool, getenv_float, getenv_int, getenv_str, load_env
 from draive.utils.freeze import freeze
 from draive.utils.logs import setup_logging
-from draive.utils.markdown import markdown_block, markdown_blocks
+from draive.utils.markdown import (
+    markdown_block,
+    markdown_block_stream,
+    markdown_blocks,
+    markdown_blocks_stream,
+)
 from draive.utils.mimic import mimic_function
 from draive.utils.missing import MISSING, Missing, is_missing, not_missing
 from draive.utils.noop import async_noop, noop
@@ -22,6 +28,7 @@ __all__ = [
     "AsyncQueue",
     "AsyncStream",
     "cache",
+    "identity_cache",
     "freeze",
     "getenv_bool",
     "getenv_float",
@@ -30,14 +37,18 @@ __all__ = [
     "is_missing",
     "load_env",
     "markdown_block",
+    "markdown_block_stream",
     "markdown_blocks",
+    "markdown_blocks_stream",
     "mimic_function",
     "Missing",
     "MISSING",
+    "ndjson_lines",
     "noop",
     "not_missing",
     "setup_logging",
     "split_sequence",
+    "sse_events",
     "throttle",
     "with_timeout",
 ]
@@ -0,0 +1,96 @@
+from collections.abc import AsyncGenerator, AsyncIterable
+
+__all__ = [
+    "ndjson_lines",
+    "sse_events",
+]
+
+
+async def ndjson_lines(
+    stream: AsyncIterable[bytes],
+    /,
+) -> AsyncGenerator[bytes, None]:
+    """\
+    Split raw byte chunks of a newline delimited json (NDJSON) stream into lines. \
+    Lines are yielded as soon as they are complete, only the incomplete tail \
+    of the stream is buffered. Empty lines are skipped.
+
+    Parameters
+    ----------
+    stream: AsyncIterable[bytes]
+        raw bytes of the stream, i.e. httpx response bytes
+
+    Returns
+    -------
+    AsyncGenerator[bytes, None]
+        generator of consecutive lines, each containing a single json value
+    """
+
+    async for line in _lines(stream):
+        if line := line.strip():
+            yield line
+
+
+async def sse_events(
+    stream: AsyncIterable[bytes],
+    /,
+) -> AsyncGenerator[bytes, None]:
+    """\
+    Extract data of server sent events (SSE) from raw byte chunks of a stream. \
+    Events are yielded as soon as they are complete, only the incomplete tail \
+    of the stream is buffered. Multiple data lines of a single event are joined \
+    using a new line, other event fields and events without data are skipped.
+
+    Parameters
+    ----------
+    stream: AsyncIterable[bytes]
+        raw bytes of the stream, i.e. httpx response bytes
+
+    Returns
+    -------
+    AsyncGenerator[bytes, None]
+        generator of consecutive events data
+    """
+
+    data: bytearray = bytearray()
+    has_data: bool = False
+    async for line in _lines(stream):
+        if not line:  # empty line dispatches the event
+            if has_data:
+                yield bytes(data)
+                data.clear()
+                has_data = False
+
+        elif line.startswith(b"data:"):
+            if has_data:
+                data += b"\n"
+
+            # single leading space is not a part of the value
+            data += line[6:] if line.startswith(b"data: ") else line[5:]
+            has_data = True
+
+        else:
+            continue  # skip comments and other fields
+
+    if has_data:  # last event might be not terminated
+        yield bytes(data)
+
+
+async def _lines(
+    stream: AsyncIterable[bytes],
+    /,
+) -> AsyncGenerator[bytes, None]:
+    buffer: bytearray = bytearray()
+    async for chunk in stream:
+        buffer += chunk
+        start: int = 0
+        while (end := buffer.find(b"\n", start)) >= 0:
+            line: bytes = bytes(buffer[start:end])
+            start = end + 1
+            yield line[:-1] if line.endswith(b"\r") else line
+
+        # keep only the incomplete tail
+        del buffer[:start]
+
+    if buffer:
+        yield bytes(buffer[:-1] if buffer.endswith(b"\r") else buffer)
@@ -3,13 +3,14 @@ from collections import OrderedDict
 from collections.abc import Callable, Coroutine, Hashable
 from functools import _make_key, partial  # pyright: ignore[reportPrivateUsage]
 from time import monotonic
-from typing import NamedTuple, cast, overload
+from typing import Any, Concatenate, NamedTuple, cast, overload
 from weakref import ref
 
 from draive.utils.mimic import mimic_function
 
 __all__ = [
     "cache",
+    "identity_cache",
 ]
 
 
@@ -324,3 +325,87 @@ class _AsyncCache[**Args, Result]:
             self._cached.popitem(last=False)
 
         return await shield(task)
+
+
+def identity_cache[Element, **Args, Result](
+    function: Callable[Concatenate[Element, Args], Result],
+    /,
+) -> Callable[Concatenate[Element, Args], Result]:
+    """\
+    Cache results of converting an immutable element, i.e. context elements converted \
+    to provider messages. Results are kept for as long as the element instance is alive \
+    and are identified by the element identity, so that it is not required to be hashable. \
+    Only the result for the last used arguments is kept per element. \
+    Cached results are shared and should not be modified. \
+    This wrapper is not thread safe.
+
+    Parameters
+    ----------
+    function: Callable[Concatenate[Element, Args], Result]
+        function to wrap in cache, element has to be passed as the first argument, \
+        remaining arguments have to be hashable
+
+    Returns
+    -------
+    Callable[Concatenate[Element, Args], Result]
+        provided function wrapped in cache
+    """
+
+    return cast(
+        Callable[Concatenate[Element, Args], Result],
+        _IdentityCache(function),
+    )
+
+
+class _IdentityCacheEntry[Entry](NamedTuple):
+    element: ref[Any]
+    key: Hashable
+    value: Entry
+
+
+class _IdentityCache[Element, **Args, Result]:
+    def __init__(
+        self,
+        function: Callable[Concatenate[Element, Args], Result],
+        /,
+    ) -> None:
+        self._function: Callable[Concatenate[Element, Args], Result] = function
+        self._cached: dict[int, _IdentityCacheEntry[Result]] = {}
+
+        # mimic function attributes if able
+        mimic_function(function, within=self)
+
+    def __call__(
+        self,
+        element: Element,
+        /,
+        *args: Args.args,
+        **kwargs: Args.kwargs,
+    ) -> Result:
+        identifier: int = id(element)
+        key: Hashable = _make_key(
+            args=args,
+            kwds=kwargs,
+            typed=True,
+        )
+
+        if (
+            (entry := self._cached.get(identifier))
+            and entry.element() is element
+            and entry.key == key
+        ):
+            return entry.value
+
+        result: Result = self._function(element, *args, **kwargs)
+        try:
+            self._cached[identifier] = _IdentityCacheEntry(
+                # drop the entry together with the element
+                element=ref(element, lambda _: self._cached.pop(identifier, None)),
+                key=key,
+                value=result,
+            )
+
+        except TypeError:
+            pass  # skip caching elements which can't be weakly referenced
+
+        return result
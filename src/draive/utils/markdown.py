@@ -1,84 +1,26 @@
-from collections.abc import Generator
+from collections.abc import AsyncGenerator, AsyncIterable, Generator
+from typing import Any, Protocol, final, runtime_checkable
+
+from draive.utils.stream import AsyncStream
 
 __all__ = [
     "markdown_block",
+    "markdown_block_stream",
     "markdown_blocks",
+    "markdown_blocks_stream",
 ]
 
 
-def markdown_blocks(  # noqa: C901, PLR0912
+def markdown_blocks(
     info: str = "",
     /,
     *,
     source: str,
 ) -> Generator[str, None]:
-    boundary_sequence: str = "```"
-    opening_sequence: str = f"{boundary_sequence}{info}"
-
-    accumulator: str = ""
-    content: str = ""
-    in_sequence: bool = False
-    in_content: bool = False
-
-    for char in source:
-        if in_sequence:
-            if accumulator.startswith(boundary_sequence):
-                if char.isspace():
-                    if in_content:
-                        in_content = False
-                        yield content.strip()
-                        content = ""  # clear to be ready for next block
-
-                    elif accumulator.startswith(opening_sequence):
-                        in_content = True
-                        content = ""  # clear current content in case of nested blocks
-
-                    in_sequence = False
-                    accumulator = ""
-
-                elif char == "`":
-                    if in_content:
-                        content += char
-                    # keep the accumulator unchanged
-
-                elif char.isalnum() and not in_content:  # take the info
-                    accumulator += char
-
-                elif in_content:
-                    accumulator += char
-                    content += accumulator
-                    in_sequence = False
-                    accumulator = ""
-
-                else:
-                    in_sequence = False
-                    accumulator = ""
-
-            elif char == "`":
-                accumulator += char
-
-            elif in_content:
-                in_sequence = False
-                accumulator += char
-                content += accumulator
-                accumulator = ""
-
-            else:
-                in_sequence = False
-                accumulator = ""
-
-        elif char == "`":
-            in_sequence = True
-            accumulator = char
-
-        elif in_content:
-            content += char
-
-        # else skip character
-
-    # when we hit the end while closing sequence was in place yield the last part
-    if in_content and in_sequence and accumulator == boundary_sequence:
-        yield content.strip()
+    scanner = _MarkdownBlocksScanner(info)
+    yield from scanner.scan(source)
+    if (block := scanner.finish()) is not None:
+        yield block
 
 
 def markdown_block(
@@ -97,3 +39,222 @@ def markdown_block(
 
     except StopIteration:
         return None
+
+
+async def markdown_blocks_stream(
+    info: str = "",
+    /,
+    *,
+    stream: AsyncIterable[Any],
+) -> AsyncGenerator[str, None]:
+    """\
+    Extract contents of fenced blocks from the stream, i.e. LMM output stream. \
+    Works the same as markdown_blocks, yielding contents as soon as the closing fence arrives.
+
+    Parameters
+    ----------
+    info: str
+        info string of the blocks to extract, i.e. "json", default is any block
+    stream: AsyncIterable[Any]
+        stream of text chunks or content chunks, i.e. LMMOutputStream, \
+        chunks without content such as tool requests are skipped
+
+    Returns
+    -------
+    AsyncGenerator[str, None]
+        generator of extracted contents
+    """
+
+    scanner = _MarkdownBlocksScanner(info)
+    async for chunk in stream:
+        if text := _chunk_text(chunk):
+            for block in scanner.scan(text):
+                yield block
+
+    if (block := scanner.finish()) is not None:
+        yield block
+
+
+async def markdown_block_stream(
+    info: str = "",
+    /,
+    *,
+    stream: AsyncIterable[Any],
+) -> str | None:
+    """\
+    Extract the first content of fenced block from the stream, i.e. LMM output stream. \
+    The stream is closed as soon as the closing fence arrives, which cancels \
+    the remaining generation for streams of lmm_invocation.
+
+    Parameters
+    ----------
+    info: str
+        info string of the block to extract, i.e. "json", default is any block
+    stream: AsyncIterable[Any]
+        stream of text chunks or content chunks, i.e. LMMOutputStream, \
+        chunks without content such as tool requests are skipped
+
+    Returns
+    -------
+    str | None
+        extracted content or None if the block was not found
+    """
+
+    blocks: AsyncGenerator[str, None] = markdown_blocks_stream(
+        info,
+        stream=stream,
+    )
+    try:
+        async for block in blocks:
+            return block
+
+        return None
+
+    finally:
+        await blocks.aclose()
+        match stream:
+            case AsyncStream():
+                stream.cancel()  # pyright: ignore[reportUnknownMemberType]
+
+            case AsyncGenerator():
+                await stream.aclose()  # pyright: ignore[reportUnknownMemberType]
+
+            case _:
+                pass  # can't stop other streams
+
+
+@runtime_checkable
+class _TextConvertible(Protocol):  # i.e. MultimodalContent
+    def as_string(self) -> str: ...
+
+
+@runtime_checkable
+class _ContentChunk(Protocol):  # i.e. LMMCompletionChunk
+    @property
+    def content(self) -> _TextConvertible: ...
+
+
+def _chunk_text(
+    chunk: Any,
+    /,
+) -> str | None:
+    match chunk:
+        case str() as text:
+            return text
+
+        case _TextConvertible() as convertible:
+            return convertible.as_string()
+
+        case _ContentChunk() as content_chunk:
+            return content_chunk.content.as_string()
+
+        case _:
+            return None  # i.e. LMMToolRequests
+
+
+_BOUNDARY_SEQUENCE: str = "```"
+
+
+@final
+class _MarkdownBlocksScanner:
+    def __init__(
+        self,
+        info: str,
+        /,
+    ) -> None:
+        self._opening_sequence: str = f"{_BOUNDARY_SEQUENCE}{info}"
+        # text of the fence being scanned, starting with "`"
+        self._accumulator: str = ""
+        self._content: list[str] = []
+        self._in_sequence: bool = False
+        self._in_content: bool = False
+
+    def scan(  # noqa: C901, PLR0912, PLR0915
+        self,
+        text: str,
+        /,
+    ) -> Generator[str, None]:
+        # use locals while scanning, state is stored back when finished
+        opening_sequence: str = self._opening_sequence
+        accumulator: str = self._accumulator
+        content: list[str] = self._content
+        in_sequence: bool = self._in_sequence
+        in_content: bool = self._in_content
+        position: int = 0
+        end: int = len(text)
+        try:
+            while position < end:
+                if not in_sequence:
+                    # jump to the next fence candidate taking the text in between
+                    found: int = text.find("`", position)
+                    if found < 0:
+                        if in_content:
+                            content.append(text[position:])
+
+                        break
+
+                    if in_content and found > position:
+                        content.append(text[position:found])
+
+                    in_sequence = True
+                    accumulator = "`"
+                    position = found + 1
+                    continue
+
+                char: str = text[position]
+                position += 1
+                if accumulator.startswith(_BOUNDARY_SEQUENCE):
+                    if char.isspace():
+                        if in_content:
+                            in_content = False
+                            yield "".join(content).strip()
+                            content = []  # clear to be ready for next block
+
+                        elif accumulator.startswith(opening_sequence):
+                            in_content = True
+                            content = []  # clear current content in case of nested blocks
+
+                        in_sequence = False
+                        accumulator = ""
+
+                    elif char == "`":
+                        if in_content:
+                            content.append(char)
+                        # keep the accumulator unchanged
+
+                    elif char.isalnum() and not in_content:  # take the info
+                        accumulator += char
+
+                    elif in_content:
+                        content.append(accumulator + char)
+                        in_sequence = False
+                        accumulator = ""
+
+                    else:
+                        in_sequence = False
+                        accumulator = ""
+
+                elif char == "`":
+                    accumulator += char
+
+                elif in_content:
+                    content.append(accumulator + char)
+                    in_sequence = False
+                    accumulator = ""
+
+                else:
+                    in_sequence = False
+                    accumulator = ""
+
+        finally:
+            self._accumulator = accumulator
+            self._content = content
+            self._in_sequence = in_sequence
+            self._in_content = in_content
+
+    def finish(self) -> str | None:
+        # when we hit the end while closing sequence was in place return the last part
+        if self._in_content and self._in_sequence and self._accumulator == _BOUNDARY_SEQUENCE:
+            return "".join(self._content).strip()
+
+        return None
@@ -1,10 +1,13 @@
 from asyncio import (
-    Lock,
+    AbstractEventLoop,
+    CancelledError,
+    Semaphore,
+    get_running_loop,
     iscoroutinefunction,
     sleep,
 )
 from collections import deque
-from collections.abc import Callable, Coroutine
+from collections.abc import Callable, Coroutine, Hashable
 from datetime import timedelta
 from time import monotonic
 from typing import cast, overload
@@ -28,16 +31,22 @@ def throttle[**Args, Result](
     *,
     limit: int = 1,
     period: timedelta | float = 1,
+    burst: int | None = None,
+    concurrent: int | None = None,
+    key: Callable[Args, Hashable] | None = None,
 ) -> Callable[
     [Callable[Args, Coroutine[None, None, Result]]], Callable[Args, Coroutine[None, None, Result]]
 ]: ...
 
 
-def throttle[**Args, Result](
+def throttle[**Args, Result](  # noqa: PLR0913
     function: Callable[Args, Coroutine[None, None, Result]] | None = None,
     *,
     limit: int = 1,
     period: timedelta | float = 1,
+    burst: int | None = None,
+    concurrent: int | None = None,
+    key: Callable[Args, Hashable] | None = None,
 ) -> (
     Callable[
         [Callable[Args, Coroutine[None, None, Result]]],
@@ -46,7 +55,9 @@ def throttle[**Args, Result](
     | Callable[Args, Coroutine[None, None, Result]]
 ):
     """\
-    Simple throttle for function calls with custom limit and period time. \
+    Sliding window throttle for function calls with custom limit and period time. \
+    Each call reserves its execution slot up front without waiting behind other calls, \
+    waiting calls are started in order of their reservations. \
     Works only for async functions. \
     It is not allowed to be used on class or instance methods. \
     This wrapper is not thread safe.
@@ -56,10 +67,18 @@ def throttle[**Args, Result](
     function: Callable[Args, Coroutine[None, None, Result]]
         function to wrap in throttle
     limit: int
-        limit of executions in given period, if no period was specified
-        it is number of concurrent executions instead, default is 1
-    period: timedelta | float | None
+        limit of executions in given period, default is 1
+    period: timedelta | float
         period time (in seconds by default) during which the limit resets, default is 1 second
+    burst: int | None
+        number of executions allowed to start immediately, the sliding window is scaled \
+        accordingly to keep the average rate of limit per period, default is None (same as limit)
+    concurrent: int | None
+        limit of concurrently running executions, applied independently from the rate limit, \
+        default is None (no concurrency limit)
+    key: Callable[Args, Hashable] | None
+        function producing a key out of call arguments, each key (i.e. api key or tenant) \
+        has its own separate limits, default is None (single limit for all calls)
 
     Returns
     -------
@@ -78,6 +97,9 @@ def throttle[**Args, Result](
                 function,
                 limit=limit,
                 period=period,
+                burst=burst,
+                concurrent=concurrent,
+                key=key,
             ),
         )
 
@@ -88,46 +110,158 @@ def throttle[**Args, Result](
         return _wrap
 
 
-class _AsyncThrottle[**Args, Result]:
+class _ThrottleWindow:
     def __init__(
+        self,
+        *,
+        capacity: int,
+        window: float,
+        concurrent: int | None,
+    ) -> None:
+        self._capacity: int = capacity
+        self._window: float = window
+        # sorted (non decreasing) start times of reserved executions
+        self._reservations: deque[float] = deque()
+        self._semaphore: Semaphore | None = Semaphore(concurrent) if concurrent else None
+        self.pending: int = 0
+
+    @property
+    def semaphore(self) -> Semaphore | None:
+        return self._semaphore
+
+    @property
+    def expired(self) -> bool:
+        return self.pending == 0 and (
+            not self._reservations or self._reservations[-1] + self._window <= monotonic()
+        )
+
+    def reserve(self) -> float:
+        # executed without suspension - no lock is required to keep reservations consistent
+        time_now: float = monotonic()
+        while self._reservations:  # cleanup old entries
+            if self._reservations[0] + self._window <= time_now:
+                self._reservations.popleft()
+
+            else:
+                break
+
+        slot: float
+        if len(self._reservations) < self._capacity:
+            slot = time_now
+
+        else:  # wait until the oldest reservation in the window will leave it
+            slot = max(time_now, self._reservations[-self._capacity] + self._window)
+
+        self._reservations.append(slot)
+        return slot
+
+    def release(
+        self,
+        slot: float,
+    ) -> None:
+        # give back reservation which was not used
+        try:
+            self._reservations.remove(slot)
+
+        except ValueError:
+            pass  # already cleaned up
+
+
+class _AsyncThrottle[**Args, Result]:
+    def __init__(  # noqa: PLR0913
         self,
         function: Callable[Args, Coroutine[None, None, Result]],
         /,
         limit: int,
         period: timedelta | float,
+        burst: int | None,
+        concurrent: int | None,
+        key: Callable[Args, Hashable] | None,
     ) -> None:
+        assert limit > 0, "Limit has to be greater than zero"  # nosec: B101
+        assert burst is None or burst > 0, "Burst has to be greater than zero"  # nosec: B101
+        assert (  # nosec: B101
+            concurrent is None or concurrent > 0
+        ), "Concurrent limit has to be greater than zero"
+
         self._function: Callable[Args, Coroutine[None, None, Result]] = function
-        self._entries: deque[float] = deque()
-        self._lock: Lock = Lock()
-        self._limit: int = limit
-        self._period: float
+        self._key: Callable[Args, Hashable] | None = key
+        self._concurrent: int | None = concurrent
+        self._capacity: int = burst or limit
+        self._window: float
         match period:
             case timedelta() as delta:
-                self._period = delta.total_seconds()
+                self._window = delta.total_seconds() * self._capacity / limit
 
             case period_seconds:
-                self._period = period_seconds
+                self._window = period_seconds * self._capacity / limit
+
+        self._windows: dict[Hashable, _ThrottleWindow] = {}
 
         # mimic function attributes if able
         mimic_function(function, within=self)
 
+    def _throttle_window(
+        self,
+        key: Hashable,
+    ) -> _ThrottleWindow:
+        if window := self._windows.get(key):
+            return window
+
+        else:
+            window = _ThrottleWindow(
+                capacity=self._capacity,
+                window=self._window,
+                concurrent=self._concurrent,
+            )
+            self._windows[key] = window
+            return window
+
+    def _cleanup(
+        self,
+        key: Hashable,
+    ) -> None:
+        window: _ThrottleWindow | None = self._windows.get(key)
+        if window is not None and window.expired:
+            del self._windows[key]
+
     async def __call__(
         self,
         *args: Args.args,
         **kwargs: Args.kwargs,
     ) -> Result:
-        async with self._lock:
-            time_now: float = monotonic()
-            while self._entries:  # cleanup old entries
-                if self._entries[0] + self._period <= time_now:
-                    self._entries.popleft()
+        key: Hashable = self._key(*args, **kwargs) if self._key else None
+        window: _ThrottleWindow = self._throttle_window(key)
+        window.pending += 1
+        try:
+            if semaphore := window.semaphore:
+                async with semaphore:
+                    await self._wait(window)
+                    return await self._function(*args, **kwargs)
 
-                else:
-                    break
+            else:
+                await self._wait(window)
+                return await self._function(*args, **kwargs)
 
-            if len(self._entries) >= self._limit:
-                await sleep(self._entries[0] - time_now)
+        finally:
+            window.pending -= 1
+            if window.pending == 0:
+                loop: AbstractEventLoop = get_running_loop()
+                # drop window state when it is no longer used
+                loop.call_later(self._window, self._cleanup, key)
+
+    async def _wait(
+        self,
+        window: _ThrottleWindow,
+    ) -> None:
+        slot: float = window.reserve()
+        delay: float = slot - monotonic()
+        if delay <= 0:
+            return  # execute immediately
 
-            self._entries.append(monotonic())
+        try:
+            await sleep(delay)
 
-        return await self._function(*args, **kwargs)
+        except CancelledError as exc:
+            window.release(slot)
+            raise exc
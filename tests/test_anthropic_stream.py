@@ -0,0 +1,305 @@
+import json
+from asyncio import StreamReader, StreamWriter, start_server
+from collections.abc import AsyncGenerator, Sequence
+from contextlib import asynccontextmanager
+from logging import Logger
+from typing import Any
+
+from draive import (
+    LMMCompletionChunk,
+    LMMInput,
+    LMMToolRequest,
+    MetricsTraceReport,
+    TokenUsage,
+    ctx,
+    tool,
+)
+from draive.anthropic import AnthropicClient, anthropic_lmm_invocation
+from draive.types import LMMOutputStreamChunk, LMMToolRequests
+from pytest import mark
+
+
+def sse_event(
+    event: str,
+    data: dict[str, Any],
+) -> bytes:
+    return f"event: {event}\ndata: {json.dumps(data)}\n\n".encode()
+
+
+def message_start() -> bytes:
+    return sse_event(
+        "message_start",
+        {
+            "type": "message_start",
+            "message": {
+                "id": "msg_test",
+                "type": "message",
+                "role": "assistant",
+                "model": "claude-3-haiku-20240307",
+                "content": [],
+                "stop_reason": None,
+                "stop_sequence": None,
+                "usage": {"input_tokens": 12, "output_tokens": 1},
+            },
+        },
+    )
+
+
+def message_end(
+    stop_reason: str,
+    output_tokens: int,
+) -> bytes:
+    return sse_event(
+        "message_delta",
+        {
+            "type": "message_delta",
+            "delta": {"stop_reason": stop_reason, "stop_sequence": None},
+            "usage": {"output_tokens": output_tokens},
+        },
+    ) + sse_event("message_stop", {"type": "message_stop"})
+
+
+TEXT_STREAM: list[bytes] = [
+    message_start(),
+    sse_event(
+        "content_block_start",
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+    ),
+    sse_event("ping", {"type": "ping"}),
+    *[
+        sse_event(
+            "content_block_delta",
+            {
+                "type": "content_block_delta",
+                "index": 0,
+                "delta": {"type": "text_delta", "text": text},
+            },
+        )
+        for text in ("Hello", ", ", "world!")
+    ],
+    sse_event("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    message_end("end_turn", 7),
+]
+
+TOOL_STREAM: list[bytes] = [
+    message_start(),
+    sse_event(
+        "content_block_start",
+        {"type": "content_block_start", "index": 0, "content_block": {"type": "text", "text": ""}},
+    ),
+    sse_event(
+        "content_block_delta",
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "text_delta", "text": "Checking"},
+        },
+    ),
+    sse_event("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    sse_event(
+        "content_block_start",
+        {
+            "type": "content_block_start",
+            "index": 1,
+            "content_block": {"type": "tool_use", "id": "call_1", "name": "weather", "input": {}},
+        },
+    ),
+    *[
+        sse_event(
+            "content_block_delta",
+            {
+                "type": "content_block_delta",
+                "index": 1,
+                "delta": {"type": "input_json_delta", "partial_json": part},
+            },
+        )
+        for part in ('{"ci', 'ty": "Wa', 'rsaw"}')
+    ],
+    sse_event("content_block_stop", {"type": "content_block_stop", "index": 1}),
+    message_end("tool_use", 21),
+]
+
+
+PARAMETERLESS_TOOL_STREAM: list[bytes] = [
+    message_start(),
+    sse_event(
+        "content_block_start",
+        {
+            "type": "content_block_start",
+            "index": 0,
+            "content_block": {
+                "type": "tool_use",
+                "id": "call_1",
+                "name": "current_time",
+                "input": {},
+            },
+        },
+    ),
+    sse_event(
+        "content_block_delta",
+        {
+            "type": "content_block_delta",
+            "index": 0,
+            "delta": {"type": "input_json_delta", "partial_json": ""},
+        },
+    ),
+    sse_event("content_block_stop", {"type": "content_block_stop", "index": 0}),
+    message_end("tool_use", 9),
+]
+
+
+class FakeSSEServer:
+    def __init__(
+        self,
+        *responses: list[bytes],
+    ) -> None:
+        self.responses: list[list[bytes]] = list(responses)
+        self.requests: list[dict[str, Any]] = []
+        self.port: int = 0
+
+    async def handle(
+        self,
+        reader: StreamReader,
+        writer: StreamWriter,
+    ) -> None:
+        head: bytes = await reader.readuntil(b"\r\n\r\n")
+        content_length: int = 0
+        for line in head.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                content_length = int(line.split(":", 1)[1])
+
+        self.requests.append(json.loads(await reader.readexactly(content_length)))
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"content-type: text/event-stream\r\n"
+            b"cache-control: no-cache\r\n"
+            b"connection: close\r\n\r\n"
+        )
+        for event in self.responses.pop(0):
+            writer.write(event)
+            await writer.drain()
+
+        writer.close()
+        await writer.wait_closed()
+
+
+@asynccontextmanager
+async def serving(*responses: list[bytes]) -> AsyncGenerator[FakeSSEServer, None]:
+    server = FakeSSEServer(*responses)
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        server.port = listening.sockets[0].getsockname()[1]
+        yield server
+
+
+@tool
+async def weather(city: str) -> str:
+    return f"Sunny in {city}"
+
+
+@tool
+async def current_time() -> str:
+    return "12:00"
+
+
+async def collect_stream(
+    server: FakeSSEServer,
+    **extra: Any,
+) -> tuple[list[LMMOutputStreamChunk], MetricsTraceReport]:
+    reports: list[MetricsTraceReport] = []
+
+    async def report_trace(
+        trace_id: str,
+        logger: Logger,
+        report: MetricsTraceReport,
+    ) -> None:
+        reports.append(report.with_combined_metrics())
+
+    chunks: list[LMMOutputStreamChunk] = []
+    async with ctx.new(
+        "test",
+        dependencies=[
+            AnthropicClient(
+                api_key="test",
+                base_url=f"http://127.0.0.1:{server.port}",
+            )
+        ],
+        trace_reporting=report_trace,
+    ):
+        async for chunk in await anthropic_lmm_invocation(
+            instruction="test",
+            context=[LMMInput.of("test")],
+            stream=True,
+            **extra,
+        ):
+            chunks.append(chunk)
+
+    return chunks, reports[0]
+
+
+def token_usage(report: MetricsTraceReport) -> TokenUsage:
+    usage: Sequence[TokenUsage] = [
+        metric for metric in report.metrics.values() if isinstance(metric, TokenUsage)
+    ]
+    assert len(usage) == 1
+    return usage[0]
+
+
+@mark.asyncio
+async def test_streams_text_chunks_incrementally():
+    async with serving(TEXT_STREAM) as sse_server:
+        chunks, report = await collect_stream(sse_server)
+
+    assert chunks == [
+        LMMCompletionChunk.of("Hello"),
+        LMMCompletionChunk.of(", "),
+        LMMCompletionChunk.of("world!"),
+    ]
+    assert sse_server.requests[0]["stream"] is True
+    model_usage = token_usage(report).usage["claude-3-haiku-20240307"]
+    assert model_usage.input_tokens == 12
+    assert model_usage.output_tokens == 7
+
+
+@mark.asyncio
+async def test_assembles_tool_use_from_partial_json():
+    async with serving(TOOL_STREAM) as sse_server:
+        chunks, report = await collect_stream(
+            sse_server,
+            tools=[weather.specification],
+        )
+
+    assert chunks == [
+        LMMCompletionChunk.of("Checking"),
+        LMMToolRequests(
+            requests=[
+                LMMToolRequest(
+                    identifier="call_1",
+                    tool="weather",
+                    arguments={"city": "Warsaw"},
+                )
+            ]
+        ),
+    ]
+    assert sse_server.requests[0]["tools"][0]["name"] == "weather"
+    assert token_usage(report).usage["claude-3-haiku-20240307"].output_tokens == 21
+
+
+@mark.asyncio
+async def test_assembles_parameterless_tool_use():
+    async with serving(PARAMETERLESS_TOOL_STREAM) as sse_server:
+        chunks, _ = await collect_stream(
+            sse_server,
+            tools=[current_time.specification],
+        )
+
+    assert chunks == [
+        LMMToolRequests(
+            requests=[
+                LMMToolRequest(
+                    identifier="call_1",
+                    tool="current_time",
+                    arguments={},
+                )
+            ]
+        ),
+    ]
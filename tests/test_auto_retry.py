@@ -2,7 +2,18 @@ from asyncio import CancelledError, Task, sleep
 from time import time
 from unittest import TestCase
 
-from draive import MetricsTrace, auto_retry, ctx
+from draive import (
+    CircuitBreaker,
+    CircuitBreakerOpen,
+    CircuitBreakerPermit,
+    CircuitBreakerStatus,
+    MetricsTrace,
+    RetryBackoff,
+    RetryBudget,
+    RetryTrace,
+    auto_retry,
+    ctx,
+)
 from pytest import mark, raises
 
 
@@ -314,3 +325,140 @@ async def test_async_fails_with_not_selected_errors():
         await compute("expected")
 
     assert executions == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_async_uses_backoff_delay_with_errors():
+    executions: int = 0
+
+    @auto_retry(limit=3, delay=RetryBackoff(base=0.02, cap=1, jitter=False))
+    async def compute(value: str, /) -> str:
+        nonlocal executions
+        executions += 1
+        raise FakeException()
+
+    time_start: float = time()
+    with raises(FakeException):
+        await compute("expected")
+    # 0.02 + 0.04 + 0.08
+    assert (time() - time_start) >= 0.14
+    assert executions == 4
+
+
+def test_backoff_jitter_stays_within_bounds():
+    backoff = RetryBackoff(base=0.1, cap=1)
+    previous: float | None = None
+    for attempt in range(1, 32):
+        delay: float = backoff.next_delay(attempt, previous=previous)
+        assert 0.1 <= delay <= 1
+        assert delay <= max(0.1, (previous or 0.1) * 3)
+        previous = delay
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_async_records_retries_in_metrics():
+    executions: int = 0
+
+    @auto_retry(limit=2)
+    async def compute(value: str, /) -> str:
+        nonlocal executions
+        executions += 1
+        if executions < 3:
+            raise FakeException()
+        else:
+            return value
+
+    assert await compute("expected") == "expected"
+    assert ctx.read(RetryTrace) == RetryTrace(retries=2)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_async_stops_retrying_with_exhausted_budget():
+    executions: int = 0
+    budget = RetryBudget(ratio=0.5, minimum=0)
+
+    @auto_retry(limit=1, budget=budget)
+    async def compute(value: str, /) -> str:
+        nonlocal executions
+        executions += 1
+        raise FakeException()
+
+    for _ in range(4):
+        with raises(FakeException):
+            await compute("expected")
+
+    # 4 calls allow up to 2 retries
+    assert executions == 6
+    assert ctx.read(RetryTrace) == RetryTrace(retries=2, exhausted=2)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_async_fails_fast_with_open_breaker():
+    executions: int = 0
+    breaker = CircuitBreaker("test", minimum_calls=2, failure_rate=0.5, cooldown=0.05)
+
+    @auto_retry(limit=3, breaker=breaker)
+    async def compute(value: str, /) -> str:
+        nonlocal executions
+        executions += 1
+        if executions <= 2:
+            raise FakeException()
+        else:
+            return value
+
+    with raises(FakeException):
+        await compute("expected")
+    # second failure opens the circuit and stops retrying
+    assert executions == 2
+    assert breaker.state == "open"
+
+    with raises(CircuitBreakerOpen):
+        await compute("expected")
+    assert executions == 2
+
+    status: CircuitBreakerStatus | None = ctx.read(CircuitBreakerStatus)
+    assert status is not None
+    assert status.states == {"test": "open"}
+    assert status.rejections == 1
+
+    await sleep(0.06)
+    assert breaker.state == "half_open"
+    assert await compute("expected") == "expected"
+    assert breaker.state == "closed"
+
+
+def test_breaker_reopens_after_failed_probe():
+    breaker = CircuitBreaker("test", minimum_calls=1, cooldown=0)
+    breaker.record_failure(breaker.acquire())
+    assert breaker.state == "half_open"
+    probe: CircuitBreakerPermit = breaker.acquire()
+    assert probe.probe
+    with raises(CircuitBreakerOpen):
+        breaker.acquire()  # only a single probe is allowed
+    breaker.record_failure(probe)
+    breaker.record_success(breaker.acquire())
+    assert breaker.state == "closed"
+
+
+def test_breaker_probe_is_resolved_only_by_its_permit():
+    breaker = CircuitBreaker("test", minimum_calls=2, cooldown=0)
+    regular: CircuitBreakerPermit = breaker.acquire()
+    assert not regular.probe
+    breaker.record_failure(breaker.acquire())
+    breaker.record_failure(breaker.acquire())
+    probe: CircuitBreakerPermit = breaker.acquire()
+
+    # calls started before opening can't release or resolve the probe
+    breaker.release(regular)
+    with raises(CircuitBreakerOpen):
+        breaker.acquire()
+    breaker.record_success(regular)
+    assert breaker.state == "half_open"
+
+    breaker.release(probe)
+    breaker.record_success(breaker.acquire())
+    assert breaker.state == "closed"
@@ -0,0 +1,98 @@
+from collections.abc import Callable
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+from draive import split_text, split_texts, split_texts_as_completed, text_splitting_executor
+from pytest import mark, raises
+
+
+@pytest.fixture
+def sample_texts() -> list[str]:
+    texts: list[str] = []
+    for path in ("tests/data/sample_text.txt", "tests/data/markdown_sample_text.txt"):
+        with open(path) as file:
+            texts.append(file.read())
+
+    return [text[idx:] for text in texts for idx in range(0, 1000, 100)]
+
+
+def count_words() -> Callable[[str], int]:
+    return lambda text: len(text.split())
+
+
+@mark.asyncio
+async def test_splits_texts_in_order(sample_texts: list[str]) -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result: list[list[str]] = await split_texts(
+            sample_texts,
+            executor=executor,
+            part_size=200,
+            count_size=len,
+            part_overlap_size=50,
+            batch_size=3,
+        )
+
+    assert result == [
+        split_text(
+            text=text,
+            part_size=200,
+            count_size=len,
+            part_overlap_size=50,
+        )
+        for text in sample_texts
+    ]
+
+
+@mark.asyncio
+async def test_splits_texts_as_completed(sample_texts: list[str]) -> None:
+    with ProcessPoolExecutor(max_workers=2) as executor:
+        result: dict[int, list[str]] = {
+            idx: parts
+            async for idx, parts in split_texts_as_completed(
+                sample_texts,
+                executor=executor,
+                part_size=200,
+                count_size=len,
+                mode="fast",
+                batch_size=3,
+            )
+        }
+
+    assert result == {
+        idx: split_text(
+            text=text,
+            part_size=200,
+            count_size=len,
+        )
+        for idx, text in enumerate(sample_texts)
+    }
+
+
+@mark.asyncio
+async def test_uses_size_counter_prepared_by_worker(sample_texts: list[str]) -> None:
+    with text_splitting_executor(count_words, max_workers=2) as executor:
+        result: list[list[str]] = await split_texts(
+            sample_texts,
+            executor=executor,
+            part_size=20,
+        )
+
+    assert result == [
+        split_text(
+            text=text,
+            part_size=20,
+            count_size=count_words(),
+        )
+        for text in sample_texts
+    ]
+
+
+@mark.asyncio
+async def test_fails_without_size_counter() -> None:
+    with ProcessPoolExecutor(max_workers=1) as executor:
+        with raises(RuntimeError):
+            await split_texts(
+                ["text"],
+                executor=executor,
+                part_size=20,
+            )
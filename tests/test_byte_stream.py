@@ -0,0 +1,49 @@
+from collections.abc import AsyncIterator, Sequence
+
+from draive.utils import ndjson_lines, sse_events
+from pytest import mark
+
+
+async def byte_chunks(chunks: Sequence[bytes]) -> AsyncIterator[bytes]:
+    for chunk in chunks:
+        yield chunk
+
+
+@mark.asyncio
+async def test_ndjson_splits_lines_across_chunks():
+    chunks = [b'{"a": 1}\n{"b"', b": 2}\r", b'\n\n{"c": 3}']
+
+    assert [line async for line in ndjson_lines(byte_chunks(chunks))] == [
+        b'{"a": 1}',
+        b'{"b": 2}',
+        b'{"c": 3}',
+    ]
+
+
+@mark.asyncio
+async def test_ndjson_yields_nothing_for_empty_stream():
+    assert [line async for line in ndjson_lines(byte_chunks([b"", b"\n"]))] == []
+
+
+@mark.asyncio
+async def test_sse_yields_events_data():
+    chunks = [
+        b': comment\r\nevent: message\r\ndata: {"a"',
+        b": 1}\r\n\r",
+        b"\ndata:first\ndata: second\nid: 2\n\nevent: ping\n\ndata: [DONE]",
+    ]
+
+    assert [event async for event in sse_events(byte_chunks(chunks))] == [
+        b'{"a": 1}',
+        b"first\nsecond",
+        b"[DONE]",
+    ]
+
+
+@mark.asyncio
+async def test_sse_yields_events_byte_by_byte():
+    stream = b"data: one\n\ndata: two\n\n"
+
+    assert [
+        event async for event in sse_events(byte_chunks([bytes([byte]) for byte in stream]))
+    ] == [b"one", b"two"]
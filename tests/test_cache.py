@@ -2,7 +2,8 @@ from asyncio import CancelledError, Task, sleep
 from collections.abc import Callable, Generator
 from time import sleep as sync_sleep
 
-from draive import cache
+from draive import LMMInput, cache
+from draive.utils import identity_cache
 from pytest import fixture, mark, raises
 
 
@@ -189,3 +190,32 @@ async def test_async_fails_with_error():
 
     with raises(FakeException):
         await randomized("expected")
+
+
+def test_identity_cache_returns_cached_value_for_same_element():
+    calls: list[str] = []
+
+    @identity_cache
+    def converted(element: LMMInput, /, details: str) -> dict[str, str]:
+        calls.append(details)
+        return {"content": element.content.as_string(), "details": details}
+
+    element = LMMInput.of("test")
+    expected: dict[str, str] = converted(element, "auto")
+    assert converted(element, "auto") is expected
+    assert converted(LMMInput.of("test"), "auto") == expected
+    assert converted(element, "high") == {"content": "test", "details": "high"}
+    assert calls == ["auto", "auto", "high"]
+
+
+def test_identity_cache_drops_value_with_element():
+    @identity_cache
+    def converted(element: LMMInput, /) -> str:
+        return element.content.as_string()
+
+    element = LMMInput.of("test")
+    converted(element)
+    cached = converted._cached  # pyright: ignore[reportFunctionMemberAccess]
+    assert len(cached) == 1
+    del element
+    assert len(cached) == 0
@@ -0,0 +1,335 @@
+import json
+from typing import Any
+
+from draive import ctx
+from draive.gemini import GeminiClient, GeminiEmbeddingConfig, GeminiEndpoint, GeminiException
+from draive.mistral import (
+    MistralChatConfig,
+    MistralClient,
+    MistralEmbeddingConfig,
+    MistralEndpoint,
+    MistralException,
+)
+from draive.mistral.models import ChatMessage
+from draive.openai import (
+    OpenAIChatConfig,
+    OpenAIClient,
+    OpenAIEndpoint,
+    OpenAIImageGenerationConfig,
+)
+from httpx import MockTransport, Request, Response
+from openai import APIError, InternalServerError
+from pytest import mark, raises
+
+
+def test_openai_keeps_endpoints_sharing_base_url():
+    client = OpenAIClient(
+        endpoints=[
+            OpenAIEndpoint(base_url="http://localhost/v1", api_key="first"),
+            OpenAIEndpoint(base_url="http://localhost/v1", api_key="second"),
+        ],
+    )
+
+    assert [status.name for status in client.endpoints_status] == ["openai_0", "openai_1"]
+
+
+def test_openai_keeps_azure_endpoints_sharing_deployment():
+    client = OpenAIClient(
+        endpoints=[
+            OpenAIEndpoint(
+                api_key="first",
+                azure_api_endpoint="https://first.openai.azure.com",
+                azure_api_version="2024-02-01",
+                azure_deployment="gpt",
+            ),
+            OpenAIEndpoint(
+                api_key="second",
+                azure_api_endpoint="https://second.openai.azure.com",
+                azure_api_version="2024-02-01",
+                azure_deployment="gpt",
+            ),
+        ],
+    )
+
+    assert len(client.endpoints_status) == 2
+
+
+def test_rejects_duplicate_endpoint_names():
+    with raises(ValueError):
+        OpenAIClient(
+            endpoints=[
+                OpenAIEndpoint(name="main", base_url="http://first/v1", api_key="first"),
+                OpenAIEndpoint(name="main", base_url="http://second/v1", api_key="second"),
+            ],
+        )
+
+    with raises(ValueError):
+        MistralClient(
+            endpoints=[
+                MistralEndpoint(name="main", endpoint="http://first", api_key="first"),
+                MistralEndpoint(name="main", endpoint="http://second", api_key="second"),
+            ],
+        )
+
+    with raises(ValueError):
+        GeminiClient(
+            endpoints=[
+                GeminiEndpoint(name="main", endpoint="http://first", api_key="first"),
+                GeminiEndpoint(name="main", endpoint="http://second", api_key="second"),
+            ],
+        )
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_mistral_fails_over_to_healthy_endpoint():
+    hosts: list[str] = []
+
+    def handler(request: Request) -> Response:
+        hosts.append(request.url.host)
+        if request.url.host == "failing":
+            return Response(500)
+
+        return Response(
+            200,
+            json={
+                "id": "embedding",
+                "object": "list",
+                "data": [{"object": "embedding", "embedding": [1.0], "index": 0}],
+                "model": "mistral-embed",
+                "usage": {"prompt_tokens": 1, "total_tokens": 1},
+            },
+        )
+
+    client = MistralClient(
+        endpoints=[
+            MistralEndpoint(endpoint="http://failing", api_key="failing"),
+            MistralEndpoint(endpoint="http://healthy", api_key="healthy"),
+        ],
+        transport=MockTransport(handler),
+    )
+
+    results: list[list[list[float]]] = []
+    failures: int = 0
+    for _ in range(6):
+        try:
+            results.append(await client.embedding(MistralEmbeddingConfig(), ["text"]))
+
+        except MistralException:
+            failures += 1
+
+    # failing endpoint is ejected after its first failure
+    assert hosts.count("failing") == 1
+    assert failures == 1
+    assert results == [[[1.0]]] * 5
+    assert [status.ejected for status in client.endpoints_status] == [True, False]
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_gemini_fails_over_to_healthy_endpoint():
+    hosts: list[str] = []
+
+    def handler(request: Request) -> Response:
+        hosts.append(request.url.host)
+        if request.url.host == "failing":
+            return Response(503)
+
+        texts: list[str] = json.loads(request.content)["texts"]
+        return Response(200, json={"embeddings": [{"value": [1.0]} for _ in texts]})
+
+    client = GeminiClient(
+        endpoints=[
+            GeminiEndpoint(endpoint="http://failing", api_key="failing"),
+            GeminiEndpoint(endpoint="http://healthy", api_key="healthy"),
+        ],
+        transport=MockTransport(handler),
+    )
+
+    failures: int = 0
+    for _ in range(6):
+        try:
+            assert await client.embedding(GeminiEmbeddingConfig(), ["text"]) == [[1.0]]
+
+        except GeminiException:
+            failures += 1
+
+    assert hosts.count("failing") == 1
+    assert failures == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_mistral_prefill_does_not_change_messages():
+    requests: list[dict[str, Any]] = []
+
+    def handler(request: Request) -> Response:
+        requests.append(json.loads(request.content))
+        return Response(
+            200,
+            json={
+                "id": "completion",
+                "object": "chat.completion",
+                "created": 0,
+                "model": "open-mistral-7b",
+                "choices": [
+                    {
+                        "index": 0,
+                        "message": {"role": "assistant", "content": "ok"},
+                        "finish_reason": "stop",
+                    }
+                ],
+                "usage": {"prompt_tokens": 1, "total_tokens": 2, "completion_tokens": 1},
+            },
+        )
+
+    client = MistralClient(
+        endpoints=[MistralEndpoint(endpoint="http://mistral", api_key="test")],
+        transport=MockTransport(handler),
+    )
+    prefill: ChatMessage = {"role": "assistant", "content": "{"}
+    messages: list[ChatMessage] = [{"role": "user", "content": "test"}, prefill]
+
+    await client.chat_completion(config=MistralChatConfig(), messages=messages)
+    await client.chat_completion(
+        config=MistralChatConfig(response_format={"type": "json_object"}),
+        messages=messages,
+    )
+
+    assert requests[0]["messages"][-1] == {"role": "assistant", "content": "{", "prefix": True}
+    assert requests[1]["messages"] == [{"role": "user", "content": "test"}]
+    assert messages == [{"role": "user", "content": "test"}, {"role": "assistant", "content": "{"}]
+    assert "prefix" not in prefill
+
+
+def openai_chunk(content: str) -> bytes:
+    chunk: dict[str, Any] = {
+        "id": "completion",
+        "object": "chat.completion.chunk",
+        "created": 0,
+        "model": "gpt-4o",
+        "choices": [{"index": 0, "delta": {"content": content}, "finish_reason": None}],
+    }
+    return f"data: {json.dumps(chunk)}\n\n".encode()
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_openai_keeps_lease_until_stream_ends():
+    def handler(request: Request) -> Response:
+        return Response(
+            200,
+            headers={
+                "Content-Type": "text/event-stream",
+                "x-ratelimit-remaining-requests": "42",
+            },
+            content=openai_chunk("first") + openai_chunk("second") + b"data: [DONE]\n\n",
+        )
+
+    client = OpenAIClient(
+        endpoints=[OpenAIEndpoint(base_url="http://openai/v1", api_key="test")],
+        transport=MockTransport(handler),
+    )
+
+    stream = await client.chat_completion(
+        config=OpenAIChatConfig(model="gpt-4o"),
+        messages=[{"role": "user", "content": "test"}],
+        stream=True,
+    )
+    contents: list[str | None] = []
+    async for chunk in stream:
+        contents.append(chunk.choices[0].delta.content)
+        # request is still outstanding while the stream is received
+        assert client.endpoints_status[0].outstanding == 1
+
+    assert contents == ["first", "second"]
+    assert client.endpoints_status[0].outstanding == 0
+    assert client.endpoints_status[0].remaining_quota == 42
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_openai_ejects_endpoint_on_stream_error():
+    def handler(request: Request) -> Response:
+        return Response(
+            200,
+            headers={"Content-Type": "text/event-stream"},
+            content=openai_chunk("first") + b'data: {"error": {"message": "overloaded"}}\n\n',
+        )
+
+    client = OpenAIClient(
+        endpoints=[OpenAIEndpoint(base_url="http://openai/v1", api_key="test")],
+        transport=MockTransport(handler),
+    )
+
+    stream = await client.chat_completion(
+        config=OpenAIChatConfig(model="gpt-4o"),
+        messages=[{"role": "user", "content": "test"}],
+        stream=True,
+    )
+    with raises(APIError):
+        async for _ in stream:
+            pass
+
+    assert client.endpoints_status[0].ejected
+    assert client.endpoints_status[0].failures == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_openai_moderation_fails_over_to_healthy_endpoint():
+    hosts: list[str] = []
+
+    def handler(request: Request) -> Response:
+        hosts.append(request.url.host)
+        if request.url.host == "failing":
+            return Response(500, headers={"x-should-retry": "false"})
+
+        return Response(
+            200,
+            json={
+                "id": "moderation",
+                "model": "text-moderation-latest",
+                "results": [{"flagged": False, "categories": {}, "category_scores": {}}],
+            },
+        )
+
+    client = OpenAIClient(
+        endpoints=[
+            OpenAIEndpoint(base_url="http://failing/v1", api_key="failing"),
+            OpenAIEndpoint(base_url="http://healthy/v1", api_key="healthy"),
+        ],
+        transport=MockTransport(handler),
+    )
+
+    failures: int = 0
+    for _ in range(6):
+        try:
+            assert not (await client.moderation_check("text")).flagged
+
+        except InternalServerError:
+            failures += 1
+
+    assert hosts.count("failing") == 1
+    assert failures == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_openai_image_generation_updates_quota():
+    def handler(request: Request) -> Response:
+        return Response(
+            200,
+            headers={"x-ratelimit-remaining-requests": "7"},
+            json={"created": 0, "data": [{"url": "http://image"}]},
+        )
+
+    client = OpenAIClient(
+        endpoints=[OpenAIEndpoint(base_url="http://openai/v1", api_key="test")],
+        transport=MockTransport(handler),
+    )
+
+    image = await client.generate_image(OpenAIImageGenerationConfig(), "test")
+
+    assert image.url == "http://image"
+    assert client.endpoints_status[0].remaining_quota == 7
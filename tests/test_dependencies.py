@@ -0,0 +1,157 @@
+from asyncio import sleep
+from typing import Literal, Self
+
+from draive import ScopeDependencies, ScopeDependency, ctx, dispose_shared_dependencies
+from draive.scope.errors import MissingScopeDependency
+from pytest import mark, raises
+
+
+class ScopedDependency(ScopeDependency):
+    prepared: int = 0
+    disposed: int = 0
+
+    @classmethod
+    def prepare(cls) -> Self:
+        cls.prepared += 1
+        return cls()
+
+    async def dispose(self) -> None:
+        self.__class__.disposed += 1
+
+
+class SharedDependency(ScopeDependency):
+    prepared: int = 0
+    disposed: int = 0
+
+    @classmethod
+    def lifetime(cls) -> Literal["scope", "shared"]:
+        return "shared"
+
+    @classmethod
+    def prepare(cls) -> Self:
+        cls.prepared += 1
+        return cls()
+
+    async def dispose(self) -> None:
+        self.__class__.disposed += 1
+
+
+class AsyncDependency(ScopeDependency):
+    prepared: int = 0
+
+    @classmethod
+    async def prepare(cls) -> Self:
+        await sleep(0)
+        cls.prepared += 1
+        return cls()
+
+
+@mark.asyncio
+async def test_prepares_only_accessed_dependencies():
+    ScopedDependency.prepared = 0
+    SharedDependency.prepared = 0
+
+    async with ctx.new(dependencies=[ScopedDependency, SharedDependency]):
+        ctx.dependency(ScopedDependency)
+        ctx.dependency(ScopedDependency)
+
+    assert ScopedDependency.prepared == 1
+    assert SharedDependency.prepared == 0
+
+
+@mark.asyncio
+async def test_requires_preparing_async_dependency():
+    AsyncDependency.prepared = 0
+
+    async with ctx.new(dependencies=[AsyncDependency]):
+        with raises(MissingScopeDependency):
+            ctx.dependency(AsyncDependency)
+
+        await ctx.prepare_dependencies(AsyncDependency)
+        dependency: AsyncDependency = ctx.dependency(AsyncDependency)
+        await ctx.prepare_dependencies(AsyncDependency)
+        assert ctx.dependency(AsyncDependency) is dependency
+
+    assert AsyncDependency.prepared == 1
+
+
+@mark.asyncio
+async def test_prepares_all_dependencies_in_background():
+    ScopedDependency.prepared = 0
+    AsyncDependency.prepared = 0
+
+    async with ctx.new(dependencies=[ScopedDependency, AsyncDependency]):
+        preparing = ctx.prepare_dependencies()
+        await preparing
+        assert ScopedDependency.prepared == 1
+        assert AsyncDependency.prepared == 1
+        ctx.dependency(ScopedDependency)
+        ctx.dependency(AsyncDependency)
+
+    assert ScopedDependency.prepared == 1
+
+
+@mark.asyncio
+async def test_prepares_and_disposes_scoped_dependency_for_each_scope():
+    ScopedDependency.prepared = 0
+    ScopedDependency.disposed = 0
+
+    for _ in range(3):
+        async with ctx.new(dependencies=[ScopedDependency]):
+            ctx.dependency(ScopedDependency)
+
+    assert ScopedDependency.prepared == 3
+    assert ScopedDependency.disposed == 3
+
+
+@mark.asyncio
+async def test_does_not_dispose_provided_instances():
+    ScopedDependency.disposed = 0
+    dependency = ScopedDependency()
+
+    async with ctx.new(dependencies=[dependency]):
+        assert ctx.dependency(ScopedDependency) is dependency
+
+    assert ScopedDependency.disposed == 0
+
+
+@mark.asyncio
+async def test_reuses_shared_dependency_between_scopes():
+    SharedDependency.prepared = 0
+    SharedDependency.disposed = 0
+    instances: list[SharedDependency] = []
+
+    for _ in range(3):
+        async with ctx.new(dependencies=[SharedDependency]):
+            instances.append(ctx.dependency(SharedDependency))
+
+    assert SharedDependency.prepared == 1
+    assert SharedDependency.disposed == 0
+    assert all(instance is instances[0] for instance in instances)
+
+    await dispose_shared_dependencies()
+    assert SharedDependency.disposed == 1
+
+    async with ctx.new(dependencies=[SharedDependency]):
+        assert ctx.dependency(SharedDependency) is not instances[0]
+
+    assert SharedDependency.prepared == 2  # prepared again after disposal
+    await dispose_shared_dependencies()
+
+
+@mark.asyncio
+async def test_disposes_shared_dependency_after_last_scope():
+    SharedDependency.prepared = 0
+    SharedDependency.disposed = 0
+
+    async with ScopeDependencies(SharedDependency) as first:
+        first.dependency(SharedDependency)
+        async with ScopeDependencies(SharedDependency) as second:
+            second.dependency(SharedDependency)
+            await dispose_shared_dependencies()
+            assert SharedDependency.disposed == 0  # still used
+
+        assert SharedDependency.disposed == 0
+
+    assert SharedDependency.prepared == 1
+    assert SharedDependency.disposed == 1
@@ -0,0 +1,97 @@
+from draive import EndpointBalancer, EndpointUsage, ctx
+from draive.helpers import EndpointUsageStatistics
+from pytest import mark, raises
+
+
+class FakeException(Exception):
+    pass
+
+
+def test_routes_to_least_outstanding_endpoint():
+    balancer = EndpointBalancer({"first": "a", "second": "b"})
+
+    with balancer.lease() as first:
+        with balancer.lease() as second:
+            assert first.name != second.name
+
+    assert [status.requests for status in balancer.status] == [1, 1]
+    assert all(status.outstanding == 0 for status in balancer.status)
+
+
+def test_skips_ejected_endpoints():
+    balancer = EndpointBalancer({"first": "a", "second": "b"})
+
+    with balancer.lease() as lease:
+        ejected: str = lease.name
+        lease.eject(60)
+
+    for _ in range(4):
+        with balancer.lease() as lease:
+            assert lease.name != ejected
+
+    assert [status.ejected for status in balancer.status].count(True) == 1
+
+
+def test_uses_ejected_endpoint_recovering_first_when_all_ejected():
+    balancer = EndpointBalancer({"first": "a", "second": "b"})
+
+    with balancer.lease() as lease:
+        lease.eject(60)
+
+    with balancer.lease() as lease:
+        recovering: str = lease.name
+        lease.eject(30)
+
+    with balancer.lease() as lease:
+        assert lease.name == recovering
+
+
+def test_routes_to_highest_remaining_quota():
+    balancer = EndpointBalancer(
+        {"first": "a", "second": "b"},
+        strategy="remaining_quota",
+    )
+
+    with balancer.lease() as lease:
+        lease.update_quota("10")
+        limited: str = lease.name
+
+    with balancer.lease() as lease:
+        assert lease.name != limited
+        lease.update_quota(100)
+
+    for _ in range(4):
+        with balancer.lease() as lease:
+            assert lease.name != limited
+
+
+def test_tracks_failures():
+    balancer = EndpointBalancer({"single": "a"})
+
+    with raises(FakeException):
+        with balancer.lease():
+            raise FakeException()
+
+    status = balancer.status[0]
+    assert status.requests == 1
+    assert status.failures == 1
+    assert status.outstanding == 0
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_records_endpoint_usage():
+    balancer = EndpointBalancer({"single": "a"})
+
+    with balancer.lease():
+        pass
+
+    with raises(FakeException):
+        with balancer.lease():
+            raise FakeException()
+
+    usage = ctx.read(EndpointUsage)
+    assert usage is not None
+    statistics: EndpointUsageStatistics = usage.usage["single"]
+    assert statistics.requests == 2
+    assert statistics.failures == 1
@@ -0,0 +1,159 @@
+import pytest
+from draive import split_text
+
+
+@pytest.fixture
+def sample_text() -> str:
+    with open("tests/data/sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def markdown_sample_text() -> str:
+    with open("tests/data/markdown_sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def nested_splitting_expected_result() -> list[str]:
+    with open("tests/data/nested_splitting.txt") as file:
+        return file.read().split("\n")
+
+
+@pytest.fixture
+def overlap_splitting_expected_result() -> list[str]:
+    with open("tests/data/overlap_splitting.txt") as file:
+        return file.read().split("\n")
+
+
+class CountingSize:
+    def __init__(self) -> None:
+        self.counted_characters: int = 0
+
+    def __call__(self, text: str) -> int:
+        self.counted_characters += len(text)
+        return len(text)
+
+
+def test_returns_single_part_when_text_fits_part_size() -> None:
+    assert split_text(
+        text="0",
+        part_size=1,
+        count_size=len,
+        separators=[],
+        mode="fast",
+    ) == ["0"]
+
+
+def test_fails_when_cant_split() -> None:
+    with pytest.raises(ValueError):
+        split_text(
+            text="01",
+            part_size=1,
+            count_size=len,
+            separators=["."],
+            mode="fast",
+        )
+
+
+def test_splitting_text_when_each_base_part_doesnt_fit_part_size() -> None:
+    assert split_text(
+        text="1234 5678.890 ab cd.efgh ijklm",
+        part_size=6,
+        count_size=len,
+        separators=[".", " "],
+        mode="fast",
+    ) == ["1234", "5678.", "890", "ab cd.", "efgh", "ijklm"]
+
+
+def test_overlapping_parts_with_nested_splitting() -> None:
+    assert split_text(
+        text="1234 56.788.90.ab.cd.ef.g.h ijklm",
+        part_size=6,
+        count_size=len,
+        separators=[" ", "."],
+        part_overlap_size=6,
+        mode="fast",
+    ) == [
+        "1234",
+        "56.",
+        "56.788.",
+        "788.90.",
+        "90.ab.",
+        "ab.cd.",
+        "cd.ef.",
+        "ef.g.",
+        "ef.g.h",
+        "ijklm",
+    ]
+
+
+def test_uses_nested_splitting_with_long_text(
+    sample_text: str,
+    nested_splitting_expected_result: list[str],
+) -> None:
+    result: list[str] = split_text(
+        text=sample_text,
+        part_size=500,
+        count_size=len,
+        separators=["\n\n", "."],
+        mode="fast",
+    )
+    assert result == nested_splitting_expected_result
+
+
+def test_uses_overlap_splitting_with_long_text(
+    sample_text: str,
+    overlap_splitting_expected_result: list[str],
+) -> None:
+    result: list[str] = split_text(
+        text=sample_text,
+        part_size=500,
+        count_size=len,
+        separators=["\n", "."],
+        part_overlap_size=100,
+        mode="fast",
+    )
+    assert result == overlap_splitting_expected_result
+
+
+@pytest.mark.parametrize(
+    ("part_size", "part_overlap_size"),
+    [(64, None), (64, 16), (200, None), (200, 50), (500, 120)],
+)
+def test_returns_same_parts_as_basic_splitting(
+    markdown_sample_text: str,
+    part_size: int,
+    part_overlap_size: int | None,
+) -> None:
+    assert split_text(
+        text=markdown_sample_text,
+        part_size=part_size,
+        count_size=len,
+        part_overlap_size=part_overlap_size,
+        mode="fast",
+    ) == split_text(
+        text=markdown_sample_text,
+        part_size=part_size,
+        count_size=len,
+        part_overlap_size=part_overlap_size,
+    )
+
+
+def test_counts_less_than_basic_splitting(sample_text: str) -> None:
+    basic_size = CountingSize()
+    split_text(
+        text=sample_text,
+        part_size=500,
+        count_size=basic_size,
+        separators=[" "],
+    )
+    fast_size = CountingSize()
+    split_text(
+        text=sample_text,
+        part_size=500,
+        count_size=fast_size,
+        separators=[" "],
+        mode="fast",
+    )
+    assert fast_size.counted_characters * 10 < basic_size.counted_characters
@@ -0,0 +1,185 @@
+import json
+from asyncio import StreamReader, StreamWriter, start_server
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from logging import Logger
+from typing import Any
+
+from draive import (
+    LMMCompletionChunk,
+    LMMInput,
+    LMMToolRequest,
+    MetricsTraceReport,
+    TokenUsage,
+    ctx,
+    tool,
+)
+from draive.gemini import GeminiClient, GeminiException, gemini_lmm_invocation
+from draive.types import LMMOutputStreamChunk, LMMToolRequests
+from pytest import mark, raises
+
+
+def sse_event(data: dict[str, Any]) -> bytes:
+    return f"data: {json.dumps(data)}\r\n\r\n".encode()
+
+
+def text_chunk(
+    text: str,
+    finish_reason: str | None = None,
+) -> bytes:
+    candidate: dict[str, Any] = {"content": {"role": "model", "parts": [{"text": text}]}}
+    if finish_reason:
+        candidate["finishReason"] = finish_reason
+
+    return sse_event(
+        {
+            "candidates": [candidate],
+            "usageMetadata": {"promptTokenCount": 9, "candidatesTokenCount": 4},
+        }
+    )
+
+
+class FakeGeminiServer:
+    def __init__(
+        self,
+        *responses: list[bytes],
+    ) -> None:
+        self.responses: list[list[bytes]] = list(responses)
+        self.paths: list[str] = []
+        self.port: int = 0
+
+    async def handle(
+        self,
+        reader: StreamReader,
+        writer: StreamWriter,
+    ) -> None:
+        head: bytes = await reader.readuntil(b"\r\n\r\n")
+        lines: list[str] = head.decode().split("\r\n")
+        self.paths.append(lines[0].split(" ")[1])
+        content_length: int = 0
+        for line in lines:
+            if line.lower().startswith("content-length:"):
+                content_length = int(line.split(":", 1)[1])
+
+        await reader.readexactly(content_length)
+        writer.write(
+            b"HTTP/1.1 200 OK\r\n"
+            b"content-type: text/event-stream\r\n"
+            b"connection: close\r\n\r\n"
+        )
+        for event in self.responses.pop(0):
+            writer.write(event)
+            await writer.drain()
+
+        writer.close()
+        await writer.wait_closed()
+
+
+@asynccontextmanager
+async def serving(*responses: list[bytes]) -> AsyncGenerator[FakeGeminiServer, None]:
+    server = FakeGeminiServer(*responses)
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        server.port = listening.sockets[0].getsockname()[1]
+        yield server
+
+
+@tool
+async def weather(city: str) -> str:
+    return f"Sunny in {city}"
+
+
+async def collect_stream(
+    server: FakeGeminiServer,
+    **extra: Any,
+) -> tuple[list[LMMOutputStreamChunk], MetricsTraceReport]:
+    reports: list[MetricsTraceReport] = []
+
+    async def report_trace(
+        trace_id: str,
+        logger: Logger,
+        report: MetricsTraceReport,
+    ) -> None:
+        reports.append(report.with_combined_metrics())
+
+    chunks: list[LMMOutputStreamChunk] = []
+    async with ctx.new(
+        "test",
+        dependencies=[
+            GeminiClient(
+                endpoint=f"http://127.0.0.1:{server.port}",
+                api_key="test",
+            )
+        ],
+        trace_reporting=report_trace,
+    ):
+        async for chunk in await gemini_lmm_invocation(
+            instruction="test",
+            context=[LMMInput.of("test")],
+            stream=True,
+            **extra,
+        ):
+            chunks.append(chunk)
+
+    return chunks, reports[0]
+
+
+@mark.asyncio
+async def test_streams_text_chunks_incrementally():
+    async with serving(
+        [
+            text_chunk("Hello"),
+            text_chunk(", "),
+            text_chunk("world!", finish_reason="STOP"),
+        ]
+    ) as server:
+        chunks, report = await collect_stream(server)
+
+    assert chunks == [
+        LMMCompletionChunk.of("Hello"),
+        LMMCompletionChunk.of(", "),
+        LMMCompletionChunk.of("world!"),
+    ]
+    assert server.paths[0].startswith(
+        "/v1beta/models/gemini-1.5-flash:streamGenerateContent?"
+    ), server.paths[0]
+    assert "alt=sse" in server.paths[0]
+    usage = next(metric for metric in report.metrics.values() if isinstance(metric, TokenUsage))
+    assert usage.usage["gemini-1.5-flash"].input_tokens == 9
+    assert usage.usage["gemini-1.5-flash"].output_tokens == 4
+
+
+@mark.asyncio
+async def test_streams_function_calls():
+    async with serving(
+        [
+            sse_event(
+                {
+                    "candidates": [
+                        {
+                            "content": {
+                                "role": "model",
+                                "parts": [
+                                    {"functionCall": {"name": "weather", "args": {"city": "Oslo"}}}
+                                ],
+                            },
+                            "finishReason": "STOP",
+                        }
+                    ],
+                }
+            ),
+        ]
+    ) as server:
+        chunks, _ = await collect_stream(server, tools=[weather.specification])
+
+    assert len(chunks) == 1
+    assert isinstance(chunks[0], LMMToolRequests)
+    request: LMMToolRequest = chunks[0].requests[0]
+    assert request.tool == "weather"
+    assert request.arguments == {"city": "Oslo"}
+
+
+@mark.asyncio
+async def test_fails_on_incomplete_stream():
+    async with serving([text_chunk("Hello")]) as server:
+        with raises(GeminiException):
+            await collect_stream(server)
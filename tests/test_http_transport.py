@@ -0,0 +1,125 @@
+from asyncio import IncompleteReadError, StreamReader, StreamWriter, start_server
+
+from draive.http import close_shared_http_transports, shared_http_transport
+from httpx import AsyncClient
+from pytest import MonkeyPatch, mark
+
+
+class ProxyServer:
+    def __init__(self) -> None:
+        self.request_lines: list[str] = []
+
+    async def handle(
+        self,
+        reader: StreamReader,
+        writer: StreamWriter,
+    ) -> None:
+        head: bytes = await reader.readuntil(b"\r\n\r\n")
+        self.request_lines.append(head.decode().split("\r\n")[0])
+        writer.write(b"HTTP/1.1 200 OK\r\ncontent-length: 7\r\nconnection: close\r\n\r\nproxied")
+        await writer.drain()
+        writer.close()
+
+
+def configure_proxy(
+    monkeypatch: MonkeyPatch,
+    /,
+    *,
+    proxy: str,
+    no_proxy: str | None = None,
+) -> None:
+    for name in ("http_proxy", "https_proxy", "all_proxy", "no_proxy"):
+        monkeypatch.delenv(name, raising=False)
+        monkeypatch.delenv(name.upper(), raising=False)
+
+    monkeypatch.setenv("HTTP_PROXY", proxy)
+    if no_proxy is not None:
+        monkeypatch.setenv("NO_PROXY", no_proxy)
+
+
+class KeepAliveServer:
+    def __init__(self) -> None:
+        self.connections: int = 0
+        self.requests: int = 0
+
+    async def handle(
+        self,
+        reader: StreamReader,
+        writer: StreamWriter,
+    ) -> None:
+        self.connections += 1
+        try:
+            while True:
+                await reader.readuntil(b"\r\n\r\n")
+                self.requests += 1
+                writer.write(b"HTTP/1.1 200 OK\r\ncontent-length: 2\r\n\r\nok")
+                await writer.drain()
+
+        except IncompleteReadError:
+            pass  # connection closed by the client
+
+        finally:
+            writer.close()
+
+
+def test_returns_same_transport_for_same_configuration():
+    assert shared_http_transport() is shared_http_transport()
+    assert shared_http_transport(max_connections=10) is shared_http_transport(max_connections=10)
+    assert shared_http_transport(max_connections=10) is not shared_http_transport()
+
+
+@mark.asyncio
+async def test_reuses_connections_between_clients():
+    server = KeepAliveServer()
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        port: int = listening.sockets[0].getsockname()[1]
+        for _ in range(3):
+            # each client is closed after use without closing the shared transport
+            async with AsyncClient(
+                base_url=f"http://localhost:{port}",
+                transport=shared_http_transport(),
+            ) as client:
+                response = await client.get("/")
+                assert response.text == "ok"
+
+        await close_shared_http_transports()
+
+    assert server.requests == 3
+    assert server.connections == 1
+
+
+@mark.asyncio
+async def test_uses_proxy_from_environment(monkeypatch: MonkeyPatch):
+    server = ProxyServer()
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        port: int = listening.sockets[0].getsockname()[1]
+        configure_proxy(monkeypatch, proxy=f"http://127.0.0.1:{port}")
+        async with AsyncClient(
+            base_url="http://api.example.com",
+            transport=shared_http_transport(),
+        ) as client:
+            response = await client.get("/status")
+            assert response.text == "proxied"
+
+        await close_shared_http_transports()
+
+    assert server.request_lines == ["GET http://api.example.com/status HTTP/1.1"]
+
+
+@mark.asyncio
+async def test_skips_proxy_excluded_from_environment(monkeypatch: MonkeyPatch):
+    server = KeepAliveServer()
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        port: int = listening.sockets[0].getsockname()[1]
+        # proxy is not listening, request would fail when proxied
+        configure_proxy(monkeypatch, proxy="http://127.0.0.1:9", no_proxy="localhost")
+        async with AsyncClient(
+            base_url=f"http://localhost:{port}",
+            transport=shared_http_transport(),
+        ) as client:
+            response = await client.get("/")
+            assert response.text == "ok"
+
+        await close_shared_http_transports()
+
+    assert server.requests == 1
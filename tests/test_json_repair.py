@@ -0,0 +1,144 @@
+from collections.abc import Sequence
+from typing import Any
+
+from draive import (
+    LMM,
+    DataModel,
+    JSONRepairTrace,
+    LMMCompletion,
+    LMMContextElement,
+    MultimodalContent,
+    ctx,
+    generate_model,
+    repairing_json_decoder,
+)
+from draive.types import LMMOutput
+from pytest import mark, raises
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_decodes_valid_json_without_repair():
+    assert repairing_json_decoder(MultimodalContent.of('{"a": [1, 2], "b": "c"}')) == {
+        "a": [1, 2],
+        "b": "c",
+    }
+    assert ctx.read(JSONRepairTrace) is None
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_records_applied_repairs():
+    repairing_json_decoder(MultimodalContent.of('{"a": 1,}'))
+    repairing_json_decoder(MultimodalContent.of('{"a": [1, 2'))
+
+    assert ctx.read(JSONRepairTrace) == JSONRepairTrace(repairs=2)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_removes_trailing_commas():
+    assert repairing_json_decoder(MultimodalContent.of('{"a": [1, 2,], "b": {"c": 3,},}')) == {
+        "a": [1, 2],
+        "b": {"c": 3},
+    }
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_adds_missing_braces():
+    assert repairing_json_decoder(MultimodalContent.of('"a": {"b": 1}}')) == {"a": {"b": 1}}
+    assert repairing_json_decoder(MultimodalContent.of('{"a": {"b": 1}')) == {"a": {"b": 1}}
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_quotes_keys():
+    assert repairing_json_decoder(MultimodalContent.of('{a: 1, b_c: "d"}')) == {
+        "a": 1,
+        "b_c": "d",
+    }
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_adds_missing_separators():
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 1\n"b" [1 2]}')) == {
+        "a": 1,
+        "b": [1, 2],
+    }
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_closes_truncated_output():
+    assert repairing_json_decoder(MultimodalContent.of('{"a": [1, 2, {"b": "trunc')) == {
+        "a": [1, 2, {}],
+    }
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 1, "b": "c\\u00')) == {"a": 1}
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 1, "b": tr')) == {"a": 1}
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 1, "b"')) == {"a": 1}
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_drops_truncated_values():
+    assert repairing_json_decoder(MultimodalContent.of('{"a": "hello wor')) == {}
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 12')) == {}
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 1, "b": [3, 4')) == {
+        "a": 1,
+        "b": [3],
+    }
+    assert repairing_json_decoder(MultimodalContent.of('{"a": 12\n')) == {"a": 12}
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_skips_text_around_object():
+    assert repairing_json_decoder(
+        MultimodalContent.of('Result:\n```json\n{"a": True, "b": None}\n```')
+    ) == {
+        "a": True,
+        "b": None,
+    }
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_fails_without_object():
+    with raises(ValueError):
+        repairing_json_decoder(MultimodalContent.of("[1, 2, 3]"))
+
+    with raises(ValueError):
+        repairing_json_decoder(MultimodalContent.of("Lorem ipsum"))
+
+
+class Generated(DataModel):
+    name: str
+    values: list[int]
+
+
+async def malformed_invocation(
+    *,
+    context: Sequence[LMMContextElement],
+    **extra: Any,
+) -> LMMOutput:
+    return LMMCompletion.of('{"name": "test", "values": [1, 2, 3,')
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[LMM(invocation=malformed_invocation)])
+async def test_generates_model_from_malformed_output():
+    with raises(ValueError):
+        await generate_model(
+            Generated,
+            instruction="test",
+            input="test",
+        )
+
+    assert await generate_model(
+        Generated,
+        instruction="test",
+        input="test",
+        decoder=repairing_json_decoder,
+    ) == Generated(name="test", values=[1, 2, 3])
@@ -0,0 +1,170 @@
+from asyncio import CancelledError, sleep
+from collections.abc import Sequence
+from typing import Any
+
+from draive import (
+    LMMCompletion,
+    LMMContextElement,
+    LMMHedgingTrace,
+    LMMInput,
+    ctx,
+    hedged_lmm_invocation,
+)
+from draive.types import LMMOutput
+from pytest import mark, raises
+
+
+class FakeException(Exception):
+    pass
+
+
+class FakeInvocation:
+    def __init__(
+        self,
+        result: str,
+        *,
+        delay: float = 0,
+        failing: bool = False,
+    ) -> None:
+        self.result: str = result
+        self.delay: float = delay
+        self.failing: bool = failing
+        self.calls: int = 0
+        self.cancelled: int = 0
+
+    async def __call__(
+        self,
+        *,
+        context: Sequence[LMMContextElement],
+        stream: bool = False,
+        **extra: Any,
+    ) -> LMMOutput:
+        self.calls += 1
+        try:
+            await sleep(self.delay)
+
+        except CancelledError as exc:
+            self.cancelled += 1
+            raise exc
+
+        if self.failing:
+            raise FakeException()
+
+        return LMMCompletion.of(self.result)
+
+
+async def invoke(invocation: Any) -> LMMOutput:
+    return await invocation(
+        instruction="test",
+        context=[LMMInput.of("test")],
+    )
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_returns_primary_result_when_fast():
+    primary = FakeInvocation("primary")
+    secondary = FakeInvocation("secondary")
+
+    result = await invoke(hedged_lmm_invocation(primary, secondary, initial_delay=0.1))
+
+    assert result == LMMCompletion.of("primary")
+    assert primary.calls == 1
+    assert secondary.calls == 0
+    assert ctx.read(LMMHedgingTrace) == LMMHedgingTrace(requests=1)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_returns_hedged_result_and_cancels_slow_primary():
+    primary = FakeInvocation("primary", delay=1)
+    secondary = FakeInvocation("secondary", delay=0.01)
+
+    result = await invoke(hedged_lmm_invocation(primary, secondary, initial_delay=0.02))
+
+    assert result == LMMCompletion.of("secondary")
+    assert primary.calls == 1
+    assert primary.cancelled == 1
+    assert secondary.calls == 1
+    assert ctx.read(LMMHedgingTrace) == LMMHedgingTrace(requests=1, hedged=1)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_uses_first_result_of_hedged_requests():
+    primary = FakeInvocation("primary", delay=0.05)
+    secondary = FakeInvocation("secondary", delay=1)
+
+    result = await invoke(hedged_lmm_invocation(primary, secondary, initial_delay=0.01))
+
+    assert result == LMMCompletion.of("primary")
+    assert secondary.calls == 1
+    assert secondary.cancelled == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_falls_back_in_order_on_errors():
+    primary = FakeInvocation("primary", failing=True)
+    secondary = FakeInvocation("secondary", failing=True)
+    tertiary = FakeInvocation("tertiary")
+
+    result = await invoke(hedged_lmm_invocation(primary, secondary, tertiary, initial_delay=1))
+
+    assert result == LMMCompletion.of("tertiary")
+    assert ctx.read(LMMHedgingTrace) == LMMHedgingTrace(requests=1, fallbacks=2)
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_raises_when_all_invocations_fail():
+    primary = FakeInvocation("primary", failing=True)
+    secondary = FakeInvocation("secondary", failing=True)
+
+    with raises(FakeException):
+        await invoke(hedged_lmm_invocation(primary, secondary, initial_delay=1))
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_hedges_after_latency_percentile():
+    primary = FakeInvocation("primary", delay=0.01)
+    secondary = FakeInvocation("secondary")
+    invocation = hedged_lmm_invocation(primary, secondary, initial_delay=1, percentile=0.5)
+
+    # initial delay is used until enough samples were collected
+    for _ in range(8):
+        assert await invoke(invocation) == LMMCompletion.of("primary")
+
+    assert secondary.calls == 0
+    primary.delay = 1
+    assert await invoke(invocation) == LMMCompletion.of("secondary")
+    assert secondary.calls == 1
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_records_latency_of_cancelled_slow_requests():
+    primary = FakeInvocation("primary", delay=0.01)
+    secondary = FakeInvocation("secondary", delay=0.1)
+    invocation = hedged_lmm_invocation(
+        primary,
+        secondary,
+        initial_delay=1,
+        percentile=0.5,
+        samples=16,
+    )
+
+    for _ in range(8):
+        assert await invoke(invocation) == LMMCompletion.of("primary")
+
+    # slow primary requests are cancelled when hedged requests win
+    primary.delay = 1
+    for _ in range(8):
+        assert await invoke(invocation) == LMMCompletion.of("secondary")
+
+    assert secondary.calls == 8
+    # hedging delay includes latency of the cancelled requests
+    primary.delay = 0.05
+    assert await invoke(invocation) == LMMCompletion.of("primary")
+    assert secondary.calls == 8
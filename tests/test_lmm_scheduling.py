@@ -0,0 +1,132 @@
+from asyncio import Task, gather, sleep
+from collections.abc import Sequence
+from typing import Any
+
+from draive import (
+    LMM,
+    LMMCompletion,
+    LMMContextElement,
+    LMMScheduler,
+    LMMScheduling,
+    LMMSchedulingClass,
+    ctx,
+    lmm_invocation,
+)
+from draive.types import LMMOutput
+from pytest import mark, raises
+
+
+@mark.asyncio
+async def test_starts_waiting_requests_by_weight():
+    scheduler = LMMScheduler(
+        concurrency=1,
+        classes={
+            "interactive": LMMSchedulingClass(weight=3),
+            "batch": LMMSchedulingClass(weight=1),
+        },
+    )
+    started: list[str] = []
+
+    async def request(priority: str) -> None:
+        await scheduler.acquire(priority)
+        started.append(priority)
+        await sleep(0)
+        scheduler.release(priority)
+
+    await scheduler.acquire("batch")  # occupy the only slot
+    requests = [request("batch") for _ in range(4)] + [request("interactive") for _ in range(6)]
+    waiting = gather(*requests)
+    await sleep(0)
+    scheduler.release("batch")
+    await waiting
+
+    # interactive requests get 3 times more slots while batch is not starved
+    assert started[:4].count("interactive") == 3
+    assert started[:8].count("batch") == 2
+    assert started.count("batch") == 4
+
+
+@mark.asyncio
+async def test_limits_class_concurrency():
+    scheduler = LMMScheduler(
+        concurrency=4,
+        classes={
+            "interactive": LMMSchedulingClass(weight=1),
+            "batch": LMMSchedulingClass(weight=1, concurrency=1),
+        },
+    )
+    running: dict[str, int] = {"interactive": 0, "batch": 0}
+    max_running: dict[str, int] = {"interactive": 0, "batch": 0}
+
+    async def request(priority: str) -> None:
+        await scheduler.acquire(priority)
+        running[priority] += 1
+        max_running[priority] = max(max_running[priority], running[priority])
+        await sleep(0.01)
+        running[priority] -= 1
+        scheduler.release(priority)
+
+    await gather(*[request("batch") for _ in range(3)], *[request("interactive") for _ in range(6)])
+
+    assert max_running["batch"] == 1
+    assert max_running["interactive"] == 3
+
+
+@mark.asyncio
+async def test_skips_cancelled_requests():
+    scheduler = LMMScheduler(concurrency=1)
+    await scheduler.acquire()
+    cancelled = Task(scheduler.acquire("batch"))
+    await sleep(0)
+    cancelled.cancel()
+    await sleep(0)
+    scheduler.release()
+
+    await scheduler.acquire("batch")
+    scheduler.release("batch")
+
+
+def test_fails_with_unknown_priority():
+    scheduler = LMMScheduler(concurrency=1)
+    with raises(ValueError):
+        scheduler.release("unknown")
+
+
+@mark.asyncio
+async def test_schedules_lmm_invocation_using_state():
+    scheduler = LMMScheduler(concurrency=1)
+    running: int = 0
+    max_running: int = 0
+
+    async def invocation(
+        *,
+        context: Sequence[LMMContextElement],
+        stream: bool = False,
+        **extra: Any,
+    ) -> LMMOutput:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+        return LMMCompletion.of("done")
+
+    async with ctx.new(
+        state=[
+            LMM(invocation=invocation),
+            LMMScheduling(scheduler=scheduler),
+        ]
+    ):
+
+        async def batch() -> LMMOutput:
+            with ctx.updated(ctx.state(LMMScheduling).updated(priority="batch")):
+                return await lmm_invocation(instruction="test", context=[])
+
+        results = await gather(
+            batch(),
+            lmm_invocation(instruction="test", context=[]),
+            batch(),
+        )
+
+    assert all(result == LMMCompletion.of("done") for result in results)
+    assert max_running == 1
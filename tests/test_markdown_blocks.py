@@ -1,4 +1,14 @@
-from draive import markdown_block, markdown_blocks
+from collections.abc import AsyncGenerator
+
+from draive import (
+    LMMCompletionChunk,
+    markdown_block,
+    markdown_block_stream,
+    markdown_blocks,
+    markdown_blocks_stream,
+)
+from draive.types import LMMToolRequests
+from pytest import mark
 
 
 def test_returns_none_with_empty():
@@ -194,3 +204,71 @@ def test_info_returns_content_with_multiple_blocks_skipping_other_blocks():
     contents: list[str] = list(markdown_blocks("test", source=source))
 
     assert contents == ["Lorem ipsum", "Sit amet"]
+
+
+async def chunked(
+    source: str,
+    size: int,
+) -> AsyncGenerator[str, None]:
+    for idx in range(0, len(source), size):
+        yield source[idx : idx + size]
+
+
+@mark.asyncio
+async def test_stream_returns_same_content_for_any_chunking():
+    source: str = "```test Lorem ipsum``` ```other Dolor``` ```test Sit `amet` ``` ```test Last```"
+
+    for size in range(1, len(source) + 1):
+        contents: list[str] = [
+            content
+            async for content in markdown_blocks_stream(
+                "test",
+                stream=chunked(source, size),
+            )
+        ]
+
+        assert contents == list(markdown_blocks("test", source=source))
+
+
+@mark.asyncio
+async def test_stream_yields_content_when_closing_fence_arrives():
+    produced: int = 0
+
+    async def stream() -> AsyncGenerator[str, None]:
+        nonlocal produced
+        for chunk in ('Result:\n```json\n{"key": ', '"value"}\n``', "`\nand", " more"):
+            produced += 1
+            yield chunk
+
+    contents: AsyncGenerator[str, None] = markdown_blocks_stream("json", stream=stream())
+
+    assert await anext(contents) == '{"key": "value"}'
+    assert produced == 3
+    await contents.aclose()
+
+
+@mark.asyncio
+async def test_stream_skips_chunks_without_content():
+    async def stream() -> AsyncGenerator[LMMCompletionChunk | LMMToolRequests, None]:
+        yield LMMCompletionChunk.of("``` Lorem")
+        yield LMMToolRequests(requests=[])
+        yield LMMCompletionChunk.of(" ipsum```")
+
+    assert await markdown_block_stream(stream=stream()) == "Lorem ipsum"
+
+
+@mark.asyncio
+async def test_stream_closes_after_first_block():
+    closed: bool = False
+
+    async def stream() -> AsyncGenerator[str, None]:
+        nonlocal closed
+        try:
+            yield "``` Lorem ipsum``` "
+            yield "``` Other```"
+
+        finally:
+            closed = True
+
+    assert await markdown_block_stream(stream=stream()) == "Lorem ipsum"
+    assert closed
@@ -0,0 +1,186 @@
+import json
+from asyncio import StreamReader, StreamWriter, start_server
+from collections.abc import AsyncGenerator
+from contextlib import asynccontextmanager
+from typing import Any
+
+from draive import LMMCompletionChunk, LMMInput, LMMToolRequest, ctx, tool
+from draive.mistral import MistralClient, mistral_lmm_invocation
+from draive.ollama import OllamaClient, ollama_lmm_invocation
+from draive.types import LMMOutputStreamChunk, LMMToolRequests
+from pytest import mark
+
+
+class FakeStreamingServer:
+    def __init__(
+        self,
+        content_type: bytes,
+        *chunks: bytes,
+    ) -> None:
+        self.content_type: bytes = content_type
+        self.chunks: tuple[bytes, ...] = chunks
+        self.requests: list[dict[str, Any]] = []
+        self.port: int = 0
+
+    async def handle(
+        self,
+        reader: StreamReader,
+        writer: StreamWriter,
+    ) -> None:
+        head: bytes = await reader.readuntil(b"\r\n\r\n")
+        content_length: int = 0
+        for line in head.decode().split("\r\n"):
+            if line.lower().startswith("content-length:"):
+                content_length = int(line.split(":", 1)[1])
+
+        self.requests.append(json.loads(await reader.readexactly(content_length)))
+        writer.write(
+            b"HTTP/1.1 200 OK\r\ncontent-type: "
+            + self.content_type
+            + b"\r\nconnection: close\r\n\r\n"
+        )
+        for chunk in self.chunks:
+            writer.write(chunk)
+            await writer.drain()
+
+        writer.close()
+        await writer.wait_closed()
+
+
+@asynccontextmanager
+async def serving(
+    content_type: bytes,
+    *chunks: bytes,
+) -> AsyncGenerator[FakeStreamingServer, None]:
+    server = FakeStreamingServer(content_type, *chunks)
+    async with await start_server(server.handle, host="127.0.0.1", port=0) as listening:
+        server.port = listening.sockets[0].getsockname()[1]
+        yield server
+
+
+def mistral_chunk(
+    delta: dict[str, Any],
+    **extra: Any,
+) -> bytes:
+    part: dict[str, Any] = {
+        "id": "test",
+        "model": "open-mistral-7b",
+        "choices": [{"index": 0, "delta": delta, **extra}],
+    }
+    return b"data: " + json.dumps(part).encode() + b"\n\n"
+
+
+@tool
+async def weather(city: str) -> str:
+    return f"Sunny in {city}"
+
+
+@mark.asyncio
+async def test_mistral_streams_text_chunks():
+    event: bytes = mistral_chunk({"content": "lo"}, finish_reason="stop")
+    async with (
+        serving(
+            b"text/event-stream",
+            mistral_chunk({"role": "assistant", "content": ""}),
+            mistral_chunk({"content": "Hel"})[:10],  # split in the middle of an event
+            mistral_chunk({"content": "Hel"})[10:] + event,
+            b"data: [DONE]\n\n",
+        ) as server
+    ):
+        chunks: list[LMMOutputStreamChunk] = []
+        async with ctx.new(
+            "test",
+            dependencies=[
+                MistralClient(endpoint=f"http://127.0.0.1:{server.port}", api_key="test"),
+            ],
+        ):
+            async for chunk in await mistral_lmm_invocation(
+                instruction="test",
+                context=[LMMInput.of("test")],
+                stream=True,
+            ):
+                chunks.append(chunk)
+
+    assert chunks == [LMMCompletionChunk.of("Hel"), LMMCompletionChunk.of("lo")]
+    assert server.requests[0]["stream"] is True
+
+
+@mark.asyncio
+async def test_mistral_streams_tool_calls():
+    async with serving(
+        b"text/event-stream",
+        mistral_chunk(
+            {
+                "tool_calls": [
+                    {
+                        "id": "call_1",
+                        "function": {"name": "weather", "arguments": '{"city": "Rome"}'},
+                    }
+                ]
+            },
+            finish_reason="tool_calls",
+        ),
+        b"data: [DONE]\n\n",
+    ) as server:
+        chunks: list[LMMOutputStreamChunk] = []
+        async with ctx.new(
+            "test",
+            dependencies=[
+                MistralClient(endpoint=f"http://127.0.0.1:{server.port}", api_key="test"),
+            ],
+        ):
+            async for chunk in await mistral_lmm_invocation(
+                instruction="test",
+                context=[LMMInput.of("test")],
+                tools=[weather.specification],
+                stream=True,
+            ):
+                chunks.append(chunk)
+
+    assert chunks == [
+        LMMToolRequests(
+            requests=[
+                LMMToolRequest(identifier="call_1", tool="weather", arguments={"city": "Rome"})
+            ]
+        )
+    ]
+
+
+@mark.asyncio
+async def test_ollama_streams_ndjson_chunks():
+    def ollama_chunk(content: str, **extra: Any) -> bytes:
+        return (
+            json.dumps(
+                {
+                    "model": "llama3:8b",
+                    "message": {"role": "assistant", "content": content},
+                    "done": False,
+                    **extra,
+                }
+            ).encode()
+            + b"\n"
+        )
+
+    last: bytes = ollama_chunk("", done=True, prompt_eval_count=5, eval_count=2)
+    async with (
+        serving(
+            b"application/x-ndjson",
+            ollama_chunk("Hel")[:7],  # split in the middle of a line
+            ollama_chunk("Hel")[7:] + ollama_chunk("lo"),
+            last,
+        ) as server
+    ):
+        chunks: list[LMMOutputStreamChunk] = []
+        async with ctx.new(
+            "test",
+            dependencies=[OllamaClient(endpoint=f"http://127.0.0.1:{server.port}")],
+        ):
+            async for chunk in await ollama_lmm_invocation(
+                instruction="test",
+                context=[LMMInput.of("test")],
+                stream=True,
+            ):
+                chunks.append(chunk)
+
+    assert chunks == [LMMCompletionChunk.of("Hel"), LMMCompletionChunk.of("lo")]
+    assert server.requests[0]["stream"] is True
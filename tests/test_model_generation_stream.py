@@ -0,0 +1,219 @@
+import json
+from collections.abc import AsyncGenerator, Sequence
+from typing import Any
+
+from draive import (
+    LMM,
+    DataModel,
+    LMMCompletion,
+    LMMCompletionChunk,
+    LMMContextElement,
+    ModelGeneration,
+    ctx,
+    generate_model,
+    lmm_invocation,
+)
+from draive.generation.model.partial import PartialJSONParser
+from draive.types import LMMOutput, LMMOutputStream
+from pytest import mark, raises
+
+
+class Person(DataModel):
+    name: str
+    age: int
+    tags: list[str]
+
+
+PERSON_JSON: str = '{"name": "John \\"Doe\\"", "age": 42, "tags": ["a", "b{", "c"]}'
+
+
+def test_partial_parser_yields_completed_fields() -> None:
+    parser = PartialJSONParser()
+    partials: list[dict[str, Any]] = []
+    for char in "```json\n" + PERSON_JSON + "\n```":
+        if partial := parser.feed(char):
+            partials.append(partial)
+
+    assert partials == [
+        {"name": 'John "Doe"'},
+        {"name": 'John "Doe"', "age": 42},
+        {"name": 'John "Doe"', "age": 42, "tags": ["a"]},
+        {"name": 'John "Doe"', "age": 42, "tags": ["a", "b{"]},
+        {"name": 'John "Doe"', "age": 42, "tags": ["a", "b{", "c"]},
+    ]
+
+
+def test_partial_parser_final_result_is_chunking_independent() -> None:
+    expected: dict[str, Any] = json.loads(PERSON_JSON)
+    for size in range(1, len(PERSON_JSON) + 1):
+        parser = PartialJSONParser()
+        last: dict[str, Any] | None = None
+        for idx in range(0, len(PERSON_JSON), size):
+            if partial := parser.feed(PERSON_JSON[idx : idx + size]):
+                last = partial
+
+        assert last == expected
+
+
+def test_partial_parser_includes_empty_and_nested_containers() -> None:
+    parser = PartialJSONParser()
+    partials: list[dict[str, Any]] = []
+    for char in '{"a": [], "b": {"c": [1, {"d": 2}]}, "e": {}}':
+        if partial := parser.feed(char):
+            partials.append(partial)
+
+    assert partials == [
+        {"a": []},
+        {"a": [], "b": {"c": [1, {"d": 2}]}},
+        {"a": [], "b": {"c": [1, {"d": 2}]}, "e": {}},
+    ]
+
+
+def test_partial_parser_keeps_previous_partials_unchanged() -> None:
+    parser = PartialJSONParser()
+    partials: list[dict[str, Any]] = []
+    for char in '{"values": [1, 2, 3]}':
+        if partial := parser.feed(char):
+            partials.append(partial)
+
+    assert partials == [
+        {"values": [1]},
+        {"values": [1, 2]},
+        {"values": [1, 2, 3]},
+    ]
+
+
+def test_partial_parser_throttles_partials_of_large_containers() -> None:
+    expected: dict[str, Any] = {"values": [{"id": idx} for idx in range(4000)]}
+    text: str = json.dumps(expected)
+    parser = PartialJSONParser()
+    partials: list[dict[str, Any]] = []
+    for idx in range(0, len(text), 8):
+        if partial := parser.feed(text[idx : idx + 8]):
+            partials.append(partial)
+
+    # each partial copies the open list, copied elements are bounded by the text length
+    assert sum(len(partial["values"]) for partial in partials) <= 5 * len(text)
+    assert len(partials) > 100
+    assert partials[-1] == expected
+
+
+async def streaming_invocation(
+    *,
+    context: Sequence[LMMContextElement],
+    stream: bool = False,
+    **extra: Any,
+) -> LMMOutputStream | LMMOutput:
+    if not stream:
+        return LMMCompletion.of(PERSON_JSON)
+
+    async def chunks() -> AsyncGenerator[LMMCompletionChunk, None]:
+        for idx in range(0, len(PERSON_JSON), 7):
+            yield LMMCompletionChunk.of(PERSON_JSON[idx : idx + 7])
+
+    return ctx.stream(chunks())
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[LMM(invocation=streaming_invocation)])
+async def test_stream_yields_partials_and_validated_model() -> None:
+    results: list[Person | dict[str, Any]] = [
+        result
+        async for result in await generate_model(
+            Person,
+            instruction="test",
+            input="test",
+            stream=True,
+        )
+    ]
+
+    assert results[-1] == Person(name='John "Doe"', age=42, tags=["a", "b{", "c"])
+    assert results[0] == {"name": 'John "Doe"'}
+    assert all(isinstance(result, dict) for result in results[:-1])
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[LMM(invocation=streaming_invocation)])
+async def test_stream_result_matches_non_stream_result() -> None:
+    results: list[Person | dict[str, Any]] = [
+        result
+        async for result in await generate_model(
+            Person,
+            instruction="test",
+            input="test",
+            stream=True,
+        )
+    ]
+
+    assert results[-1] == await generate_model(
+        Person,
+        instruction="test",
+        input="test",
+    )
+
+
+async def invalid_invocation(
+    *,
+    context: Sequence[LMMContextElement],
+    stream: bool = False,
+    **extra: Any,
+) -> LMMOutputStream | LMMOutput:
+    async def chunks() -> AsyncGenerator[LMMCompletionChunk, None]:
+        yield LMMCompletionChunk.of('{"name": "John", ')
+        yield LMMCompletionChunk.of('"age": "unknown"}')
+
+    return ctx.stream(chunks())
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[LMM(invocation=invalid_invocation)])
+async def test_stream_validates_final_model() -> None:
+    results: list[Person | dict[str, Any]] = []
+    with raises(ValueError):
+        async for result in await generate_model(
+            Person,
+            instruction="test",
+            input="test",
+            stream=True,
+        ):
+            results.append(result)
+
+    assert results == [{"name": "John"}, {"name": "John", "age": "unknown"}]
+
+
+async def non_streaming_generator(  # noqa: PLR0913
+    generated: type[Person],
+    /,
+    *,
+    instruction: Any,
+    input: Any,  # noqa: A002
+    schema_injection: Any = "auto",
+    tools: Any = None,
+    examples: Any = None,
+    decoder: Any = None,
+    **extra: Any,
+) -> Person:
+    completion = await lmm_invocation(
+        instruction="test",
+        context=[],
+        stream=False,
+        **extra,
+    )
+    assert isinstance(completion, LMMCompletion)  # nosec: B101
+    return generated.from_json(completion.content.as_string())
+
+
+@mark.asyncio
+@ctx.wrap(
+    "test",
+    state=[
+        LMM(invocation=streaming_invocation),
+        ModelGeneration(generate=non_streaming_generator),  # pyright: ignore[reportArgumentType]
+    ],
+)
+async def test_non_stream_does_not_pass_stream_to_generator() -> None:
+    assert await generate_model(
+        Person,
+        instruction="test",
+        input="test",
+    ) == Person(name='John "Doe"', age=42, tags=["a", "b{", "c"])
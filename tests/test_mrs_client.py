@@ -0,0 +1,110 @@
+from asyncio import to_thread
+from threading import Event, current_thread
+from typing import Any
+
+from draive import ctx, dispose_shared_dependencies
+from pytest import MonkeyPatch, fixture, importorskip, mark, raises
+
+# tests require the optional mistralrs package, runner itself is replaced with a stub
+mistralrs = importorskip("mistralrs")
+
+from draive.mrs import MRSChatConfig, MRSClient  # noqa: E402
+
+
+class StubRunner:
+    loaded: list[tuple[str, Any]] = []  # noqa: RUF012
+    loading: Event = Event()
+
+    def __init__(
+        self,
+        *,
+        which: Any,
+    ) -> None:
+        StubRunner.loaded.append((current_thread().name, which))
+        StubRunner.loading.set()
+
+    def send_chat_completion_request(
+        self,
+        request: Any,
+    ) -> str:
+        return current_thread().name
+
+
+@fixture(autouse=True)
+def stub_runner(monkeypatch: MonkeyPatch) -> None:
+    StubRunner.loaded = []
+    StubRunner.loading = Event()
+    monkeypatch.setattr("draive.mrs.client.Runner", StubRunner)
+
+
+def model(model_id: str) -> Any:
+    return mistralrs.Which.Plain(
+        model_id=model_id,
+        arch=mistralrs.Architecture.Phi3,
+        tokenizer_json=None,
+        repeat_last_n=64,
+    )
+
+
+@mark.asyncio
+async def test_runs_each_model_within_own_threads():
+    first = model("first")
+    second = model("second")
+    client = MRSClient(models={"first": first, "second": second})
+
+    first_thread: Any = await client.chat_completion(
+        config=MRSChatConfig(model="first"),
+        messages=[{"role": "user", "content": "test"}],
+    )
+    second_thread: Any = await client.chat_completion(
+        config=MRSChatConfig(model="second"),
+        messages=[{"role": "user", "content": "test"}],
+    )
+
+    # requests are executed within the same threads which loaded the model
+    assert StubRunner.loaded == [(first_thread, first), (second_thread, second)]
+    assert first_thread.startswith("mrs-first")
+    assert second_thread.startswith("mrs-second")
+    await client.dispose()
+
+
+@mark.asyncio
+async def test_preloads_selected_models():
+    first = model("first")
+    client = MRSClient(
+        models={"first": first, "second": model("second")},
+        preload=["first"],
+    )
+
+    assert await to_thread(StubRunner.loading.wait, 1)
+    assert [which for _, which in StubRunner.loaded] == [first]
+
+    await client.chat_completion(
+        config=MRSChatConfig(model="first"),
+        messages=[{"role": "user", "content": "test"}],
+    )
+    # preloaded runner is reused
+    assert len(StubRunner.loaded) == 1
+    await client.dispose()
+
+
+@mark.asyncio
+async def test_shuts_down_executors_with_shared_lifetime(monkeypatch: MonkeyPatch):
+    client = MRSClient(models={"first": model("first")})
+    monkeypatch.setattr(MRSClient, "prepare", classmethod(lambda cls: client))
+
+    async with ctx.new(dependencies=[MRSClient]):
+        assert ctx.dependency(MRSClient) is client
+        await client.chat_completion(
+            config=MRSChatConfig(model="first"),
+            messages=[{"role": "user", "content": "test"}],
+        )
+
+    # shared client is kept after the scope ends
+    async with ctx.new(dependencies=[MRSClient]):
+        assert ctx.dependency(MRSClient) is client
+
+    await dispose_shared_dependencies()
+
+    with raises(RuntimeError):
+        client._models["first"].executor.submit(print)  # pyright: ignore[reportPrivateUsage]
@@ -1,4 +1,4 @@
-from draive import ImageURLContent, MultimodalContent, TextContent
+from draive import ImageDataContent, ImageURLContent, MultimodalContent, TextContent
 
 input_string: str = "Lorem ipsum,\ndolor sit amet"
 input_text: TextContent = TextContent(text=input_string)
@@ -77,3 +77,17 @@ def test_merged_contents_with_different_meta_are_concatenated_where_able():
         input_text.updated(meta={"test": False}),
         input_text,
     )
+
+
+def test_media_data_is_encoded_lazily_once():
+    image = ImageDataContent.from_dict({"image_data": memoryview(b"image")})
+    assert image.image_data == b"image"
+    assert image.image_base64 == "aW1hZ2U="
+    assert image.image_base64 is image.image_base64
+
+
+def test_media_data_is_serialized_as_base64():
+    image = ImageDataContent(image_data=b"image", image_description="test")
+    assert image.as_dict()["image_data"] == "aW1hZ2U="
+    assert ImageDataContent.from_json(image.as_json()) == image
+    assert MultimodalContent.of(image).as_string() == "![test]()"
@@ -0,0 +1,149 @@
+from asyncio import sleep
+from collections.abc import Sequence
+from random import Random
+from typing import Any
+
+from draive import Embedded, TextEmbedding, ctx, semantic_split_text, split_text
+from pytest import mark
+
+TOPICS: Sequence[str] = ("cat", "car", "sea")
+
+
+async def topic_embedding(
+    values: Sequence[str],
+    **extra: Any,
+) -> list[Embedded[str]]:
+    return [
+        Embedded(
+            value=value,
+            vector=[float(topic in value) for topic in TOPICS],
+        )
+        for value in values
+    ]
+
+
+async def noisy_embedding(
+    values: Sequence[str],
+    **extra: Any,
+) -> list[Embedded[str]]:
+    # the same topic with slightly different vectors, as produced by real models
+    return [
+        Embedded(
+            value=value,
+            vector=[1.0 + Random(value).uniform(-0.1, 0.1) for _ in range(8)],
+        )
+        for value in values
+    ]
+
+
+TEXT: str = (
+    "My cat sleeps all day. The cat likes fish. Every cat purrs. "
+    "A car needs fuel. The car is red. My car is fast. "
+    "The sea is deep. Fish live in the sea. The sea is blue."
+)
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[TextEmbedding(embed=topic_embedding)])
+async def test_returns_text_when_fits_part_size() -> None:
+    assert await semantic_split_text(
+        text=TEXT,
+        part_size=len(TEXT),
+        count_size=len,
+    ) == [TEXT]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[TextEmbedding(embed=topic_embedding)])
+async def test_splits_on_topic_boundaries() -> None:
+    assert await semantic_split_text(
+        text=TEXT,
+        part_size=100,
+        count_size=len,
+        window_size=2,
+        similarity_threshold=0.5,
+        batch_size=4,
+    ) == [
+        "My cat sleeps all day. The cat likes fish. Every cat purrs.",
+        "A car needs fuel. The car is red. My car is fast.",
+        "The sea is deep. Fish live in the sea. The sea is blue.",
+    ]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[TextEmbedding(embed=topic_embedding)])
+async def test_splits_topics_not_fitting_part_size() -> None:
+    result: list[str] = await semantic_split_text(
+        text=TEXT,
+        part_size=45,
+        count_size=len,
+        window_size=2,
+        similarity_threshold=0.5,
+    )
+    assert result == [
+        "My cat sleeps all day. The cat likes fish.",
+        "Every cat purrs.",
+        "A car needs fuel. The car is red.",
+        "My car is fast.",
+        "The sea is deep. Fish live in the sea.",
+        "The sea is blue.",
+    ]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[TextEmbedding(embed=topic_embedding)])
+async def test_splits_too_long_sentences_using_words() -> None:
+    result: list[str] = await semantic_split_text(
+        text="cat cat cat cat cat cat. car car.",
+        part_size=12,
+        count_size=len,
+    )
+    assert result == ["cat cat cat", "cat cat", "cat.", "car car."]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[TextEmbedding(embed=noisy_embedding)])
+async def test_keeps_single_topic_parts_count() -> None:
+    text: str = "\n".join(
+        f"The cat number {idx} sleeps all day long on the sofa in the sun." for idx in range(80)
+    )
+    result: list[str] = await semantic_split_text(
+        text=text,
+        part_size=1000,
+        count_size=len,
+    )
+    assert len(result) == len(
+        split_text(
+            text=text,
+            part_size=1000,
+            count_size=len,
+        )
+    )
+
+
+@mark.asyncio
+async def test_limits_concurrent_batches() -> None:
+    running: int = 0
+    max_running: int = 0
+
+    async def embedding(
+        values: Sequence[str],
+        **extra: Any,
+    ) -> list[Embedded[str]]:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.01)
+        running -= 1
+        return await topic_embedding(values)
+
+    async with ctx.new("test", state=[TextEmbedding(embed=embedding)]):
+        await semantic_split_text(
+            text=TEXT,
+            part_size=45,
+            count_size=len,
+            batch_size=1,
+            concurrent_batches=2,
+        )
+
+    assert max_running == 2
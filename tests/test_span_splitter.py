@@ -0,0 +1,128 @@
+from typing import Literal
+
+import pytest
+from draive import TextSpan, split_text, split_text_spans
+
+
+@pytest.fixture
+def sample_text() -> str:
+    with open("tests/data/sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def markdown_sample_text() -> str:
+    with open("tests/data/markdown_sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def overlap_splitting_expected_result() -> list[str]:
+    with open("tests/data/overlap_splitting.txt") as file:
+        return file.read().split("\n")
+
+
+def test_returns_whole_text_span_when_text_fits_part_size() -> None:
+    spans: list[TextSpan] = split_text_spans(
+        text=" 0 ",
+        part_size=3,
+        count_size=len,
+        separators=[],
+    )
+    assert [(span.start, span.end, span.text) for span in spans] == [(0, 3, " 0 ")]
+
+
+def test_fails_when_cant_split() -> None:
+    with pytest.raises(ValueError):
+        split_text_spans(
+            text="01",
+            part_size=1,
+            count_size=len,
+            separators=["."],
+        )
+
+
+def test_returns_offsets_of_stripped_parts() -> None:
+    text: str = "1234 5678.890 ab cd.efgh ijklm"
+    spans: list[TextSpan] = split_text_spans(
+        text=text,
+        part_size=6,
+        count_size=len,
+        separators=[".", " "],
+    )
+    assert [(span.start, span.end) for span in spans] == [
+        (0, 4),
+        (5, 10),
+        (10, 13),
+        (14, 20),
+        (20, 24),
+        (25, 30),
+    ]
+    assert [str(span) for span in spans] == ["1234", "5678.", "890", "ab cd.", "efgh", "ijklm"]
+    assert all(span.text == text[span.start : span.end] for span in spans)
+
+
+def test_overlapping_spans_with_nested_splitting() -> None:
+    assert [
+        span.text
+        for span in split_text_spans(
+            text="1234 56.788.90.ab.cd.ef.g.h ijklm",
+            part_size=6,
+            count_size=len,
+            separators=[" ", "."],
+            part_overlap_size=6,
+        )
+    ] == [
+        "1234",
+        "56.",
+        "56.788.",
+        "788.90.",
+        "90.ab.",
+        "ab.cd.",
+        "cd.ef.",
+        "ef.g.",
+        "ef.g.h",
+        "ijklm",
+    ]
+
+
+def test_uses_overlap_splitting_with_long_text(
+    sample_text: str,
+    overlap_splitting_expected_result: list[str],
+) -> None:
+    spans: list[TextSpan] = split_text_spans(
+        text=sample_text,
+        part_size=500,
+        count_size=len,
+        separators=["\n", "."],
+        part_overlap_size=100,
+    )
+    assert [span.text for span in spans] == overlap_splitting_expected_result
+
+
+@pytest.mark.parametrize("mode", ["basic", "exhaustive"])
+@pytest.mark.parametrize(
+    ("part_size", "part_overlap_size"),
+    [(64, None), (64, 16), (200, None), (200, 50), (500, 120)],
+)
+def test_returns_same_parts_as_text_splitting(
+    markdown_sample_text: str,
+    mode: Literal["basic", "exhaustive"],
+    part_size: int,
+    part_overlap_size: int | None,
+) -> None:
+    spans: list[TextSpan] = split_text_spans(
+        text=markdown_sample_text,
+        part_size=part_size,
+        count_size=len,
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+    )
+    assert [span.text for span in spans] == split_text(
+        text=markdown_sample_text,
+        part_size=part_size,
+        count_size=len,
+        part_overlap_size=part_overlap_size,
+        mode=mode,
+    )
+    assert all(span.text == markdown_sample_text[span.start : span.end] for span in spans)
@@ -0,0 +1,119 @@
+from collections.abc import AsyncIterator
+
+import pytest
+from draive import split_text, split_text_async_stream, split_text_stream
+from pytest import mark
+
+
+@pytest.fixture
+def sample_text() -> str:
+    with open("tests/data/sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def markdown_sample_text() -> str:
+    with open("tests/data/markdown_sample_text.txt") as file:
+        return file.read()
+
+
+@pytest.fixture
+def overlap_splitting_expected_result() -> list[str]:
+    with open("tests/data/overlap_splitting.txt") as file:
+        return file.read().split("\n")
+
+
+def test_splits_file_lines(
+    overlap_splitting_expected_result: list[str],
+) -> None:
+    with open("tests/data/sample_text.txt") as file:
+        result: list[str] = list(
+            split_text_stream(
+                file,
+                part_size=500,
+                count_size=len,
+                separators=["\n", "."],
+                part_overlap_size=100,
+                window_size=256,
+            )
+        )
+
+    assert result == overlap_splitting_expected_result
+
+
+@pytest.mark.parametrize("window_size", [128, 512, 65536])
+@pytest.mark.parametrize(
+    ("part_size", "part_overlap_size"),
+    [(64, None), (200, 50), (500, 120)],
+)
+def test_returns_same_parts_as_text_splitting(
+    markdown_sample_text: str,
+    window_size: int,
+    part_size: int,
+    part_overlap_size: int | None,
+) -> None:
+    assert list(
+        split_text_stream(
+            (
+                markdown_sample_text[idx : idx + 37]
+                for idx in range(0, len(markdown_sample_text), 37)
+            ),
+            part_size=part_size,
+            count_size=len,
+            part_overlap_size=part_overlap_size,
+            window_size=window_size,
+        )
+    ) == split_text(
+        text=markdown_sample_text,
+        part_size=part_size,
+        count_size=len,
+        part_overlap_size=part_overlap_size,
+    )
+
+
+def test_decodes_bytes_split_within_characters() -> None:
+    encoded: bytes = "zażółć gęślą jaźń".encode()
+    assert list(
+        split_text_stream(
+            (encoded[idx : idx + 1] for idx in range(len(encoded))),
+            part_size=7,
+            count_size=len,
+            window_size=4,
+        )
+    ) == ["zażółć", "gęślą", "jaźń"]
+
+
+def test_skips_whitespace_only_stream() -> None:
+    assert (
+        list(
+            split_text_stream(
+                ["\n", " \n"],
+                part_size=6,
+                count_size=len,
+            )
+        )
+        == []
+    )
+
+
+@mark.asyncio
+async def test_splits_async_bytes_stream(
+    sample_text: str,
+    overlap_splitting_expected_result: list[str],
+) -> None:
+    async def stream() -> AsyncIterator[bytes]:
+        encoded: bytes = sample_text.encode()
+        for idx in range(0, len(encoded), 100):
+            yield encoded[idx : idx + 100]
+
+    assert [
+        part
+        async for part in split_text_async_stream(
+            stream(),
+            part_size=500,
+            count_size=len,
+            separators=["\n", "."],
+            part_overlap_size=100,
+            window_size=1024,
+        )
+    ] == overlap_splitting_expected_result
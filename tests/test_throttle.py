@@ -0,0 +1,126 @@
+from asyncio import CancelledError, Task, gather, sleep
+from time import monotonic
+
+from draive import ctx, throttle
+from pytest import mark, raises
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_returns_result_when_returning_value():
+    @throttle
+    async def compute(value: int) -> int:
+        return value
+
+    assert await compute(42) == 42
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_delays_executions_exceeding_limit():
+    started: list[float] = []
+
+    @throttle(limit=2, period=0.1)
+    async def compute() -> None:
+        started.append(monotonic())
+
+    start: float = monotonic()
+    await gather(*[compute() for _ in range(5)])
+
+    assert len(started) == 5
+    assert started[1] - start < 0.05
+    assert started[2] - start >= 0.09
+    assert started[4] - start >= 0.19
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_does_not_serialize_waiting_executions():
+    finished: list[int] = []
+
+    @throttle(limit=1, period=0.05)
+    async def compute(value: int) -> None:
+        await sleep(0.2)
+        finished.append(value)
+
+    start: float = monotonic()
+    await gather(*[compute(value) for value in range(3)])
+
+    assert sorted(finished) == [0, 1, 2]
+    # executions overlap - waiting is not sequential with function execution
+    assert monotonic() - start < 0.45
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_allows_burst_exceeding_limit():
+    started: list[float] = []
+
+    @throttle(limit=1, period=0.05, burst=3)
+    async def compute() -> None:
+        started.append(monotonic())
+
+    start: float = monotonic()
+    await gather(*[compute() for _ in range(4)])
+
+    assert started[2] - start < 0.05
+    assert started[3] - start >= 0.14
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_limits_concurrent_executions():
+    running: int = 0
+    max_running: int = 0
+
+    @throttle(limit=10, period=0.01, concurrent=2)
+    async def compute() -> None:
+        nonlocal running, max_running
+        running += 1
+        max_running = max(max_running, running)
+        await sleep(0.02)
+        running -= 1
+
+    await gather(*[compute() for _ in range(6)])
+
+    assert max_running == 2
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_applies_limits_per_key():
+    started: dict[str, list[float]] = {"a": [], "b": []}
+
+    @throttle(limit=1, period=0.1, key=lambda tenant: tenant)
+    async def compute(tenant: str) -> None:
+        started[tenant].append(monotonic())
+
+    start: float = monotonic()
+    await gather(compute("a"), compute("b"), compute("a"))
+
+    assert started["a"][0] - start < 0.05
+    assert started["b"][0] - start < 0.05
+    assert started["a"][1] - start >= 0.09
+
+
+@mark.asyncio
+@ctx.wrap("test")
+async def test_releases_reservation_when_cancelled():
+    started: list[float] = []
+
+    @throttle(limit=1, period=0.1)
+    async def compute() -> None:
+        started.append(monotonic())
+
+    start: float = monotonic()
+    await compute()
+    cancelled: Task[None] = Task(compute())
+    await sleep(0.01)
+    cancelled.cancel()
+    with raises(CancelledError):
+        await cancelled
+
+    await compute()
+
+    assert len(started) == 2
+    assert started[1] - start < 0.15
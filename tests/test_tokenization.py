@@ -0,0 +1,67 @@
+from collections.abc import Sequence
+from typing import Any
+
+from draive import (
+    Tokenization,
+    count_text_tokens,
+    count_texts_tokens,
+    ctx,
+    tokenize_text,
+    tokenize_texts,
+)
+from draive.mistral import MistralChatConfig, mistral_tokenize_text, mistral_tokenize_texts
+from pytest import mark
+
+
+def characters_tokenize_text(
+    text: str,
+    **extra: Any,
+) -> list[int]:
+    return [ord(character) for character in text]
+
+
+def characters_count_text_tokens(
+    text: str,
+    **extra: Any,
+) -> int:
+    return len(text)
+
+
+def characters_tokenize_texts(
+    texts: Sequence[str],
+    **extra: Any,
+) -> list[list[int]]:
+    return [[ord(character) for character in text] for text in texts]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[Tokenization(tokenize_text=characters_tokenize_text)])
+async def test_falls_back_to_text_tokenizer():
+    assert tokenize_texts(["ab", "c"]) == [[97, 98], [99]]
+    assert count_text_tokens("abc") == 3
+    assert count_texts_tokens(["ab", "", "c"]) == [2, 0, 1]
+
+
+@mark.asyncio
+@ctx.wrap(
+    "test",
+    state=[
+        Tokenization(
+            tokenize_text=characters_tokenize_text,
+            tokenize_texts=characters_tokenize_texts,
+            count_text_tokens=characters_count_text_tokens,
+        )
+    ],
+)
+async def test_uses_provided_batch_tokenizer_and_counter():
+    assert tokenize_text("ab") == [97, 98]
+    assert tokenize_texts(["ab", "c"]) == [[97, 98], [99]]
+    assert count_text_tokens("abc") == 3
+    assert count_texts_tokens(["ab", "c"]) == [2, 1]
+
+
+@mark.asyncio
+@ctx.wrap("test", state=[MistralChatConfig()])
+async def test_sentencepiece_batch_matches_single_texts():
+    texts: list[str] = ["Lorem ipsum dolor sit amet", "", "consectetur adipiscing elit"]
+    assert mistral_tokenize_texts(texts) == [mistral_tokenize_text(text) for text in texts]
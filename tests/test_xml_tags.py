@@ -1,4 +1,21 @@
-from draive import ImageURLContent, MultimodalContent, xml_tag, xml_tags
+from collections.abc import AsyncGenerator
+
+from draive import (
+    ConversationMessageChunk,
+    ImageURLContent,
+    LMMCompletionChunk,
+    LMMOutputStreamChunk,
+    MultimodalContent,
+    TextContent,
+    xml_tag,
+    xml_tag_stream,
+    xml_tagged,
+    xml_tagged_stream,
+    xml_tags,
+    xml_tags_stream,
+)
+from draive.types import LMMToolRequests
+from pytest import mark
 
 
 def test_returns_none_with_empty():
@@ -296,3 +313,143 @@ def test_skips_content_from_different_tags():
             "amet",
         ),
     ]
+
+
+def test_preserves_parts_meta():
+    multimodal_source: MultimodalContent = MultimodalContent.of(
+        TextContent(text="<test>Lorem", meta={"part": 1}),
+        TextContent(text=" ipsum</te", meta={"part": 2}),
+        TextContent(text="st>", meta={"part": 3}),
+    )
+
+    assert xml_tag("test", source=multimodal_source) == MultimodalContent.of(
+        TextContent(text="Lorem", meta={"part": 1}),
+        TextContent(text=" ipsum", meta={"part": 2}),
+    )
+
+
+def test_returns_contents_of_multiple_tags_in_order():
+    text_source: str = (
+        "<first>Lorem</first><other>Other</other><second a=b>ipsum</second><first>Dolor</first>"
+    )
+
+    assert [
+        (tag, content.as_string())
+        for tag, content in xml_tagged(["first", "second"], source=text_source)
+    ] == [
+        ("first", "Lorem"),
+        ("second", "ipsum"),
+        ("first", "Dolor"),
+    ]
+
+    multimodal_source: MultimodalContent = MultimodalContent.of(
+        "<first>Lorem ",
+        ImageURLContent(image_url="image"),
+        "ipsum</first><second>Dolor</second>",
+    )
+
+    assert list(xml_tagged(["first", "second"], source=multimodal_source)) == [
+        (
+            "first",
+            MultimodalContent.of(
+                "Lorem ",
+                ImageURLContent(image_url="image"),
+                "ipsum",
+            ),
+        ),
+        ("second", MultimodalContent.of("Dolor")),
+    ]
+
+
+def test_returns_innermost_content_of_multiple_nested_tags():
+    text_source: str = "<first>Lorem<second>ipsum</second></first>"
+
+    assert [
+        (tag, content.as_string())
+        for tag, content in xml_tagged(["first", "second"], source=text_source)
+    ] == [("second", "ipsum")]
+
+
+async def completion_stream(
+    *chunks: str | ImageURLContent | LMMToolRequests,
+) -> AsyncGenerator[LMMOutputStreamChunk, None]:
+    for chunk in chunks:
+        match chunk:
+            case LMMToolRequests() as requests:
+                yield requests
+
+            case content:
+                yield LMMCompletionChunk.of(content)
+
+
+@mark.asyncio
+async def test_returns_stream_content_with_tags_split_between_chunks():
+    assert [
+        content
+        async for content in xml_tags_stream(
+            "test",
+            stream=completion_stream(
+                "Lorem<te",
+                "st>Lorem ",
+                ImageURLContent(image_url="image"),
+                "ip",
+                LMMToolRequests(requests=[]),
+                "sum</",
+                "test><other>Other</other><test>Dolor</test",
+                ">",
+            ),
+        )
+    ] == [
+        MultimodalContent.of(
+            "Lorem ",
+            ImageURLContent(image_url="image"),
+            "ipsum",
+        ),
+        MultimodalContent.of("Dolor"),
+    ]
+
+
+@mark.asyncio
+async def test_returns_stream_contents_of_multiple_tags():
+    async def message_stream() -> AsyncGenerator[ConversationMessageChunk, None]:
+        for chunk in ("<first>Lor", "em</first><sec", "ond>ipsum</second>"):
+            yield ConversationMessageChunk(
+                identifier="message",
+                content=MultimodalContent.of(chunk),
+            )
+
+    assert [
+        (tag, content)
+        async for tag, content in xml_tagged_stream(
+            ["first", "second"],
+            stream=message_stream(),
+        )
+    ] == [
+        ("first", MultimodalContent.of("Lorem")),
+        ("second", MultimodalContent.of("ipsum")),
+    ]
+
+
+@mark.asyncio
+async def test_stops_stream_when_tag_found():
+    consumed: list[str] = []
+    closed: bool = False
+
+    async def stream() -> AsyncGenerator[str, None]:
+        nonlocal closed
+        try:
+            for chunk in ("<test>Lorem", " ipsum</test>", "<test>Dolor</test>", "Sit amet"):
+                consumed.append(chunk)
+                yield chunk
+
+        finally:
+            closed = True
+
+    assert await xml_tag_stream("test", stream=stream(), conversion=str) == "Lorem ipsum"
+    assert consumed == ["<test>Lorem", " ipsum</test>"]
+    assert closed
+
+
+@mark.asyncio
+async def test_returns_none_when_stream_has_no_tag():
+    assert await xml_tag_stream("test", stream=completion_stream("Lorem <other>ipsum")) is None